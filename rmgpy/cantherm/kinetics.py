@@ -264,11 +264,8 @@ class KineticsJob:
             return
 
         Tlist = 1000.0/numpy.arange(0.4, 3.35, 0.05)
-        klist = numpy.zeros_like(Tlist)
-        klist2 = numpy.zeros_like(Tlist)
-        for i in range(Tlist.shape[0]):
-            klist[i] = self.reaction.calculateTSTRateCoefficient(Tlist[i])
-            klist2[i] = self.reaction.kinetics.getRateCoefficient(Tlist[i])
+        klist = self.reaction.calculateTSTRateCoefficients(Tlist)
+        klist2 = self.reaction.kinetics.getRateCoefficients(Tlist)
 
         order = len(self.reaction.reactants)
         klist *= 1e6 ** (order-1)
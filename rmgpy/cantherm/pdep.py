@@ -498,9 +498,7 @@ class PressureDependenceJob(object):
                 
                 K2 = numpy.zeros((Tcount, Pcount))
                 if reaction.kinetics is not None:
-                    for t in range(Tcount):
-                        for p in range(Pcount):
-                            K2[t,p] = reaction.kinetics.getRateCoefficient(Tlist[t], Plist[p])
+                    K2 = reaction.kinetics.getRateCoefficients(Tlist, Plist)
                 
                 K = self.K[:,:,prod,reac].copy()
                 order = len(reaction.reactants)
@@ -33,6 +33,7 @@ This module contains functions for writing of Chemkin input files.
 """
 import shutil
 import math
+import collections
 import re
 import logging
 import textwrap
@@ -739,48 +740,140 @@ def readReactionComments(reaction, comments, read = True):
 
 ################################################################################
 
-def loadSpeciesDictionary(path):
+def readSpeciesDictionary(f):
+    """
+    Read the entries of an RMG species dictionary from the file-like object
+    `f`, yielding the adjacency list of each entry in turn as it is read.
+    Trailing InChI identifiers and comments are removed from the adjacency
+    lists.
+    """
+    adjlist = ''
+    for line in f:
+        if line.strip() == '' and adjlist.strip() != '':
+            # Finish this adjacency list
+            yield adjlist
+            adjlist = ''
+        else:
+            if "InChI" in line:
+                line = line.split()[0] + '\n'
+            if '//' in line:
+                index = line.index('//')
+                line = line[0:index]
+            adjlist += line
+    if adjlist.strip() != '':
+        # Reached end of file
+        yield adjlist
+
+def getDictionaryEntryLabel(adjlist):
+    """
+    Return the label of the species dictionary entry `adjlist` without
+    parsing the adjacency list, or ``None`` if the entry has no label.
+    """
+    for label in adjlist.splitlines():
+        if label.strip():
+            break
+    else:
+        return None
+    tokens = label.split()
+    if tokens[0].isdigit() or tokens[0] == 'multiplicity':
+        return None
+    return label.strip()
+
+_inertSpecies = None
+
+def readDictionaryEntry(adjlist):
+    """
+    Return the species described by the species dictionary entry `adjlist`,
+    with its resonance structures generated. Inert species such as N2 and
+    the noble gases are marked as unreactive.
+    """
+    global _inertSpecies
+    if _inertSpecies is None:
+        _inertSpecies = [Species().fromSMILES(inert) for inert in ('[He]', '[Ne]', 'N#N', '[Ar]')]
+    species = Species().fromAdjacencyList(adjlist)
+    species.generate_resonance_structures()
+    for inert in _inertSpecies:
+        if inert.isIsomorphic(species):
+            species.reactive = False
+            break
+    return species
+
+class SpeciesDictionary(collections.MutableMapping):
+    """
+    A dictionary of species loaded from an RMG species dictionary, mapping
+    the species labels to the species. The adjacency list of each species is
+    only parsed, and its resonance structures generated, when the species is
+    first accessed, so that loading a large dictionary is cheap when only some
+    of its species are needed.
+    """
+
+    def __init__(self):
+        self.species = {}
+        self.adjlists = {}
+
+    def __getitem__(self, label):
+        try:
+            return self.species[label]
+        except KeyError:
+            pass
+        species = readDictionaryEntry(self.adjlists.pop(label))
+        self.species[label] = species
+        return species
+
+    def __setitem__(self, label, species):
+        self.adjlists.pop(label, None)
+        self.species[label] = species
+
+    def __delitem__(self, label):
+        if label in self.species:
+            del self.species[label]
+        else:
+            del self.adjlists[label]
+
+    def __contains__(self, label):
+        return label in self.species or label in self.adjlists
+
+    def __iter__(self):
+        return iter(self.species.keys() + self.adjlists.keys())
+
+    def __len__(self):
+        return len(self.species) + len(self.adjlists)
+
+    def addEntry(self, adjlist):
+        """
+        Add the species dictionary entry `adjlist`. Entries without a label
+        are parsed immediately, since the label can only be determined from
+        the resulting species.
+        """
+        label = getDictionaryEntryLabel(adjlist)
+        if label is None:
+            species = readDictionaryEntry(adjlist)
+            self[species.label] = species
+        else:
+            self.species.pop(label, None)
+            self.adjlists[label] = adjlist
+
+def loadSpeciesDictionary(path, lazy=False):
     """
     Load an RMG dictionary - containing species identifiers and the associated
     adjacency lists - from the file located at `path` on disk. Returns a dict
     mapping the species identifiers to the loaded species. Resonance isomers
-    for each species are automatically generated.
+    for each species are automatically generated. If `lazy` is ``True``, a
+    :class:`SpeciesDictionary` is returned instead, which only parses each
+    species when it is first accessed.
     """
+    if lazy:
+        speciesDict = SpeciesDictionary()
+        with open(path, 'r') as f:
+            for adjlist in readSpeciesDictionary(f):
+                speciesDict.addEntry(adjlist)
+        return speciesDict
+
     speciesDict = {}
-    
-    inerts = [Species().fromSMILES(inert) for inert in ('[He]', '[Ne]', 'N#N', '[Ar]')]
     with open(path, 'r') as f:
-        adjlist = ''
-        for line in f:
-            if line.strip() == '' and adjlist.strip() != '':
-                # Finish this adjacency list
-                species = Species().fromAdjacencyList(adjlist)
-                species.generate_resonance_structures()
-                label = species.label
-                for inert in inerts:
-                    if inert.isIsomorphic(species):
-                        species.reactive = False
-                        break
-                speciesDict[label] = species
-                adjlist = ''
-            else:
-                if "InChI" in line:
-                    line = line.split()[0] + '\n'
-                if '//' in line:
-                    index = line.index('//')
-                    line = line[0:index]
-                adjlist += line
-        else: #reach end of file
-            if adjlist.strip() != '':
-                species = Species().fromAdjacencyList(adjlist)
-                species.generate_resonance_structures()
-                label = species.label
-                for inert in inerts:
-                    if inert.isIsomorphic(species):
-                        species.reactive = False
-                        break
-                speciesDict[label] = species
-
+        for adjlist in readSpeciesDictionary(f):
+            species = readDictionaryEntry(adjlist)
+            speciesDict[species.label] = species
     return speciesDict
 
 def removeCommentFromLine(line):
@@ -855,17 +948,131 @@ def loadChemkinFile(path, dictionaryPath=None, transportPath=None, readComments
     # You need to append an additional adjacency list for nonreactive species, such
     # as N2, or else the species objects will not store any structures for the final
     # HTML output.
+    # Only the species listed in the Chemkin file are parsed
     if dictionaryPath:
-        speciesDict = loadSpeciesDictionary(dictionaryPath)
+        speciesDict = loadSpeciesDictionary(dictionaryPath, lazy=True)
+    
+    reactionList = _readChemkinFile(path, speciesDict, speciesAliases, speciesList, thermoPath,
+                                    lambda f: readReactionsBlock(f, speciesDict, readComments = readComments))
+    if reactionList is None:
+        reactionList = []
+
+    # Index the reactions now to have identical numbering as in Chemkin 
+    index = 0
+    for reaction in reactionList:
+        index += 1
+        reaction.index = index
+
+    # Check for marked (and unmarked!) duplicate reactions
+    # Combine marked duplicate reactions into a single reaction using MultiKinetics
+    # Raise exception for unmarked duplicate reactions
+    # Reactions can only be duplicates if they have the same reactants, products
+    # and collider, so each reaction is only compared to the later reactions
+    # in its group
+    reactionGroups = {}
+    reactionPositions = []
+    for reaction in reactionList:
+        key = (tuple([id(spec) for spec in reaction.reactants]),
+               tuple([id(spec) for spec in reaction.products]),
+               id(reaction.specificCollider))
+        group = reactionGroups.setdefault(key, [])
+        reactionPositions.append((group, len(group)))
+        group.append(reaction)
+
+    duplicateReactionsToRemove = []
+    duplicateReactionsToAdd = []
+    removedReactions = set()
+    for index1 in range(len(reactionList)):
+        reaction1 = reactionList[index1]
+        if id(reaction1) in removedReactions:
+            continue
+
+        group, position = reactionPositions[index1]
+        for reaction2 in group[position+1:]:
+            if reaction1.duplicate and reaction2.duplicate:
+
+                if isinstance(reaction1, LibraryReaction) and isinstance(reaction2, LibraryReaction):
+                    assert reaction1.library == reaction2.library
+                    if id(reaction1) not in removedReactions:
+                        # already created duplicate reaction, move on to appending any additional duplicate kinetics
+                        if isinstance(reaction1.kinetics,
+                                      _kinetics.PDepArrhenius):
+                            kinetics = _kinetics.MultiPDepArrhenius()
+                        elif isinstance(reaction1.kinetics,
+                                        _kinetics.Arrhenius):
+                            kinetics = _kinetics.MultiArrhenius()
+                        else:
+                            logging.warning('Unexpected kinetics type {0} for duplicate reaction {1}. Not combining reactions.'.format(reaction1.kinetics.__class__, reaction1))
+                            continue
+                        reaction = LibraryReaction(
+                            index = reaction1.index,
+                            reactants = reaction1.reactants,
+                            products = reaction1.products,
+                            specificCollider = reaction1.specificCollider,
+                            kinetics = kinetics,
+                            library = reaction1.library,
+                            duplicate = False,
+                        )
+                        duplicateReactionsToAdd.append(reaction)
+                        kinetics.arrhenius = [reaction1.kinetics]
+                        duplicateReactionsToRemove.append(reaction1)
+                        removedReactions.add(id(reaction1))
+
+                else:
+                    # Do not use as duplicate reactions if it's not a library reaction
+                    # Template reactions should be kept separate
+                    continue
+
+                if (isinstance(reaction.kinetics,
+                               _kinetics.MultiPDepArrhenius) and
+                        isinstance(reaction2.kinetics,
+                                   _kinetics.PDepArrhenius)):
+                    reaction.kinetics.arrhenius.append(reaction2.kinetics)
+                elif (isinstance(reaction.kinetics,
+                                 _kinetics.MultiArrhenius) and
+                          isinstance(reaction2.kinetics,
+                                     _kinetics.Arrhenius)):
+                    reaction.kinetics.arrhenius.append(reaction2.kinetics)
+                else:
+                    raise ChemkinError('Mixed kinetics for duplicate reaction {0}.'.format(reaction))
+
+                duplicateReactionsToRemove.append(reaction2)
+                removedReactions.add(id(reaction2))
+            elif reaction1.kinetics.isPressureDependent() == reaction2.kinetics.isPressureDependent():
+                # If both reactions are pressure-independent or both are pressure-dependent, then they need duplicate tags
+                # Chemkin treates pdep and non-pdep reactions as different, so those are okay
+                raise ChemkinError('Encountered unmarked duplicate reaction {0}.'.format(reaction1))
+
+    if removedReactions:
+        reactionList = [reaction for reaction in reactionList if id(reaction) not in removedReactions]
+    reactionList.extend(duplicateReactionsToAdd)
+
+    # If the transport path is given, then read it to obtain the transport
+    # properties
+    if transportPath:
+        loadTransportFile(transportPath, speciesDict)
     
+    _relabelSpecies(speciesList, speciesAliases, useChemkinNames)
+
+    reactionList.sort(key=lambda reaction: reaction.index)
+    return speciesList, reactionList
+
+def _readChemkinFile(path, speciesDict, speciesAliases, speciesList, thermoPath, readReactions):
+    """
+    Read the species and thermo blocks of the Chemkin file at `path`, updating
+    `speciesDict`, `speciesAliases` and `speciesList`, and the thermo file at
+    `thermoPath` if one is given. The reactions block is read by calling
+    `readReactions` with the file positioned just before the 'REACTIONS'
+    statement, and the result of the call is returned (``None`` if the file
+    has no reactions block).
+    """
+    result = None
     with open(path, 'r+b') as f:
     
         line0 = f.readline()
         while line0 != '':        
             line = removeCommentFromLine(line0)[0]
             line = line.strip()
-            tokens = line.split()
-            tokens_upper = line.upper().split()
             
             if 'SPECIES' in line.upper():
                 # Unread the line (we'll re-read it in readReactionBlock())
@@ -882,7 +1089,7 @@ def loadChemkinFile(path, dictionaryPath=None, transportPath=None, readComments
                 # Reactions section
                 # Unread the line (we'll re-read it in readReactionBlock())
                 f.seek(-len(line0), 1)
-                reactionList = readReactionsBlock(f, speciesDict, readComments = readComments)
+                result = readReactions(f)
                     
             line0 = f.readline()
             
@@ -898,86 +1105,14 @@ def loadChemkinFile(path, dictionaryPath=None, transportPath=None, readComments
                     readThermoBlock(f, speciesDict)  
                     break
                 line0 = f.readline()
-    # Index the reactions now to have identical numbering as in Chemkin 
-    index = 0
-    for reaction in reactionList:
-        index += 1
-        reaction.index = index
+    return result
 
-    # Check for marked (and unmarked!) duplicate reactions
-    # Combine marked duplicate reactions into a single reaction using MultiKinetics
-    # Raise exception for unmarked duplicate reactions
-    duplicateReactionsToRemove = []
-    duplicateReactionsToAdd = []
-    for index1 in range(len(reactionList)):
-        reaction1 = reactionList[index1]
-        if reaction1 in duplicateReactionsToRemove:
-            continue
-
-        for index2 in range(index1+1, len(reactionList)):
-            reaction2 = reactionList[index2]
-            if reaction1.reactants == reaction2.reactants and reaction1.products == reaction2.products and reaction1.specificCollider == reaction2.specificCollider:
-                if reaction1.duplicate and reaction2.duplicate:
-                    
-                    if isinstance(reaction1, LibraryReaction) and isinstance(reaction2, LibraryReaction):
-                        assert reaction1.library == reaction2.library
-                        if reaction1 not in duplicateReactionsToRemove:
-                            # already created duplicate reaction, move on to appending any additional duplicate kinetics
-                            if isinstance(reaction1.kinetics,
-                                          _kinetics.PDepArrhenius):
-                                kinetics = _kinetics.MultiPDepArrhenius()
-                            elif isinstance(reaction1.kinetics,
-                                            _kinetics.Arrhenius):
-                                kinetics = _kinetics.MultiArrhenius()
-                            else:
-                                logging.warning('Unexpected kinetics type {0} for duplicate reaction {1}. Not combining reactions.'.format(reaction1.kinetics.__class__, reaction1))
-                                continue
-                            reaction = LibraryReaction(
-                                index = reaction1.index,
-                                reactants = reaction1.reactants,
-                                products = reaction1.products,
-                                specificCollider = reaction1.specificCollider,
-                                kinetics = kinetics,
-                                library = reaction1.library,
-                                duplicate = False,
-                            )
-                            duplicateReactionsToAdd.append(reaction)
-                            kinetics.arrhenius = [reaction1.kinetics]
-                            duplicateReactionsToRemove.append(reaction1)
-
-                    else:
-                        # Do not use as duplicate reactions if it's not a library reaction
-                        # Template reactions should be kept separate
-                        continue
-                    
-                    if (isinstance(reaction.kinetics,
-                                   _kinetics.MultiPDepArrhenius) and
-                            isinstance(reaction2.kinetics,
-                                       _kinetics.PDepArrhenius)):
-                        reaction.kinetics.arrhenius.append(reaction2.kinetics)
-                    elif (isinstance(reaction.kinetics,
-                                     _kinetics.MultiArrhenius) and
-                              isinstance(reaction2.kinetics,
-                                         _kinetics.Arrhenius)):
-                        reaction.kinetics.arrhenius.append(reaction2.kinetics)
-                    else:
-                        raise ChemkinError('Mixed kinetics for duplicate reaction {0}.'.format(reaction))
-                    
-                    duplicateReactionsToRemove.append(reaction2)
-                elif reaction1.kinetics.isPressureDependent() == reaction2.kinetics.isPressureDependent():
-                    # If both reactions are pressure-independent or both are pressure-dependent, then they need duplicate tags
-                    # Chemkin treates pdep and non-pdep reactions as different, so those are okay
-                    raise ChemkinError('Encountered unmarked duplicate reaction {0}.'.format(reaction1))
-                    
-    for reaction in duplicateReactionsToRemove:
-        reactionList.remove(reaction)
-    reactionList.extend(duplicateReactionsToAdd)
-
-    # If the transport path is given, then read it to obtain the transport
-    # properties
-    if transportPath:
-        loadTransportFile(transportPath, speciesDict)
-    
+def _relabelSpecies(speciesList, speciesAliases, useChemkinNames=False):
+    """
+    Relabel the species in `speciesList` read from a Chemkin file using the
+    `speciesAliases` found in its species block, unless `useChemkinNames` is
+    ``True``, and extract the species indices from their labels.
+    """
     if not useChemkinNames:
         # Apply species aliases if known
         for spec in speciesList:
@@ -994,10 +1129,6 @@ def loadChemkinFile(path, dictionaryPath=None, transportPath=None, readComments
             spec.label = label
             spec.index = int(index)
 
-    reactionList.sort(key=lambda reaction: reaction.index)
-    return speciesList, reactionList
-
-
 def readSpeciesBlock(f, speciesDict, speciesAliases, speciesList):
     """
     Read a Species block from a chemkin file.
@@ -1154,6 +1285,31 @@ def readReactionsBlock(f, speciesDict, readComments = True):
     This function can also read the ``reactions.txt`` and ``pdepreactions.txt``
     files from RMG-Java kinetics libraries, which have a similar syntax.
     """    
+    return list(iterReactionsBlock(f, speciesDict, readComments=readComments))
+
+def iterReactionsBlock(f, speciesDict, readComments = True):
+    """
+    Read a reactions block from a Chemkin file stream, yielding each reaction
+    as it is parsed. The text of the block is split into reaction entries
+    first, but the (much more expensive) parsing of each entry into a reaction
+    is only done as the reactions are requested.
+    """
+    Aunits, Eunits = readReactionsBlockUnits(f)
+    records = _readReactionRecords(f)
+    for kineticsIndex, commentsIndex in _pairReactionRecords(records):
+        kinetics = records[kineticsIndex][0]
+        comments = records[commentsIndex][1] if commentsIndex is not None else ''
+        reaction = _readReaction(kinetics, comments, speciesDict, Aunits, Eunits, readComments)
+        if reaction is not None:
+            yield reaction
+
+def readReactionsBlockUnits(f):
+    """
+    Read the header of a reactions block from a Chemkin file stream, and
+    return the units of the preexponential factors (as a list indexed by
+    reaction order) and of the activation energies. When finished, `f` is
+    positioned at the start of the first reaction.
+    """
     energyUnits = 'cal/mol'
     moleculeUnits = 'moles'
     volumeUnits = 'cm3'
@@ -1233,55 +1389,87 @@ def readReactionsBlock(f, speciesDict, readComments = True):
     ]
     Eunits = energyUnits
     
-    kineticsList = []
-    commentsList = []
+    return Aunits, Eunits
+
+def _readReactionsBlockLine(line):
+    """
+    Split a `line` of a reactions block into its data and comment parts.
+    Returns whether the whole line is a comment, the data and the comment.
+    """
+    lineStartsWithComment = line.lstrip().startswith('!') or line.lstrip().startswith('//')
+    line, comment = removeCommentFromLine(line)
+    return lineStartsWithComment, line.strip(), comment.strip()
+
+def _readReactionRecords(f):
+    """
+    Split the remainder of a reactions block from a Chemkin file stream into
+    records, each starting with a reaction equation. Returns a list of
+    ``(kinetics, comments, start, end)`` tuples containing the data and
+    comment lines of each record and the byte offsets at which the record
+    starts and ends in the stream.
+    """
+    records = []
     kinetics = ''
     comments = ''
+    start = offset = f.tell()
     
     line = f.readline()
     while line != '':
-
-        lineStartsWithComment = line.lstrip().startswith('!') or line.lstrip().startswith('//')
-        line, comment = removeCommentFromLine(line)
-        line = line.strip(); comment = comment.strip()
+        lineStartsWithComment, data, comment = _readReactionsBlockLine(line)
     
-        if 'end' in line or 'END' in line:
+        if 'end' in data or 'END' in data:
             break
 
-        # if 'rev' in line or 'REV' in line:
-            # can no longer name reactants rev...
-        #    line = f.readline()
-        #    continue  # need to re-do the comment stripping!
-
-        if '=' in line and not lineStartsWithComment:
+        if '=' in data and not lineStartsWithComment:
             # Finish previous record
-            kineticsList.append(kinetics)
-            commentsList.append(comments)
+            records.append((kinetics, comments, start, offset))
             kinetics = ''
             comments = ''
+            start = offset
             
-        if line: kinetics += line + '\n'
+        if data: kinetics += data + '\n'
         if comment: comments += comment + '\n'
         
+        offset += len(line)
         line = f.readline()
         
     # Don't forget the last reaction!
     if kinetics.strip() != '':
-        kineticsList.append(kinetics)
-        commentsList.append(comments)
+        records.append((kinetics, comments, start, offset))
     
-    if len(kineticsList) == 0 and len(commentsList) == 0:
+    return records
+
+def _splitReactionRecord(text):
+    """
+    Return the data and comment lines of a single reaction record `text`, as
+    located by :func:`_readReactionRecords`.
+    """
+    kinetics = ''
+    comments = ''
+    for line in text.splitlines(True):
+        lineStartsWithComment, data, comment = _readReactionsBlockLine(line)
+        if data: kinetics += data + '\n'
+        if comment: comments += comment + '\n'
+    return kinetics, comments
+
+def _pairReactionRecords(records):
+    """
+    Match the kinetics of each reaction to its comments in the `records` of a
+    reactions block. Returns a list of ``(kineticsIndex, commentsIndex)``
+    pairs of record indices, where `commentsIndex` is ``None`` if the comments
+    of the reaction could not be identified.
+    """
+    if len(records) == 0:
         # No reactions found
-        pass
-    elif kineticsList[0] == '' and commentsList[-1] == '':
-        # True for Chemkin files generated from RMG-Py
-        kineticsList.pop(0)
-        commentsList.pop(-1)
-    elif kineticsList[0] == '' and commentsList[0] == '':
+        return []
+    elif records[0][0] == '' and records[-1][1] == '':
+        # True for Chemkin files generated from RMG-Py, in which the comments
+        # precede the reaction they apply to
+        return [(index + 1, index) for index in range(len(records) - 1)]
+    elif records[0][0] == '' and records[0][1] == '':
         # True for Chemkin files generated from RMG-Java
-        kineticsList.pop(0)
-        commentsList.pop(0)
-    else:
+        return [(index, index) for index in range(1, len(records))]
+    elif records[0][0] == '':
         # In reality, comments can occur anywhere in the Chemkin
         # file (e.g. either or both of before and after the
         # reaction equation)
@@ -1289,26 +1477,130 @@ def readReactionsBlock(f, speciesDict, readComments = True):
         # throw the comments away
         # (This is better than failing to load the Chemkin file at
         # all, which would likely occur otherwise)
-        if kineticsList[0] == '':
-            kineticsList.pop(0)
-        if len(kineticsList) != len(commentsList):
-            logging.warning("Discarding comments from Chemkin file because not sure which reaction they apply to")
-            commentsList = ['' for kinetics in kineticsList]
-        
-    reactionList = []
-    for kinetics, comments in zip(kineticsList, commentsList):
-        try:
-            reaction = readKineticsEntry(kinetics, speciesDict, Aunits, Eunits)
-            reaction = readReactionComments(reaction, comments, read = readComments)
-        except ChemkinError, e:
-            if e.message == "Skip reaction!":
-                logging.warning("Skipping the reaction {0!r}".format(kinetics))
-                continue
-            else:
-                raise e
-        reactionList.append(reaction)
-        
-    return reactionList
+        logging.warning("Discarding comments from Chemkin file because not sure which reaction they apply to")
+        return [(index, None) for index in range(1, len(records))]
+    else:
+        return [(index, index) for index in range(len(records))]
+
+def _readReaction(kinetics, comments, speciesDict, Aunits, Eunits, readComments=True):
+    """
+    Return the reaction described by the `kinetics` and `comments` of an entry
+    in a reactions block, or ``None`` if the reaction is to be skipped.
+    """
+    try:
+        reaction = readKineticsEntry(kinetics, speciesDict, Aunits, Eunits)
+        reaction = readReactionComments(reaction, comments, read = readComments)
+    except ChemkinError, e:
+        if e.message == "Skip reaction!":
+            logging.warning("Skipping the reaction {0!r}".format(kinetics))
+            return None
+        else:
+            raise e
+    return reaction
+
+class ChemkinFileIndex(object):
+    """
+    A byte-offset index of the reactions in a Chemkin file, providing random
+    access to the reactions of a large mechanism. The species and thermo
+    blocks are read when the index is built, but the reactions block is only
+    scanned to locate the entry of each reaction, which is then parsed from
+    the file each time the reaction is requested. The attributes are:
+
+    =============== ============================================================
+    Attribute       Description
+    =============== ============================================================
+    `path`          The path of the Chemkin file
+    `speciesList`   The species declared in the Chemkin file
+    `speciesDict`   A dictionary of the species by their Chemkin names
+    `readComments`  ``True`` to parse the RMG comments of the reactions
+    `offsets`       The byte offsets of the kinetics and comments of each reaction
+    =============== ============================================================
+
+    Unlike :func:`loadChemkinFile`, duplicate reactions are not combined, and
+    the reactions are numbered by their position in the file. Reactions which
+    the parser skips are returned as ``None`` by :meth:`getReaction`.
+    """
+
+    def __init__(self, path, dictionaryPath=None, thermoPath=None, readComments=True, useChemkinNames=False):
+        self.path = path
+        self.readComments = readComments
+        self.speciesList = []
+        self.speciesDict = loadSpeciesDictionary(dictionaryPath, lazy=True) if dictionaryPath else {}
+        self.offsets = []
+        self.Aunits = None
+        self.Eunits = None
+        speciesAliases = {}
+        _readChemkinFile(path, self.speciesDict, speciesAliases, self.speciesList, thermoPath, self._indexReactions)
+        _relabelSpecies(self.speciesList, speciesAliases, useChemkinNames)
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def __getitem__(self, index):
+        return self.getReaction(index)
+
+    def __iter__(self):
+        """
+        Iterate over the reactions in the file, skipping those which the
+        parser skips.
+        """
+        with open(self.path, 'rb') as f:
+            for index in range(len(self.offsets)):
+                reaction = self._readReaction(f, index)
+                if reaction is not None:
+                    yield reaction
+
+    def _indexReactions(self, f):
+        """
+        Locate the entries in the reactions block of the Chemkin file stream
+        `f`, which is positioned just before the 'REACTIONS' statement.
+        """
+        self.Aunits, self.Eunits = readReactionsBlockUnits(f)
+        records = _readReactionRecords(f)
+        self.offsets = []
+        for kineticsIndex, commentsIndex in _pairReactionRecords(records):
+            kineticsSpan = records[kineticsIndex][2:4]
+            commentsSpan = records[commentsIndex][2:4] if commentsIndex is not None else None
+            self.offsets.append((kineticsSpan, commentsSpan))
+
+    def _readEntry(self, f, index):
+        """
+        Return the kinetics and comments text of reaction `index` from the
+        Chemkin file stream `f`.
+        """
+        kineticsSpan, commentsSpan = self.offsets[index]
+        f.seek(kineticsSpan[0])
+        kinetics = _splitReactionRecord(f.read(kineticsSpan[1] - kineticsSpan[0]))[0]
+        if commentsSpan is None:
+            comments = ''
+        else:
+            f.seek(commentsSpan[0])
+            comments = _splitReactionRecord(f.read(commentsSpan[1] - commentsSpan[0]))[1]
+        return kinetics, comments
+
+    def _readReaction(self, f, index):
+        kinetics, comments = self._readEntry(f, index)
+        reaction = _readReaction(kinetics, comments, self.speciesDict, self.Aunits, self.Eunits, self.readComments)
+        if reaction is not None:
+            reaction.index = index + 1
+        return reaction
+
+    def getReaction(self, index):
+        """
+        Parse and return the reaction at position `index` in the file.
+        """
+        if index < 0:
+            index += len(self.offsets)
+        with open(self.path, 'rb') as f:
+            return self._readReaction(f, index)
+
+    def getComments(self, index):
+        """
+        Return the unparsed comments of the reaction at position `index` in
+        the file.
+        """
+        with open(self.path, 'rb') as f:
+            return self._readEntry(f, index)[1]
 
 ################################################################################
 
@@ -1773,30 +2065,47 @@ def markDuplicateReactions(reactions):
         markDuplicateReaction(reaction1, remainingList)
  
 
-def saveSpeciesDictionary(path, species, oldStyle=False):
+def saveSpeciesDictionary(path, species, oldStyle=False, cache=None):
     """
     Save the given list of `species` as adjacency lists in a text file `path` 
     on disk.
     
     If `oldStyle==True` then it saves it in the old RMG-Java syntax.
     """
+    if not oldStyle:
+        string = renderSpeciesDictionary(species, cache=cache)
+        with open(path, 'w') as f:
+            f.write(string)
+        return
     with open(path, 'w') as f:
         for spec in species:
-            if oldStyle:
-                try:
-                    f.write(spec.molecule[0].toAdjacencyList(label=getSpeciesIdentifier(spec), removeH=True, oldStyle=True))
-                except:
-                    newAdjList = spec.molecule[0].toAdjacencyList(label=getSpeciesIdentifier(spec), removeH=False)
-                    f.write("// Couldn't save {0} in old RMG-Java syntax, but here it is in newer RMG-Py syntax:".format(getSpeciesIdentifier(spec)))
-                    f.write("\n// " + "\n// ".join(newAdjList.splitlines()) + '\n')
-            else:
-                try:
-                    f.write(spec.molecule[0].toAdjacencyList(label=getSpeciesIdentifier(spec), removeH=False))
-                except:
-                    raise ChemkinError('Ran into error saving dictionary for species {0}. Please check your files.'.format(getSpeciesIdentifier(spec)))
+            try:
+                f.write(spec.molecule[0].toAdjacencyList(label=getSpeciesIdentifier(spec), removeH=True, oldStyle=True))
+            except:
+                newAdjList = spec.molecule[0].toAdjacencyList(label=getSpeciesIdentifier(spec), removeH=False)
+                f.write("// Couldn't save {0} in old RMG-Java syntax, but here it is in newer RMG-Py syntax:".format(getSpeciesIdentifier(spec)))
+                f.write("\n// " + "\n// ".join(newAdjList.splitlines()) + '\n')
             f.write('\n')
 
-def saveTransportFile(path, species):
+def writeDictionaryEntry(species):
+    """
+    Return the adjacency list of `species` as written to a species dictionary.
+    """
+    try:
+        return species.molecule[0].toAdjacencyList(label=getSpeciesIdentifier(species), removeH=False) + '\n'
+    except:
+        raise ChemkinError('Ran into error saving dictionary for species {0}. Please check your files.'.format(getSpeciesIdentifier(species)))
+
+def renderSpeciesDictionary(species, cache=None):
+    """
+    Return the contents of a species dictionary for the given list of
+    `species` as a string, reusing unchanged entries from `cache` if given.
+    """
+    if cache is None:
+        return ''.join([writeDictionaryEntry(spec) for spec in species])
+    return ''.join([cache.getDictionaryEntry(spec) for spec in species])
+
+def saveTransportFile(path, species, cache=None):
     r"""
     Save a Chemkin transport properties file to `path` on disk containing the
     transport properties of the given list of `species`.
@@ -1818,68 +2127,103 @@ def saveTransportFile(path, species):
     7. After the last number, a comment field can be enclosed in parenthesis.
 
     """
-
+    string = renderTransportFile(species, cache=cache)
     with open(path, 'w') as f:
-        f.write("! {0:15} {1:8} {2:9} {3:9} {4:9} {5:9} {6:9} {7:9}\n".format('Species','Shape', 'LJ-depth', 'LJ-diam', 'DiplMom', 'Polzblty', 'RotRelaxNum','Data'))
-        f.write("! {0:15} {1:8} {2:9} {3:9} {4:9} {5:9} {6:9} {7:9}\n".format('Name','Index', 'epsilon/k_B', 'sigma', 'mu', 'alpha', 'Zrot','Source'))
-        for spec in species:
-            transportData = spec.getTransportData()
-            if (not transportData):
-                missingData = True
-            else:
-                missingData = False
-            
-            label = getSpeciesIdentifier(spec)
-            
-            if missingData:
-                f.write('! {0:19s} {1!r}\n'.format(label, transportData))
-            else:
-                f.write('{0:19} {1:d}   {2:9.3f} {3:9.3f} {4:9.3f} {5:9.3f} {6:9.3f}    ! {7:s}\n'.format(
-                    label,
-                    transportData.shapeIndex,
-                    transportData.epsilon.value_si / constants.R,
-                    transportData.sigma.value_si * 1e10,
-                    (transportData.dipoleMoment.value_si * constants.c * 1e21 if transportData.dipoleMoment else 0),
-                    (transportData.polarizability.value_si * 1e30 if transportData.polarizability else 0),
-                    (transportData.rotrelaxcollnum if transportData.rotrelaxcollnum else 0),
-                    transportData.comment,
-                ))
-
-def saveChemkinFile(path, species, reactions, verbose = True, checkForDuplicates=True):
+        f.write(string)
+
+def renderTransportFile(species, cache=None):
+    """
+    Return the contents of a Chemkin transport properties file for the given
+    list of `species` as a string, reusing unchanged entries from `cache` if
+    given.
+    """
+    lines = []
+    lines.append("! {0:15} {1:8} {2:9} {3:9} {4:9} {5:9} {6:9} {7:9}\n".format('Species','Shape', 'LJ-depth', 'LJ-diam', 'DiplMom', 'Polzblty', 'RotRelaxNum','Data'))
+    lines.append("! {0:15} {1:8} {2:9} {3:9} {4:9} {5:9} {6:9} {7:9}\n".format('Name','Index', 'epsilon/k_B', 'sigma', 'mu', 'alpha', 'Zrot','Source'))
+    for spec in species:
+        if cache is None:
+            lines.append(writeTransportEntry(spec))
+        else:
+            lines.append(cache.getTransportEntry(spec))
+    return ''.join(lines)
+
+def writeTransportEntry(species):
+    """
+    Return the line of a Chemkin transport properties file for `species`.
+    """
+    transportData = species.getTransportData()
+    if (not transportData):
+        missingData = True
+    else:
+        missingData = False
+    
+    label = getSpeciesIdentifier(species)
+    
+    if missingData:
+        return '! {0:19s} {1!r}\n'.format(label, transportData)
+    else:
+        return '{0:19} {1:d}   {2:9.3f} {3:9.3f} {4:9.3f} {5:9.3f} {6:9.3f}    ! {7:s}\n'.format(
+            label,
+            transportData.shapeIndex,
+            transportData.epsilon.value_si / constants.R,
+            transportData.sigma.value_si * 1e10,
+            (transportData.dipoleMoment.value_si * constants.c * 1e21 if transportData.dipoleMoment else 0),
+            (transportData.polarizability.value_si * 1e30 if transportData.polarizability else 0),
+            (transportData.rotrelaxcollnum if transportData.rotrelaxcollnum else 0),
+            transportData.comment,
+        )
+
+def saveChemkinFile(path, species, reactions, verbose = True, checkForDuplicates=True, cache=None):
     """
     Save a Chemkin input file to `path` on disk containing the provided lists
     of `species` and `reactions`.
     If checkForDuplicates is False then we don't check for unlabeled duplicate reactions,
     thus saving time (eg. if you are sure you've already labeled them as duplicate).
+    If a :class:`ChemkinBlockCache` is given as `cache`, entries that have not
+    changed since they were last rendered are reused from it.
     """
     # Check for duplicate
     if checkForDuplicates:
         markDuplicateReactions(reactions)
-    
-    f = open(path, 'w')
+
+    string = renderChemkinFile(species, reactions, verbose=verbose, cache=cache)
+    with open(path, 'w') as f:
+        f.write(string)
+
+def renderChemkinFile(species, reactions, verbose=True, cache=None):
+    """
+    Return the contents of a Chemkin input file containing the provided lists
+    of `species` and `reactions` as a string. If a :class:`ChemkinBlockCache`
+    is given as `cache`, the thermo and kinetics entries are taken from it
+    rather than being regenerated.
+    """
+    lines = []
     
     sorted_species = sorted(species, key=lambda species: species.index)
 
     # Elements section
-    writeElementsSection(f)
+    lines.append(getElementsSection())
 
     # Species section
-    f.write('SPECIES\n')
+    lines.append('SPECIES\n')
     for spec in sorted_species:
         label = getSpeciesIdentifier(spec)
         if verbose:
-            f.write('    {0!s:<16}    ! {1}\n'.format(label, str(spec)))
+            lines.append('    {0!s:<16}    ! {1}\n'.format(label, str(spec)))
         else:
-            f.write('    {0!s:<16}\n'.format(label))
-    f.write('END\n\n\n\n')
+            lines.append('    {0!s:<16}\n'.format(label))
+    lines.append('END\n\n\n\n')
 
     # Thermodynamics section
-    f.write('THERM ALL\n')
-    f.write('    300.000  1000.000  5000.000\n\n')
+    lines.append('THERM ALL\n')
+    lines.append('    300.000  1000.000  5000.000\n\n')
     for spec in sorted_species:
-        f.write(writeThermoEntry(spec, verbose=verbose))
-        f.write('\n')
-    f.write('END\n\n\n\n')
+        if cache is None:
+            lines.append(writeThermoEntry(spec, verbose=verbose))
+        else:
+            lines.append(cache.getThermoEntry(spec, verbose=verbose))
+        lines.append('\n')
+    lines.append('END\n\n\n\n')
 
     ## Transport section would go here
     #f.write('TRANSPORT\n')
@@ -1889,17 +2233,26 @@ def saveChemkinFile(path, species, reactions, verbose = True, checkForDuplicates
     #f.write('END\n\n')
 
     # Reactions section
-    f.write('REACTIONS    KCAL/MOLE   MOLES\n\n')
+    lines.append('REACTIONS    KCAL/MOLE   MOLES\n\n')
     global __chemkin_reaction_count
     __chemkin_reaction_count = 0
     for rxn in reactions:
-        f.write(writeKineticsEntry(rxn, speciesList=species, verbose=verbose))
+        if cache is None:
+            lines.append(writeKineticsEntry(rxn, speciesList=species, verbose=verbose))
+        else:
+            segments, count = cache.getKineticsEntry(rxn, speciesList=species, verbose=verbose)
+            # Fill in the Chemkin reaction indices for this position in the file
+            lines.append(segments[0])
+            for i in range(1, len(segments)):
+                lines.append('{0:d}'.format(__chemkin_reaction_count + i))
+                lines.append(segments[i])
+            __chemkin_reaction_count += count
         # Don't forget to mark duplicates!
-        f.write('\n')
-    f.write('END\n\n')
-    f.close()
+        lines.append('\n')
+    lines.append('END\n\n')
     logging.info("Chemkin file contains {0} reactions.".format(__chemkin_reaction_count))
     __chemkin_reaction_count = None
+    return ''.join(lines)
 
 def saveJavaKineticsLibrary(path, species, reactions):
     """
@@ -1941,39 +2294,69 @@ def saveJavaKineticsLibrary(path, species, reactions):
     
     saveSpeciesDictionary(os.path.join(path, 'species.txt'), species, oldStyle=True)
 
-def saveChemkin(reactionModel, path, verbose_path, dictionaryPath=None, transportPath=None, saveEdgeSpecies=False):
+def saveChemkin(reactionModel, path, verbose_path, dictionaryPath=None, transportPath=None, saveEdgeSpecies=False, cache=None):
     """
     Save a Chemkin file for the current model as well as any desired output
     species and reactions to `path`. If `saveEdgeSpecies` is True, then 
     a chemkin file and dictionary file for the core and edge species and reactions
     will be saved.  
     """
-    
+    files = renderChemkin(reactionModel, path, verbose_path, dictionaryPath, transportPath, saveEdgeSpecies, cache)
+    writeOutputFiles(files)
+
+def renderChemkin(reactionModel, path, verbose_path, dictionaryPath=None, transportPath=None, saveEdgeSpecies=False, cache=None):
+    """
+    Generate the files written by :func:`saveChemkin` without writing them.
+    Returns a list of ``(path, contents)`` tuples.
+    """
     if saveEdgeSpecies == False:
         speciesList = reactionModel.core.species + reactionModel.outputSpeciesList
         rxnList = reactionModel.core.reactions + reactionModel.outputReactionList
-        saveChemkinFile(path, speciesList, rxnList, verbose = False, checkForDuplicates=False) # We should already have marked everything as duplicates by now        
-        logging.info('Saving current model to verbose Chemkin file...')
-        saveChemkinFile(verbose_path, speciesList, rxnList, verbose = True, checkForDuplicates=False)
-        if dictionaryPath:
-            saveSpeciesDictionary(dictionaryPath, speciesList)
-        if transportPath:
-            saveTransportFile(transportPath, speciesList)
-        
     else:
         speciesList = reactionModel.core.species + reactionModel.edge.species
         rxnList = reactionModel.core.reactions + reactionModel.edge.reactions
-        saveChemkinFile(path, speciesList, rxnList, verbose = False, checkForDuplicates=False)        
+
+    # We should already have marked everything as duplicates by now
+    files = [(path, renderChemkinFile(speciesList, rxnList, verbose=False, cache=cache))]
+    if saveEdgeSpecies == False:
+        logging.info('Saving current model to verbose Chemkin file...')
+    else:
         logging.info('Saving current core and edge to verbose Chemkin file...')
-        saveChemkinFile(verbose_path, speciesList, rxnList, verbose = True, checkForDuplicates=False)
-        if dictionaryPath:
-            saveSpeciesDictionary(dictionaryPath, speciesList)
-        if transportPath:
-            saveTransportFile(transportPath, speciesList)
+    files.append((verbose_path, renderChemkinFile(speciesList, rxnList, verbose=True, cache=cache)))
+    if dictionaryPath:
+        files.append((dictionaryPath, renderSpeciesDictionary(speciesList, cache=cache)))
+    if transportPath:
+        files.append((transportPath, renderTransportFile(speciesList, cache=cache)))
+    return files
 
-def saveChemkinFiles(rmg):
+def writeOutputFiles(files, copies=None):
+    """
+    Write each ``(path, contents)`` pair in `files` to disk, then copy each
+    ``(source, destination)`` pair in `copies`, replacing the destination.
+    """
+    for path, contents in files:
+        with open(path, 'w') as f:
+            f.write(contents)
+    for source, destination in (copies or []):
+        if os.path.exists(destination):
+            os.unlink(destination)
+        shutil.copy2(source, destination)
+
+def saveChemkinFiles(rmg, cache=None):
     """
     Save the current reaction model to a set of Chemkin files.
+
+    Unchanged entries are reused from the :class:`ChemkinBlockCache` `cache`
+    if one is given.
+    """
+    files, copies = renderChemkinFiles(rmg, cache)
+    writeOutputFiles(files, copies)
+
+def renderChemkinFiles(rmg, cache=None):
+    """
+    Generate the files written by :func:`saveChemkinFiles` without writing
+    them. Returns a list of ``(path, contents)`` tuples to write and a list of
+    ``(source, destination)`` tuples to copy afterwards.
     """        
     logging.info('Saving current model core to Chemkin file...')
     this_chemkin_path = os.path.join(rmg.outputDirectory, 'chemkin', 'chem{0:04d}.inp'.format(len(rmg.reactionModel.core.species)))
@@ -1981,10 +2364,8 @@ def saveChemkinFiles(rmg):
     latest_chemkin_verbose_path = os.path.join(rmg.outputDirectory, 'chemkin', 'chem_annotated.inp')
     latest_dictionary_path = os.path.join(rmg.outputDirectory, 'chemkin','species_dictionary.txt')
     latest_transport_path = os.path.join(rmg.outputDirectory, 'chemkin', 'tran.dat')
-    saveChemkin(rmg.reactionModel, this_chemkin_path, latest_chemkin_verbose_path, latest_dictionary_path, latest_transport_path, False)
-    if os.path.exists(latest_chemkin_path):
-        os.unlink(latest_chemkin_path)
-    shutil.copy2(this_chemkin_path,latest_chemkin_path)
+    files = renderChemkin(rmg.reactionModel, this_chemkin_path, latest_chemkin_verbose_path, latest_dictionary_path, latest_transport_path, False, cache)
+    copies = [(this_chemkin_path, latest_chemkin_path)]
     
     if rmg.saveEdgeSpecies == True:
         logging.info('Saving current model core and edge to Chemkin file...')
@@ -1993,10 +2374,10 @@ def saveChemkinFiles(rmg):
         latest_chemkin_verbose_path = os.path.join(rmg.outputDirectory, 'chemkin', 'chem_edge_annotated.inp')
         latest_dictionary_path = os.path.join(rmg.outputDirectory, 'chemkin','species_edge_dictionary.txt')
         latest_transport_path = None
-        saveChemkin(rmg.reactionModel, this_chemkin_path, latest_chemkin_verbose_path, latest_dictionary_path, latest_transport_path, rmg.saveEdgeSpecies)
-        if os.path.exists(latest_chemkin_path):
-            os.unlink(latest_chemkin_path)
-        shutil.copy2(this_chemkin_path,latest_chemkin_path)
+        files.extend(renderChemkin(rmg.reactionModel, this_chemkin_path, latest_chemkin_verbose_path, latest_dictionary_path, latest_transport_path, rmg.saveEdgeSpecies, cache))
+        copies.append((this_chemkin_path, latest_chemkin_path))
+
+    return files, copies
 
 def writeElementsSection(f):
     """
@@ -2004,6 +2385,12 @@ def writeElementsSection(f):
     all elements and isotopes available in RMG. It may become useful in the future
     to only include elements/isotopes present in the current RMG run. 
     """
+    f.write(getElementsSection())
+
+def getElementsSection():
+    """
+    Return the ELEMENTS section of the chemkin file as a string.
+    """
 
     s = 'ELEMENTS\n'
 
@@ -2020,8 +2407,141 @@ def writeElementsSection(f):
             s += '\t' + el + '\n'
     s += 'END\n\n'
 
-    f.write(s)
+    return s
+
 
+################################################################################
+
+_chemkinIndexPattern = re.compile(r'(?<=^! Reaction index: Chemkin #)\d+(?=; RMG #)', re.MULTILINE)
+
+def _writeKineticsEntrySegments(reaction, speciesList, verbose):
+    """
+    Return the Chemkin entry for `reaction` split into the text segments that
+    fall around its Chemkin reaction indices, together with the number of
+    Chemkin reactions in the entry. This allows the entry to be numbered
+    wherever it ends up in the file without having to be regenerated.
+    """
+    global __chemkin_reaction_count
+    count = __chemkin_reaction_count
+    __chemkin_reaction_count = 0
+    try:
+        string = writeKineticsEntry(reaction, speciesList=speciesList, verbose=verbose)
+        numReactions = __chemkin_reaction_count
+    finally:
+        __chemkin_reaction_count = count
+    return _chemkinIndexPattern.split(string), numReactions
+
+class ChemkinBlockCache(object):
+    """
+    A cache of the rendered text entries that make up the Chemkin, species
+    dictionary and transport files of a model, so that the files can be
+    reassembled after each iteration without reformatting every species and
+    reaction.
+
+    Each entry is stored along with the objects and values it was generated
+    from, and is regenerated as soon as any of them changes (e.g. the species
+    gets new thermo data or a new label, or the reaction gets new kinetics).
+    Entries that are not requested between two calls to :meth:`expire` are
+    dropped, so species and reactions removed from the model do not build up.
+    """
+
+    def __init__(self):
+        self.thermo = {}
+        self.kinetics = {}
+        self.dictionary = {}
+        self.transport = {}
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    def expire(self):
+        """
+        Drop all entries that were not used since the previous call to this
+        method, and start a new generation.
+        """
+        for cache in (self.thermo, self.kinetics, self.dictionary, self.transport):
+            for key in [key for key, entry in cache.iteritems() if entry[0] < self.generation]:
+                del cache[key]
+        self.generation += 1
+
+    def _get(self, cache, key, objects, values, render):
+        """
+        Return the entry stored in `cache` under `key` if it was generated
+        from the same `objects` (compared by identity) and `values` (compared
+        by equality), or generate it by calling `render` otherwise.
+        """
+        entry = cache.get(key)
+        if (entry is not None and entry[3] == values and len(entry[2]) == len(objects)
+                and all([obj1 is obj2 for obj1, obj2 in zip(entry[2], objects)])):
+            self.hits += 1
+            entry[0] = self.generation
+            return entry[1]
+        self.misses += 1
+        result = render()
+        # The objects are kept alive by the entry, so their ids cannot be reused
+        cache[key] = [self.generation, result, objects, values]
+        return result
+
+    def getThermoEntry(self, species, verbose=True):
+        """
+        Return the Chemkin thermo entry for `species`, as generated by
+        :func:`writeThermoEntry`.
+        """
+        thermo = species.getThermoData()
+        molecule = species.molecule[0] if species.molecule else None
+        return self._get(self.thermo, (id(species), verbose), 
+            (species, thermo, molecule),
+            (getSpeciesIdentifier(species), getattr(thermo, 'comment', None)),
+            lambda: writeThermoEntry(species, verbose=verbose))
+
+    def getKineticsEntry(self, reaction, speciesList, verbose=True):
+        """
+        Return the Chemkin kinetics entry for `reaction`, as generated by
+        :func:`writeKineticsEntry`, split into the text segments that fall
+        around its Chemkin reaction indices, together with the number of
+        Chemkin reactions in the entry.
+        """
+        kinetics = reaction.kinetics
+        if isinstance(kinetics, (_kinetics.ThirdBody, _kinetics.Lindemann, _kinetics.Troe)):
+            # The collider efficiencies written depend on the whole species list
+            return _writeKineticsEntrySegments(reaction, speciesList, verbose)
+        speciesInvolved = reaction.reactants + reaction.products
+        if reaction.specificCollider is not None:
+            speciesInvolved = speciesInvolved + [reaction.specificCollider]
+        if verbose and reaction.pairs:
+            for pair in reaction.pairs:
+                speciesInvolved = speciesInvolved + list(pair)
+        objects = tuple([reaction, kinetics] + speciesInvolved)
+        values = (
+            tuple([getSpeciesIdentifier(spec) for spec in speciesInvolved]),
+            len(reaction.pairs) if reaction.pairs else 0,
+            kinetics.comment if kinetics is not None else None,
+            reaction.duplicate,
+            reaction.reversible,
+        )
+        return self._get(self.kinetics, (id(reaction), verbose), objects, values,
+            lambda: _writeKineticsEntrySegments(reaction, speciesList, verbose))
+
+    def getDictionaryEntry(self, species):
+        """
+        Return the species dictionary entry for `species`, as generated by
+        :func:`writeDictionaryEntry`.
+        """
+        return self._get(self.dictionary, id(species),
+            (species, species.molecule[0]),
+            (getSpeciesIdentifier(species),),
+            lambda: writeDictionaryEntry(species))
+
+    def getTransportEntry(self, species):
+        """
+        Return the transport file entry for `species`, as generated by
+        :func:`writeTransportEntry`.
+        """
+        transportData = species.getTransportData()
+        return self._get(self.transport, id(species),
+            (species, transportData),
+            (getSpeciesIdentifier(species), getattr(transportData, 'comment', None)),
+            lambda: writeTransportEntry(species))
 
 class ChemkinWriter(object):
     """
@@ -2048,9 +2568,20 @@ class ChemkinWriter(object):
     def __init__(self, outputDirectory=''):
         super(ChemkinWriter, self).__init__()
         makeOutputSubdirectory(outputDirectory, 'chemkin')
+        self.cache = ChemkinBlockCache()
     
     def update(self, rmg):
-        saveChemkinFiles(rmg)
+        self.write(self.snapshot(rmg))
 
-        
-    
+    def snapshot(self, rmg):
+        """
+        Generate the contents of the Chemkin files for the current model,
+        reusing cached entries where possible. Returns the files to write and
+        the files to copy, for :meth:`write`.
+        """
+        self.cache.expire()
+        return renderChemkinFiles(rmg, cache=self.cache)
+
+    def write(self, data):
+        files, copies = data
+        writeOutputFiles(files, copies)
@@ -307,6 +307,107 @@ multiplicity 2
 
         self.assertEqual(reaction.specificCollider.label, 'N2(5)')
 
+class TestChemkinBlockCache(unittest.TestCase):
+    """
+    Contains unit tests of the :class:`ChemkinBlockCache` class.
+    """
+
+    def setUp(self):
+        folder = os.path.join(os.path.dirname(rmgpy.__file__), 'test_data/chemkin/chemkin_py')
+        chemkinPath = os.path.join(folder, 'minimal', 'chem.inp')
+        dictionaryPath = os.path.join(folder, 'minimal', 'species_dictionary.txt')
+        self.species, self.reactions = loadChemkinFile(chemkinPath, dictionaryPath)
+
+    def testCachedOutputMatchesUncachedOutput(self):
+        """
+        Test that files assembled from cached entries are identical to freshly generated files.
+        """
+        cache = ChemkinBlockCache()
+        for verbose in [True, False]:
+            expected = renderChemkinFile(self.species, self.reactions, verbose=verbose)
+            # The second pass is assembled entirely from the cache
+            self.assertEqual(renderChemkinFile(self.species, self.reactions, verbose=verbose, cache=cache), expected)
+            self.assertEqual(renderChemkinFile(self.species, self.reactions, verbose=verbose, cache=cache), expected)
+        self.assertEqual(renderSpeciesDictionary(self.species, cache=cache), renderSpeciesDictionary(self.species))
+        self.assertTrue(cache.hits > 0)
+
+    def testReactionIndicesFollowPosition(self):
+        """
+        Test that cached verbose entries are renumbered when reactions move within the file.
+        """
+        cache = ChemkinBlockCache()
+        renderChemkinFile(self.species, self.reactions, verbose=True, cache=cache)
+        reordered = self.reactions[::-1]
+        self.assertEqual(renderChemkinFile(self.species, reordered, verbose=True, cache=cache),
+                         renderChemkinFile(self.species, reordered, verbose=True))
+
+    def testChangedDataInvalidatesEntry(self):
+        """
+        Test that an entry is regenerated when the data it was generated from changes.
+        """
+        cache = ChemkinBlockCache()
+        reaction = self.reactions[0]
+        segments, count = cache.getKineticsEntry(reaction, self.species, verbose=True)
+        reaction.kinetics = Arrhenius(A=(1.0e13, 'cm^3/(mol*s)'), n=0, Ea=(0, 'kcal/mol'), T0=(1, 'K'), comment='new kinetics')
+        newSegments, newCount = cache.getKineticsEntry(reaction, self.species, verbose=True)
+        self.assertNotEqual(segments, newSegments)
+        self.assertIn('! new kinetics', ''.join(newSegments))
+
+    def testExpireDropsUnusedEntries(self):
+        """
+        Test that entries not used during a generation are dropped by expire().
+        """
+        cache = ChemkinBlockCache()
+        cache.expire()
+        cache.getDictionaryEntry(self.species[0])
+        cache.getDictionaryEntry(self.species[1])
+        cache.expire()
+        cache.getDictionaryEntry(self.species[0])
+        cache.expire()
+        self.assertEqual(cache.dictionary.keys(), [id(self.species[0])])
+
+class TestChemkinFileIndex(unittest.TestCase):
+    """
+    Contains unit tests of the :class:`ChemkinFileIndex` class and the lazy
+    species dictionary.
+    """
+
+    def setUp(self):
+        folder = os.path.join(os.path.dirname(rmgpy.__file__), 'test_data/chemkin/chemkin_py')
+        self.chemkinPath = os.path.join(folder, 'pdd', 'chem.inp')
+        self.dictionaryPath = os.path.join(folder, 'pdd', 'species_dictionary.txt')
+
+    def testIndexMatchesLoadedReactions(self):
+        """
+        Test that the reactions read through the index match those loaded by loadChemkinFile().
+        """
+        species, reactions = loadChemkinFile(self.chemkinPath, self.dictionaryPath)
+        index = ChemkinFileIndex(self.chemkinPath, self.dictionaryPath)
+        self.assertEqual([spec.label for spec in index.speciesList], [spec.label for spec in species])
+        self.assertEqual(len(index), len(reactions))
+        for reaction, indexedReaction in zip(reactions, index):
+            self.assertEqual(str(indexedReaction), str(reaction))
+            self.assertEqual(indexedReaction.index, reaction.index)
+            self.assertEqual(indexedReaction.__class__, reaction.__class__)
+        # Random access to the last reaction
+        self.assertEqual(str(index[-1]), str(reactions[-1]))
+        self.assertIn('Reaction index: Chemkin #{0:d}'.format(len(index)), index.getComments(len(index) - 1))
+
+    def testLazySpeciesDictionary(self):
+        """
+        Test that the lazy species dictionary only parses the species that are used.
+        """
+        speciesDict = loadSpeciesDictionary(self.dictionaryPath)
+        lazySpeciesDict = loadSpeciesDictionary(self.dictionaryPath, lazy=True)
+        self.assertEqual(sorted(lazySpeciesDict.keys()), sorted(speciesDict.keys()))
+        self.assertEqual(len(lazySpeciesDict.species), 0)
+        label = sorted(speciesDict.keys())[0]
+        self.assertIn(label, lazySpeciesDict)
+        self.assertEqual(len(lazySpeciesDict.species), 0)
+        self.assertTrue(lazySpeciesDict[label].isIsomorphic(speciesDict[label]))
+        self.assertEqual(lazySpeciesDict[label].reactive, speciesDict[label].reactive)
+        self.assertEqual(len(lazySpeciesDict.species), 1)
+
 class TestReadReactionComments(unittest.TestCase):
     @classmethod
     def setUpClass(self):
@@ -44,6 +44,8 @@ except ImportError:
     logging.warning("Upgrade to Python 2.7 or later to ensure your database entries are read and written in the same order each time!")
     OrderedDict = dict
 from rmgpy.molecule import Molecule, Group
+from rmgpy.molecule.atomtype import atomTypes
+from rmgpy.molecule.structurecache import StructureCache
 
 from reference import Reference, Article, Book, Thesis
 from rmgpy.exceptions import DatabaseError, ForbiddenStructureException, InvalidAdjacencyListError
@@ -163,6 +165,9 @@ class Database:
     local_context['Book'] = Book
     local_context['Thesis'] = Thesis
 
+    # The number of steps taken down the trees of all databases, for profiling
+    descendTreeCalls = 0
+
     def __init__(self,
                  entries=None,
                  top=None,
@@ -990,6 +995,7 @@ class Database:
         structure.  This is used in kinetics groups to find the correct reaction template, but
         not generally used in other GAVs due to species generally not being prelabeled.
         """
+        Database.descendTreeCalls += 1
 
         if root is None:
             for root in self.top:
@@ -1255,44 +1261,220 @@ def getAllCombinations(nodeLists):
 
 ################################################################################
 
+# The bit of each atom type in the atom type masks, filled when first needed
+_atomTypeBits = {}
+
+def _getAtomTypeBit(atomType):
+    """
+    Return the bit of the :class:`AtomType` object `atomType` in the atom type
+    masks used by :class:`ForbiddenStructures`.
+    """
+    if not _atomTypeBits:
+        for index, label in enumerate(sorted(atomTypes.keys())):
+            _atomTypeBits[atomTypes[label]] = 1 << index
+    return _atomTypeBits[atomType]
+
+def _getBondOrderBit(order):
+    """
+    Return the bit of the bond order `order` in the bond order masks used by
+    :class:`ForbiddenStructures`. Orders are rounded to the nearest half.
+    """
+    return 1 << int(round(2 * order))
+
+def getMoleculeFeatures(molecule):
+    """
+    Return the features of the :class:`Molecule` object `molecule` compared
+    against the prefilters of the forbidden structures: a mask of the atom
+    types of its atoms, a mask of the orders of its bonds, and a tuple of the
+    numbers of atoms, bonds, radical electrons, and carbon, nitrogen, oxygen
+    and sulfur atoms.
+    """
+    typeMask = 0; orderMask = 0
+    bondCount = 0; radicalCount = 0
+    carbonCount = 0; nitrogenCount = 0; oxygenCount = 0; sulfurCount = 0
+    for atom in molecule.vertices:
+        if atom.atomType is not None:
+            typeMask |= _getAtomTypeBit(atom.atomType)
+        for bond in atom.edges.itervalues():
+            orderMask |= _getBondOrderBit(bond.getOrderNum())
+            bondCount += 1
+        radicalCount += atom.radicalElectrons
+        symbol = atom.element.symbol
+        if symbol == 'C':
+            carbonCount += 1
+        elif symbol == 'N':
+            nitrogenCount += 1
+        elif symbol == 'O':
+            oxygenCount += 1
+        elif symbol == 'S':
+            sulfurCount += 1
+    counts = (len(molecule.vertices), bondCount // 2, radicalCount, carbonCount, nitrogenCount, oxygenCount, sulfurCount)
+    return typeMask, orderMask, counts
+
+class ForbiddenPrefilter(object):
+    """
+    A set of conditions that a molecule must satisfy to contain the
+    :class:`Group` of a forbidden structure, which are much cheaper to check
+    than the subgraph isomorphism itself. The attributes are:
+
+    =============== ============================================================
+    Attribute       Description
+    =============== ============================================================
+    `entry`         The forbidden structure :class:`Entry`
+    `labeled`       ``True`` if the group has labeled atoms, ``False`` if not
+    `typeMasks`     The masks of the atom types each group atom can match
+    `orderMasks`    The masks of the bond orders each group bond can match
+    `counts`        The minimum numbers of atoms, bonds, radical electrons, and carbon, nitrogen, oxygen and sulfur atoms
+    =============== ============================================================
+
+    Each of the `typeMasks` and `orderMasks` must share a bit with the
+    corresponding mask of the molecule, and each of the `counts` must not
+    exceed the corresponding count of the molecule, as returned by
+    :func:`getMoleculeFeatures`. Entries whose item is not a :class:`Group`
+    have no conditions.
+    """
+
+    def __init__(self, entry):
+        self.entry = entry
+        self.typeMasks = []
+        self.orderMasks = []
+        self.counts = None
+        group = entry.item
+        if not isinstance(group, Group):
+            self.labeled = True
+            return
+        self.labeled = len(group.getLabeledAtoms()) > 0
+
+        typeMasks = set(); orderMasks = set()
+        bondCount = 0
+        for atom in group.vertices:
+            if atom.atomType:
+                mask = 0
+                for atomType in atom.atomType:
+                    mask |= _getAtomTypeBit(atomType)
+                    for specific in atomType.specific:
+                        mask |= _getAtomTypeBit(specific)
+                typeMasks.add(mask)
+            for bond in atom.edges.itervalues():
+                if bond.getOrderNum():
+                    mask = 0
+                    for order in bond.getOrderNum():
+                        mask |= _getBondOrderBit(order)
+                    orderMasks.add(mask)
+                bondCount += 1
+        self.typeMasks = sorted(typeMasks)
+        self.orderMasks = sorted(orderMasks)
+        self.counts = (len(group.vertices), bondCount // 2, group.radicalCount,
+                       group.carbonCount, group.nitrogenCount, group.oxygenCount, group.sulfurCount)
+
+    def isPossibleMatch(self, features):
+        """
+        Return ``False`` if the molecule with the `features` returned by
+        :func:`getMoleculeFeatures` cannot contain the group, or ``True`` if
+        it might.
+        """
+        typeMask, orderMask, counts = features
+        for mask in self.typeMasks:
+            if not mask & typeMask:
+                return False
+        for mask in self.orderMasks:
+            if not mask & orderMask:
+                return False
+        if self.counts is not None:
+            for count, required in zip(counts, self.counts):
+                if count < required:
+                    return False
+        return True
+
 class ForbiddenStructures(Database):
     """
     A database consisting solely of structures that are forbidden
     from occurring.
+
+    A :class:`ForbiddenPrefilter` is made for each entry the first time a
+    molecule is checked, so molecules that cannot contain an entry are
+    rejected without a subgraph isomorphism check. Whether a structure
+    contains any of the entries without labeled atoms only depends on the
+    structure, so it is stored in the `verdictCache`. Both are reset by
+    :meth:`clearCache`, which must be called if the entries are modified
+    other than by loading them.
     """
-    
+
+    def __init__(self, entries=None, top=None, label='', name='', shortDesc='', longDesc=''):
+        Database.__init__(self, entries=entries, top=top, label=label, name=name, shortDesc=shortDesc, longDesc=longDesc)
+        self.prefilters = None
+        self.verdictCache = StructureCache()
+
+    def clearCache(self):
+        """
+        Remove the prefilters of the entries and the cached verdicts.
+        """
+        self.prefilters = None
+        self.verdictCache.clear()
+
+    def getPrefilters(self):
+        """
+        Return the list of :class:`ForbiddenPrefilter` objects of the entries,
+        making them if needed.
+        """
+        if self.prefilters is None or len(self.prefilters) != len(self.entries):
+            self.prefilters = [ForbiddenPrefilter(entry) for entry in self.entries.values()]
+            self.verdictCache.clear()
+        return self.prefilters
+
     def isMoleculeForbidden(self, molecule):
         """
         Return ``True`` if the given :class:`Molecule` object `molecule`
         contains forbidden functionality, or ``False`` if not. Labeled atoms
         on the forbidden structures and the molecule are honored.
         """
-        for entry in self.entries.values():
-            entryLabeledAtoms = entry.item.getLabeledAtoms()
-            moleculeLabeledAtoms = molecule.getLabeledAtoms()
+        prefilters = self.getPrefilters()
+        if self.verdictCache.getValue(molecule, self.containsUnlabeledStructure):
+            return True
+
+        features = getMoleculeFeatures(molecule)
+        moleculeLabeledAtoms = None
+        for prefilter in prefilters:
+            if not prefilter.labeled or not prefilter.isPossibleMatch(features):
+                continue
+            if moleculeLabeledAtoms is None:
+                moleculeLabeledAtoms = molecule.getLabeledAtoms()
+            entryLabeledAtoms = prefilter.entry.item.getLabeledAtoms()
             initialMap = {}
             for label in entryLabeledAtoms:
                 # all group labels must be present in the molecule
-                if label not in moleculeLabeledAtoms: break  
+                if label not in moleculeLabeledAtoms: break
                 initialMap[moleculeLabeledAtoms[label]] = entryLabeledAtoms[label]
             else:
-                if molecule.isMappingValid(entry.item, initialMap) and molecule.isSubgraphIsomorphic(entry.item, initialMap):
+                if molecule.isMappingValid(prefilter.entry.item, initialMap) and molecule.isSubgraphIsomorphic(prefilter.entry.item, initialMap):
                     return True
-            
+
+        return False
+
+    def containsUnlabeledStructure(self, molecule):
+        """
+        Return ``True`` if the given :class:`Molecule` object `molecule` is
+        charged or contains any of the forbidden structures without labeled
+        atoms, or ``False`` if not. The result only depends on the structure
+        of `molecule`.
+        """
         # Until we have more thermodynamic data of molecular ions we will forbid them
-        molecule_charge = 0
-        for atom in molecule.atoms:
-            molecule_charge += atom.charge
-        if molecule_charge != 0:
+        if sum([atom.charge for atom in molecule.vertices]) != 0:
             return True
-        
+        features = getMoleculeFeatures(molecule)
+        for prefilter in self.getPrefilters():
+            if prefilter.labeled or not prefilter.isPossibleMatch(features):
+                continue
+            if molecule.isSubgraphIsomorphic(prefilter.entry.item):
+                return True
         return False
-    
+
     def loadOld(self, path):
         """
         Load an old forbidden structures file from the location `path` on disk.
         """
         self.loadOldDictionary(path, pattern=True)
+        self.clearCache()
         return self
 
     def saveOld(self, path):
@@ -1309,6 +1491,7 @@ class ForbiddenStructures(Database):
         """
         assert molecule is not None or group is not None
         assert not (molecule is not None and group is not None)
+        self.clearCache()
         if molecule is not None:
             item = Molecule.fromAdjacencyList(molecule)
         elif group is not None:
@@ -32,8 +32,8 @@ import os
 import unittest
 from external.wip import work_in_progress
 
-from rmgpy.data.base import Entry, Database
-from rmgpy.molecule import Group
+from rmgpy.data.base import Entry, Database, ForbiddenStructures, ForbiddenPrefilter, getMoleculeFeatures
+from rmgpy.molecule import Group, Molecule
 
 ################################################################################
 
@@ -118,6 +118,56 @@ class TestBaseDatabase(unittest.TestCase):
 
 
 
+class TestForbiddenStructures(unittest.TestCase):
+    """
+    Contains unit tests for the ForbiddenStructures class.
+    """
+
+    def setUp(self):
+        """
+        A function run before each unit test in this class.
+        """
+        self.database = ForbiddenStructures()
+        self.database.loadEntry(label='peroxide', group="""
+1 O u0 {2,S}
+2 O u0 {1,S}
+""")
+        self.database.loadEntry(label='labeled_triple', group="""
+1 *1 C u0 {2,T}
+2    C u0 {1,T}
+""")
+
+    def testPrefilter(self):
+        """
+        Test that the prefilters reject molecules that cannot contain the group.
+        """
+        prefilter = ForbiddenPrefilter(self.database.entries['peroxide'])
+        self.assertFalse(prefilter.labeled)
+        self.assertFalse(prefilter.isPossibleMatch(getMoleculeFeatures(Molecule(SMILES='CCO'))))
+        self.assertTrue(prefilter.isPossibleMatch(getMoleculeFeatures(Molecule(SMILES='OCO'))))
+        self.assertTrue(prefilter.isPossibleMatch(getMoleculeFeatures(Molecule(SMILES='OO'))))
+        prefilter = ForbiddenPrefilter(self.database.entries['labeled_triple'])
+        self.assertTrue(prefilter.labeled)
+        self.assertFalse(prefilter.isPossibleMatch(getMoleculeFeatures(Molecule(SMILES='C=C'))))
+
+    def testIsMoleculeForbidden(self):
+        """
+        Test that molecules are forbidden as before, and that the verdicts of
+        isomorphic structures are reused.
+        """
+        self.assertTrue(self.database.isMoleculeForbidden(Molecule(SMILES='OO')))
+        self.assertFalse(self.database.isMoleculeForbidden(Molecule(SMILES='OCO')))
+        self.assertTrue(self.database.isMoleculeForbidden(Molecule(SMILES='CCOO')))
+        self.assertEqual(self.database.verdictCache.hits, 0)
+        self.assertTrue(self.database.isMoleculeForbidden(Molecule(SMILES='OO')))
+        self.assertEqual(self.database.verdictCache.hits, 1)
+
+        # Labeled forbidden structures only match labeled molecules
+        molecule = Molecule(SMILES='C#C')
+        self.assertFalse(self.database.isMoleculeForbidden(molecule))
+        molecule.atoms[0].label = '*1'
+        self.assertTrue(self.database.isMoleculeForbidden(molecule))
+
 ################################################################################
 
 if __name__ == '__main__':
@@ -1412,11 +1412,16 @@ class KineticsFamily(Database):
         )
         
         # Store the labeled atoms so we can recover them later
-        # (e.g. for generating reaction pairs and templates)
+        # (e.g. for generating reaction pairs and templates); in the reverse
+        # direction the products are the input molecules, whose labels are
+        # cleared once the reaction has been created, so store theirs too
         labeledAtoms = []
-        for reactant in reaction.reactants:
-            for label, atom in reactant.getLabeledAtoms().items():
-                labeledAtoms.append((label, atom))
+        for reactant in reaction.reactants if isForward else reaction.reactants + reaction.products:
+            for label, atoms in reactant.getLabeledAtoms().items():
+                if not isinstance(atoms, list):
+                    atoms = [atoms]
+                for atom in atoms:
+                    labeledAtoms.append((label, atom))
         reaction.labeledAtoms = labeledAtoms
         
         return reaction
@@ -1642,6 +1647,11 @@ class KineticsFamily(Database):
                         if productStructures is not None:
                             rxn = self.__createReaction(reactantStructures, productStructures, forward)
                             if rxn: rxnList.append(rxn)
+                    finally:
+                        # The reactants may be the molecules of core species,
+                        # so never leave labels on them; those of the reactions
+                        # made are kept in their labeledAtoms attribute
+                        for struct in reactantStructures: struct.clearLabeledAtoms()
 
         # Bimolecular reactants: A + B --> products
         elif len(reactants) == 2 and len(template.reactants) == 2:
@@ -1669,6 +1679,8 @@ class KineticsFamily(Database):
                                 if productStructures is not None:
                                     rxn = self.__createReaction(reactantStructures, productStructures, forward)
                                     if rxn: rxnList.append(rxn)
+                            finally:
+                                for struct in reactantStructures: struct.clearLabeledAtoms()
 
                     # Only check for swapped reactants if they are different
                     if reactants[0] is not reactants[1]:
@@ -1689,6 +1701,8 @@ class KineticsFamily(Database):
                                     if productStructures is not None:
                                         rxn = self.__createReaction(reactantStructures, productStructures, forward)
                                         if rxn: rxnList.append(rxn)
+                                finally:
+                                    for struct in reactantStructures: struct.clearLabeledAtoms()
         # If products is given, remove reactions from the reaction list that
         # don't generate the given products
         if products is not None:
@@ -1730,7 +1744,7 @@ class KineticsFamily(Database):
         for reaction in rxnList:
             
             # Restore the labeled atoms long enough to generate some metadata
-            for reactant in reaction.reactants:
+            for reactant in reaction.reactants if reaction.isForward else reaction.reactants + reaction.products:
                 reactant.clearLabeledAtoms()
             for label, atom in reaction.labeledAtoms:
                 atom.label = label
@@ -41,6 +41,8 @@ cdef class Arrhenius(KineticsModel):
     
     cpdef double getRateCoefficient(self, double T, double P=?) except -1
 
+    cpdef numpy.ndarray getRateCoefficients(self, numpy.ndarray Tlist, numpy.ndarray Plist=?)
+
     cpdef changeT0(self, double T0)
 
     cpdef fitToData(self, numpy.ndarray Tlist, numpy.ndarray klist, str kunits, double T0=?, numpy.ndarray weights=?, bint threeParams=?)
@@ -80,6 +82,8 @@ cdef class PDepArrhenius(PDepKineticsModel):
     cdef getAdjacentExpressions(self, double P)
     
     cpdef double getRateCoefficient(self, double T, double P=?) except -1
+
+    cpdef numpy.ndarray getRateCoefficients(self, numpy.ndarray Tlist, numpy.ndarray Plist=?)
     
     cpdef fitToData(self, numpy.ndarray Tlist, numpy.ndarray Plist, numpy.ndarray K, str kunits, double T0=?)
 
@@ -95,6 +99,8 @@ cdef class MultiArrhenius(KineticsModel):
     
     cpdef double getRateCoefficient(self, double T, double P=?) except -1
 
+    cpdef numpy.ndarray getRateCoefficients(self, numpy.ndarray Tlist, numpy.ndarray Plist=?)
+
     cpdef bint isIdenticalTo(self, KineticsModel otherKinetics) except -2
     
     cpdef Arrhenius toArrhenius(self, double Tmin=?, double Tmax=?)
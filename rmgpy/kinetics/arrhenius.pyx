@@ -122,6 +122,20 @@ cdef class Arrhenius(KineticsModel):
         T0 = self._T0.value_si
         return A * (T / T0)**n * exp(-Ea / (constants.R * T))
 
+    cpdef numpy.ndarray getRateCoefficients(self, numpy.ndarray Tlist, numpy.ndarray Plist=None):
+        """
+        Return the rate coefficients in the appropriate combination of m^3,
+        mol, and s at the temperatures `Tlist` in K. If the pressures `Plist`
+        in Pa are given, the rate coefficients on the grid of temperatures and
+        pressures are returned as an array of shape (len(Tlist), len(Plist)).
+        """
+        cdef numpy.ndarray T, k
+        T = numpy.asarray(Tlist, numpy.float64)
+        k = self._A.value_si * (T / self._T0.value_si)**self._n.value_si * numpy.exp(-self._Ea.value_si / (constants.R * T))
+        if Plist is None:
+            return k
+        return numpy.repeat(k[:,numpy.newaxis], Plist.shape[0], axis=1)
+
     cpdef changeT0(self, double T0):
         """
         Changes the reference temperature used in the exponent to `T0` in K, 
@@ -519,6 +533,42 @@ cdef class PDepArrhenius(PDepKineticsModel):
             if klow == khigh == 0.0: return 0.0
             k = klow * 10**(log10(P/Plow)/log10(Phigh/Plow)*log10(khigh/klow))
         return k
+
+    cpdef numpy.ndarray getRateCoefficients(self, numpy.ndarray Tlist, numpy.ndarray Plist=None):
+        """
+        Return the rate coefficients in the appropriate combination of m^3,
+        mol, and s on the grid of temperatures `Tlist` in K and pressures
+        `Plist` in Pa, as an array of shape (len(Tlist), len(Plist)). Each
+        Arrhenius expression is evaluated once over all of the temperatures.
+        """
+        cdef numpy.ndarray T, P, pressures, klist, ilow, ihigh, Plow, Phigh, bounded, klow, khigh, x, K
+        cdef KineticsModel arrh
+
+        if Plist is None or numpy.any(Plist == 0):
+            raise ValueError('No pressure specified to pressure-dependent PDepArrhenius.getRateCoefficients().')
+
+        T = numpy.asarray(Tlist, numpy.float64)
+        P = numpy.asarray(Plist, numpy.float64)
+        pressures = self._pressures.value_si
+        klist = numpy.array([arrh.getRateCoefficients(T) for arrh in self.arrhenius]).T
+
+        # Find the pressures that most closely bound each pressure in Plist
+        ilow = numpy.maximum(numpy.searchsorted(pressures, P, side='right') - 1, 0)
+        ihigh = numpy.minimum(numpy.searchsorted(pressures, P, side='left'), pressures.shape[0] - 1)
+
+        Plow = pressures[ilow]
+        Phigh = pressures[ihigh]
+
+        # Interpolate logarithmically in pressure between them
+        bounded = Plow != Phigh
+        x = numpy.zeros(P.shape[0], numpy.float64)
+        x[bounded] = numpy.log10(P[bounded] / Plow[bounded]) / numpy.log10(Phigh[bounded] / Plow[bounded])
+        klow = klist[:,ilow]
+        khigh = klist[:,ihigh]
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            K = klow * (khigh / klow)**x
+        K[(klow == 0) & (khigh == 0)] = 0.0
+        return K
     
     cpdef fitToData(self, numpy.ndarray Tlist, numpy.ndarray Plist, numpy.ndarray K, str kunits, double T0=1):
         """
@@ -636,6 +686,23 @@ cdef class MultiArrhenius(KineticsModel):
             k += arrh.getRateCoefficient(T)
         return k
 
+    cpdef numpy.ndarray getRateCoefficients(self, numpy.ndarray Tlist, numpy.ndarray Plist=None):
+        """
+        Return the rate coefficients in the appropriate combination of m^3,
+        mol, and s at the temperatures `Tlist` in K. If the pressures `Plist`
+        in Pa are given, the rate coefficients on the grid of temperatures and
+        pressures are returned as an array of shape (len(Tlist), len(Plist)).
+        """
+        cdef numpy.ndarray K
+        cdef Arrhenius arrh
+        if Plist is None:
+            K = numpy.zeros(len(Tlist), numpy.float64)
+        else:
+            K = numpy.zeros((len(Tlist), len(Plist)), numpy.float64)
+        for arrh in self.arrhenius:
+            K += arrh.getRateCoefficients(Tlist, Plist)
+        return K
+
     cpdef bint isIdenticalTo(self, KineticsModel otherKinetics) except -2:
         """
         Returns ``True`` if kinetics matches that of another kinetics model.  Each duplicate
@@ -815,3 +882,4 @@ cdef class MultiPDepArrhenius(PDepKineticsModel):
 
         for i, arr in enumerate(self.arrhenius):
             arr.setCanteraKinetics(ctReaction[i], speciesList)
+
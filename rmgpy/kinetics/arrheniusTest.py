@@ -129,6 +129,19 @@ class TestArrhenius(unittest.TestCase):
             kact = self.arrhenius.getRateCoefficient(T)
             self.assertAlmostEqual(kexp, kact, delta=1e-4*kexp)
 
+    def test_getRateCoefficients(self):
+        """
+        Test the Arrhenius.getRateCoefficients() method.
+        """
+        Tlist = numpy.array([200,400,600,800,1000,1200,1400,1600,1800,2000], numpy.float64)
+        klist = self.arrhenius.getRateCoefficients(Tlist)
+        for T, k in zip(Tlist, klist):
+            self.assertAlmostEqual(k / self.arrhenius.getRateCoefficient(T), 1.0, 10)
+        K = self.arrhenius.getRateCoefficients(Tlist, numpy.array([1e4,1e5], numpy.float64))
+        self.assertEqual(K.shape, (10,2))
+        self.assertTrue(numpy.array_equal(K[:,0], klist))
+        self.assertTrue(numpy.array_equal(K[:,1], klist))
+
     def test_changeT0(self):
         """
         Test the Arrhenius.changeT0() method.
@@ -508,6 +521,20 @@ class TestPDepArrhenius(unittest.TestCase):
             k0 = self.kinetics.getRateCoefficient(T, P)
             k1 = math.sqrt(self.arrhenius0.getRateCoefficient(T) * self.arrhenius1.getRateCoefficient(T))
             self.assertAlmostEqual(k0, k1, delta=1e-6*k1)
+
+    def test_getRateCoefficients(self):
+        """
+        Test the PDepArrhenius.getRateCoefficients() method, including at
+        pressures outside the range of the Arrhenius expressions.
+        """
+        Tlist = numpy.array([300,500,700,900,1100,1300,1500], numpy.float64)
+        Plist = numpy.array([1e3,1e4,3e4,1e5,3e5,1e6,1e7], numpy.float64)
+        K = self.kinetics.getRateCoefficients(Tlist, Plist)
+        self.assertEqual(K.shape, (7,7))
+        for t in range(Tlist.shape[0]):
+            for p in range(Plist.shape[0]):
+                self.assertAlmostEqual(K[t,p] / self.kinetics.getRateCoefficient(Tlist[t], Plist[p]), 1.0, 10)
+        self.assertRaises(ValueError, self.kinetics.getRateCoefficients, Tlist)
         
     def test_fitToData(self):
         """
@@ -47,6 +47,8 @@ cdef class Chebyshev(PDepKineticsModel):
     
     cpdef double getRateCoefficient(self, double T, double P=?) except -1
 
+    cpdef numpy.ndarray getRateCoefficients(self, numpy.ndarray Tlist, numpy.ndarray Plist=?)
+
     cpdef fitToData(self, numpy.ndarray Tlist, numpy.ndarray Plist, numpy.ndarray K, str kunits,
         int degreeT, int degreeP, double Tmin, double Tmax, double Pmin, double Pmax)
 
@@ -28,6 +28,7 @@
 ################################################################################
 
 import numpy
+from numpy.polynomial.chebyshev import chebvander
 from libc.math cimport exp, log, sqrt, log10
 
 cimport rmgpy.constants as constants
@@ -166,6 +167,28 @@ cdef class Chebyshev(PDepKineticsModel):
                 k += coeffs[t,p] * self.chebyshev(t, Tred) * self.chebyshev(p, Pred)
         return 10.0**k
 
+    cpdef numpy.ndarray getRateCoefficients(self, numpy.ndarray Tlist, numpy.ndarray Plist=None):
+        """
+        Return the rate coefficients in the appropriate combination of m^3,
+        mol, and s on the grid of temperatures `Tlist` in K and pressures
+        `Plist` in Pa, as an array of shape (len(Tlist), len(Plist)).
+        """
+        cdef numpy.ndarray T, P, Tred, Pred
+        cdef double Tmin, Tmax, Pmin, Pmax
+
+        if Plist is None or numpy.any(Plist == 0):
+            raise ValueError('No pressure specified to pressure-dependent Chebyshev.getRateCoefficients().')
+
+        T = numpy.asarray(Tlist, numpy.float64)
+        P = numpy.asarray(Plist, numpy.float64)
+        Tmin = self._Tmin.value_si
+        Tmax = self._Tmax.value_si
+        Pmin = self._Pmin.value_si
+        Pmax = self._Pmax.value_si
+        Tred = (2.0/T - 1.0/Tmin - 1.0/Tmax) / (1.0/Tmax - 1.0/Tmin)
+        Pred = (2.0*numpy.log10(P) - log10(Pmin) - log10(Pmax)) / (log10(Pmax) - log10(Pmin))
+        return 10.0**numpy.dot(numpy.dot(chebvander(Tred, self.degreeT - 1), self._coeffs.value_si), chebvander(Pred, self.degreeP - 1).T)
+
     cpdef fitToData(self, numpy.ndarray Tlist, numpy.ndarray Plist, numpy.ndarray K,
         str kunits, int degreeT, int degreeP, double Tmin, double Tmax, double Pmin, double Pmax):
         """
@@ -176,9 +199,7 @@ cdef class Chebyshev(PDepKineticsModel):
         and `Pmax` set the edges of the valid temperature and pressure ranges
         in K and bar, respectively.
         """
-        cdef int nT = len(Tlist), nP = len(Plist)
-        cdef list Tred, Pred
-        cdef int t1, p1, t2, p2
+        cdef numpy.ndarray Tred, Pred, A, b
         cdef double T, P
 
         # Set temperature and pressure ranges
@@ -188,30 +209,22 @@ cdef class Chebyshev(PDepKineticsModel):
         self.Pmax = (Pmax*1e-5,"bar")
 
         # Calculate reduced temperatures and pressures
-        Tred = [self.getReducedTemperature(T) for T in Tlist]
-        Pred = [self.getReducedPressure(P) for P in Plist]
+        Tred = numpy.array([self.getReducedTemperature(T) for T in Tlist], numpy.float64)
+        Pred = numpy.array([self.getReducedPressure(P) for P in Plist], numpy.float64)
 
         K = quantity.RateCoefficient(K,kunits).value_si
 
         # Create matrix and vector for coefficient fit (linear least-squares)
-        A = numpy.zeros((nT*nP, degreeT*degreeP), numpy.float64)
-        b = numpy.zeros((nT*nP), numpy.float64)
-        for t1, T in enumerate(Tred):
-            for p1, P in enumerate(Pred):
-                for t2 in range(degreeT):
-                    for p2 in range(degreeP):
-                        A[p1*nT+t1, p2*degreeT+t2] = self.chebyshev(t2, T) * self.chebyshev(p2, P)
-                b[p1*nT+t1] = log10(K[t1,p1])
+        # The row for temperature t1 and pressure p1 is p1*nT+t1, and the
+        # column for the polynomials of degree t2 and p2 is p2*degreeT+t2
+        A = numpy.kron(chebvander(Pred, degreeP - 1), chebvander(Tred, degreeT - 1))
+        b = numpy.log10(K).T.ravel()
 
         # Do linear least-squares fit to get coefficients
         x, residues, rank, s = numpy.linalg.lstsq(A, b)
 
         # Extract coefficients
-        coeffs = numpy.zeros((degreeT,degreeP), numpy.float64)
-        for t2 in range(degreeT):
-            for p2 in range(degreeP):
-                coeffs[t2,p2] = x[p2*degreeT+t2]
-        self.coeffs = coeffs
+        self.coeffs = x.reshape((degreeP,degreeT)).T
 
         self.degreeT = degreeT
         self.degreeP = degreeP
@@ -136,6 +136,19 @@ class TestChebyshev(unittest.TestCase):
             for p in range(Plist.shape[0]):
                 Kact = self.chebyshev.getRateCoefficient(Tlist[t], Plist[p])
                 self.assertAlmostEqual(Kact / Kexp[t,p], 1.0, 4, '{0} != {1} within 4 places'.format(Kexp[t,p], Kact))
+
+    def test_getRateCoefficients(self):
+        """
+        Test the Chebyshev.getRateCoefficients() method.
+        """
+        Tlist = numpy.array([300,500,1000,1500], numpy.float64)
+        Plist = numpy.array([1e4,1e5,1e6], numpy.float64)
+        K = self.chebyshev.getRateCoefficients(Tlist, Plist)
+        self.assertEqual(K.shape, (4,3))
+        for t in range(Tlist.shape[0]):
+            for p in range(Plist.shape[0]):
+                self.assertAlmostEqual(K[t,p] / self.chebyshev.getRateCoefficient(Tlist[t], Plist[p]), 1.0, 10)
+        self.assertRaises(ValueError, self.chebyshev.getRateCoefficients, Tlist)
         
     def test_fitToData(self):
         """
@@ -39,6 +39,8 @@ cdef class ThirdBody(PDepKineticsModel):
     
     cpdef double getRateCoefficient(self, double T, double P=?) except -1
 
+    cpdef numpy.ndarray getRateCoefficients(self, numpy.ndarray Tlist, numpy.ndarray Plist=?)
+
     cpdef bint isIdenticalTo(self, KineticsModel otherKinetics) except -2
     
     cpdef changeRate(self, double factor)
@@ -52,6 +54,8 @@ cdef class Lindemann(PDepKineticsModel):
     
     cpdef double getRateCoefficient(self, double T, double P=?) except -1
 
+    cpdef numpy.ndarray getRateCoefficients(self, numpy.ndarray Tlist, numpy.ndarray Plist=?)
+
     cpdef bint isIdenticalTo(self, KineticsModel otherKinetics) except -2
     
     cpdef changeRate(self, double factor)
@@ -67,6 +71,8 @@ cdef class Troe(PDepKineticsModel):
     
     cpdef double getRateCoefficient(self, double T, double P=?) except -1
 
+    cpdef numpy.ndarray getRateCoefficients(self, numpy.ndarray Tlist, numpy.ndarray Plist=?)
+
     cpdef bint isIdenticalTo(self, KineticsModel otherKinetics) except -2
     
     cpdef changeRate(self, double factor)
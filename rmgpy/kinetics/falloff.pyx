@@ -99,6 +99,22 @@ cdef class ThirdBody(PDepKineticsModel):
         
         return k0 * C
 
+    cpdef numpy.ndarray getRateCoefficients(self, numpy.ndarray Tlist, numpy.ndarray Plist=None):
+        """
+        Return the rate coefficients in the appropriate combination of m^3,
+        mol, and s at the temperatures `Tlist` in K. If the pressures `Plist`
+        in Pa are given, the rate coefficients on the grid of temperatures and
+        pressures are returned as an array of shape (len(Tlist), len(Plist)).
+        """
+        cdef numpy.ndarray T, P, C, K
+        
+        T = numpy.asarray(Tlist, numpy.float64)
+        P = numpy.zeros(1, numpy.float64) if Plist is None else numpy.asarray(Plist, numpy.float64)
+        C = P / constants.R / T[:,numpy.newaxis]     # bath gas concentrations in mol/m^3
+        K = self.arrheniusLow.getRateCoefficients(T)[:,numpy.newaxis] * C
+        
+        return K[:,0] if Plist is None else K
+
     cpdef bint isIdenticalTo(self, KineticsModel otherKinetics) except -2:
         """
         Checks to see if kinetics matches that of other kinetics and returns ``True``
@@ -193,6 +209,25 @@ cdef class Lindemann(PDepKineticsModel):
         
         return kinf * (Pr / (1 + Pr))
 
+    cpdef numpy.ndarray getRateCoefficients(self, numpy.ndarray Tlist, numpy.ndarray Plist=None):
+        """
+        Return the rate coefficients in the appropriate combination of m^3,
+        mol, and s at the temperatures `Tlist` in K. If the pressures `Plist`
+        in Pa are given, the rate coefficients on the grid of temperatures and
+        pressures are returned as an array of shape (len(Tlist), len(Plist)).
+        """
+        cdef numpy.ndarray T, P, C, k0, kinf, Pr, K
+        
+        T = numpy.asarray(Tlist, numpy.float64)
+        P = numpy.zeros(1, numpy.float64) if Plist is None else numpy.asarray(Plist, numpy.float64)
+        C = P / constants.R / T[:,numpy.newaxis]     # bath gas concentrations in mol/m^3
+        k0 = self.arrheniusLow.getRateCoefficients(T)[:,numpy.newaxis]
+        kinf = self.arrheniusHigh.getRateCoefficients(T)[:,numpy.newaxis]
+        Pr = k0 * C / kinf
+        K = kinf * (Pr / (1 + Pr))
+        
+        return K[:,0] if Plist is None else K
+
     cpdef bint isIdenticalTo(self, KineticsModel otherKinetics) except -2:
         """
         Checks to see if kinetics matches that of other kinetics and returns ``True``
@@ -343,6 +378,43 @@ cdef class Troe(PDepKineticsModel):
 
         return kinf * (Pr / (1 + Pr)) * F
 
+    cpdef numpy.ndarray getRateCoefficients(self, numpy.ndarray Tlist, numpy.ndarray Plist=None):
+        """
+        Return the rate coefficients in the appropriate combination of m^3,
+        mol, and s at the temperatures `Tlist` in K. If the pressures `Plist`
+        in Pa are given, the rate coefficients on the grid of temperatures and
+        pressures are returned as an array of shape (len(Tlist), len(Plist)).
+        """
+        cdef numpy.ndarray T, P, C, k0, kinf, Pr, K
+        cdef numpy.ndarray n, c, Fcent, logFcent, F
+        cdef double d, alpha, T1, T2, T3
+        
+        T = numpy.asarray(Tlist, numpy.float64)
+        P = numpy.zeros(1, numpy.float64) if Plist is None else numpy.asarray(Plist, numpy.float64)
+        C = P / constants.R / T[:,numpy.newaxis]     # bath gas concentrations in mol/m^3
+        k0 = self.arrheniusLow.getRateCoefficients(T)[:,numpy.newaxis]
+        kinf = self.arrheniusHigh.getRateCoefficients(T)[:,numpy.newaxis]
+        Pr = k0 * C / kinf
+        K = kinf * (Pr / (1 + Pr))
+        
+        alpha = self.alpha
+        T1 = self._T1.value_si if self._T1 is not None else 0.0
+        T2 = self._T2.value_si if self._T2 is not None else 0.0
+        T3 = self._T3.value_si if self._T3 is not None else 0.0
+        
+        if T1 != 0 or T3 != 0:
+            with numpy.errstate(divide='ignore'):
+                Fcent = (1 - alpha) * numpy.exp(-T / T3) + alpha * numpy.exp(-T / T1)
+                if T2 != 0.0: Fcent += numpy.exp(-T2 / T)
+                logFcent = numpy.log10(Fcent)[:,numpy.newaxis]
+                d = 0.14
+                n = 0.75 - 1.27 * logFcent
+                c = -0.4 - 0.67 * logFcent
+                F = 10.0**(logFcent/(1 + ((numpy.log10(Pr) + c)/(n - d * (numpy.log10(Pr))))**2))
+            K *= F
+        
+        return K[:,0] if Plist is None else K
+
     cpdef bint isIdenticalTo(self, KineticsModel otherKinetics) except -2:
         """
         Checks to see if kinetics matches that of other kinetics and returns ``True``
@@ -210,6 +210,18 @@ class TestThirdBody(unittest.TestCase):
                 Kact = self.thirdBody.getRateCoefficient(Tlist[t], Plist[p])
                 self.assertAlmostEqual(Kact, Kexp[t,p], delta=1e-4*Kexp[t,p])
 
+    def test_getRateCoefficients(self):
+        """
+        Test the ThirdBody.getRateCoefficients() method.
+        """
+        Tlist = numpy.array([300,500,1000,1500], numpy.float64)
+        Plist = numpy.array([1e4,1e5,1e6], numpy.float64)
+        K = self.thirdBody.getRateCoefficients(Tlist, Plist)
+        self.assertEqual(K.shape, (4,3))
+        for t in range(Tlist.shape[0]):
+            for p in range(Plist.shape[0]):
+                self.assertAlmostEqual(K[t,p] / self.thirdBody.getRateCoefficient(Tlist[t], Plist[p]), 1.0, 10)
+
     def test_pickle(self):
         """
         Test that a ThirdBody object can be successfully pickled and
@@ -390,6 +402,18 @@ class TestLindemann(unittest.TestCase):
                 Kact = self.lindemann.getRateCoefficient(Tlist[t], Plist[p])
                 self.assertAlmostEqual(Kact, Kexp[t,p], delta=1e-4*Kexp[t,p])
 
+    def test_getRateCoefficients(self):
+        """
+        Test the Lindemann.getRateCoefficients() method.
+        """
+        Tlist = numpy.array([300,500,1000,1500], numpy.float64)
+        Plist = numpy.array([1e4,1e5,1e6], numpy.float64)
+        K = self.lindemann.getRateCoefficients(Tlist, Plist)
+        self.assertEqual(K.shape, (4,3))
+        for t in range(Tlist.shape[0]):
+            for p in range(Plist.shape[0]):
+                self.assertAlmostEqual(K[t,p] / self.lindemann.getRateCoefficient(Tlist[t], Plist[p]), 1.0, 10)
+
     def test_pickle(self):
         """
         Test that a Lindemann object can be pickled and unpickled with no loss
@@ -618,6 +642,18 @@ class TestTroe(unittest.TestCase):
                 Kact = self.troe.getRateCoefficient(Tlist[t], Plist[p])
                 self.assertAlmostEqual(Kact, Kexp[t,p], delta=1e-4*Kexp[t,p])
 
+    def test_getRateCoefficients(self):
+        """
+        Test the Troe.getRateCoefficients() method.
+        """
+        Tlist = numpy.array([300,500,1000,1500], numpy.float64)
+        Plist = numpy.array([1e4,1e5,1e6], numpy.float64)
+        K = self.troe.getRateCoefficients(Tlist, Plist)
+        self.assertEqual(K.shape, (4,3))
+        for t in range(Tlist.shape[0]):
+            for p in range(Plist.shape[0]):
+                self.assertAlmostEqual(K[t,p] / self.troe.getRateCoefficient(Tlist[t], Plist[p]), 1.0, 10)
+
     def test_pickle(self):
         """
         Test that a Troe object can be pickled and unpickled with no loss of
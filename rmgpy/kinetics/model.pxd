@@ -48,6 +48,8 @@ cdef class KineticsModel:
     cpdef bint isTemperatureValid(self, double T) except -2
 
     cpdef double getRateCoefficient(self, double T, double P=?) except -1
+
+    cpdef numpy.ndarray getRateCoefficients(self, numpy.ndarray Tlist, numpy.ndarray Plist=?)
     
     cpdef toHTML(self)
 
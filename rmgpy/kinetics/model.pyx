@@ -180,6 +180,24 @@ cdef class KineticsModel:
         """
         raise NotImplementedError('Unexpected call to KineticsModel.getRateCoefficient(); you should be using a class derived from KineticsModel.')
 
+    cpdef numpy.ndarray getRateCoefficients(self, numpy.ndarray Tlist, numpy.ndarray Plist=None):
+        """
+        Return the rate coefficients in the appropriate combination of m^3,
+        mol, and s at the temperatures `Tlist` in K. If the pressures `Plist`
+        in Pa are given, the rate coefficients on the grid of temperatures and
+        pressures are returned as an array of shape (len(Tlist), len(Plist)).
+        """
+        cdef numpy.ndarray[numpy.float64_t, ndim=1] T, P
+        cdef numpy.ndarray[numpy.float64_t, ndim=2] K
+        cdef int i, j
+        T = numpy.asarray(Tlist, numpy.float64)
+        P = numpy.zeros(1, numpy.float64) if Plist is None else numpy.asarray(Plist, numpy.float64)
+        K = numpy.empty((T.shape[0], P.shape[0]), numpy.float64)
+        for i in range(T.shape[0]):
+            for j in range(P.shape[0]):
+                K[i,j] = self.getRateCoefficient(T[i], P[j])
+        return K[:,0] if Plist is None else K
+
     cpdef toHTML(self):
         """
         Return an HTML rendering.
@@ -623,6 +623,22 @@ for atomType in atomTypes.values():
         for index in range(len(items)):
             items[index] = atomTypes[items[index]]
 
+# For each element with more specific atom types, the specific atom types in
+# order of priority, each with the (index, allowed values) pairs of the
+# features from getFeatures() that it constrains; wildcards are left out
+atomTypeConditions = {}
+for atomSymbol in allElements:
+    if atomSymbol not in nonSpecifics:
+        atomTypeConditions[atomSymbol] = [
+            (specificAtomType, tuple([(index, frozenset(feature)) for index, feature in enumerate(specificAtomType.getFeatures()) if feature]))
+            for specificAtomType in atomTypes[atomSymbol].specific
+        ]
+
+# The atom types found so far, keyed by the element symbol followed by the
+# features from getFeatures(); since the features determine the atom type,
+# each combination only needs to be matched against the conditions once
+atomTypeTable = {}
+
 
 def getFeatures(atom, bonds):
     """
@@ -664,8 +680,8 @@ def getAtomType(atom, bonds):
     with local bond structure `bonds`, a ``dict`` containing atom-bond pairs.
     """
 
-    cython.declare(atomSymbol=str)
-    cython.declare(molFeatureList=cython.list, atomTypeFeatureList=cython.list)
+    cython.declare(atomSymbol=str, key=tuple, index=cython.int, values=frozenset, specificAtomType=AtomType)
+    cython.declare(molFeatureList=cython.list)
 
     # Use element and counts to determine proper atom type
     atomSymbol = atom.symbol
@@ -674,14 +690,17 @@ def getAtomType(atom, bonds):
         return atomTypes[atomSymbol]
 
     molFeatureList = getFeatures(atom, bonds)
-    for specificAtomType in atomTypes[atomSymbol].specific:
-        atomtypeFeatureList = specificAtomType.getFeatures()
-        for molFeature, atomtypeFeature in zip(molFeatureList, atomtypeFeatureList):
-            if atomtypeFeature == []:
-                continue
-            elif molFeature not in atomtypeFeature:
+    key = (atomSymbol,) + tuple(molFeatureList)
+    try:
+        return atomTypeTable[key]
+    except KeyError:
+        pass
+    for specificAtomType, conditions in atomTypeConditions[atomSymbol]:
+        for index, values in conditions:
+            if molFeatureList[index] not in values:
                 break
         else:
+            atomTypeTable[key] = specificAtomType
             return specificAtomType
     else:
         single = molFeatureList[0]
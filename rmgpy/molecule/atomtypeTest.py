@@ -586,6 +586,25 @@ class TestGetAtomType(unittest.TestCase):
         self.assertEqual(self.atomType(self.mol7, 0), 'He')
         self.assertEqual(self.atomType(self.mol8, 0), 'Ne')
 
+    def testAtomTypeTable(self):
+        """
+        Test that getAtomType() stores the atom types it finds in the lookup
+        table, and that they match the first specific atom type whose features
+        allow the atom.
+        """
+        for mol in [self.mol1, self.mol2]:
+            for atom in mol.vertices:
+                atomType = getAtomType(atom, atom.edges)
+                if atom.symbol in atomtype.nonSpecifics:
+                    continue
+                features = atomtype.getFeatures(atom, atom.edges)
+                self.assertIs(atomtype.atomTypeTable[(atom.symbol,) + tuple(features)], atomType)
+                for specificAtomType in atomtype.atomTypes[atom.symbol].specific:
+                    if all([not allowed or feature in allowed for feature, allowed in zip(features, specificAtomType.getFeatures())]):
+                        self.assertIs(specificAtomType, atomType)
+                        break
+                self.assertIs(getAtomType(atom, atom.edges), atomType)
+
 ################################################################################
 
 if __name__ == '__main__':
@@ -0,0 +1,248 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+################################################################################
+#
+#   RMG - Reaction Mechanism Generator
+#
+#   Copyright (c) 2002-2017 Prof. William H. Green (whgreen@mit.edu),
+#   Prof. Richard H. West (r.west@neu.edu) and the RMG Team (rmg_dev@mit.edu)
+#
+#   Permission is hereby granted, free of charge, to any person obtaining a
+#   copy of this software and associated documentation files (the 'Software'),
+#   to deal in the Software without restriction, including without limitation
+#   the rights to use, copy, modify, merge, publish, distribute, sublicense,
+#   and/or sell copies of the Software, and to permit persons to whom the
+#   Software is furnished to do so, subject to the following conditions:
+#
+#   The above copyright notice and this permission notice shall be included in
+#   all copies or substantial portions of the Software.
+#
+#   THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#   FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#   DEALINGS IN THE SOFTWARE.
+#
+################################################################################
+
+"""
+This module contains a compact representation of molecular structures as a
+handful of arrays, which is much cheaper to copy and to pickle than a
+:class:`Molecule` made of :class:`Atom` and :class:`Bond` objects. Molecules
+are pickled in this form, e.g. when saving restart files or sending species
+to and from worker processes.
+"""
+
+import numpy
+
+from .element import getElement
+from .atomtype import atomTypes
+
+################################################################################
+
+# Elements by (atomic number, isotope), filled as they are needed
+_elements = {}
+
+def _getElement(number, isotope):
+    """
+    Return the :class:`Element` with atomic number `number` and isotope
+    `isotope`, without searching the list of elements more than once.
+    """
+    try:
+        return _elements[number, isotope]
+    except KeyError:
+        element = _elements[number, isotope] = getElement(number, isotope)
+        return element
+
+class CompactMolecule(object):
+    """
+    A molecular structure stored as arrays of atom properties and an
+    adjacency matrix in compressed sparse row (CSR) format. The attributes
+    are:
+
+    =================== =================== ====================================
+    Attribute           Type                Description
+    =================== =================== ====================================
+    `numbers`           ``numpy.ndarray``   The atomic number of each atom
+    `isotopes`          ``numpy.ndarray``   The isotope of each atom (-1 for the natural abundance)
+    `radicals`          ``numpy.ndarray``   The number of radical electrons on each atom
+    `lonePairs`         ``numpy.ndarray``   The number of lone electron pairs on each atom
+    `charges`           ``numpy.ndarray``   The formal charge of each atom
+    `ids`               ``numpy.ndarray``   The ID of each atom
+    `atomTypes`         ``list``            The label of the atom type of each atom, or ``None``
+    `labels`            ``list``            The label of each atom
+    `indptr`            ``numpy.ndarray``   The bonds of atom `i` are at ``indptr[i]:indptr[i+1]`` in `indices` and `orders`
+    `indices`           ``numpy.ndarray``   The index of the bonded atom of each bond, in increasing order for each atom
+    `orders`            ``numpy.ndarray``   The order of each bond
+    `multiplicity`      ``int``             The spin multiplicity of the molecule
+    =================== =================== ====================================
+
+    Each bond is stored twice, once for each of its atoms. The atoms are in
+    the order of the vertices of the :class:`Molecule` the object was created
+    from, and :meth:`toMolecule` returns them in the same order. The arrays
+    are pickled as strings of their bytes, which avoids the overhead of
+    pickling each of them as a numpy array.
+    """
+
+    def __init__(self, molecule=None):
+        self.numbers = numpy.zeros(0, numpy.int16)
+        self.isotopes = numpy.zeros(0, numpy.int16)
+        self.radicals = numpy.zeros(0, numpy.int8)
+        self.lonePairs = numpy.zeros(0, numpy.int8)
+        self.charges = numpy.zeros(0, numpy.int8)
+        self.ids = numpy.zeros(0, numpy.int32)
+        self.atomTypes = []
+        self.labels = []
+        self.indptr = numpy.zeros(1, numpy.int32)
+        self.indices = numpy.zeros(0, numpy.int32)
+        self.orders = numpy.zeros(0, numpy.float64)
+        self.multiplicity = -187
+        if molecule is not None:
+            self.fromMolecule(molecule)
+
+    def __len__(self):
+        return len(self.numbers)
+
+    def __getstate__(self):
+        """
+        Return the state of the object for pickling.
+        """
+        return (self.numbers.tostring(), self.isotopes.tostring(), self.radicals.tostring(),
+                self.lonePairs.tostring(), self.charges.tostring(), self.ids.tostring(),
+                self.atomTypes, self.labels, self.indptr.tostring(), self.indices.tostring(),
+                self.orders.tostring(), self.multiplicity)
+
+    def __setstate__(self, state):
+        """
+        Set the state of the object when unpickling.
+        """
+        (numbers, isotopes, radicals, lonePairs, charges, ids, self.atomTypes, self.labels,
+         indptr, indices, orders, self.multiplicity) = state
+        self.numbers = numpy.fromstring(numbers, numpy.int16)
+        self.isotopes = numpy.fromstring(isotopes, numpy.int16)
+        self.radicals = numpy.fromstring(radicals, numpy.int8)
+        self.lonePairs = numpy.fromstring(lonePairs, numpy.int8)
+        self.charges = numpy.fromstring(charges, numpy.int8)
+        self.ids = numpy.fromstring(ids, numpy.int32)
+        self.indptr = numpy.fromstring(indptr, numpy.int32)
+        self.indices = numpy.fromstring(indices, numpy.int32)
+        self.orders = numpy.fromstring(orders, numpy.float64)
+
+    def fromMolecule(self, molecule):
+        """
+        Set the arrays from the :class:`Molecule` object `molecule`. Returns
+        this object.
+        """
+        atoms = molecule.vertices
+        indices = {}
+        for index, atom in enumerate(atoms):
+            indices[atom] = index
+
+        self.numbers = numpy.array([atom.element.number for atom in atoms], numpy.int16)
+        self.isotopes = numpy.array([atom.element.isotope for atom in atoms], numpy.int16)
+        self.radicals = numpy.array([atom.radicalElectrons for atom in atoms], numpy.int8)
+        self.lonePairs = numpy.array([atom.lonePairs for atom in atoms], numpy.int8)
+        self.charges = numpy.array([atom.charge for atom in atoms], numpy.int8)
+        self.ids = numpy.array([atom.id for atom in atoms], numpy.int32)
+        self.atomTypes = [atom.atomType.label if atom.atomType else None for atom in atoms]
+        self.labels = [atom.label for atom in atoms]
+
+        indptr = [0]; neighbors = []; orders = []
+        for atom in atoms:
+            bonds = sorted([(indices[atom2], bond.order) for atom2, bond in atom.edges.iteritems()])
+            neighbors.extend([index for index, order in bonds])
+            orders.extend([order for index, order in bonds])
+            indptr.append(len(neighbors))
+        self.indptr = numpy.array(indptr, numpy.int32)
+        self.indices = numpy.array(neighbors, numpy.int32)
+        self.orders = numpy.array(orders, numpy.float64)
+        self.multiplicity = molecule.multiplicity
+        return self
+
+    def toMolecule(self):
+        """
+        Return a new :class:`Molecule` object with the structure stored in
+        the arrays.
+        """
+        from .molecule import Atom, Bond, Molecule
+        atoms = []
+        for index in range(len(self.numbers)):
+            atom = Atom(element=_getElement(int(self.numbers[index]), int(self.isotopes[index])),
+                        radicalElectrons=int(self.radicals[index]),
+                        charge=int(self.charges[index]),
+                        label=self.labels[index],
+                        lonePairs=int(self.lonePairs[index]),
+                        id=int(self.ids[index]))
+            if self.atomTypes[index] is not None:
+                atom.atomType = atomTypes[self.atomTypes[index]]
+            atoms.append(atom)
+        molecule = Molecule(atoms=atoms)
+        for index1 in range(len(atoms)):
+            for position in range(self.indptr[index1], self.indptr[index1 + 1]):
+                index2 = self.indices[position]
+                if index1 < index2:
+                    molecule.addBond(Bond(atoms[index1], atoms[index2], order=float(self.orders[position])))
+        molecule.multiplicity = self.multiplicity
+        return molecule
+
+    def copy(self):
+        """
+        Return a copy of the structure. No atom or bond objects are created.
+        """
+        other = CompactMolecule.__new__(CompactMolecule)
+        other.numbers = self.numbers.copy()
+        other.isotopes = self.isotopes.copy()
+        other.radicals = self.radicals.copy()
+        other.lonePairs = self.lonePairs.copy()
+        other.charges = self.charges.copy()
+        other.ids = self.ids.copy()
+        other.atomTypes = self.atomTypes[:]
+        other.labels = self.labels[:]
+        other.indptr = self.indptr.copy()
+        other.indices = self.indices.copy()
+        other.orders = self.orders.copy()
+        other.multiplicity = self.multiplicity
+        return other
+
+    def getBonds(self, index):
+        """
+        Return a dict mapping the index of each atom bonded to the atom at
+        `index` to the order of the bond.
+        """
+        start, end = self.indptr[index], self.indptr[index + 1]
+        return dict(zip(self.indices[start:end].tolist(), self.orders[start:end].tolist()))
+
+    def getInvariant(self):
+        """
+        Return a key that does not depend on the order of the atoms: the
+        multiplicity, the sorted properties and bond orders of each atom, and
+        the sorted orders of its bonds. Isomorphic structures always have
+        equal invariants.
+        """
+        orders = numpy.rint(self.orders * 100).astype(numpy.int32)
+        atoms = []
+        for index in range(len(self.numbers)):
+            start, end = self.indptr[index], self.indptr[index + 1]
+            atoms.append((self.numbers[index], self.isotopes[index], self.radicals[index], self.lonePairs[index],
+                          self.charges[index], tuple(sorted(orders[start:end].tolist()))))
+        atoms.sort()
+        return (self.multiplicity, tuple(atoms))
+
+    def isIsomorphic(self, other):
+        """
+        Return ``True`` if the structure is isomorphic to `other`, which can be
+        a :class:`CompactMolecule` or a :class:`Molecule` object. Structures
+        that differ in their atoms or bonds are rejected from the arrays
+        alone; only the remaining candidates are compared by a full
+        isomorphism check.
+        """
+        if not isinstance(other, CompactMolecule):
+            other = CompactMolecule(other)
+        if len(self.numbers) != len(other.numbers) or len(self.indices) != len(other.indices):
+            return False
+        if self.getInvariant() != other.getInvariant():
+            return False
+        return self.toMolecule().isIsomorphic(other.toMolecule())
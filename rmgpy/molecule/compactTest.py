@@ -0,0 +1,153 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+################################################################################
+#
+#   RMG - Reaction Mechanism Generator
+#
+#   Copyright (c) 2002-2017 Prof. William H. Green (whgreen@mit.edu), 
+#   Prof. Richard H. West (r.west@neu.edu) and the RMG Team (rmg_dev@mit.edu)
+#
+#   Permission is hereby granted, free of charge, to any person obtaining a
+#   copy of this software and associated documentation files (the 'Software'),
+#   to deal in the Software without restriction, including without limitation
+#   the rights to use, copy, modify, merge, publish, distribute, sublicense,
+#   and/or sell copies of the Software, and to permit persons to whom the
+#   Software is furnished to do so, subject to the following conditions:
+#
+#   The above copyright notice and this permission notice shall be included in
+#   all copies or substantial portions of the Software.
+#
+#   THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#   FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#   DEALINGS IN THE SOFTWARE.
+#
+################################################################################
+
+"""
+This module contains unit tests of the rmgpy.molecule.compact module.
+"""
+
+import cPickle
+import unittest
+
+from rmgpy.molecule.molecule import Molecule
+from rmgpy.molecule.compact import CompactMolecule
+
+################################################################################
+
+class TestCompactMolecule(unittest.TestCase):
+    """
+    Contains unit tests of the CompactMolecule class.
+    """
+
+    def setUp(self):
+        """
+        A function run before each unit test in this class.
+        """
+        self.molecule = Molecule().fromAdjacencyList("""
+multiplicity 2
+1 C u0 p0 c0 {2,D} {4,S} {5,S}
+2 C u0 p0 c0 {1,D} {3,S} {6,S}
+3 C u1 p0 c0 {2,S} {7,S} {8,S}
+4 O u0 p2 c0 {1,S} {9,S}
+5 H u0 p0 c0 {1,S}
+6 H u0 p0 c0 {2,S}
+7 H u0 p0 c0 {3,S}
+8 H u0 p0 c0 {3,S}
+9 H u0 p0 c0 {4,S}
+""")
+        self.molecule.assignAtomIDs()
+        self.compact = CompactMolecule(self.molecule)
+
+    def testArrays(self):
+        """
+        Test that the arrays describe the atoms and bonds of the molecule.
+        """
+        self.assertEqual(len(self.compact), 9)
+        self.assertEqual(self.compact.numbers.tolist(), [6, 6, 6, 8, 1, 1, 1, 1, 1])
+        self.assertEqual(self.compact.radicals.tolist(), [0, 0, 1, 0, 0, 0, 0, 0, 0])
+        self.assertEqual(self.compact.lonePairs.tolist(), [0, 0, 0, 2, 0, 0, 0, 0, 0])
+        self.assertEqual(self.compact.indptr.tolist(), [0, 3, 6, 9, 11, 12, 13, 14, 15, 16])
+        self.assertEqual(self.compact.getBonds(0), {1: 2.0, 3: 1.0, 4: 1.0})
+        self.assertEqual(self.compact.atomTypes[:4], ['Cd', 'Cd', 'Cs', 'O2s'])
+        self.assertEqual(self.compact.multiplicity, 2)
+
+    def testToMolecule(self):
+        """
+        Test that converting back to a molecule gives an identical molecule.
+        """
+        molecule = self.compact.toMolecule()
+        self.assertTrue(molecule.isIsomorphic(self.molecule))
+        self.assertTrue(molecule.isIdentical(self.molecule))
+        self.assertEqual(molecule.multiplicity, 2)
+        for atom1, atom2 in zip(molecule.vertices, self.molecule.vertices):
+            self.assertIs(atom1.atomType, atom2.atomType)
+            self.assertEqual(atom1.id, atom2.id)
+
+    def testCopy(self):
+        """
+        Test that copies do not share their arrays with the original.
+        """
+        other = self.compact.copy()
+        other.radicals[2] = 0
+        self.assertEqual(self.compact.radicals[2], 1)
+        self.assertFalse(other.isIsomorphic(self.compact))
+        self.assertTrue(self.compact.isIsomorphic(self.molecule))
+
+    def testPickle(self):
+        """
+        Test that a compact molecule can be pickled and unpickled.
+        """
+        for protocol in [0, -1]:
+            other = cPickle.loads(cPickle.dumps(self.compact, protocol))
+            self.assertTrue(other.isIsomorphic(self.compact))
+            self.assertEqual(other.labels, self.compact.labels)
+            self.assertEqual(other.ids.tolist(), self.compact.ids.tolist())
+            self.assertEqual(other.orders.tolist(), self.compact.orders.tolist())
+            # The unpickled arrays can be modified
+            other.radicals[2] = 0
+
+    def testPickleMolecule(self):
+        """
+        Test that molecules are pickled in the compact form without losing
+        their atom labels, IDs and types, and that the pickle is smaller
+        than one of the atoms and bonds.
+        """
+        self.molecule.atoms[2].label = '*1'
+        self.molecule.props['test'] = 1
+        data = cPickle.dumps(self.molecule, -1)
+        molecule = cPickle.loads(data)
+        self.assertTrue(molecule.isIdentical(self.molecule))
+        self.assertEqual(molecule.multiplicity, 2)
+        self.assertEqual(molecule.props, {'test': 1})
+        self.assertEqual(molecule.atoms[2].label, '*1')
+        for atom1, atom2 in zip(molecule.atoms, self.molecule.atoms):
+            self.assertIs(atom1.atomType, atom2.atomType)
+            self.assertEqual(atom1.id, atom2.id)
+        self.assertTrue(len(data) < len(cPickle.dumps((self.molecule.vertices, self.molecule.multiplicity), -1)))
+
+    def testIsIsomorphic(self):
+        """
+        Test isomorphism checks between compact molecules.
+        """
+        other = CompactMolecule(Molecule(SMILES='[CH2]C=CO'))
+        self.assertTrue(self.compact.isIsomorphic(other))
+        self.assertFalse(self.compact.isIsomorphic(CompactMolecule(Molecule(SMILES='C=C[CH]O'))))
+        self.assertFalse(self.compact.isIsomorphic(CompactMolecule(Molecule(SMILES='CC=CO'))))
+
+    def testMoleculeMethods(self):
+        """
+        Test the conversion methods of the Molecule class.
+        """
+        molecule = Molecule().fromCompact(self.molecule.toCompact())
+        self.assertTrue(molecule.isIdentical(self.molecule))
+
+################################################################################
+
+if __name__ == '__main__':
+    unittest.main(testRunner=unittest.TextTestRunner(verbosity=2))
@@ -1,4 +1,4 @@
-from .molecule cimport Atom, Molecule
+from .molecule cimport Atom, Bond, Molecule
 
 cpdef dict _known_smiles_molecules
 cpdef dict _known_smiles_radicals
@@ -23,6 +23,12 @@ cpdef toRDKitMol(Molecule mol, bint removeHs=*, bint returnMapping=*, bint sanit
 
 cpdef bint is_valid_combo(list combo, Molecule mol, list distances)
 
+cpdef tuple get_identifier_state(Molecule mol)
+
+cpdef str getIdentifier(Molecule mol, str identifier)
+
+cpdef list getIdentifiers(list molecules, str identifier)
+
 cpdef list find_lowest_u_layer(Molecule mol, list u_layer, list equivalent_atoms)
 
 cpdef Molecule generate_minimum_resonance_isomer(Molecule mol)
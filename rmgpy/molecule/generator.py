@@ -47,6 +47,7 @@ from .util import partition, agglomerate, generate_combo
 import rmgpy.molecule.element as element
 import rmgpy.molecule.inchi as inchiutil
 import rmgpy.molecule.resonance as resonance
+from .structurecache import StructureCache
 # global variables:
 
 #: This dictionary is used to shortcut lookups of a molecule's SMILES string from its chemical formula.
@@ -301,6 +302,70 @@ def toSMILES(mol):
         return Chem.MolToSmiles(rdkitmol, kekuleSmiles=True)
     return Chem.MolToSmiles(rdkitmol)
 
+#: The functions used by :func:`getIdentifier` to generate each kind of identifier
+_identifier_functions = {
+    'SMILES': toSMILES,
+    'InChI': toInChI,
+    'InChIKey': toInChIKey,
+    'AugmentedInChI': toAugmentedInChI,
+    'AugmentedInChIKey': toAugmentedInChIKey,
+}
+
+def _new_identifiers(mol):
+    """
+    Return an empty dict for the identifiers of `mol`, to be filled in by
+    :func:`getIdentifier` as they are generated.
+    """
+    return {}
+
+# The process-wide cache used by getIdentifier, holding a dict of the
+# identifiers generated so far for each structure, by kind
+identifier_cache = StructureCache()
+
+def get_identifier_state(mol):
+    """
+    Return a tuple of the multiplicity of `mol` and the properties and bonds
+    of each of its atoms, in order. The identifiers stored on a molecule are
+    only used while this tuple is unchanged, so that they are regenerated
+    after the molecule is modified in any way.
+    """
+    cython.declare(atom=Atom, atom2=Atom, bond=Bond, indices=dict, i=cython.int)
+    indices = {}
+    for i, atom in enumerate(mol.vertices):
+        indices[atom] = i
+    return (mol.multiplicity, tuple([(atom.element.number, atom.element.isotope, atom.radicalElectrons, atom.charge,
+                                      atom.lonePairs, tuple(sorted([(indices[atom2], bond.order)
+                                                                    for atom2, bond in atom.edges.iteritems()])))
+                                     for atom in mol.vertices]))
+
+def getIdentifier(mol, identifier):
+    """
+    Return the identifier of `mol` of the kind `identifier`, which is one of
+    ``'SMILES'``, ``'InChI'``, ``'InChIKey'``, ``'AugmentedInChI'`` or
+    ``'AugmentedInChIKey'``. Identifiers are stored on the molecule until it
+    is modified, and in the process-wide :data:`identifier_cache` by
+    structure, so each is only generated once for each structure.
+    """
+    cython.declare(state=tuple, identifiers=dict)
+    state = get_identifier_state(mol)
+    if mol._identifiers is None or mol._identifiers[0] != state:
+        identifiers = identifier_cache.getValue(mol, _new_identifiers)
+        mol._identifiers = (state, identifiers)
+    identifiers = mol._identifiers[1]
+    try:
+        return identifiers[identifier]
+    except KeyError:
+        value = identifiers[identifier] = _identifier_functions[identifier](mol)
+        return value
+
+def getIdentifiers(molecules, identifier):
+    """
+    Return a list of the identifiers of the kind `identifier` of each of the
+    `molecules`, as for :func:`getIdentifier`. Molecules with the same
+    structure share a single conversion.
+    """
+    return [getIdentifier(mol, identifier) for mol in molecules]
+
 def toOBMol(mol, returnMapping=False):
     """
     Convert a molecular structure to an OpenBabel OBMol object. Uses
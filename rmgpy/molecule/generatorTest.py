@@ -762,5 +762,56 @@ class SMILESGenerationTest(unittest.TestCase):
         smiles = '[O][O]'
         self.compare(adjlist, smiles)
 
+class IdentifierCacheTest(unittest.TestCase):
+    """
+    Contains unit tests of the caching of identifiers by structure.
+    """
+
+    def setUp(self):
+        identifier_cache.clear()
+
+    def tearDown(self):
+        identifier_cache.clear()
+
+    def testCachedOnMolecule(self):
+        """
+        Test that identifiers are stored on the molecule until it is modified.
+        """
+        mol = Molecule().fromSMILES('CCO')
+        self.assertEqual(mol.toSMILES(), 'CCO')
+        self.assertEqual(mol.toSMILES(), 'CCO')
+        self.assertEqual(identifier_cache.misses, 1)
+        self.assertEqual(identifier_cache.hits, 0)
+
+        # Remove a hydrogen atom to make a radical
+        for atom in mol.atoms:
+            if atom.isOxygen():
+                for atom2 in atom.edges.keys():
+                    if atom2.isHydrogen():
+                        mol.removeAtom(atom2)
+                        break
+                atom.incrementRadical()
+        mol.multiplicity = 2
+        self.assertEqual(mol.toSMILES(), 'CC[O]')
+        self.assertEqual(identifier_cache.misses, 2)
+
+    def testCachedByStructure(self):
+        """
+        Test that isomorphic molecules share their identifiers.
+        """
+        inchi = Molecule().fromSMILES('C=CC').toAugmentedInChI()
+        mol = Molecule().fromSMILES('CC=C')
+        self.assertEqual(mol.toAugmentedInChI(), inchi)
+        self.assertEqual(identifier_cache.hits, 1)
+        self.assertEqual(mol.toAugmentedInChI(), toAugmentedInChI(mol))
+
+    def testGetIdentifiers(self):
+        """
+        Test that identifiers can be generated for several molecules at once.
+        """
+        molecules = [Molecule().fromSMILES(smiles) for smiles in ['[CH3]', 'CC', '[CH3]']]
+        self.assertEqual(getIdentifiers(molecules, 'InChI'), [toInChI(mol) for mol in molecules])
+        self.assertEqual(identifier_cache.hits, 1)
+
 if __name__ == '__main__':
     unittest.main()
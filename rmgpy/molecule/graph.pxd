@@ -65,9 +65,24 @@ cdef class Edge(object):
 
 ################################################################################
 
+cdef class RingPerception:
+
+    cdef public list vertices
+    cdef public int numVertices
+    cdef public set cyclicVertices
+    cdef public set cyclicEdges
+    cdef public list SSSR
+    cdef public tuple disparateRings
+    cdef public dict cyclesOfSize
+
+    cdef addCyclicEdge(self, Edge edge)
+
+################################################################################
+
 cdef class Graph:
 
     cdef public list vertices
+    cdef RingPerception _rings
 
     cpdef Vertex addVertex(self, Vertex vertex)
 
@@ -107,6 +122,8 @@ cdef class Graph:
 
     cpdef list findSubgraphIsomorphisms(self, Graph other, dict initialMap=?)
 
+    cpdef RingPerception getRingPerception(self)
+
     cpdef bint isCyclic(self) except -2
 
     cpdef bint isVertexInCycle(self, Vertex vertex) except -2
@@ -125,6 +142,8 @@ cdef class Graph:
     
     cpdef tuple getDisparateRings(self)
 
+    cdef tuple _findDisparateRings(self)
+
     cpdef list getAllCycles(self, Vertex startingVertex)
 
     cpdef list getAllCyclesOfSize(self, int size)
@@ -134,6 +153,8 @@ cdef class Graph:
     cpdef list __exploreCyclesRecursively(self, list chain, list cycles)
 
     cpdef list getSmallestSetOfSmallestRings(self)
+
+    cdef list _findRings(self, RingPerception rings, int size)
     
     cpdef list getLargestRing(self, Vertex vertex)
     
@@ -198,6 +198,86 @@ cdef class Edge(object):
 
 cdef VF2 vf2 = VF2()
 
+cdef class RingPerception:
+    """
+    The rings of a graph, perceived once and kept until the graph changes.
+    The attributes are:
+
+    =================== =================== ====================================
+    Attribute           Type                Description
+    =================== =================== ====================================
+    `vertices`          ``list``            The vertex list of the graph the rings were perceived for
+    `numVertices`       ``int``             The number of vertices in that list when the rings were perceived
+    `cyclicVertices`    ``set``             The vertices that are in one or more cycles
+    `cyclicEdges`       ``set``             The edges that are in one or more cycles
+    `SSSR`              ``list``            The smallest set of smallest rings, or ``None`` if not yet found
+    `disparateRings`    ``tuple``           The monocyclic and fused polycyclic rings, or ``None`` if not yet found
+    `cyclesOfSize`      ``dict``            The rings of each size found so far
+    =================== =================== ====================================
+
+    The cyclic vertices and edges are found when the object is created, in
+    time linear in the size of the graph: an edge is in a cycle exactly when
+    it is not a bridge, and the bridges are found in a single depth-first
+    search. The rings themselves are found when they are first requested.
+    """
+
+    def __init__(self, Graph graph):
+        cdef dict order, low
+        cdef list stack
+        cdef Vertex root, vertex, vertex2, parent
+        cdef Edge edge
+        cdef int counter
+
+        self.vertices = graph.vertices
+        self.numVertices = len(graph.vertices)
+        self.cyclicVertices = set()
+        self.cyclicEdges = set()
+        self.SSSR = None
+        self.disparateRings = None
+        self.cyclesOfSize = {}
+
+        # Iterative depth-first search for the edges that are not bridges;
+        # order[v] is the discovery order of v, and low[v] the lowest order
+        # reachable from the subtree of v using one edge that is not in the tree
+        order = {}
+        low = {}
+        counter = 0
+        for root in graph.vertices:
+            if root in order:
+                continue
+            order[root] = low[root] = counter
+            counter += 1
+            stack = [(root, None, iter(root.edges))]
+            while stack:
+                vertex, parent, neighbors = stack[-1]
+                for vertex2 in neighbors:
+                    if vertex2 is parent:
+                        continue
+                    elif vertex2 in order:
+                        if order[vertex2] < order[vertex]:
+                            # An edge back to an ancestor closes a cycle
+                            low[vertex] = min(low[vertex], order[vertex2])
+                            self.addCyclicEdge(vertex.edges[vertex2])
+                    else:
+                        order[vertex2] = low[vertex2] = counter
+                        counter += 1
+                        stack.append((vertex2, vertex, iter(vertex2.edges)))
+                        break
+                else:
+                    stack.pop()
+                    if parent is not None:
+                        low[parent] = min(low[parent], low[vertex])
+                        if low[vertex] <= order[parent]:
+                            # The edge to the parent is not a bridge
+                            self.addCyclicEdge(vertex.edges[parent])
+
+    cdef addCyclicEdge(self, Edge edge):
+        self.cyclicEdges.add(edge)
+        self.cyclicVertices.add(edge.vertex1)
+        self.cyclicVertices.add(edge.vertex2)
+
+################################################################################
+
 cdef class Graph:
     """
     A graph data type. The vertices of the graph are stored in a list
@@ -210,6 +290,7 @@ cdef class Graph:
 
     def __init__(self, vertices=None):
         self.vertices = vertices or []
+        self._rings = None
         
     def __reduce__(self):
         """
@@ -223,6 +304,7 @@ cdef class Graph:
         """
         self.vertices.append(vertex)
         vertex.edges = dict()
+        self._rings = None
         return vertex
 
     cpdef Edge addEdge(self, Edge edge):
@@ -234,6 +316,7 @@ cdef class Graph:
             raise ValueError('Attempted to add edge between vertices not in the graph.')
         edge.vertex1.edges[edge.vertex2] = edge
         edge.vertex2.edges[edge.vertex1] = edge
+        self._rings = None
         return edge
 
     cpdef dict getEdges(self, Vertex vertex):
@@ -276,6 +359,7 @@ cdef class Graph:
             del vertex2.edges[vertex]
         vertex.edges = dict()
         self.vertices.remove(vertex)
+        self._rings = None
 
     cpdef removeEdge(self, Edge edge):
         """
@@ -285,6 +369,7 @@ cdef class Graph:
         """
         del edge.vertex1.edges[edge.vertex2]
         del edge.vertex2.edges[edge.vertex1]
+        self._rings = None
 
     cpdef Graph copy(self, bint deep=False):
         """
@@ -419,6 +504,7 @@ cdef class Graph:
         """
         cdef Vertex vertex
         for vertex in self.vertices: vertex.resetConnectivityValues()
+        self._rings = None
         
     cpdef updateConnectivityValues(self):
         """
@@ -490,35 +576,40 @@ cdef class Graph:
         """
         return vf2.findSubgraphIsomorphisms(self, other, initialMap)
 
+    cpdef RingPerception getRingPerception(self):
+        """
+        Return the :class:`RingPerception` object for the current structure of
+        the graph. The methods that add or remove vertices or edges discard the
+        rings perceived before, as does :meth:`resetConnectivityValues`, which
+        should be called after changing the edges of the vertices directly. The
+        rings are also perceived again if the vertex list has been replaced or
+        resized without using these methods.
+        """
+        if (self._rings is None or self._rings.vertices is not self.vertices
+                or self._rings.numVertices != len(self.vertices)):
+            self._rings = RingPerception(self)
+        return self._rings
+
     cpdef bint isCyclic(self) except -2:
         """
         Return ``True`` if one or more cycles are present in the graph or
         ``False`` otherwise.
         """
-        cdef Vertex vertex
-        for vertex in self.vertices:
-            if self.isVertexInCycle(vertex):
-                return True
-        return False
+        return len(self.getRingPerception().cyclicVertices) > 0
 
     cpdef bint isVertexInCycle(self, Vertex vertex) except -2:
         """
         Return ``True`` if the given `vertex` is contained in one or more
         cycles in the graph, or ``False`` if not.
         """
-        return self.__isChainInCycle([vertex])
+        return vertex in self.getRingPerception().cyclicVertices
 
     cpdef bint isEdgeInCycle(self, Edge edge) except -2:
         """
         Return :data:`True` if the edge between vertices `vertex1` and `vertex2`
         is in one or more cycles in the graph, or :data:`False` if not.
         """
-        cdef list cycles
-        cycles = self.getAllCycles(edge.vertex1)
-        for cycle in cycles:
-            if edge.vertex2 in cycle:
-                return True
-        return False
+        return edge.vertex1.edges.get(edge.vertex2) in self.getRingPerception().cyclicEdges
 
     cpdef bint __isChainInCycle(self, list chain) except -2:
         """
@@ -549,13 +640,10 @@ cdef class Graph:
         """ 
         Returns all vertices belonging to one or more cycles.        
         """
-        cdef list cyclicVertices
-        # Loop through all vertices and check whether they are cyclic
-        cyclicVertices = []
-        for vertex in self.vertices:
-            if self.isVertexInCycle(vertex):
-                cyclicVertices.append(vertex)                
-        return cyclicVertices
+        cdef set cyclicVertices
+        cdef Vertex vertex
+        cyclicVertices = self.getRingPerception().cyclicVertices
+        return [vertex for vertex in self.vertices if vertex in cyclicVertices]
     
     cpdef list getAllPolycyclicVertices(self):
         """
@@ -582,82 +670,36 @@ cdef class Graph:
         a single polycyclic cycle, and return only those cycles. 
         Cycles which are not polycyclic are not returned.
         """
-        cdef list polycyclicVertices, continuousCycles, SSSR
-        cdef set polycyclicCycle
-        cdef Vertex vertex
-        
-        SSSR = self.getSmallestSetOfSmallestRings()
-        if not SSSR:
-            return []
-        
-        polycyclicVertices = self.getAllPolycyclicVertices()
-        
-        if not polycyclicVertices:
-            # no polycyclic vertices detected
-            return []
-        else: 
-            # polycyclic vertices found, merge cycles together
-            # that have common polycyclic vertices            
-            continuousCycles = []
-            for vertex in polycyclicVertices:
-                # First check if it is in any existing continuous cycles
-                for cycle in continuousCycles:
-                    if vertex in cycle:
-                        polycyclicCycle = cycle
-                        break
-                else:
-                    # Otherwise create a new cycle
-                    polycyclicCycle = set()
-                    continuousCycles.append(polycyclicCycle)
-                    
-                for cycle in SSSR:
-                    if vertex in cycle:
-                        polycyclicCycle.update(cycle)
-                        
-            # convert each set to a list
-            continuousCycles = [list(cycle) for cycle in continuousCycles]
-            return continuousCycles
+        return self.getDisparateRings()[1]
     
     cpdef list getMonocyclicRings(self):
         """
         Return a list of cycles that are monocyclic.
         """
-        cdef list polycyclicVertices, SSSR, monocyclicCycles, polycyclicSSSR
-        cdef Vertex vertex
-        
-        SSSR = self.getSmallestSetOfSmallestRings()
-        if not SSSR:
-            return []
-        
-        polycyclicVertices = self.getAllPolycyclicVertices()
-        
-        if not polycyclicVertices:
-            # No polycyclicVertices detected, all the rings from getSmallestSetOfSmallestRings
-            # are monocyclic
-            return SSSR
-        
-        polycyclicSSSR = []
-        for vertex in polycyclicVertices:
-            for cycle in SSSR:
-                if vertex in cycle:
-                    if cycle not in polycyclicSSSR:
-                        polycyclicSSSR.append(cycle)
-        
-        # remove the polycyclic cycles from the list of SSSR, leaving behind just the monocyclics
-        monocyclicCycles = SSSR
-        for cycle in polycyclicSSSR:
-            monocyclicCycles.remove(cycle)
-        return monocyclicCycles
+        return self.getDisparateRings()[0]
     
     cpdef tuple getDisparateRings(self):
         """
         Return a list of distinct polycyclic and monocyclic rings within the graph.
-        There is some code duplication in this function in order to maximize speed up
-        so as to call `self.getSmallestSetOfSmallestRings()` only once.
+        The rings are found once for each structure of the graph; new lists
+        are returned on every call.
         
         Returns: monocyclicRingsList, polycyclicRingsList
         """
-        
+        cdef RingPerception rings
+        cdef list monocyclicCycles, polycyclicCycles, cycle
+
+        rings = self.getRingPerception()
+        if rings.disparateRings is None:
+            rings.disparateRings = self._findDisparateRings()
+        monocyclicCycles, polycyclicCycles = rings.disparateRings
+        return [cycle[:] for cycle in monocyclicCycles], [cycle[:] for cycle in polycyclicCycles]
+
+    cdef tuple _findDisparateRings(self):
+        """
+        Find the distinct polycyclic and monocyclic rings within the graph
+        for :meth:`getDisparateRings`.
+        """
         cdef set polycyclicCycle
         cdef Vertex vertex
         cdef list SSSR, vertices, polycyclicVertices, continuousCycles
@@ -735,105 +777,31 @@ cdef class Graph:
         from a Connection Table." *J. Chem. Inf. Comput. Sci.* **33**,
         p. 657-662 (1993).
         """
-        cdef Graph graph
-        cdef bint done, found
-        cdef list cycleList, cycles, cycle, graphs, neighbors, verticesToRemove, vertices, cycleSetList
-        cdef Vertex vertex, rootVertex
+        cdef RingPerception rings
+        cdef list cycleList, cycleSetList, cycle
         cdef set set1, set2
 
-        # Make a copy of the graph so we don't modify the original
-        graph = self.copy(deep=True)
-        vertices = graph.vertices[:]
-
-        # Step 1: Remove all terminal vertices
-        done = False
-        while not done:
-            verticesToRemove = []
-            for vertex in graph.vertices:
-                if len(vertex.edges) == 1: verticesToRemove.append(vertex)
-            done = len(verticesToRemove) == 0
-            # Remove identified vertices from graph
-            for vertex in verticesToRemove:
-                graph.removeVertex(vertex)
+        rings = self.getRingPerception()
+        if size not in rings.cyclesOfSize:
+            cycleList = self._findRings(rings, size)
 
-        # Step 2: Remove all other vertices that are not part of cycles
-        verticesToRemove = []
-        for vertex in graph.vertices:
-            found = graph.isVertexInCycle(vertex)
-            if not found:
-                verticesToRemove.append(vertex)
-        # Remove identified vertices from graph
-        for vertex in verticesToRemove:
-            graph.removeVertex(vertex)
+            #remove duplicates if there are more than 2 cycles:
+            if len(cycleList) >= 2:
+                cycleSetList = [set(cycleList[0])]
+                for cycle1 in cycleList[1:]:
+                    set1 = set(cycle1)
+                    for set2 in cycleSetList:
+                        if set1 == set2:
+                            break
+                    #not a duplicate so add it to cycleSetList
+                    else: cycleSetList.append(set1)
 
-        # Step 3: Split graph into remaining subgraphs
-        graphs = graph.split()
+                #transform back to list of lists:
+                cycleList = [list(set1) for set1 in cycleSetList]
 
-        # Step 4: Find ring sets in each subgraph
-        cycleList = []
+            rings.cyclesOfSize[size] = cycleList
 
-        for graph in graphs:
-
-            while len(graph.vertices) > 0:
-
-                # Choose root vertex as vertex with smallest number of edges
-                rootVertex = None
-                graph.updateConnectivityValues()
-                for vertex in graph.vertices:
-                    if rootVertex is None:
-                        rootVertex = vertex
-                    elif getVertexConnectivityValue(vertex) > getVertexConnectivityValue(rootVertex):
-                        rootVertex = vertex
-
-                # Get all cycles involving the root vertex
-                cycles = graph.getAllCycles(rootVertex)
-                if len(cycles) == 0:
-                    # This vertex is no longer in a ring, so remove it
-                    graph.removeVertex(rootVertex)
-                    continue
-
-                # Keep the smallest of the cycles found above
-                cycle = cycles[0]
-                for c in cycles:
-                    if len(c) == size: cycleList.append(c)
-
-                # Remove the root vertex to create single edges, note this will not
-                # function properly if there is no vertex with 2 edges (i.e. cubane)
-                graph.removeVertex(rootVertex)
-
-                # Remove from the graph all vertices in the cycle that have only one edge
-                loneCarbon = True
-                while loneCarbon:
-                    loneCarbon = False
-                    verticesToRemove = []
-
-                    for vertex in cycle:
-                        if len(vertex.edges) == 1:
-                            loneCarbon = True
-                            verticesToRemove.append(vertex)
-                    else:
-                        for vertex in verticesToRemove:
-                            graph.removeVertex(vertex)
-
-        # Map atoms in cycles back to atoms in original graph
-        for i in range(len(cycleList)):
-            cycleList[i] = [self.vertices[vertices.index(v)] for v in cycleList[i]]
-
-        #remove duplicates if there are more than 2 cycles:
-        if len(cycleList) <2 : return cycleList
-        cycleSetList = [set(cycleList[0])]
-        for cycle1 in cycleList[1:]:
-            set1 = set(cycle1)
-            for set2 in cycleSetList:
-                if set1 == set2:
-                    break
-            #not a duplicate so add it to cycleSetList
-            else: cycleSetList.append(set1)
-
-        #transform back to list of lists:
-        cycleSetList = [list(set1) for set1 in cycleSetList]
-
-        return cycleSetList
+        return [cycle[:] for cycle in rings.cyclesOfSize[size]]
 
     cpdef list getAllSimpleCyclesOfSize(self, int size):
         """
@@ -897,36 +865,45 @@ cdef class Graph:
         New Algorithm for Directly Finding the Smallest Set of Smallest Rings
         from a Connection Table." *J. Chem. Inf. Comput. Sci.* **33**,
         p. 657-662 (1993).
+
+        The rings are found once for each structure of the graph; new lists
+        are returned on every call.
+        """
+        cdef RingPerception rings
+        cdef list cycle
+
+        rings = self.getRingPerception()
+        if rings.SSSR is None:
+            rings.SSSR = self._findRings(rings, 0)
+        return [cycle[:] for cycle in rings.SSSR]
+
+    cdef list _findRings(self, RingPerception rings, int size):
+        """
+        Find rings using the algorithm of Fan et al. If `size` is zero, return
+        the smallest set of smallest rings; otherwise return all of the rings
+        of length `size` found from each root vertex, which may include
+        duplicates. The vertices that are not in any cycle are taken from
+        `rings` rather than searched for.
         """
         cdef Graph graph
-        cdef bint done, found
-        cdef list cycleList, cycles, cycle, graphs, neighbors, verticesToRemove, vertices
+        cdef bint loneCarbon
+        cdef list cycleList, cycles, cycle, c, graphs, verticesToRemove, vertices
+        cdef dict originals
         cdef Vertex vertex, rootVertex
+        cdef int index
 
         # Make a copy of the graph so we don't modify the original
         graph = self.copy(deep=True)
         vertices = graph.vertices[:]
-        
-        # Step 1: Remove all terminal vertices
-        done = False
-        while not done:
-            verticesToRemove = []
-            for vertex in graph.vertices:
-                if len(vertex.edges) == 1: verticesToRemove.append(vertex)
-            done = len(verticesToRemove) == 0
-            # Remove identified vertices from graph
-            for vertex in verticesToRemove:
-                graph.removeVertex(vertex)
+        originals = {}
+        for index in range(len(vertices)):
+            originals[vertices[index]] = self.vertices[index]
 
-        # Step 2: Remove all other vertices that are not part of cycles
-        verticesToRemove = []
-        for vertex in graph.vertices:
-            found = graph.isVertexInCycle(vertex)
-            if not found:
-                verticesToRemove.append(vertex)
-        # Remove identified vertices from graph
-        for vertex in verticesToRemove:
-            graph.removeVertex(vertex)
+        # Steps 1 and 2: Remove all vertices that are not part of cycles,
+        # including all terminal vertices
+        for vertex in vertices:
+            if originals[vertex] not in rings.cyclicVertices:
+                graph.removeVertex(vertex)
 
         # Step 3: Split graph into remaining subgraphs
         graphs = graph.split()
@@ -953,12 +930,17 @@ cdef class Graph:
                     graph.removeVertex(rootVertex)
                     continue
 
-                # Keep the smallest of the cycles found above
                 cycle = cycles[0]
-                for c in cycles[1:]:
-                    if len(c) < len(cycle):
-                        cycle = c
-                cycleList.append(cycle)
+                if size == 0:
+                    # Keep the smallest of the cycles found above
+                    for c in cycles[1:]:
+                        if len(c) < len(cycle):
+                            cycle = c
+                    cycleList.append(cycle)
+                else:
+                    # Keep all of the cycles of the requested size
+                    for c in cycles:
+                        if len(c) == size: cycleList.append(c)
                 
                 # Remove the root vertex to create single edges, note this will not
                 # function properly if there is no vertex with 2 edges (i.e. cubane)
@@ -979,10 +961,7 @@ cdef class Graph:
                             graph.removeVertex(vertex)
 
         # Map atoms in cycles back to atoms in original graph
-        for i in range(len(cycleList)):
-            cycleList[i] = [self.vertices[vertices.index(v)] for v in cycleList[i]]
-
-        return cycleList
+        return [[originals[vertex] for vertex in cycle] for cycle in cycleList]
 
     cpdef list getLargestRing(self, Vertex vertex):
         """
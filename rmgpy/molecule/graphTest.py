@@ -601,6 +601,65 @@ class TestGraph(unittest.TestCase):
         self.assertEqual(len(cycleList), 1)
         self.assertEqual(len(cycleList[0]), 4)
 
+    def test_ringPerceptionCache(self):
+        """
+        Test that the rings of a graph are perceived again after it changes.
+        """
+        edge = Edge(self.graph.vertices[0], self.graph.vertices[3])
+        self.graph.addEdge(edge) # To create a cycle
+        rings = self.graph.getRingPerception()
+        self.assertTrue(self.graph.getRingPerception() is rings)
+        self.assertEqual(len(self.graph.getSmallestSetOfSmallestRings()), 1)
+        self.graph.removeEdge(edge)
+        self.assertFalse(self.graph.getRingPerception() is rings)
+        self.assertFalse(self.graph.isCyclic())
+        self.assertEqual(len(self.graph.getSmallestSetOfSmallestRings()), 0)
+        self.graph.addEdge(Edge(self.graph.vertices[0], self.graph.vertices[5]))
+        self.assertTrue(self.graph.isCyclic())
+        self.assertEqual(len(self.graph.getSmallestSetOfSmallestRings()[0]), 6)
+        # Changes made without the graph methods need resetConnectivityValues
+        rings = self.graph.getRingPerception()
+        edge = self.graph.vertices[0].edges[self.graph.vertices[5]]
+        del edge.vertex1.edges[edge.vertex2]
+        del edge.vertex2.edges[edge.vertex1]
+        self.assertTrue(self.graph.getRingPerception() is rings)
+        self.graph.resetConnectivityValues()
+        self.assertFalse(self.graph.isCyclic())
+        # Replacing the vertex list is detected without it
+        rings = self.graph.getRingPerception()
+        self.graph.vertices = self.graph.vertices[:]
+        self.assertFalse(self.graph.getRingPerception() is rings)
+
+    def test_ringPerceptionBridge(self):
+        """
+        Test that an edge joining two cycles is not in a cycle.
+        """
+        vertices = [Vertex() for i in range(6)]
+        graph = Graph()
+        for vertex in vertices: graph.addVertex(vertex)
+        for index1, index2 in [(0,1), (1,2), (2,0), (2,3), (3,4), (4,5), (5,3)]:
+            graph.addEdge(Edge(vertices[index1], vertices[index2]))
+        bridge = graph.getEdge(vertices[2], vertices[3])
+        self.assertFalse(graph.isEdgeInCycle(bridge))
+        self.assertEqual(len(graph.getAllCyclicVertices()), 6)
+        self.assertEqual(len(graph.getSmallestSetOfSmallestRings()), 2)
+        self.assertEqual(len(graph.getMonocyclicRings()), 2)
+        self.assertEqual(len(graph.getPolycyclicRings()), 0)
+
+    def test_getSmallestSetOfSmallestRingsCopy(self):
+        """
+        Test that changing the rings returned from the cache does not change
+        the cache.
+        """
+        edge = Edge(self.graph.vertices[0], self.graph.vertices[3])
+        self.graph.addEdge(edge) # To create a cycle
+        cycleList = self.graph.getSmallestSetOfSmallestRings()
+        cycleList[0].pop()
+        cycleList.append([])
+        cycleList = self.graph.getSmallestSetOfSmallestRings()
+        self.assertEqual(len(cycleList), 1)
+        self.assertEqual(len(cycleList[0]), 4)
+
     def test_getPolycyclicRings(self):
         """
         Test that the Graph.getPolycyclicRings() method returns only polycyclic rings.
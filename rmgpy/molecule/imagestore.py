@@ -0,0 +1,204 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+################################################################################
+#
+#   RMG - Reaction Mechanism Generator
+#
+#   Copyright (c) 2002-2017 Prof. William H. Green (whgreen@mit.edu), 
+#   Prof. Richard H. West (r.west@neu.edu) and the RMG Team (rmg_dev@mit.edu)
+#
+#   Permission is hereby granted, free of charge, to any person obtaining a
+#   copy of this software and associated documentation files (the 'Software'),
+#   to deal in the Software without restriction, including without limitation
+#   the rights to use, copy, modify, merge, publish, distribute, sublicense,
+#   and/or sell copies of the Software, and to permit persons to whom the
+#   Software is furnished to do so, subject to the following conditions:
+#
+#   The above copyright notice and this permission notice shall be included in
+#   all copies or substantial portions of the Software.
+#
+#   THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#   FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#   DEALINGS IN THE SOFTWARE.
+#
+################################################################################
+
+"""
+This module provides a content-addressed store of molecule drawings, used when
+generating HTML output for large models. Each image is saved under a name
+derived from the canonical structure of the molecule (its augmented InChI)
+rather than the label of the species it belongs to, so an image is drawn only
+once per structure, however often the species is relabeled or appears in
+different models. Missing images are drawn in parallel in a pool of worker
+processes. Images can also be made available under other names, such as the
+labels of species, for tools that look them up by name.
+"""
+
+import os
+import os.path
+import hashlib
+import logging
+import multiprocessing
+import shutil
+from collections import OrderedDict
+
+################################################################################
+
+def getStructureKey(molecule):
+    """
+    Return a string that identifies the structure of `molecule`, suitable for
+    use as a file name. The augmented InChI is used where possible; otherwise
+    the key is derived from the adjacency list.
+    """
+    try:
+        identifier = 'InChI:' + molecule.toAugmentedInChI()
+    except Exception:
+        identifier = 'adjlist:' + molecule.toAdjacencyList(removeH=False)
+    return hashlib.sha1(identifier).hexdigest()
+
+def _drawStructure(args):
+    """
+    Draw the molecule given by the adjacency list `adjlist` to the png file
+    `path`. The image is drawn to a temporary file first, so that a partly
+    written image is never left at `path`. This function runs in the worker
+    processes of :class:`StructureImageStore`.
+    """
+    from rmgpy.molecule.molecule import Molecule
+    from rmgpy.molecule.draw import MoleculeDrawer
+    adjlist, path = args
+    tempPath = '{0}.{1:d}.tmp'.format(path, os.getpid())
+    try:
+        MoleculeDrawer().draw(Molecule().fromAdjacencyList(adjlist), 'png', tempPath)
+        os.rename(tempPath, path)
+    except Exception as e:
+        logging.error('Unable to draw structure {0}: {1!s}'.format(os.path.basename(path), e))
+        if os.path.exists(tempPath):
+            os.remove(tempPath)
+        return False
+    return True
+
+def _linkImage(source, path):
+    """
+    Make the image `source` also available as `path`, replacing any existing
+    file there, as a hard link where possible or a copy otherwise.
+    """
+    if os.path.lexists(path):
+        os.remove(path)
+    try:
+        os.link(source, path)
+    except (AttributeError, OSError):
+        shutil.copyfile(source, path)
+
+class StructureImageStore(object):
+    """
+    A directory of png drawings of molecules named by their structure key.
+    The attributes are:
+
+    =============== =========================================================
+    Attribute       Description
+    =============== =========================================================
+    `path`          The directory in which the images are stored
+    `processes`     The number of worker processes to draw with (default: the number of CPUs)
+    `maxKeys`       The maximum number of molecules whose structure keys are kept
+    =============== =========================================================
+
+    Images are requested with :meth:`getImage`, which returns the file name
+    immediately, and drawn by the next call to :meth:`render`. If a `name` is
+    given, the image is also made available as `<name>.png` in the store
+    directory, which is where the flux diagram tools expect the image of a
+    species to be.
+
+    The pool of worker processes is started when the store is created and
+    reused by every call to :meth:`render`, so the store should be created
+    on the main thread before any other threads are started; forking a
+    process while another thread holds a lock can deadlock the workers. Call
+    :meth:`close` to stop the workers when the store is no longer needed.
+    """
+
+    def __init__(self, path, processes=None, maxKeys=10000):
+        self.path = path
+        self.processes = processes or multiprocessing.cpu_count()
+        self.maxKeys = maxKeys
+        # Cache of structure keys by molecule id, least recently used first;
+        # the molecule is kept in the entry so that its id cannot be reused
+        # by another object while the entry exists
+        self.keys = OrderedDict()
+        self.pending = {}
+        # The structure keys of the names requested since the last render,
+        # and of the names whose images have been linked by this store
+        self.pendingNames = {}
+        self.names = {}
+        if not os.path.isdir(self.path):
+            os.makedirs(self.path)
+        self.pool = multiprocessing.Pool(self.processes) if self.processes > 1 else None
+
+    def close(self):
+        """
+        Stop the worker processes of the store.
+        """
+        if self.pool is not None:
+            self.pool.close()
+            self.pool.join()
+            self.pool = None
+
+    def getKey(self, molecule):
+        """
+        Return the structure key of `molecule`.
+        """
+        entry = self.keys.pop(id(molecule), None)
+        if entry is None or entry[0] is not molecule:
+            entry = (molecule, getStructureKey(molecule))
+        self.keys[id(molecule)] = entry
+        while len(self.keys) > self.maxKeys:
+            self.keys.popitem(last=False)
+        return entry[1]
+
+    def getImage(self, molecule, name=None):
+        """
+        Return the file name, relative to the store directory, of the image of
+        `molecule`, and schedule the image to be drawn if it does not exist.
+        If `name` is given, the image is also linked to `<name>.png` by the
+        next call to :meth:`render`.
+        """
+        key = self.getKey(molecule)
+        filename = key + '.png'
+        if key not in self.pending and not os.path.exists(os.path.join(self.path, filename)):
+            self.pending[key] = molecule.toAdjacencyList(removeH=False)
+        if name is not None and self.names.get(name) != key:
+            self.pendingNames[name] = key
+        return filename
+
+    def render(self):
+        """
+        Draw all of the images requested since the last call to this method
+        that do not exist yet. Returns the number of images drawn.
+        """
+        tasks = [(adjlist, os.path.join(self.path, key + '.png')) for key, adjlist in self.pending.iteritems()]
+        self.pending = {}
+        count = 0
+        if tasks:
+            logging.info('Drawing {0:d} new species structures...'.format(len(tasks)))
+            if self.pool is not None and len(tasks) > 1:
+                results = self.pool.map(_drawStructure, tasks, chunksize=max(1, len(tasks) // (4 * self.processes)))
+            else:
+                results = map(_drawStructure, tasks)
+            count = sum(results)
+
+        for name, key in self.pendingNames.iteritems():
+            source = os.path.join(self.path, key + '.png')
+            if not os.path.exists(source):
+                continue
+            try:
+                _linkImage(source, os.path.join(self.path, name + '.png'))
+            except (IOError, OSError) as e:
+                logging.error('Unable to save the structure of {0}: {1!s}'.format(name, e))
+                continue
+            self.names[name] = key
+        self.pendingNames = {}
+
+        return count
@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+################################################################################
+#
+#   RMG - Reaction Mechanism Generator
+#
+#   Copyright (c) 2002-2017 Prof. William H. Green (whgreen@mit.edu), 
+#   Prof. Richard H. West (r.west@neu.edu) and the RMG Team (rmg_dev@mit.edu)
+#
+#   Permission is hereby granted, free of charge, to any person obtaining a
+#   copy of this software and associated documentation files (the 'Software'),
+#   to deal in the Software without restriction, including without limitation
+#   the rights to use, copy, modify, merge, publish, distribute, sublicense,
+#   and/or sell copies of the Software, and to permit persons to whom the
+#   Software is furnished to do so, subject to the following conditions:
+#
+#   The above copyright notice and this permission notice shall be included in
+#   all copies or substantial portions of the Software.
+#
+#   THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#   FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#   DEALINGS IN THE SOFTWARE.
+#
+################################################################################
+
+"""
+This module contains unit tests of the rmgpy.molecule.imagestore module.
+"""
+
+import unittest
+import os.path
+import shutil
+import tempfile
+
+from rmgpy.molecule import Molecule
+from rmgpy.molecule.imagestore import StructureImageStore, getStructureKey
+
+################################################################################
+
+class TestStructureImageStore(unittest.TestCase):
+    """
+    Contains unit tests of the StructureImageStore class.
+    """
+
+    def setUp(self):
+        """
+        A function run before each unit test in this class.
+        """
+        self.path = tempfile.mkdtemp()
+        self.store = StructureImageStore(os.path.join(self.path, 'species'), processes=1)
+
+    def tearDown(self):
+        """
+        A function run after each unit test in this class.
+        """
+        shutil.rmtree(self.path)
+
+    def testKeyDependsOnStructureOnly(self):
+        """
+        Test that identical structures share a key and different ones do not.
+        """
+        self.assertEqual(getStructureKey(Molecule(SMILES='CCO')), getStructureKey(Molecule(SMILES='OCC')))
+        self.assertNotEqual(getStructureKey(Molecule(SMILES='CCO')), getStructureKey(Molecule(SMILES='COC')))
+
+    def testImagesAreRequestedOnce(self):
+        """
+        Test that an image is only scheduled once per structure.
+        """
+        filename1 = self.store.getImage(Molecule(SMILES='CCO'))
+        filename2 = self.store.getImage(Molecule(SMILES='OCC'))
+        self.assertEqual(filename1, filename2)
+        self.assertEqual(len(self.store.pending), 1)
+
+    def testExistingImagesAreNotRedrawn(self):
+        """
+        Test that images already in the store directory are not drawn again.
+        """
+        molecule = Molecule(SMILES='CCO')
+        filename = self.store.getImage(molecule)
+        self.store.pending = {}
+        open(os.path.join(self.store.path, filename), 'w').close()
+        self.assertEqual(self.store.getImage(molecule), filename)
+        self.assertEqual(self.store.render(), 0)
+
+    def testNamedImages(self):
+        """
+        Test that images requested with a name are also saved under that name.
+        """
+        path = os.path.join(self.store.path, 'ethanol(1).png')
+        for smiles in ['CCO', 'COC']:
+            filename = self.store.getImage(Molecule(SMILES=smiles), 'ethanol(1)')
+            self.store.pending = {}
+            with open(os.path.join(self.store.path, filename), 'w') as f:
+                f.write(smiles)
+            self.store.render()
+            with open(path) as f:
+                self.assertEqual(f.read(), smiles)
+        self.store.getImage(Molecule(SMILES='COC'), 'ethanol(1)')
+        self.assertEqual(self.store.pendingNames, {})
+
+    def testKeysAreBounded(self):
+        """
+        Test that only the most recently used molecules are kept with their keys.
+        """
+        self.store.maxKeys = 2
+        molecules = [Molecule(SMILES=smiles) for smiles in ['C', 'CC', 'CCC']]
+        for molecule in molecules:
+            self.store.getKey(molecule)
+        self.assertEqual(len(self.store.keys), 2)
+        self.assertNotIn(id(molecules[0]), self.store.keys)
+        self.store.getKey(molecules[1])
+        self.store.getKey(molecules[0])
+        self.assertEqual(self.store.keys.keys(), [id(molecules[1]), id(molecules[0])])
+
+################################################################################
+
+if __name__ == '__main__':
+    unittest.main(testRunner=unittest.TextTestRunner(verbosity=2))
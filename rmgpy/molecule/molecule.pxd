@@ -120,6 +120,7 @@ cdef class Molecule(Graph):
     cdef public object rdMol
     cdef public int rdMolConfId
     cdef str _fingerprint
+    cdef public tuple _identifiers
     cdef public str InChI
     cdef public dict props
     
@@ -57,6 +57,7 @@ import rmgpy.molecule.parser as parser
 import rmgpy.molecule.generator as generator
 import rmgpy.molecule.resonance as resonance
 from .kekulize import kekulize
+from .compact import CompactMolecule
 from .adjlist import Saturator
 
 ################################################################################
@@ -673,6 +674,10 @@ class Molecule(Graph):
 
     A new molecule object can be easily instantiated by passing the `SMILES` or
     `InChI` string representing the molecular structure.
+
+    The SMILES, InChI and InChI key identifiers returned by the ``to*``
+    methods are cached by :func:`rmgpy.molecule.generator.getIdentifier`,
+    on the molecule until it is modified and across the process by structure.
     """
 
     def __init__(self, atoms=None, symmetry=-1, multiplicity=-187, props=None, SMILES=''):
@@ -680,6 +685,7 @@ class Molecule(Graph):
         self.symmetryNumber = symmetry
         self.multiplicity = multiplicity
         self._fingerprint = None
+        self._identifiers = None
         self.InChI = ''
         if SMILES != '': self.fromSMILES(SMILES)
         self.props = props or {}
@@ -730,9 +736,13 @@ class Molecule(Graph):
 
     def __reduce__(self):
         """
-        A helper function used when pickling an object.
+        A helper function used when pickling an object. The structure is
+        pickled as a :class:`CompactMolecule`, which is several times smaller
+        and faster to pickle than the atoms and bonds, so each atom is
+        recreated when unpickling: atoms referenced from outside the molecule
+        are not shared with it afterwards.
         """
-        return (Molecule, (self.vertices, self.symmetryNumber, self.multiplicity, self.props))
+        return (makeMolecule, (self.toCompact(), self.symmetryNumber, self.props))
 
     def __getAtoms(self): return self.vertices
     def __setAtoms(self, atoms): self.vertices = atoms
@@ -931,6 +941,24 @@ class Molecule(Graph):
         other.multiplicity = self.multiplicity
         return other
 
+    def toCompact(self):
+        """
+        Return a :class:`CompactMolecule` with the structure of this molecule,
+        which is cheaper to copy and to pickle.
+        """
+        return CompactMolecule(self)
+
+    def fromCompact(self, compact):
+        """
+        Set the structure of this molecule from the :class:`CompactMolecule`
+        object `compact`. New atoms and bonds are created.
+        """
+        molecule = compact.toMolecule()
+        self.vertices = molecule.vertices
+        self.multiplicity = molecule.multiplicity
+        self._fingerprint = None
+        return self
+
     def merge(self, other):
         """
         Merge two molecules so as to store them in a single :class:`Molecule`
@@ -1379,7 +1407,7 @@ class Molecule(Graph):
         Convert a molecular structure to an InChI string. Uses
         `OpenBabel <http://openbabel.org/>`_ to perform the conversion.
         """
-        return generator.toInChI(self)            
+        return generator.getIdentifier(self, 'InChI')            
         
     def toAugmentedInChI(self):
         """
@@ -1388,7 +1416,7 @@ class Molecule(Graph):
         
         Separate layer with a forward slash character.
         """
-        return generator.toAugmentedInChI(self)
+        return generator.getIdentifier(self, 'AugmentedInChI')
         
     
     def toInChIKey(self):
@@ -1404,7 +1432,7 @@ class Molecule(Graph):
         Removes check-sum dash (-) and character so that only 
         the 14 + 9 characters remain.
         """
-        return generator.toInChIKey(self)
+        return generator.getIdentifier(self, 'InChIKey')
     
     def toAugmentedInChIKey(self):
         """
@@ -1414,7 +1442,7 @@ class Molecule(Graph):
         Simply append the multiplicity string, do not separate by a
         character like forward slash.
         """
-        return generator.toAugmentedInChIKey(self)
+        return generator.getIdentifier(self, 'AugmentedInChIKey')
     
 
     def toSMARTS(self):
@@ -1440,7 +1468,7 @@ class Molecule(Graph):
         and removes Hydrogen atoms.
         """
         
-        return generator.toSMILES(self)
+        return generator.getIdentifier(self, 'SMILES')
 
     def toRDKitMol(self, *args, **kwargs):
         """
@@ -1581,10 +1609,12 @@ class Molecule(Graph):
         """
         Return the symmetry number for the structure. The symmetry number
         includes both external and internal modes.
+
+        Symmetry numbers are stored in a process-wide cache by structure, so
+        each structure is only analyzed once.
         """
-        from rmgpy.molecule.symmetry import calculateSymmetryNumber
-        self.updateConnectivityValues() # for consistent results
-        self.symmetryNumber = calculateSymmetryNumber(self)
+        from rmgpy.molecule.symmetry import calculateCachedSymmetryNumber
+        self.symmetryNumber = calculateCachedSymmetryNumber(self)
         return self.symmetryNumber
     
     def isRadical(self):
@@ -2005,3 +2035,14 @@ class Molecule(Graph):
 # this variable is used to name atom IDs so that there are as few conflicts by 
 # using the entire space of integer objects
 atom_id_counter = -2**15
+
+def makeMolecule(compact, symmetry=-1, props=None):
+    """
+    Return a new :class:`Molecule` with the structure of the
+    :class:`CompactMolecule` `compact`, the symmetry number `symmetry` and the
+    properties `props`. Used when unpickling molecules.
+    """
+    molecule = compact.toMolecule()
+    molecule.symmetryNumber = symmetry
+    molecule.props = props or {}
+    return molecule
@@ -5,10 +5,24 @@ cpdef list populate_resonance_algorithms(dict features=?)
 
 cpdef dict analyze_molecule(Molecule mol)
 
+cpdef tuple get_structure_key(Molecule mol, bint useAtomIDs=?)
+
+cpdef int _get_bond_order_key(Bond bond)
+
+cpdef tuple get_resonance_cache_key(Molecule mol, bint clarStructures=?, bint keepIsomorphic=?)
+
+cpdef tuple _serialize_resonance_structure(Molecule mol)
+
+cpdef Molecule _deserialize_resonance_structure(Molecule mol, dict mapping, tuple structure)
+
 cpdef list generate_resonance_structures(Molecule mol, bint clarStructures=?, bint keepIsomorphic=?)
 
+cpdef list generate_resonance_structures_uncached(Molecule mol, bint clarStructures=?, bint keepIsomorphic=?)
+
 cpdef list _generate_resonance_structures(list molList, list methodList, bint keepIsomorphic=?, bint copy=?)
 
+cpdef tuple _get_duplicate_key(Molecule mol, bint keepIsomorphic)
+
 cpdef list generate_adjacent_resonance_structures(Molecule mol)
 
 cpdef list generate_lone_pair_radical_resonance_structures(Molecule mol)
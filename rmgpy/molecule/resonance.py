@@ -54,6 +54,7 @@ import itertools
 from .graph import Vertex, Edge, Graph, getVertexConnectivityValue
 from .molecule import Atom, Bond, Molecule
 from .kekulize import kekulize
+from .structurecache import StructureCache
 import rmgpy.molecule.pathfinder as pathfinder
 from rmgpy.exceptions import ILPSolutionError, KekulizationError, AtomTypeError
 
@@ -126,9 +127,162 @@ def analyze_molecule(mol):
 
     return features
 
+
+def get_structure_key(mol, useAtomIDs=False):
+    """
+    Return a hashable key of the structure of `mol` that does not depend on
+    the order of its atoms. Isomorphic molecules always have equal keys, but
+    the converse is not guaranteed.
+
+    Each atom is labeled by its element, radical electrons, charge and lone
+    pairs, and the labels are refined twice with the sorted labels and bond
+    orders of the neighboring atoms. If `useAtomIDs` is ``True``, the atom IDs
+    are included in the labels instead, so that molecules that are identical
+    in the sense of :meth:`Molecule.isIdentical` have equal keys.
+    """
+    cython.declare(atom=Atom, neighbor=Atom, bond=Bond, labels=dict, newLabels=dict, iteration=cython.int)
+
+    if useAtomIDs:
+        return tuple(sorted([(atom.id, atom.element.number, atom.radicalElectrons, atom.charge, atom.lonePairs,
+                              tuple(sorted([(neighbor.id, neighbor.element.number, _get_bond_order_key(bond))
+                                            for neighbor, bond in atom.edges.iteritems()])))
+                             for atom in mol.vertices]))
+
+    labels = {}
+    for atom in mol.vertices:
+        labels[atom] = hash((atom.element.number, atom.radicalElectrons, atom.charge, atom.lonePairs))
+    for iteration in range(2):
+        newLabels = {}
+        for atom in mol.vertices:
+            newLabels[atom] = hash((labels[atom], tuple(sorted([(_get_bond_order_key(bond), labels[neighbor])
+                                                                for neighbor, bond in atom.edges.iteritems()]))))
+        labels = newLabels
+    return tuple(sorted(labels.values()))
+
+def _get_bond_order_key(bond):
+    """
+    Return the order of `bond` rounded so that orders that compare equal in
+    :meth:`Bond.isOrder` give the same value.
+    """
+    return int(round(bond.order * 100))
+
+def get_resonance_cache_key(mol, clarStructures=True, keepIsomorphic=False):
+    """
+    Return a key for the resonance structures of `mol` that does not depend on
+    the order of its atoms: the structure key of :func:`get_structure_key`
+    together with the multiplicity and the generation options.
+    """
+    return (mol.multiplicity, clarStructures, keepIsomorphic, get_structure_key(mol))
+
+def _serialize_resonance_structure(mol):
+    """
+    Return a compact representation of the resonance structure `mol`, which
+    must have unique atom IDs: its multiplicity, the properties of each atom
+    that can change between resonance structures, and its bonds.
+    """
+    cython.declare(atom=Atom, atom2=Atom, bond=Bond, atoms=tuple, bonds=list)
+    atoms = tuple([(atom.id, atom.radicalElectrons, atom.charge, atom.lonePairs, atom.atomType) for atom in mol.vertices])
+    bonds = []
+    for atom in mol.vertices:
+        for atom2, bond in atom.edges.iteritems():
+            if atom.id < atom2.id:
+                bonds.append((atom.id, atom2.id, bond.order))
+    return (mol.multiplicity, atoms, tuple(bonds))
+
+def _deserialize_resonance_structure(mol, mapping, structure):
+    """
+    Return a new :class:`Molecule` with the atoms of `mol` set up as in the
+    serialized resonance `structure`. The `mapping` maps each atom of `mol` to
+    the isomorphic atom of the molecule the structure was generated from.
+    """
+    cython.declare(atom=Atom, newAtom=Atom, newMol=Molecule, atomsByID=dict, atomData=dict)
+    multiplicity, atoms, bonds = structure
+    atomData = dict([(data[0], data) for data in atoms])
+    atomsByID = {}
+    newMol = Molecule()
+    for atom in mol.vertices:
+        newAtom = atom.copy()
+        referenceID = mapping[atom].id
+        data = atomData[referenceID]
+        newAtom.radicalElectrons, newAtom.charge, newAtom.lonePairs, newAtom.atomType = data[1:]
+        atomsByID[referenceID] = newAtom
+        newMol.addAtom(newAtom)
+    for atomID1, atomID2, order in bonds:
+        newMol.addBond(Bond(atomsByID[atomID1], atomsByID[atomID2], order=order))
+    newMol.multiplicity = multiplicity
+    return newMol
+
+def _find_resonance_mapping(mol, reference):
+    """
+    Return the list of isomorphisms between `mol` and the structure
+    `reference` stored in :data:`resonance_cache`, which is empty if they
+    are not isomorphic.
+    """
+    return mol.findIsomorphism(reference)
+
+# The process-wide cache used by generate_resonance_structures. Entries are
+# stored under the key of get_resonance_cache_key, and the value of each
+# input structure is a tuple of its generated resonance structures as compact
+# tuples of atom properties and bonds keyed by atom ID. A hit maps these onto
+# the atoms of the requested molecule, so new Molecule objects with its atom
+# IDs are handed out every time.
+resonance_cache = StructureCache(getKey=get_resonance_cache_key, match=_find_resonance_mapping)
+
 def generate_resonance_structures(mol, clarStructures=True, keepIsomorphic=False):
     """
     Generate and return all of the resonance structures for the input molecule.
+    The first structure in the returned list is `mol` itself.
+
+    Radical and cyclic molecules are looked up in :data:`resonance_cache`
+    first, so that the structures of each molecule, and in particular the Clar
+    structures of polycyclic aromatics, are only generated once. See
+    :func:`generate_resonance_structures_uncached` for the details of the
+    generation.
+    """
+    cython.declare(molList=list, structures=tuple, key=tuple, oldIDs=list, atom=Atom, atoms=list, index=cython.int,
+                   temporaryIDs=cython.bint, newMol=Molecule)
+
+    if resonance_cache.maxSize <= 0 or not (mol.isRadical() or mol.isCyclic()):
+        return generate_resonance_structures_uncached(mol, clarStructures, keepIsomorphic)
+    if keepIsomorphic and not mol.atomIDValid():
+        # The structures kept depend on the atom IDs in this case, so they
+        # cannot be transferred from another molecule
+        return generate_resonance_structures_uncached(mol, clarStructures, keepIsomorphic)
+
+    key = get_resonance_cache_key(mol, clarStructures, keepIsomorphic)
+    entry = resonance_cache.find(mol, key)
+    if entry is not None:
+        reference, structures, mapping = entry
+        return [mol] + [_deserialize_resonance_structure(mol, mapping[0], structure) for structure in structures]
+
+    # Give the atoms unique IDs while generating the structures so that the
+    # atoms of each structure can be matched with those of the input molecule
+    atoms = mol.vertices[:]
+    oldIDs = [atom.id for atom in atoms]
+    temporaryIDs = not mol.atomIDValid()
+    if temporaryIDs:
+        for index, atom in enumerate(atoms):
+            atom.id = index
+    try:
+        molList = generate_resonance_structures_uncached(mol, clarStructures, keepIsomorphic)
+        if all([newMol.atomIDValid() and set([atom.id for atom in newMol.vertices]) == set([atom.id for atom in atoms])
+                for newMol in molList[1:]]):
+            resonance_cache.add(mol, tuple([_serialize_resonance_structure(newMol) for newMol in molList[1:]]), key)
+    finally:
+        if temporaryIDs:
+            for index, atom in enumerate(atoms):
+                atom.id = oldIDs[index]
+    if temporaryIDs:
+        # The generated structures contain copies of the atoms with the temporary IDs
+        for newMol in molList[1:]:
+            for atom in newMol.vertices:
+                if 0 <= atom.id < len(oldIDs):
+                    atom.id = oldIDs[atom.id]
+    return molList
+
+def generate_resonance_structures_uncached(mol, clarStructures=True, keepIsomorphic=False):
+    """
+    Generate and return all of the resonance structures for the input molecule.
 
     Most of the complexity of this method goes into handling aromatic species, particularly to generate an accurate
     set of resonance structures that is consistent regardless of the input structure. The following considerations
@@ -229,12 +383,20 @@ def _generate_resonance_structures(molList, methodList, keepIsomorphic=False, co
         copy                if False, append new resonance structures to input list (default)
                             if True, make a new list with all of the resonance structures
     """
-    cython.declare(index=cython.int, molecule=Molecule, newMolList=list, newMol=Molecule, mol=Molecule)
+    cython.declare(index=cython.int, molecule=Molecule, newMolList=list, newMol=Molecule, mol=Molecule,
+                   structures=dict, candidates=list)
 
     if copy:
         # Make a copy of the list so we don't modify the input list
         molList = molList[:]
 
+    # Group the structures by a key that is equal for any two structures that
+    # would be considered duplicates, so that each new structure only needs
+    # to be compared with the structures sharing its key
+    structures = {}
+    for mol in molList:
+        structures.setdefault(_get_duplicate_key(mol, keepIsomorphic), []).append(mol)
+
     # Iterate over resonance isomers
     index = 0
     while index < len(molList):
@@ -246,19 +408,34 @@ def _generate_resonance_structures(molList, methodList, keepIsomorphic=False, co
 
         for newMol in newMolList:
             # Append to isomer list if unique
-            for mol in molList:
+            candidates = structures.setdefault(_get_duplicate_key(newMol, keepIsomorphic), [])
+            for mol in candidates:
                 if not keepIsomorphic and mol.isIsomorphic(newMol):
                     break
                 elif keepIsomorphic and mol.isIdentical(newMol):
                     break
             else:
                 molList.append(newMol)
+                candidates.append(newMol)
 
         # Move to next resonance isomer
         index += 1
 
     return molList
 
+def _get_duplicate_key(mol, keepIsomorphic):
+    """
+    Return the key used by :func:`_generate_resonance_structures` to find the
+    structures that `mol` could be a duplicate of: a structure key that
+    includes the atom IDs if `keepIsomorphic` is ``True``, since only
+    identical structures are duplicates then, or the multiplicity and a
+    structure key otherwise.
+    """
+    if keepIsomorphic:
+        return get_structure_key(mol, useAtomIDs=True)
+    else:
+        return (mol.multiplicity, get_structure_key(mol))
+
 def generate_adjacent_resonance_structures(mol):
     """
     Generate all of the resonance structures formed by one allyl radical shift.
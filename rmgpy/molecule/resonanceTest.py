@@ -1376,3 +1376,95 @@ class ClarTest(unittest.TestCase):
         newmol = generate_clar_structures(mol)
 
         self.assertEquals(len(newmol), 0)
+
+class ResonanceCacheTest(unittest.TestCase):
+    """
+    Contains unit tests for the cache of resonance structures.
+    """
+
+    def setUp(self):
+        resonance_cache.clear()
+
+    def tearDown(self):
+        resonance_cache.clear()
+        resonance_cache.maxSize = 10000
+
+    def testCachedStructuresMatchGenerated(self):
+        """Test that the structures returned from the cache match those generated"""
+        expected = generate_resonance_structures_uncached(Molecule(SMILES="[CH2]C=CC=C"))
+
+        mol1 = Molecule(SMILES="[CH2]C=CC=C")
+        molList1 = generate_resonance_structures(mol1)
+        mol2 = Molecule(SMILES="C=CC=C[CH2]")
+        molList2 = generate_resonance_structures(mol2)
+
+        self.assertEqual(resonance_cache.misses, 1)
+        self.assertEqual(resonance_cache.hits, 1)
+        self.assertIs(molList2[0], mol2)
+        self.assertEqual(len(molList2), len(expected))
+        for mol in expected:
+            self.assertTrue(any([mol.isIsomorphic(newMol) for newMol in molList2]))
+        for newMol in molList2[1:]:
+            self.assertTrue(all([newMol is not oldMol for oldMol in molList1]))
+            self.assertTrue(all([atom1 is not atom2 for atom1 in newMol.vertices for atom2 in mol2.vertices]))
+
+    def testCachedStructuresKeepAtomIDs(self):
+        """Test that structures returned from the cache have the atom IDs of the input molecule"""
+        generate_resonance_structures(Molecule(SMILES="c1ccccc1[CH2]"), keepIsomorphic=True)
+
+        mol = Molecule(SMILES="[CH2]c1ccccc1")
+        mol.assignAtomIDs()
+        atomIDs = set([atom.id for atom in mol.vertices])
+        expected = generate_resonance_structures_uncached(mol.copy(deep=True), keepIsomorphic=True)
+        molList = generate_resonance_structures(mol, keepIsomorphic=True)
+
+        self.assertEqual(resonance_cache.hits, 1)
+        self.assertEqual(len(molList), len(expected))
+        for newMol in molList:
+            self.assertEqual(set([atom.id for atom in newMol.vertices]), atomIDs)
+
+    def testTemporaryAtomIDsAreRestored(self):
+        """Test that generating structures for the cache does not change the atom IDs"""
+        mol = Molecule(SMILES="C=C[CH]C=CC")
+        molList = generate_resonance_structures(mol)
+        for newMol in molList:
+            self.assertTrue(all([atom.id == -1 for atom in newMol.vertices]))
+
+    def testCacheSizeIsBounded(self):
+        """Test that the least recently used structures are removed from a full cache"""
+        resonance_cache.maxSize = 1
+        generate_resonance_structures(Molecule(SMILES="C=C[CH]C=CC"))
+        generate_resonance_structures(Molecule(SMILES="[CH2]C=CC=C"))
+        self.assertEqual(resonance_cache.size, 1)
+        self.assertEqual(len(resonance_cache.entries), 1)
+        generate_resonance_structures(Molecule(SMILES="C=C[CH]C=CC"))
+        self.assertEqual(resonance_cache.hits, 0)
+
+class StructureKeyTest(unittest.TestCase):
+    """
+    Contains unit tests for the structure keys used to find duplicate resonance structures.
+    """
+
+    def testIsomorphicMoleculesHaveEqualKeys(self):
+        """Test that the structure key does not depend on the order of the atoms"""
+        mol1 = Molecule(SMILES="[CH2]C=CC=C")
+        mol2 = Molecule(SMILES="C=CC=C[CH2]")
+        self.assertEqual(get_structure_key(mol1), get_structure_key(mol2))
+
+    def testResonanceStructuresHaveDifferentKeys(self):
+        """Test that distinct resonance structures of the same species have different keys"""
+        molList = generate_resonance_structures_uncached(Molecule(SMILES="C=C[CH]C=CC"))
+        keys = set([get_structure_key(mol) for mol in molList])
+        self.assertEqual(len(keys), len(molList))
+
+    def testKeyWithAtomIDs(self):
+        """Test that the structure key with atom IDs distinguishes isomorphic but not identical molecules"""
+        mol1 = Molecule(SMILES="[CH2]C=C")
+        mol1.assignAtomIDs()
+        mol2 = mol1.copy(deep=True)
+        self.assertEqual(get_structure_key(mol1, useAtomIDs=True), get_structure_key(mol2, useAtomIDs=True))
+
+        molList = generate_resonance_structures_uncached(mol1, keepIsomorphic=True)
+        self.assertEqual(len(molList), 2)
+        self.assertNotEqual(get_structure_key(molList[0], useAtomIDs=True), get_structure_key(molList[1], useAtomIDs=True))
+        self.assertEqual(get_structure_key(molList[0]), get_structure_key(molList[1]))
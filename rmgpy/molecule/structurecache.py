@@ -0,0 +1,158 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+################################################################################
+#
+#   RMG - Reaction Mechanism Generator
+#
+#   Copyright (c) 2002-2017 Prof. William H. Green (whgreen@mit.edu),
+#   Prof. Richard H. West (r.west@neu.edu) and the RMG Team (rmg_dev@mit.edu)
+#
+#   Permission is hereby granted, free of charge, to any person obtaining a
+#   copy of this software and associated documentation files (the 'Software'),
+#   to deal in the Software without restriction, including without limitation
+#   the rights to use, copy, modify, merge, publish, distribute, sublicense,
+#   and/or sell copies of the Software, and to permit persons to whom the
+#   Software is furnished to do so, subject to the following conditions:
+#
+#   The above copyright notice and this permission notice shall be included in
+#   all copies or substantial portions of the Software.
+#
+#   THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#   FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#   DEALINGS IN THE SOFTWARE.
+#
+################################################################################
+
+"""
+This module provides a bounded cache of values computed for molecular
+structures, such as their identifiers or symmetry numbers, so that each value
+is only computed once for each structure however many molecules share it.
+"""
+
+from collections import OrderedDict
+
+################################################################################
+
+def getCacheKey(molecule):
+    """
+    Return the default key of `molecule` in a :class:`StructureCache`: its
+    multiplicity and the order-independent structure key of
+    :func:`rmgpy.molecule.resonance.get_structure_key`.
+    """
+    from .resonance import get_structure_key
+    return (molecule.multiplicity, get_structure_key(molecule))
+
+def isIsomorphic(molecule, reference):
+    """
+    Return ``True`` if `molecule` is isomorphic to `reference`. This is the
+    default match function of a :class:`StructureCache`.
+    """
+    return molecule.isIsomorphic(reference)
+
+class StructureCache(object):
+    """
+    A bounded cache of values computed for molecular structures, from which
+    the least recently used structures are removed first. The attributes are:
+
+    =============== ============================================================
+    Attribute       Description
+    =============== ============================================================
+    `maxSize`       The maximum number of structures to keep (0 disables the cache)
+    `getKey`        A function returning the key of a molecule
+    `match`         A function of a molecule and a cached structure returning a true value if they match
+    `entries`       An ordered dict of the cached entries, least recently used first
+    `size`          The number of structures in the cache
+    `hits`          The number of lookups that found their structure
+    `misses`        The number of lookups that did not
+    =============== ============================================================
+
+    Entries are stored under a key of the structure that does not depend on
+    the order of its atoms, by default that of :func:`getCacheKey`. Since
+    structures that share a key need not match, each key holds a list of
+    entries, each of which is a copy of a structure and its value.
+    """
+
+    def __init__(self, maxSize=10000, getKey=getCacheKey, match=isIsomorphic):
+        self.maxSize = maxSize
+        self.getKey = getKey
+        self.match = match
+        self.entries = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return self.size
+
+    def clear(self):
+        """
+        Remove all of the entries from the cache.
+        """
+        self.entries = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+
+    def find(self, molecule, key=None):
+        """
+        Return a tuple of the cached structure matching `molecule`, its value
+        and the result of the match function, or ``None`` if no structure
+        matches. The key of `molecule` is calculated unless given as `key`.
+        """
+        if key is None:
+            key = self.getKey(molecule)
+        entries = self.entries.get(key)
+        if entries is not None:
+            for reference, value in entries:
+                result = self.match(molecule, reference)
+                if result:
+                    # Mark the key as most recently used
+                    del self.entries[key]
+                    self.entries[key] = entries
+                    self.hits += 1
+                    return reference, value, result
+        self.misses += 1
+        return None
+
+    def get(self, molecule, key=None):
+        """
+        Return the value of `molecule` if a matching structure is in the
+        cache, or ``None`` otherwise.
+        """
+        entry = self.find(molecule, key)
+        return entry[1] if entry is not None else None
+
+    def add(self, molecule, value, key=None):
+        """
+        Store the `value` computed for `molecule`, removing the least recently
+        used entries if the cache is full. A copy of `molecule` is stored, so
+        it can be modified afterwards.
+        """
+        if self.maxSize <= 0:
+            return
+        if key is None:
+            key = self.getKey(molecule)
+        self.entries.setdefault(key, []).append((molecule.copy(deep=True), value))
+        self.size += 1
+        while self.size > self.maxSize:
+            oldKey, oldEntries = self.entries.popitem(last=False)
+            self.size -= len(oldEntries)
+
+    def getValue(self, molecule, function):
+        """
+        Return the value of `molecule` from the cache, or calculate it as
+        ``function(molecule)`` and store it if no matching structure is in the
+        cache.
+        """
+        key = self.getKey(molecule)
+        entry = self.find(molecule, key)
+        if entry is not None:
+            return entry[1]
+        value = function(molecule)
+        self.add(molecule, value, key)
+        return value
@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+################################################################################
+#
+#   RMG - Reaction Mechanism Generator
+#
+#   Copyright (c) 2002-2017 Prof. William H. Green (whgreen@mit.edu),
+#   Prof. Richard H. West (r.west@neu.edu) and the RMG Team (rmg_dev@mit.edu)
+#
+#   Permission is hereby granted, free of charge, to any person obtaining a
+#   copy of this software and associated documentation files (the 'Software'),
+#   to deal in the Software without restriction, including without limitation
+#   the rights to use, copy, modify, merge, publish, distribute, sublicense,
+#   and/or sell copies of the Software, and to permit persons to whom the
+#   Software is furnished to do so, subject to the following conditions:
+#
+#   The above copyright notice and this permission notice shall be included in
+#   all copies or substantial portions of the Software.
+#
+#   THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#   FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#   DEALINGS IN THE SOFTWARE.
+#
+################################################################################
+
+"""
+This module contains unit tests of the rmgpy.molecule.structurecache module.
+"""
+
+import unittest
+
+from rmgpy.molecule import Molecule
+from rmgpy.molecule.structurecache import StructureCache
+
+################################################################################
+
+class TestStructureCache(unittest.TestCase):
+    """
+    Contains unit tests of the StructureCache class.
+    """
+
+    def testIsomorphicStructuresShareValues(self):
+        """
+        Test that a value is found for any molecule isomorphic to the stored one.
+        """
+        cache = StructureCache()
+        cache.add(Molecule().fromSMILES('CCO'), 'ethanol')
+        self.assertEqual(cache.get(Molecule().fromSMILES('OCC')), 'ethanol')
+        self.assertIsNone(cache.get(Molecule().fromSMILES('COC')))
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.misses, 1)
+
+    def testGetValue(self):
+        """
+        Test that the value function is only called for new structures.
+        """
+        cache = StructureCache()
+        calls = []
+        def function(molecule):
+            calls.append(molecule)
+            return len(molecule.atoms)
+        self.assertEqual(cache.getValue(Molecule().fromSMILES('CC'), function), 8)
+        self.assertEqual(cache.getValue(Molecule().fromSMILES('CC'), function), 8)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len(cache), 1)
+
+    def testLeastRecentlyUsedStructuresAreRemoved(self):
+        """
+        Test that the least recently used structures are removed from a full cache.
+        """
+        cache = StructureCache(maxSize=2)
+        molecules = [Molecule().fromSMILES(smiles) for smiles in ['C', 'CC', 'CCC']]
+        cache.add(molecules[0], 0)
+        cache.add(molecules[1], 1)
+        self.assertEqual(cache.get(molecules[0]), 0)
+        cache.add(molecules[2], 2)
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get(molecules[1]))
+        self.assertEqual(cache.get(molecules[0]), 0)
+        self.assertEqual(cache.get(molecules[2]), 2)
+
+    def testDisabledCache(self):
+        """
+        Test that nothing is stored in a cache with a maximum size of 0.
+        """
+        cache = StructureCache(maxSize=0)
+        self.assertEqual(cache.getValue(Molecule().fromSMILES('C'), lambda molecule: 1), 1)
+        self.assertEqual(len(cache), 0)
+
+################################################################################
+
+if __name__ == '__main__':
+    unittest.main(testRunner=unittest.TextTestRunner(verbosity=2))
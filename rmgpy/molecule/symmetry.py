@@ -33,6 +33,101 @@ This module provides functionality for estimating the symmetry number of a
 molecule from its chemical graph representation.
 """
 
+import os.path
+import logging
+import cPickle
+
+from .resonance import get_structure_key
+from .structurecache import StructureCache
+
+################################################################################
+
+class SymmetryNumberCache(StructureCache):
+    """
+    A :class:`StructureCache` of the symmetry numbers calculated for each
+    molecular structure, which can be saved to and loaded from a file so that
+    it persists between jobs. The `modified` attribute is ``True`` if entries
+    were added since the cache was last saved or loaded.
+
+    Saved files are tagged with the `version` of the cache, and files with
+    another version are ignored, so symmetry numbers calculated by an older
+    version of the code are never reused.
+    """
+
+    # Increase whenever a change to the calculation could change the
+    # symmetry numbers of the saved structures
+    version = 1
+
+    def __init__(self, maxSize=10000):
+        StructureCache.__init__(self, maxSize)
+        self.modified = False
+
+    def clear(self):
+        """
+        Remove all of the entries from the cache.
+        """
+        StructureCache.clear(self)
+        self.modified = False
+
+    def add(self, molecule, value, key=None):
+        """
+        Store the symmetry number `value` calculated for `molecule`.
+        """
+        StructureCache.add(self, molecule, value, key)
+        self.modified = True
+
+    def save(self, path):
+        """
+        Save the entries of the cache to the file at `path`.
+        """
+        entries = [entry for entries in self.entries.itervalues() for entry in entries]
+        with open(path, 'wb') as f:
+            cPickle.dump({'version': self.version, 'entries': entries}, f, cPickle.HIGHEST_PROTOCOL)
+        self.modified = False
+
+    def load(self, path):
+        """
+        Add the entries saved in the file at `path` to the cache. The keys are
+        recalculated, so the file can be shared between installations. Nothing
+        is loaded if the file does not exist or was saved by another version
+        of the cache.
+        """
+        if not os.path.exists(path):
+            return
+        try:
+            with open(path, 'rb') as f:
+                data = cPickle.load(f)
+        except Exception:
+            logging.warning('Ignoring unreadable symmetry number cache {0}'.format(path))
+            return
+        if not isinstance(data, dict) or data.get('version') != self.version:
+            logging.info('Ignoring symmetry number cache {0} from another version of RMG'.format(path))
+            return
+        entries = data['entries']
+        for molecule, symmetryNumber in entries:
+            if self.get(molecule) is None:
+                StructureCache.add(self, molecule, symmetryNumber)
+        self.hits = 0
+        self.misses = 0
+        self.modified = False
+        logging.info('Loaded {0:d} cached symmetry numbers from {1}'.format(len(entries), path))
+
+def calculateCachedSymmetryNumber(molecule):
+    """
+    Return the symmetry number of `molecule` from :data:`symmetryNumberCache`,
+    calculating and storing it if the structure is not in the cache.
+    """
+    return symmetryNumberCache.getValue(molecule, _calculateSymmetryNumber)
+
+def _calculateSymmetryNumber(molecule):
+    molecule.updateConnectivityValues() # for consistent results
+    return calculateSymmetryNumber(molecule)
+
+# The process-wide cache used by Molecule.calculateSymmetryNumber
+symmetryNumberCache = SymmetryNumberCache()
+
+################################################################################
+
 def calculateAtomSymmetryNumber(molecule, atom):
     """
     Return the symmetry number centered at `atom` in the structure. The
@@ -59,12 +154,14 @@ def calculateAtomSymmetryNumber(molecule, atom):
     molecule.removeAtom(atom)
     groups = molecule.split()
 
-    # Determine equivalence of functional groups around atom
+    # Determine equivalence of functional groups around atom; groups with
+    # different structure keys cannot be isomorphic, so they are not compared
     groupIsomorphism = dict([(group, dict()) for group in groups])
-    for group1 in groups:
-        for group2 in groups:
+    groupKeys = [get_structure_key(group) for group in groups]
+    for index1, group1 in enumerate(groups):
+        for index2, group2 in enumerate(groups):
             if group1 is not group2 and group2 not in groupIsomorphism[group1]:
-                groupIsomorphism[group1][group2] = group1.isIsomorphic(group2)
+                groupIsomorphism[group1][group2] = groupKeys[index1] == groupKeys[index2] and group1.isIsomorphic(group2)
                 groupIsomorphism[group2][group1] = groupIsomorphism[group1][group2]
             elif group1 is group2:
                 groupIsomorphism[group1][group1] = True
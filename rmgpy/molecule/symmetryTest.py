@@ -28,11 +28,15 @@
 #
 ################################################################################
 
+import os
+import cPickle
+import shutil
+import tempfile
 import unittest
 from external.wip import work_in_progress
 
 from rmgpy.molecule.molecule import Molecule
-from rmgpy.molecule.symmetry import calculateAtomSymmetryNumber, calculateAxisSymmetryNumber, calculateBondSymmetryNumber, calculateCyclicSymmetryNumber
+from rmgpy.molecule.symmetry import calculateAtomSymmetryNumber, calculateAxisSymmetryNumber, calculateBondSymmetryNumber, calculateCyclicSymmetryNumber, SymmetryNumberCache, symmetryNumberCache
 from rmgpy.species import Species
 from rmgpy.molecule.resonance import generate_aromatic_resonance_structures
 ################################################################################
@@ -652,5 +656,81 @@ multiplicity 3
     
 ################################################################################
 
+class TestSymmetryNumberCache(unittest.TestCase):
+    """
+    Contains unit tests of the cache of symmetry numbers by structure.
+    """
+
+    def setUp(self):
+        symmetryNumberCache.clear()
+
+    def tearDown(self):
+        symmetryNumberCache.clear()
+
+    def testCachedSymmetryNumber(self):
+        """
+        Test that an isomorphic molecule gets its symmetry number from the cache.
+        """
+        self.assertEqual(Molecule().fromSMILES('CC').calculateSymmetryNumber(), 18)
+        self.assertEqual(symmetryNumberCache.misses, 1)
+        self.assertEqual(Molecule().fromSMILES('CC').calculateSymmetryNumber(), 18)
+        self.assertEqual(symmetryNumberCache.hits, 1)
+        self.assertEqual(Molecule().fromSMILES('C[CH2]').calculateSymmetryNumber(), 6)
+        self.assertEqual(symmetryNumberCache.misses, 2)
+
+    def testSaveAndLoad(self):
+        """
+        Test that the cache can be saved to a file and loaded again.
+        """
+        Molecule().fromSMILES('C').calculateSymmetryNumber()
+        Molecule().fromSMILES('C=C').calculateSymmetryNumber()
+        self.assertTrue(symmetryNumberCache.modified)
+        directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(directory, 'symmetry.pkl')
+            symmetryNumberCache.save(path)
+            self.assertFalse(symmetryNumberCache.modified)
+            cache = SymmetryNumberCache()
+            cache.load(path)
+        finally:
+            shutil.rmtree(directory)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.get(Molecule().fromSMILES('C=C')), 4)
+        self.assertIsNone(cache.get(Molecule().fromSMILES('CC')))
+
+    def testLoadIgnoresOtherVersions(self):
+        """
+        Test that files saved by another version of the cache are not loaded.
+        """
+        Molecule().fromSMILES('C').calculateSymmetryNumber()
+        directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(directory, 'symmetry.pkl')
+            symmetryNumberCache.save(path)
+            cache = SymmetryNumberCache()
+            cache.version = symmetryNumberCache.version + 1
+            cache.load(path)
+            self.assertEqual(len(cache), 0)
+            # Files written before the version was stored are plain lists
+            with open(path, 'wb') as f:
+                cPickle.dump([(Molecule().fromSMILES('C'), 12)], f)
+            cache = SymmetryNumberCache()
+            cache.load(path)
+            self.assertEqual(len(cache), 0)
+        finally:
+            shutil.rmtree(directory)
+
+    def testSizeIsBounded(self):
+        """
+        Test that the least recently used structures are removed from a full cache.
+        """
+        cache = SymmetryNumberCache(maxSize=2)
+        for smiles in ['C', 'CC', 'CCC']:
+            cache.add(Molecule().fromSMILES(smiles), 1)
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get(Molecule().fromSMILES('C')))
+
+################################################################################
+
 if __name__ == '__main__':
     unittest.main( testRunner = unittest.TextTestRunner(verbosity=2) )
@@ -373,14 +373,8 @@ def fitInterpolationModel(reaction, Tlist, Plist, K, model, Tmin, Tmax, Pmin, Pm
 
     # Compute log RMS error for fit
     if errorCheck:
-        logRMS = 0.0
         # Check that fit is within an order of magnitude at all points
-        for t, T in enumerate(Tlist):
-            for p, P in enumerate(Plist):
-                logkmodel = log(kinetics.getRateCoefficient(T, P))
-                logkdata = log(K[t,p])
-                logRMS += (logkmodel - logkdata) * (logkmodel - logkdata)
-        logRMS = sqrt(logRMS / len(Tlist) / len(Plist))
+        logRMS = sqrt(numpy.mean((numpy.log(kinetics.getRateCoefficients(numpy.asarray(Tlist, numpy.float64), numpy.asarray(Plist, numpy.float64))) - numpy.log(K))**2))
         if logRMS > 0.5:
             logging.warning('RMS error for k(T,P) fit = {0:g} for reaction {1}.'.format(logRMS, reaction))
     
@@ -524,21 +524,47 @@ class Reaction:
         Return the enthalpies of reaction in J/mol evaluated at temperatures
         `Tlist` in K.
         """
-        return numpy.array([self.getEnthalpyOfReaction(T) for T in Tlist], numpy.float64)
+        cython.declare(dHrxn=numpy.ndarray, reactant=Species, product=Species)
+        dHrxn = numpy.zeros(len(Tlist), numpy.float64)
+        for reactant in self.reactants:
+            dHrxn -= reactant.getEnthalpies(Tlist)
+        for product in self.products:
+            dHrxn += product.getEnthalpies(Tlist)
+        return dHrxn
 
     def getEntropiesOfReaction(self, Tlist):
         """
         Return the entropies of reaction in J/mol*K evaluated at temperatures
         `Tlist` in K.
         """
-        return numpy.array([self.getEntropyOfReaction(T) for T in Tlist], numpy.float64)
+        cython.declare(dSrxn=numpy.ndarray, reactant=Species, product=Species)
+        dSrxn = numpy.zeros(len(Tlist), numpy.float64)
+        for reactant in self.reactants:
+            dSrxn -= reactant.getEntropies(Tlist)
+        for product in self.products:
+            dSrxn += product.getEntropies(Tlist)
+        return dSrxn
 
     def getFreeEnergiesOfReaction(self, Tlist):
         """
         Return the Gibbs free energies of reaction in J/mol evaluated at
         temperatures `Tlist` in K.
         """
-        return numpy.array([self.getFreeEnergyOfReaction(T) for T in Tlist], numpy.float64)
+        cython.declare(dGrxn=numpy.ndarray, reactant=Species, product=Species)
+        dGrxn = numpy.zeros(len(Tlist), numpy.float64)
+        for reactant in self.reactants:
+            try:
+                dGrxn -= reactant.getFreeEnergies(Tlist)
+            except Exception:
+                logging.error("Problem with reactant {!r} in reaction {!s}".format(reactant, self))
+                raise
+        for product in self.products:
+            try:
+                dGrxn += product.getFreeEnergies(Tlist)
+            except Exception:
+                logging.error("Problem with product {!r} in reaction {!s}".format(product, self))
+                raise
+        return dGrxn
 
     def getEquilibriumConstants(self, Tlist, type='Kc'):
         """
@@ -548,7 +574,23 @@ class Reaction:
         ``Kc`` for concentrations (default), or ``Kp`` for pressures. Note that
         this function currently assumes an ideal gas mixture.
         """
-        return numpy.array([self.getEquilibriumConstant(T, type) for T in Tlist], numpy.float64)
+        cython.declare(T=numpy.ndarray, K=numpy.ndarray, P0=cython.double)
+        T = numpy.asarray(Tlist, numpy.float64)
+        # Use free energies of reaction to calculate Ka
+        K = numpy.exp(-self.getFreeEnergiesOfReaction(T) / constants.R / T)
+        # Convert Ka to Kc or Kp if specified
+        P0 = 1e5
+        if type == 'Kc':
+            # Convert from Ka to Kc; C0 is the reference concentration
+            K *= (P0 / constants.R / T) ** (len(self.products) - len(self.reactants))
+        elif type == 'Kp':
+            # Convert from Ka to Kp; P0 is the reference pressure
+            K *= P0 ** (len(self.products) - len(self.reactants))
+        elif type != 'Ka' and type != '':
+            raise ReactionError('Invalid type "%s" passed to Reaction.getEquilibriumConstants(); should be "Ka", "Kc", or "Kp".' % type)
+        if (K == 0).any():
+            raise ReactionError('Got equilibrium constant of 0')
+        return K
 
     def getStoichiometricCoefficient(self, spec):
         """
@@ -651,14 +693,12 @@ class Reaction:
         The equilibrium constant is evaluated from the current reaction instance (self).
         """
         cython.declare(kf=Arrhenius, kr=Arrhenius)
-        cython.declare(Tlist=numpy.ndarray, klist=numpy.ndarray, i=cython.int)
+        cython.declare(Tlist=numpy.ndarray, klist=numpy.ndarray)
         kf = kForward
         assert isinstance(kf, Arrhenius), "Only reverses Arrhenius rates"
         Tlist = 1.0 / numpy.arange(0.0005, 0.0034, 0.0001)  # 294 K to 2000 K
         # Determine the values of the reverse rate coefficient k_r(T) at each temperature
-        klist = numpy.zeros_like(Tlist)
-        for i in range(len(Tlist)):
-            klist[i] = kf.getRateCoefficient(Tlist[i]) / self.getEquilibriumConstant(Tlist[i])
+        klist = kf.getRateCoefficients(Tlist) / self.getEquilibriumConstants(Tlist)
         kr = Arrhenius()
         kr.fitToData(Tlist, klist, reverseUnits, kf.T0.value_si)
         return kr
@@ -670,8 +710,7 @@ class Reaction:
         (but not necessarily all) kinetics types.
         """
         cython.declare(Tlist=numpy.ndarray, Plist=numpy.ndarray, K=numpy.ndarray,
-                       rxn=Reaction, klist=numpy.ndarray, i=cython.size_t,
-                       Tindex=cython.size_t, Pindex=cython.size_t)
+                       rxn=Reaction, klist=numpy.ndarray)
 
         supported_types = (
                             KineticsData.__name__,
@@ -692,9 +731,7 @@ class Reaction:
         if isinstance(kf, KineticsData):
             
             Tlist = kf.Tdata.value_si
-            klist = numpy.zeros_like(Tlist)
-            for i in range(len(Tlist)):
-                klist[i] = kf.getRateCoefficient(Tlist[i]) / self.getEquilibriumConstant(Tlist[i])
+            klist = kf.getRateCoefficients(Tlist) / self.getEquilibriumConstants(Tlist)
             
             kr = KineticsData(Tdata=(Tlist,"K"), kdata=(klist,kunits), Tmin=(numpy.min(Tlist),"K"), Tmax=(numpy.max(Tlist),"K"))
             return kr
@@ -705,10 +742,7 @@ class Reaction:
         elif isinstance (kf, Chebyshev):
             Tlist = 1.0/numpy.linspace(1.0/kf.Tmax.value, 1.0/kf.Tmin.value, 50)
             Plist = numpy.linspace(kf.Pmin.value, kf.Pmax.value, 20)
-            K = numpy.zeros((len(Tlist), len(Plist)), numpy.float64)
-            for Tindex, T in enumerate(Tlist):
-                for Pindex, P in enumerate(Plist):
-                    K[Tindex, Pindex] = kf.getRateCoefficient(T, P) / self.getEquilibriumConstant(T)
+            K = kf.getRateCoefficients(Tlist, Plist) / self.getEquilibriumConstants(Tlist)[:,numpy.newaxis]
             kr = Chebyshev()
             kr.fitToData(Tlist, Plist, K, kunits, kf.degreeT, kf.degreeP, kf.Tmin.value, kf.Tmax.value, kf.Pmin.value, kf.Pmax.value)
             return kr
@@ -719,10 +753,7 @@ class Reaction:
             else:
                 Tlist = 1.0/numpy.arange(0.0005, 0.0035, 0.0001)
             Plist = kf.pressures.value_si
-            K = numpy.zeros((len(Tlist), len(Plist)), numpy.float64)
-            for Tindex, T in enumerate(Tlist):
-                for Pindex, P in enumerate(Plist):
-                    K[Tindex, Pindex] = kf.getRateCoefficient(T, P) / self.getEquilibriumConstant(T)
+            K = kf.getRateCoefficients(Tlist, Plist) / self.getEquilibriumConstants(Tlist)[:,numpy.newaxis]
             kr = PDepArrhenius()
             kr.fitToData(Tlist, Plist, K, kunits, kf.arrhenius[0].T0.value)
             return kr       
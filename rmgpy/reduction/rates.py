@@ -203,3 +203,117 @@ def isImportant(rxn, spc, reactions, reactantOrProduct, tolerance, T, P, coreSpe
  
     elif alpha <= tolerance:
         return False
+
+def computeReactionRates(reactions, reactantOrProduct, T, P, concentrations, speciesIndex):
+    """
+    Computes the reaction rate of every reaction in `reactions` at every
+    sample of `concentrations`, a matrix with one row per sample and one
+    column per species, whose columns are given by the `speciesIndex` dict
+    of species labels. The rates are evaluated exactly as by
+    computeReactionRate, but for all reactions and samples at once.
+
+    Returns a matrix with one row per sample and one column per reaction.
+    """
+    numSamples = concentrations.shape[0]
+    numSlots = max([len(rxn.products) for rxn in reactions] or [0])
+
+    # Species column and stoichiometric exponent of each product slot of each
+    # reaction; unused slots contribute a factor of exactly 1
+    slotIndices = np.zeros((numSlots, len(reactions)), np.int)
+    slotExponents = np.zeros((numSlots, len(reactions)), np.int)
+    slotUsed = np.zeros((numSlots, len(reactions)), np.bool)
+    k = np.zeros(len(reactions), np.float64)
+    for j, rxn in enumerate(reactions):
+        for slot, spc in enumerate(rxn.products):
+            slotIndices[slot, j] = speciesIndex[spc.label]
+            slotExponents[slot, j] = rxn.getStoichiometricCoefficient(spc, reactantOrProduct)
+            slotUsed[slot, j] = True
+        rmgReaction = rxn.rmgReaction
+        k[j] = rmgReaction.getRateCoefficient(T,P) / rmgReaction.getEquilibriumConstant(T)
+
+    totconc = np.ones((numSamples, len(reactions)), np.float64)
+    isZero = np.zeros((numSamples, len(reactions)), np.bool)
+    for slot in xrange(numSlots):
+        ci = concentrations[:, slotIndices[slot]]
+        isZero |= (np.abs(ci) < CLOSE_TO_ZERO) & slotUsed[slot]
+        totconc *= ci ** slotExponents[slot]
+
+    rates = k * totconc
+    rates[isZero] = 0.
+    return rates
+
+def computeImportanceRatios(reactions, T, P, concentrations, speciesIndex):
+    """
+    Computes the ratios alpha = rij / Ri used by isImportant for every
+    reaction j and every reactant or product i of it, at every sample of
+    `concentrations` (see computeReactionRates). The total rates Ri are formed
+    for all species at once by multiplying the reaction rates with a sparse
+    stoichiometry matrix.
+
+    Returns two arrays with, for each reaction, the largest ratio found and
+    the largest ratio that is not close to 1. Ratios for which isImportant
+    would reject the reaction regardless of the tolerance (rij or Ri close to
+    zero, or alpha negative) are ignored; reactions without any valid ratio
+    get -inf.
+    """
+    from scipy import sparse
+
+    numSamples = concentrations.shape[0]
+    maxRatios = np.empty(len(reactions), np.float64)
+    maxRatios.fill(-np.inf)
+    maxRatiosNotUnity = maxRatios.copy()
+    if numSamples == 0 or len(reactions) == 0:
+        return maxRatios, maxRatiosNotUnity
+
+    labelIndex = {}
+    for rxn in reactions:
+        for spc in rxn.reactants + rxn.products:
+            labelIndex.setdefault(spc.label, len(labelIndex))
+
+    for reactantOrProduct in ['reactant', 'product']:
+        rates = computeReactionRates(reactions, reactantOrProduct, T, P, concentrations, speciesIndex)
+
+        # Stoichiometry matrix (species x reactions) whose product with the
+        # rates gives the total rate Ri of calcRf, summed in reaction order
+        rows, cols, values = [], [], []
+        # The (reaction, species) pairs for which rij is evaluated
+        pairReactions, pairSpecies, pairCoefficients = [], [], []
+        for j, rxn in enumerate(reactions):
+            for label in set([spc.label for spc in rxn.reactants]):
+                rows.append(labelIndex[label])
+                cols.append(j)
+                values.append(-rxn.stoichio[reactantOrProduct][label])
+            molecules = rxn.reactants if reactantOrProduct == 'reactant' else rxn.products
+            for label in set([spc.label for spc in molecules]):
+                pairReactions.append(j)
+                pairSpecies.append(labelIndex[label])
+                pairCoefficients.append(-rxn.stoichio[reactantOrProduct][label])
+        stoichiometry = sparse.coo_matrix((np.array(values, np.float64), (rows, cols)),
+                                          shape=(len(labelIndex), len(reactions))).tocsr()
+        Ri = stoichiometry.dot(rates.T).T[:, pairSpecies]
+        rij = np.array(pairCoefficients, np.float64) * rates[:, pairReactions]
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            alpha = rij / Ri
+        valid = (np.abs(rij) >= CLOSE_TO_ZERO) & (np.abs(Ri) >= CLOSE_TO_ZERO) & (alpha >= 0)
+        alphaNotUnity = np.where(valid & ~np.isclose(alpha, 1.0), alpha, -np.inf)
+        alpha = np.where(valid, alpha, -np.inf)
+
+        np.maximum.at(maxRatios, pairReactions, alpha.max(axis=0))
+        np.maximum.at(maxRatiosNotUnity, pairReactions, alphaNotUnity.max(axis=0))
+
+    return maxRatios, maxRatiosNotUnity
+
+def isImportantAtTolerance(maxRatios, maxRatiosNotUnity, tolerance):
+    """
+    Returns a boolean array indicating for each reaction whether isImportant
+    would find it important for at least one of its reactants or products at
+    the given `tolerance`, using the largest ratios computed by
+    computeImportanceRatios.
+
+    As in isImportant, a ratio close to 1 does not make a reaction important
+    when the tolerance is itself close to 1.
+    """
+    if np.isclose(tolerance, 1.0):
+        return maxRatiosNotUnity > tolerance
+    return maxRatios > tolerance
@@ -35,16 +35,17 @@ import re
 
 #local imports
 from rmgpy.chemkin import getSpeciesIdentifier
-from rmgpy.scoop_framework.util import broadcast, get, map_
+from rmgpy.scoop_framework.util import broadcast, get
 from rmgpy.scoop_framework.util import logger as logging
 from rmgpy.rmg.settings import ModelSettings, SimulatorSettings
 
 from model import ReductionReaction
-from rates import isImportant
+from rates import isImportant, computeImportanceRatios, isImportantAtTolerance
 
 
 #global variables
 reactions = None
+importanceRatios = None
 
 
 def simulateOne(reactionModel, atol, rtol, reactionSystem):
@@ -125,7 +126,7 @@ def simulateAll(rmg):
         
 
 def initialize(wd, rxns):
-    global working_dir, reactions
+    global working_dir, reactions, importanceRatios
     working_dir = wd
     assert os.path.isdir(working_dir)
     
@@ -133,6 +134,9 @@ def initialize(wd, rxns):
     
     reactions = [ReductionReaction(rxn) for rxn in rxns]
     broadcast(reactions, 'reactions')
+
+    # the importance ratios of the new reactions have not been computed yet
+    importanceRatios = None
     
 
 def retrieveReactions():
@@ -158,38 +162,27 @@ def findImportantReactions(rmg, tolerance):
     """
     This function:
 
-    - loops over all the species involved in a specific reaction
-    - decides whether the specific reaction is important for the species.
-
-    Whenever it is found that a reaction is important for a species, we break
-    the species loop, and keep the reaction in the model.
+    - computes, for every reaction, the ratios rij / Ri of its rate of 
+    formation or consumption of each of the species involved in it, to the 
+    total rate of formation or consumption of that species
+    - decides whether the reaction is important for any of the species at
+    the given tolerance.
 
+    The ratios only depend on the simulation of the full model, so they are
+    computed once after each call to initialize, and reused for every trial
+    tolerance.
 
     Returns:
-        a list of rxns that can be removed.
+        a list of the important rxns, which are to be kept in the model.
     """
-    
-    # run the simulation, creating concentration profiles for each reaction system defined in input.
-    simdata = simulateAll(rmg)
-
+    global importanceRatios
 
-    reduceReactions = retrieveReactions()
+    if importanceRatios is None:
+        # run the simulation, creating concentration profiles for each reaction system defined in input.
+        simdata = simulateAll(rmg)
+        importanceRatios = computeAllImportanceRatios(retrieveReactions(), rmg.reactionSystems, simdata)
 
-    def chunks(l, n):
-        """Yield successive n-sized chunks from l."""
-        for i in xrange(0, len(l), n):
-            yield l[i:i+n]
-
-    CHUNKSIZE = 40
-    boolean_array = []
-    for chunk in chunks(reduceReactions,CHUNKSIZE):
-        N = len(chunk)
-        partial_results = list(
-            map_(
-                assessReaction, chunk, [rmg.reactionSystems] * N, [tolerance] * N, [simdata] * N
-                )
-            )
-        boolean_array.extend(partial_results)
+    boolean_array = isImportantAtTolerance(importanceRatios[0], importanceRatios[1], tolerance)
 
     """
     Assuming that the order of the reduced reactions array and the core reactions of the reaction model
@@ -205,6 +198,55 @@ def findImportantReactions(rmg, tolerance):
 
     return importantRxns
 
+def getSampleIndices(profile):
+    """
+    Returns the indices of the samples of the concentration profile at which
+    the importance of the reactions is evaluated: N evenly spaced indices from
+    the table with simulation results.
+
+    The more samples, the less chance we have to remove an important reaction,
+    but the more work is needed to assess the reactions.
+    """
+    timesteps = len(profile) / 2
+    logging.debug('Evaluating the importance of a reaction at {} time samples.'.format(timesteps))
+
+    assert timesteps <= len(profile)
+    return map(int, np.linspace(0, len(profile)-1, num = timesteps))
+
+def computeAllImportanceRatios(reactions, reactionSystems, data, chunkSize=1000000):
+    """
+    Computes the largest ratios rij / Ri of each reaction over all of the
+    samples of the concentration profiles of all reaction systems (see
+    rates.computeImportanceRatios). The samples are processed in chunks such
+    that about `chunkSize` ratios are evaluated at once.
+
+    Returns two arrays with, for each reaction, the largest ratio and the
+    largest ratio not close to 1.
+    """
+    maxRatios = np.empty(len(reactions), np.float64)
+    maxRatios.fill(-np.inf)
+    maxRatiosNotUnity = maxRatios.copy()
+
+    samplesPerChunk = max(1, chunkSize // max(1, 3 * len(reactions)))
+
+    for datum, reactionSystem in zip(data, reactionSystems):
+        T, P = reactionSystem.T.value_si, reactionSystem.P.value_si
+
+        speciesNames, profile = datum
+        speciesIndex = {}
+        for i, name in enumerate(speciesNames):
+            speciesIndex[name] = i
+
+        indices = getSampleIndices(profile)
+        concentrations = np.array([profile[index][1] for index in indices], np.float64)
+        for start in xrange(0, len(indices), samplesPerChunk):
+            ratios, ratiosNotUnity = computeImportanceRatios(reactions, T, P,
+                                                             concentrations[start:start+samplesPerChunk], speciesIndex)
+            np.maximum(maxRatios, ratios, maxRatios)
+            np.maximum(maxRatiosNotUnity, ratiosNotUnity, maxRatiosNotUnity)
+
+    return maxRatios, maxRatiosNotUnity
+
 def assessReaction(rxn, reactionSystems, tolerance, data):
     """
     Returns whether the reaction is important or not in the reactions.
@@ -229,24 +271,7 @@ def assessReaction(rxn, reactionSystems, tolerance, data):
         
         speciesNames, profile = datum
 
-        # take N evenly spaced indices from the table with simulation results:
-
-        """
-
-        Number of time steps between start and end time of the batch reactor simulation at which the importance of 
-        reactions should be evaluated.
-
-
-
-        The more timesteps, the less chance we have to remove an important reactions, but the more simulations
-        need to be carried out.
-        """
-        
-        timesteps = len(profile) / 2
-        logging.debug('Evaluating the importance of a reaction at {} time samples.'.format(timesteps))
-
-        assert timesteps <= len(profile)
-        indices = map(int, np.linspace(0, len(profile)-1, num = timesteps))
+        indices = getSampleIndices(profile)
         for index in indices:
             assert profile[index] is not None
             timepoint, coreSpeciesConcentrations = profile[index]
@@ -97,6 +97,21 @@ class ReduceFunctionalTest(unittest.TestCase):
             conv, importantRxns = reduceModel(tol, targets, reactionModel, rmg, index)
             self.assertIsNotNone(conv)
 
+    def testImportanceRatiosMatchAssessReaction(self):
+        """
+        Test that the importance ratios computed for all reactions at once
+        select the same reactions as assessReaction does one by one.
+        """
+        rmg = ReduceFunctionalTest.rmg
+        reactions = retrieveReactions()
+        simdata = simulateAll(rmg)
+
+        maxRatios, maxRatiosNotUnity = computeAllImportanceRatios(reactions, rmg.reactionSystems, simdata)
+        for tol in [1.0, 0.7, 1e-3, 1e-6]:
+            expected = [assessReaction(rxn, rmg.reactionSystems, tol, simdata) for rxn in reactions]
+            important = isImportantAtTolerance(maxRatios, maxRatiosNotUnity, tol)
+            self.assertEqual([bool(isImport) for isImport in important], expected)
+
 class ReduceUnitTest(unittest.TestCase):
     
 
@@ -234,7 +234,8 @@ def model(toleranceMoveToCore=None, toleranceMoveEdgeReactionToCore=numpy.inf,to
           toleranceMoveEdgeReactionToSurfaceInterrupt=None,
           toleranceMoveEdgeReactionToCoreInterrupt=None, maximumEdgeSpecies=1000000, minCoreSizeForPrune=50, 
           minSpeciesExistIterationsForPrune=2, filterReactions=False, ignoreOverallFluxCriterion=False,
-          maxNumSpecies=None,maxNumObjsPerIter=1,terminateAtMaxObjects=False,toleranceThermoKeepSpeciesInEdge=numpy.inf,dynamicsTimeScale=(0.0,'sec')):
+          maxNumSpecies=None,maxNumObjsPerIter=1,terminateAtMaxObjects=False,toleranceThermoKeepSpeciesInEdge=numpy.inf,dynamicsTimeScale=(0.0,'sec'),
+          fluxCheckInterval=1):
     """
     How to generate the model. `toleranceMoveToCore` must be specified. 
     toleranceMoveReactionToCore and toleranceReactionInterruptSimulation refers to an additional criterion for forcing an edge reaction to be included in the core
@@ -242,6 +243,8 @@ def model(toleranceMoveToCore=None, toleranceMoveEdgeReactionToCore=numpy.inf,to
     Other parameters are optional and control the pruning.
     ignoreOverallFluxCriterion=True will cause the toleranceMoveToCore to be only applied
     to the pressure dependent network expansion and not movement of species from edge to core
+    fluxCheckInterval sets the number of solver steps between checks of the edge fluxes; the
+    default of 1 checks them at every step
     """
     if toleranceMoveToCore is None:
         raise InputError("You must provide a toleranceMoveToCore value. It should be less than or equal to toleranceInterruptSimulation which is currently {0}".format(toleranceInterruptSimulation))
@@ -252,7 +255,7 @@ def model(toleranceMoveToCore=None, toleranceMoveEdgeReactionToCore=numpy.inf,to
           toleranceMoveEdgeReactionToSurface, toleranceMoveSurfaceSpeciesToCore, toleranceMoveSurfaceReactionToCore,
           toleranceMoveEdgeReactionToSurfaceInterrupt,toleranceMoveEdgeReactionToCoreInterrupt, maximumEdgeSpecies, minCoreSizeForPrune, 
           minSpeciesExistIterationsForPrune, filterReactions, ignoreOverallFluxCriterion, maxNumSpecies, maxNumObjsPerIter,terminateAtMaxObjects,
-          toleranceThermoKeepSpeciesInEdge,Quantity(dynamicsTimeScale)))
+          toleranceThermoKeepSpeciesInEdge,Quantity(dynamicsTimeScale),fluxCheckInterval))
     
 def quantumMechanics(
                     software,
@@ -324,7 +327,7 @@ def pressureDependence(
 
 def options(name='Seed', generateSeedEachIteration=False, saveSeedToDatabase=False, units='si', saveRestartPeriod=None, 
             generateOutputHTML=False, generatePlots=False, saveSimulationProfiles=False, verboseComments=False, 
-            saveEdgeSpecies=False, keepIrreversible=False, wallTime='00:00:00:00'):
+            saveEdgeSpecies=False, keepIrreversible=False, wallTime='00:00:00:00', profilePhases=None):
     rmg.name = name
     rmg.generateSeedEachIteration=generateSeedEachIteration
     rmg.saveSeedToDatabase=saveSeedToDatabase
@@ -341,6 +344,7 @@ def options(name='Seed', generateSeedEachIteration=False, saveSeedToDatabase=Fal
     rmg.saveEdgeSpecies = saveEdgeSpecies
     rmg.keepIrreversible = keepIrreversible
     rmg.wallTime = wallTime
+    rmg.profilePhases = profilePhases
 
 def generatedSpeciesConstraints(**kwargs):
 
@@ -674,6 +678,8 @@ def saveInputFile(path, rmg):
     f.write('    keepIrreversible = {0},\n'.format(rmg.keepIrreversible))
     f.write('    verboseComments = {0},\n'.format(rmg.verboseComments))
     f.write('    wallTime = {0},\n'.format(rmg.wallTime))
+    if rmg.profilePhases:
+        f.write('    profilePhases = {0!r},\n'.format(rmg.profilePhases))
     f.write(')\n\n')
     
     f.close()
@@ -69,7 +69,13 @@ class SimulationProfileWriter(object):
             - header row with species names
             - each row with mole fractions of the core species in the given reaction system.
         """
+        self.write(self.snapshot(reactionSystem))
 
+    def snapshot(self, reactionSystem):
+        """
+        Return the filename, header row and mole fraction rows to be written
+        for the current simulation of `reactionSystem`.
+        """
         filename = os.path.join(
             self.outputDirectory,
             'solver',
@@ -82,6 +88,11 @@ class SimulationProfileWriter(object):
         for spc in self.coreSpecies:
             header.append(getSpeciesIdentifier(spc))
 
+        return filename, header, list(reactionSystem.snapshots)
+
+    def write(self, data):
+        filename, header, snapshots = data
+
         with open(filename, 'wb') as csvfile:
             worksheet = csv.writer(csvfile)
 
@@ -89,7 +100,7 @@ class SimulationProfileWriter(object):
             worksheet.writerow(header) 
 
             # add mole fractions:
-            worksheet.writerows(reactionSystem.snapshots)
+            worksheet.writerows(snapshots)
             
 
 class SimulationProfilePlotter(object):
@@ -125,7 +136,13 @@ class SimulationProfilePlotter(object):
             - reaction system
             - number of core species
         """
+        self.write(self.snapshot(reactionSystem))
 
+    def snapshot(self, reactionSystem):
+        """
+        Return the names of the csv file to plot and the png file to save for
+        the current simulation of `reactionSystem`.
+        """
         csvFile = os.path.join(
             self.outputDirectory,
             'solver',
@@ -141,5 +158,9 @@ class SimulationProfilePlotter(object):
                 self.reaction_sys_index + 1, len(self.coreSpecies)
                 )
             )
-            
+
+        return csvFile, pngFile
+
+    def write(self, data):
+        csvFile, pngFile = data
         SimulationPlot(csvFile=csvFile, numSpecies=10, ylabel='Mole Fraction').plot(pngFile)
@@ -45,6 +45,7 @@ from copy import deepcopy
 
 from rmgpy.constraints import failsSpeciesConstraints
 from rmgpy.molecule import Molecule
+from rmgpy.molecule.symmetry import symmetryNumberCache
 from rmgpy.solver.base import TerminationTime, TerminationConversion
 from rmgpy.solver.simple import SimpleReactor
 from rmgpy.data.rmg import RMGDatabase
@@ -68,7 +69,7 @@ from rmgpy.rmg.output import OutputHTMLWriter
 from rmgpy.rmg.listener import SimulationProfileWriter, SimulationProfilePlotter
 from rmgpy.restart import RestartWriter
 from rmgpy.qm.main import QMDatabaseWriter
-from rmgpy.stats import ExecutionStatsWriter
+from rmgpy.stats import ExecutionStatsWriter, PhaseTimingsWriter
 from rmgpy.thermo.thermoengine import submit
 from rmgpy.tools.sensitivity import plotSensitivity
 from cantera import ck2cti
@@ -122,9 +123,12 @@ class RMG(util.Subject):
     `pressureDependence`                Whether to process unimolecular (pressure-dependent) reaction networks
     `quantumMechanics`                  Whether to apply quantum mechanical calculations instead of group additivity to certain molecular types.
     `wallTime`                          The maximum amount of CPU time in the form DD:HH:MM:SS to expend on this job; used to stop gracefully so we can still get profiling information
+    `profilePhases`                     ``True`` or a list of phase names to profile with cProfile, saving the profiles in the 'profile' subfolder, ``None`` otherwise
     `kineticsdatastore`                 ``True`` if storing details of each kinetic database entry in text file, ``False`` otherwise
     ----------------------------------- ------------------------------------------------
     `initializationTime`                The time at which the job was initiated, in seconds since the epoch (i.e. from time.time())
+    `timer`                             The :class:`PhaseTimer` collecting the time spent in each phase of the job
+    `phaseTimingsWriter`                The listener saving the time spent in each phase after the output of each iteration
     `done`                              Whether the job has completed (there is nothing new to add)
     =================================== ================================================
     
@@ -194,6 +198,10 @@ class RMG(util.Subject):
         self.thermoCentralDatabase = None
 
         self.execTime = []
+        self.reactionSystemListeners = []
+        self.profilePhases = None
+        self.timer = util.PhaseTimer()
+        self.phaseTimingsWriter = None
     
     def loadInput(self, path=None):
         """
@@ -204,6 +212,8 @@ class RMG(util.Subject):
         if path is None: path = self.inputFile
         readInputFile(path, self)
         self.reactionModel.kineticsEstimator = self.kineticsEstimator
+        self.timer = util.PhaseTimer(profile=self.profilePhases)
+        self.reactionModel.timer = self.timer
         # If the output directory is not yet set, then set it to the same
         # directory as the input file by default
         if not self.outputDirectory:
@@ -392,6 +402,9 @@ class RMG(util.Subject):
 
         # Load databases
         self.loadDatabase()
+
+        # Reuse the symmetry numbers calculated by earlier jobs in this output directory
+        symmetryNumberCache.load(os.path.join(self.outputDirectory, 'symmetry.pkl'))
         
         # Do all liquid-phase startup things:
         if self.solvent:
@@ -412,6 +425,7 @@ class RMG(util.Subject):
         # Initialize reaction model
         if restart:
             self.initializeRestartRun(os.path.join(self.outputDirectory,'restart.pkl'))
+            self.reactionModel.timer = self.timer
         else:
     
             # Seed mechanisms: add species and reactions from seed mechanism
@@ -501,26 +515,43 @@ class RMG(util.Subject):
         found in the RMG input file.
         """
 
-        self.attach(ChemkinWriter(self.outputDirectory))
+        # Listeners that support it write their output on a background thread.
+        # The restart and QM database writers pickle and save live objects,
+        # so they still run synchronously.
+        # matplotlib is not thread-safe, so everything that plots shares one worker.
+        plotWorker = util.BackgroundWorker(name='plotting')
+
+        self.attach(util.BackgroundListener(ChemkinWriter(self.outputDirectory)))
 
         if self.generateOutputHTML:
-            self.attach(OutputHTMLWriter(self.outputDirectory))
+            self.attach(util.BackgroundListener(OutputHTMLWriter(self.outputDirectory)))
 
         if self.saveRestartPeriod:
-            self.attach(RestartWriter()) 
+            self.attach(util.BackgroundListener(RestartWriter()))
 
         if self.quantumMechanics:
-            self.attach(QMDatabaseWriter()) 
+            self.attach(util.BackgroundListener(QMDatabaseWriter()))
 
-        self.attach(ExecutionStatsWriter(self.outputDirectory))
+        self.attach(util.BackgroundListener(ExecutionStatsWriter(self.outputDirectory), worker=plotWorker))
 
         if self.saveSimulationProfiles:
 
             for index, reactionSystem in enumerate(self.reactionSystems):
-                reactionSystem.attach(SimulationProfileWriter(
-                    self.outputDirectory, index, self.reactionModel.core.species))   
-                reactionSystem.attach(SimulationProfilePlotter(
-                    self.outputDirectory, index, self.reactionModel.core.species))  
+                # The plotter reads the file written by the profile writer, so
+                # both use the same worker to keep them in order
+                listener = util.BackgroundListener(SimulationProfileWriter(
+                    self.outputDirectory, index, self.reactionModel.core.species), worker=plotWorker)
+                reactionSystem.attach(listener)
+                self.reactionSystemListeners.append(listener)
+                listener = util.BackgroundListener(SimulationProfilePlotter(
+                    self.outputDirectory, index, self.reactionModel.core.species), worker=plotWorker)
+                reactionSystem.attach(listener)
+                self.reactionSystemListeners.append(listener)
+
+        # Not attached, but updated by saveEverything once the output phase
+        # has ended, so that each record includes the time spent saving the
+        # output of its own iteration
+        self.phaseTimingsWriter = util.BackgroundListener(PhaseTimingsWriter(self.outputDirectory))
         
 
     def execute(self, **kwargs):
@@ -562,12 +593,14 @@ class RMG(util.Subject):
                                                               maximumEdgeSpecies =self.modelSettingsList[0].maximumEdgeSpecies,
                                                               reactionSystems=self.reactionSystems)
         
-        self.reactionModel.enlarge(reactEdge=True, 
-            unimolecularReact=self.unimolecularReact, 
-            bimolecularReact=self.bimolecularReact)
+        with self.timer.phase('enlarge'):
+            self.reactionModel.enlarge(reactEdge=True, 
+                unimolecularReact=self.unimolecularReact, 
+                bimolecularReact=self.bimolecularReact)
         
         if not numpy.isinf(self.modelSettingsList[0].toleranceThermoKeepSpeciesInEdge):
-            self.reactionModel.thermoFilterDown(maximumEdgeSpecies=self.modelSettingsList[0].maximumEdgeSpecies)
+            with self.timer.phase('pruning'):
+                self.reactionModel.thermoFilterDown(maximumEdgeSpecies=self.modelSettingsList[0].maximumEdgeSpecies)
         
         logging.info('Completed initial enlarge edge step...')
         
@@ -620,18 +653,20 @@ class RMG(util.Subject):
                         # Turn pruning off if we haven't reached minimum core size.
                         prune = False
                         
-                    try: terminated,resurrected,obj,newSurfaceSpecies,newSurfaceReactions = reactionSystem.simulate(
-                        coreSpecies = self.reactionModel.core.species,
-                        coreReactions = self.reactionModel.core.reactions,
-                        edgeSpecies = self.reactionModel.edge.species,
-                        edgeReactions = self.reactionModel.edge.reactions,
-                        surfaceSpecies = self.reactionModel.surface.species,
-                        surfaceReactions = self.reactionModel.surface.reactions,
-                        pdepNetworks = self.reactionModel.networkList,
-                        prune = prune,
-                        modelSettings=modelSettings,
-                        simulatorSettings = simulatorSettings,
-                    )
+                    try:
+                        with self.timer.phase('simulation'):
+                            terminated,resurrected,obj,newSurfaceSpecies,newSurfaceReactions = reactionSystem.simulate(
+                                coreSpecies = self.reactionModel.core.species,
+                                coreReactions = self.reactionModel.core.reactions,
+                                edgeSpecies = self.reactionModel.edge.species,
+                                edgeReactions = self.reactionModel.edge.reactions,
+                                surfaceSpecies = self.reactionModel.surface.species,
+                                surfaceReactions = self.reactionModel.surface.reactions,
+                                pdepNetworks = self.reactionModel.networkList,
+                                prune = prune,
+                                modelSettings=modelSettings,
+                                simulatorSettings = simulatorSettings,
+                            )
                     except:
                         logging.error("Model core reactions:")
                         if len(self.reactionModel.core.reactions) > 5:
@@ -666,8 +701,9 @@ class RMG(util.Subject):
                     objectsToEnlarge = list(set(objectsToEnlarge))
 
                     # Add objects to enlarge to the core first
-                    for objectToEnlarge in objectsToEnlarge:
-                        self.reactionModel.enlarge(objectToEnlarge)
+                    with self.timer.phase('enlarge'):
+                        for objectToEnlarge in objectsToEnlarge:
+                            self.reactionModel.enlarge(objectToEnlarge)
                         
                     if len(self.reactionModel.core.species) > numCoreSpecies:
                         tempModelSettings = deepcopy(modelSettings)
@@ -678,17 +714,18 @@ class RMG(util.Subject):
                             # Run a raw simulation to get updated reaction system threshold values
                             # Run with the same conditions as with pruning off
                             if not resurrected:
-                                reactionSystem.simulate(
-                                        coreSpecies = self.reactionModel.core.species,
-                                        coreReactions = self.reactionModel.core.reactions,
-                                        edgeSpecies = [],
-                                        edgeReactions = [],
-                                        surfaceSpecies = self.reactionModel.surface.species,
-                                        surfaceReactions = self.reactionModel.surface.reactions,
-                                        pdepNetworks = self.reactionModel.networkList,
-                                        modelSettings = tempModelSettings,
-                                        simulatorSettings = simulatorSettings,
-                                    )
+                                with self.timer.phase('simulation'):
+                                    reactionSystem.simulate(
+                                            coreSpecies = self.reactionModel.core.species,
+                                            coreReactions = self.reactionModel.core.reactions,
+                                            edgeSpecies = [],
+                                            edgeReactions = [],
+                                            surfaceSpecies = self.reactionModel.surface.species,
+                                            surfaceReactions = self.reactionModel.surface.reactions,
+                                            pdepNetworks = self.reactionModel.networkList,
+                                            modelSettings = tempModelSettings,
+                                            simulatorSettings = simulatorSettings,
+                                        )
                                 self.updateReactionThresholdAndReactFlags(
                                         rxnSysUnimolecularThreshold = reactionSystem.unimolecularThreshold,
                                         rxnSysBimolecularThreshold = reactionSystem.bimolecularThreshold)
@@ -709,12 +746,14 @@ class RMG(util.Subject):
                                                               maximumEdgeSpecies=modelSettings.maximumEdgeSpecies,
                                                               reactionSystems=self.reactionSystems)
         
-                        self.reactionModel.enlarge(reactEdge=True, 
-                                unimolecularReact=self.unimolecularReact, 
-                                bimolecularReact=self.bimolecularReact)
+                        with self.timer.phase('enlarge'):
+                            self.reactionModel.enlarge(reactEdge=True, 
+                                    unimolecularReact=self.unimolecularReact, 
+                                    bimolecularReact=self.bimolecularReact)
                         
                         if not numpy.isinf(self.modelSettingsList[0].toleranceThermoKeepSpeciesInEdge):
-                            self.reactionModel.thermoFilterDown(maximumEdgeSpecies=modelSettings.maximumEdgeSpecies)
+                            with self.timer.phase('pruning'):
+                                self.reactionModel.thermoFilterDown(maximumEdgeSpecies=modelSettings.maximumEdgeSpecies)
                     
                     maxNumSpcsHit = len(self.reactionModel.core.species) >= modelSettings.maxNumSpecies
 
@@ -731,9 +770,10 @@ class RMG(util.Subject):
                     # If we reached our termination conditions, then try to prune
                     # species from the edge
                     if allTerminated and modelSettings.fluxToleranceKeepInEdge>0.0:
-                        self.reactionModel.prune(self.reactionSystems, modelSettings.fluxToleranceKeepInEdge, modelSettings.maximumEdgeSpecies, modelSettings.minSpeciesExistIterationsForPrune)
-                        # Perform garbage collection after pruning
-                        collected = gc.collect()
+                        with self.timer.phase('pruning'):
+                            self.reactionModel.prune(self.reactionSystems, modelSettings.fluxToleranceKeepInEdge, modelSettings.maximumEdgeSpecies, modelSettings.minSpeciesExistIterationsForPrune)
+                            # Perform garbage collection after pruning
+                            collected = gc.collect()
                         logging.info('Garbage collector: collected %d objects.' % (collected))
     
                 # Consider stopping gracefully if the next iteration might take us
@@ -750,6 +790,7 @@ class RMG(util.Subject):
                         coreSpec, coreReac, edgeSpec, edgeReac = self.reactionModel.getModelSize()
                         logging.info('The current model core has %s species and %s reactions' % (coreSpec, coreReac))
                         logging.info('The current model edge has %s species and %s reactions' % (edgeSpec, edgeReac))
+                        self.flushListeners()
                         return
                     
             if maxNumSpcsHit: #resets maxNumSpcsHit and continues the settings for loop
@@ -760,6 +801,9 @@ class RMG(util.Subject):
         if not self.generateSeedEachIteration:
             self.makeSeedMech(firstTime=True)
             
+        # Make sure all output (e.g. the Chemkin files converted below) is on disk
+        self.flushListeners()
+
         # Run sensitivity analysis post-model generation if sensitivity analysis is on
         for index, reactionSystem in enumerate(self.reactionSystems):
             
@@ -1135,13 +1179,42 @@ class RMG(util.Subject):
         
         self.execTime.append(time.time() - self.initializationTime)
 
+        if symmetryNumberCache.modified:
+            symmetryNumberCache.save(os.path.join(self.outputDirectory, 'symmetry.pkl'))
+
         # Notify registered listeners:
-        self.notify()
+        with self.timer.phase('output'):
+            self.notify()
+
+        if self.phaseTimingsWriter is not None:
+            self.phaseTimingsWriter.update(self)
             
+    def flushListeners(self):
+        """
+        Wait for any registered listeners that write their output in the
+        background to finish writing it.
+        """
+        for observer in self._observers + self.reactionSystemListeners + [self.phaseTimingsWriter]:
+            if hasattr(observer, 'flush'):
+                observer.flush()
+
     def finish(self):
         """
         Complete the model generation.
         """
+        self.flushListeners()
+        for observer in self._observers + self.reactionSystemListeners:
+            if hasattr(observer, 'close'):
+                observer.close()
+        self.timer.saveProfiles(os.path.join(self.outputDirectory, 'profile'))
+
+        listeners = [observer for observer in self._observers + self.reactionSystemListeners + [self.phaseTimingsWriter]
+                     if isinstance(observer, util.BackgroundListener)]
+        if listeners:
+            logging.info('')
+            logging.info('Time spent saving output:')
+            for listener in listeners:
+                listener.logTimings()
         # Log end timestamp
         logging.info('')
         logging.info('RMG execution terminated at ' + time.asctime())
@@ -1226,46 +1299,56 @@ class RMG(util.Subject):
             reactionSystem.initialMoleFractions = initialMoleFractions
     
         # The reactions and reactionDict still point to the old reaction families
-        reactionDict = {}
-        for family0_label in self.reactionModel.reactionDict:
-    
-            # Find the equivalent library or family in the newly-loaded kinetics database
-            family_label = None
-            family0_obj = getFamilyLibraryObject(family0_label)
-            if isinstance(family0_obj, KineticsLibrary):
-                for label, database in self.database.kinetics.libraries.iteritems():
-                    if database.label == family0_label:
-                        family_label = database.label
-                        break
-            elif isinstance(family0_obj, KineticsFamily):
-                for label, database in self.database.kinetics.families.iteritems():
-                    if database.label == family0_label:
-                        family_label = database.label
-                        break    
-            else:
-                import pdb; pdb.set_trace()
-            if family_label is None:
-                raise Exception("Unable to find matching reaction family for %s" % family0_label)
-    
-            # Update each affected reaction to point to that new family
-            # Also use that new family in a duplicate reactionDict
-            reactionDict[family_label] = {}
-            for reactant1 in self.reactionModel.reactionDict[family0_label]:
-                reactionDict[family_label][reactant1] = {}
-                for reactant2 in self.reactionModel.reactionDict[family0_label][reactant1]:
-                    reactionDict[family_label][reactant1][reactant2] = []
+        reactionDict = self.reactionModel.reactionDict
+        if any([isinstance(value, dict) for value in reactionDict.itervalues()]):
+            # Restart files written before the reaction database was flattened
+            # nest the reactions by family and reactant keys, most recent first
+            rxnLists = [rxnList[::-1] for familyDict in reactionDict.itervalues()
+                        for reactantDict in familyDict.itervalues()
+                        for rxnList in reactantDict.itervalues()]
+        else:
+            rxnLists = reactionDict.values()
+
+        familyLabels = {}
+        reactions = []
+        for rxnList in rxnLists:
+            for rxn in rxnList:
+                family0_label = rxn.family
+                family0_obj = getFamilyLibraryObject(family0_label)
+
+                # Find the equivalent library or family in the newly-loaded kinetics database
+                if family0_label not in familyLabels:
+                    family_label = None
                     if isinstance(family0_obj, KineticsLibrary):
-                        for rxn in self.reactionModel.reactionDict[family0_label][reactant1][reactant2]:
-                            assert isinstance(rxn, LibraryReaction)
-                            rxn.library = family_label
-                            reactionDict[family_label][reactant1][reactant2].append(rxn)
+                        for label, database in self.database.kinetics.libraries.iteritems():
+                            if database.label == family0_label:
+                                family_label = database.label
+                                break
                     elif isinstance(family0_obj, KineticsFamily):
-                        for rxn in self.reactionModel.reactionDict[family0_label][reactant1][reactant2]:
-                            assert isinstance(rxn, TemplateReaction)
-                            rxn.family_label = family_label
-                            reactionDict[family_label][reactant1][reactant2].append(rxn)
-        
-        self.reactionModel.reactionDict = reactionDict
+                        for label, database in self.database.kinetics.families.iteritems():
+                            if database.label == family0_label:
+                                family_label = database.label
+                                break
+                    if family_label is None:
+                        raise Exception("Unable to find matching reaction family for %s" % family0_label)
+                    familyLabels[family0_label] = family_label
+                family_label = familyLabels[family0_label]
+
+                # Update each affected reaction to point to that new family
+                if isinstance(family0_obj, KineticsLibrary):
+                    assert isinstance(rxn, LibraryReaction)
+                    rxn.library = family_label
+                elif isinstance(family0_obj, KineticsFamily):
+                    assert isinstance(rxn, TemplateReaction)
+                    rxn.family_label = family_label
+                reactions.append(rxn)
+
+        # Rebuild the reaction database, including the indices that restart
+        # files from older versions do not have
+        self.reactionModel.reactionDict = {}
+        self.reactionModel.reactionIdDict = {}
+        self.reactionModel.reactionKeysBySpecies = {}
+        self.reactionModel.registerReactions(reactions)
     
     def loadRestartFile(self, path):
         """
@@ -38,13 +38,17 @@ import numpy
 import itertools
 import gc
 import os
+import heapq
 
 from rmgpy.display import display
+from rmgpy.util import PhaseTimer
 from rmgpy import settings
 import rmgpy.constants as constants
 from rmgpy.constraints import failsSpeciesConstraints
 from rmgpy.quantity import Quantity
 from rmgpy.species import Species
+from rmgpy.molecule.resonance import get_structure_key
+from rmgpy.thermo import NASA, NASATable
 from rmgpy.thermo.thermoengine import submit
 from rmgpy.reaction import Reaction
 from rmgpy.exceptions import ForbiddenStructureException
@@ -202,6 +206,8 @@ class CoreEdgeReactionModel:
         self.networkCount = 0
         self.speciesDict = {}
         self.reactionDict = {}
+        self.reactionIdDict = {}
+        self.reactionKeysBySpecies = {}
         self.speciesCache = [None for i in range(4)]
         self.speciesCounter = 0
         self.reactionCounter = 0
@@ -223,12 +229,17 @@ class CoreEdgeReactionModel:
         self.minCoreSizeForPrune = 50
         self.maximumEdgeSpecies = 100000
         self.Tmax = 0
+        self.thermoFilterFreeEnergies = {}
+        self.thermoFilterCoreCount = 0
+        self.thermoFilterEdgeSpecies = set()
+        self.thermoFilterHeap = []
         self.reactionSystems = []
         self.newSurfaceSpcsAdd = set()
         self.newSurfaceRxnsAdd = set()
         self.newSurfaceSpcsLoss = set()
         self.newSurfaceRxnsLoss = set()
         self.solventName = ''
+        self.timer = PhaseTimer()
 
     def checkForExistingSpecies(self, molecule):
         """
@@ -259,10 +270,13 @@ class CoreEdgeReactionModel:
         for i, spec in enumerate(self.speciesCache):
             if spec is not None:
                 for mol in spec.molecule:
+                    self.timer.count('isomorphismChecks')
                     if obj.isIsomorphic(mol):
+                        self.timer.count('speciesCacheHits')
                         self.speciesCache.pop(i)
                         self.speciesCache.insert(0, spec)
                         return True, spec
+        self.timer.count('speciesCacheMisses')
 
         # Return an existing species if a match is found
         formula = molecule.getFormula()
@@ -271,6 +285,7 @@ class CoreEdgeReactionModel:
         except KeyError:
             return False, None
         for spec in speciesList:
+            self.timer.count('isomorphismChecks')
             if spec.isIsomorphic(obj):
                 self.speciesCache.pop()
                 self.speciesCache.insert(0, spec)
@@ -278,11 +293,15 @@ class CoreEdgeReactionModel:
         # At this point we can conclude that the structure does not exist
         return False, None
 
-    def makeNewSpecies(self, object, label='', reactive=True, checkForExisting=True):
+    def makeNewSpecies(self, object, label='', reactive=True, checkForExisting=True, generateThermo=True):
         """
         Formally create a new species from the specified `object`, which can be
         either a :class:`Molecule` object or an :class:`rmgpy.species.Species`
         object.
+
+        If `generateThermo` is ``False``, the thermo of a new species is not
+        submitted; the caller is then expected to pass the species to
+        :meth:`submitThermoData`.
         """
 
         if isinstance(object, rmgpy.species.Species):
@@ -296,6 +315,10 @@ class CoreEdgeReactionModel:
 
         # If desired, check to ensure that the species is new; return the
         # existing species if not new
+        if checkForExisting and isinstance(object, rmgpy.species.Species) and \
+                object.reactive and self.indexSpeciesDict.get(object.index) is object:
+            # The object is already a species of the model
+            return object, False
         if checkForExisting:
             found, spec = self.checkForExistingSpecies(molecule)
             if found: return spec, False
@@ -318,21 +341,18 @@ class CoreEdgeReactionModel:
         spec.generate_resonance_structures()
         spec.molecularWeight = Quantity(spec.molecule[0].getMolecularWeight()*1000.,"amu")
         
-        if not spec.thermo:
-            submit(spec,self.solventName)
+        if generateThermo:
+            self.submitThermoData([spec])
         
         if spec.label == '':
-            if spec.thermo and spec.thermo.label != '': #check if thermo libraries have a name for it
-                logging.info('Species with SMILES of {0} named {1} based on thermo library name'.format(molecule.toSMILES().replace('/','').replace('\\',''),spec.thermo.label))
-                spec.label = spec.thermo.label
-                label = spec.label
-            else:
-                # Use SMILES as default format for label
-                # However, SMILES can contain slashes (to describe the
-                # stereochemistry around double bonds); since RMG doesn't 
-                # distinguish cis and trans isomers, we'll just strip these out
-                # so that we can use the label in file paths
-                label = molecule.toSMILES().replace('/','').replace('\\','')
+            # Use SMILES as default format for label
+            # However, SMILES can contain slashes (to describe the
+            # stereochemistry around double bonds); since RMG doesn't 
+            # distinguish cis and trans isomers, we'll just strip these out
+            # so that we can use the label in file paths
+            label = molecule.toSMILES().replace('/','').replace('\\','')
+        else:
+            label = spec.label
                 
         logging.debug('Creating new species {0}'.format(label))
         
@@ -352,23 +372,103 @@ class CoreEdgeReactionModel:
 
         return spec, True
 
+    def submitThermoData(self, spcs):
+        """
+        Submit the thermo calculation of each species in the list `spcs` that
+        does not have thermo yet. All of the calculations are submitted before
+        any result is used, so that they can run in parallel. Species without
+        a label are then named after their thermo library entry, if any.
+        """
+        with self.timer.phase('thermo'):
+            for spec in spcs:
+                if not spec.thermo:
+                    self.timer.count('thermoEstimates')
+                    submit(spec,self.solventName)
+
+        for spec in spcs:
+            if spec.label == '' and spec.thermo and spec.thermo.label != '': #check if thermo libraries have a name for it
+                logging.info('Species with SMILES of {0} named {1} based on thermo library name'.format(spec.molecule[0].toSMILES().replace('/','').replace('\\',''),spec.thermo.label))
+                spec.label = spec.thermo.label
+
+    def makeNewSpeciesForReactions(self, rxns):
+        """
+        Create the species of the reactants, products and specific colliders
+        of all of the reactions in the list `rxns` in one pass, and replace the
+        structures in the reactions (and in their reactant-product pairs) by
+        those species. Returns the list of species that are new to the model.
+
+        The structures are first deduplicated among themselves, so that each
+        distinct structure is checked against the existing species only once.
+        The new species are then created together and their thermo is
+        submitted as a single batch.
+        """
+        # Collect the distinct structures of all of the reactions
+        structures = {}
+        uniqueStructures = []
+        speciesMap = {}
+        for rxn in rxns:
+            objs = rxn.reactants + rxn.products
+            if rxn.specificCollider is not None:
+                objs = objs + [rxn.specificCollider]
+            for obj in objs:
+                if id(obj) in speciesMap:
+                    continue
+                if isinstance(obj, rmgpy.species.Species):
+                    molecule = obj.molecule[0]
+                else:
+                    molecule = obj
+                key = get_structure_key(molecule)
+                candidates = structures.setdefault(key, [])
+                for molecule0, index in candidates:
+                    if molecule.isIsomorphic(molecule0):
+                        break
+                else:
+                    index = len(uniqueStructures)
+                    candidates.append((molecule, index))
+                    uniqueStructures.append(obj)
+                speciesMap[id(obj)] = (obj, index)
+
+        # Make the species of the distinct structures, without their thermo
+        species = []
+        newSpecies = []
+        for obj in uniqueStructures:
+            spec, isNew = self.makeNewSpecies(obj, generateThermo=False)
+            species.append(spec)
+            if isNew:
+                newSpecies.append(spec)
+
+        # Submit the thermo of all of the new species at once
+        self.submitThermoData(newSpecies)
+
+        # Replace the structures in the reactions by the species
+        for rxn in rxns:
+            rxn.reactants = [species[speciesMap[id(obj)][1]] for obj in rxn.reactants]
+            rxn.products = [species[speciesMap[id(obj)][1]] for obj in rxn.products]
+            if rxn.specificCollider is not None:
+                rxn.specificCollider = species[speciesMap[id(rxn.specificCollider)][1]]
+            if rxn.pairs is not None:
+                rxn.pairs = [(species[speciesMap[id(reactant)][1]], species[speciesMap[id(product)][1]])
+                             for reactant, product in rxn.pairs]
+                if getattr(rxn, 'reverse', None) is not None and rxn.reverse.pairs is not None:
+                    rxn.reverse.pairs = [(product, reactant) for reactant, product in rxn.pairs]
+
+        return newSpecies
+
     def checkForExistingReaction(self, rxn):
         """
         Check to see if an existing reaction has the same reactants, products, and
         family as `rxn`. Returns :data:`True` or :data:`False` and the matched
         reaction (if found).
 
-        First, a shortlist of reaction is retrieved that have the same reaction keys
-        as the parameter reaction.
+        First, a shortlist of reactions is retrieved that have the same reaction key
+        (family and sorted keys of the reactants and products) as the parameter
+        reaction. The species references of each reaction in the shortlist are
+        compared to those of the parameter reaction. If a match is found, the
+        discovered reaction is returned.
 
-        Next, the reaction ID containing an identifier (e.g. label) of the reactants
-        and products is compared between the parameter reaction and the each of the
-        reactions in the shortlist. If a match is found, the discovered reaction is 
-        returned.
-
-        If a match is not yet found, the Library (seed mechs, reaction libs)
-        in the reaction database are iterated over to check if a reaction was overlooked
-        (a reaction with a different "family" key as the parameter reaction).
+        If a match is not yet found, the reactions with the same reaction ID in
+        any family are retrieved to check if a reaction from another Library
+        (seed mechs, reaction libs) was overlooked.
 
         """
 
@@ -385,21 +485,17 @@ class CoreEdgeReactionModel:
         familyObj = getFamilyLibraryObject(rxn.family)
         shortlist = self.searchRetrieveReactions(rxn)
 
-        # Now use short-list to check for matches. All should be in same forward direction.
-
-        # Make sure the reactant and product lists are sorted before performing the check
-        rxn_id = generateReactionId(rxn)
-
+        # Now use short-list to check for matches. The short-list only holds
+        # reactions with the same reaction key, in either direction for
+        # reaction families, so the reactant and product keys already match.
         for rxn0 in shortlist:
-            rxn_id0 = generateReactionId(rxn0)
 
-            if (rxn_id == rxn_id0) and isinstance(familyObj, KineticsLibrary):
+            if isinstance(familyObj, KineticsLibrary):
                 # If the reaction comes from a kinetics library, then we can 
                 # retain duplicates if they are marked
                 if areIdenticalSpeciesReferences(rxn, rxn0) and not rxn.duplicate:
                     return True, rxn0
-            elif ((rxn_id == rxn_id0) or (rxn_id == rxn_id0[::-1])) and \
-                        isinstance(familyObj, KineticsFamily):
+            elif isinstance(familyObj, KineticsFamily):
                 # ensure TemplateReactions have the same templates and families in order
                 # to classify this as existing reaction. Also checks for reverse
                 # direction matching. Marks duplicate if identical species and different
@@ -419,36 +515,20 @@ class CoreEdgeReactionModel:
                     else:
                         rxn.duplicate = True
                         rxn0.duplicate = True
-            elif (rxn_id == rxn_id0):
-                if areIdenticalSpeciesReferences(rxn, rxn0):
-                    return True, rxn0
+            elif areIdenticalSpeciesReferences(rxn, rxn0):
+                return True, rxn0
 
         # Now check seed mechanisms
         # We want to check for duplicates in *other* seed mechanisms, but allow
         # duplicated *within* the same seed mechanism
-        _, r1_fwd, r2_fwd = generateReactionKey(rxn)
-        _, r1_rev, r2_rev = generateReactionKey(rxn, useProducts=True)
-
-        for library in self.reactionDict:
-            libObj = getFamilyLibraryObject(library)
-            if isinstance(libObj, KineticsLibrary) and library != rxn.family:
-
-                # First check seed short-list in forward direction                
-                shortlist = self.retrieve(library, r1_fwd, r2_fwd)
-                
-                for rxn0 in shortlist:
-                    rxn_id0 = generateReactionId(rxn0)
-                    if (rxn_id == rxn_id0) or (rxn_id == rxn_id0[::-1]):
-                        if areIdenticalSpeciesReferences(rxn, rxn0):
-                            return True, rxn0
-                
-                # Now get the seed short-list of the reverse reaction
+        rxn_id = generateReactionId(rxn)
+        shortlist = self.retrieveById(rxn_id) + self.retrieveById(rxn_id[::-1])
 
-                shortlist = self.retrieve(library, r1_rev, r2_rev)
-                
-                for rxn0 in shortlist:
-                    if areIdenticalSpeciesReferences(rxn, rxn0):
-                        return True, rxn0
+        for rxn0 in shortlist:
+            if rxn0.family != rxn.family and \
+                    isinstance(getFamilyLibraryObject(rxn0.family), KineticsLibrary):
+                if areIdenticalSpeciesReferences(rxn, rxn0):
+                    return True, rxn0
 
         return False, None
 
@@ -591,7 +671,8 @@ class CoreEdgeReactionModel:
             elif isinstance(newObject, tuple) and isinstance(newObject[0], PDepNetwork) and self.pressureDependence:
 
                 pdepNetwork, newSpecies = newObject
-                newReactions.extend(pdepNetwork.exploreIsomer(newSpecies))
+                with self.timer.phase('reactionGeneration'):
+                    newReactions.extend(pdepNetwork.exploreIsomer(newSpecies))
 
                 for rxn in newReactions:
                     rxn = self.inflate(rxn)
@@ -619,7 +700,8 @@ class CoreEdgeReactionModel:
                     for products in network.products:
                         products = products.species
                         if len(products) == 1 and products[0] == species:
-                            newReactions = network.exploreIsomer(species)
+                            with self.timer.phase('reactionGeneration'):
+                                newReactions = network.exploreIsomer(species)
                             for rxn in newReactions:
                                 rxn = self.inflate(rxn)
                                 try:
@@ -643,27 +725,41 @@ class CoreEdgeReactionModel:
         else:
             # We are reacting the edge
 
-            rxns = reactAll(self.core.species, numOldCoreSpecies, unimolecularReact, bimolecularReact)
+            # The reactions are processed in stages over the whole batch:
+            # the species of all reactants and products are made and their
+            # thermo submitted first, then the reactions are made and placed
+            with self.timer.phase('reactionGeneration'):
+                rxns = reactAll(self.core.species, numOldCoreSpecies, unimolecularReact, bimolecularReact)
             spcs = [self.retrieveNewSpecies(rxn) for rxn in rxns]
             
-            for rxn, spc in zip(rxns, spcs):
-                rxn = self.inflate(rxn) 
+            for rxn in rxns:
+                self.inflate(rxn) 
                 try:
                     rxn.reverse = self.inflate(rxn.reverse)
                 except AttributeError, e:
                     pass
-                self.processNewReactions([rxn], spc)
+
+            with self.timer.phase('species'):
+                newSpecies = self.makeNewSpeciesForReactions(rxns)
+            logging.debug('Made {0:d} new species for {1:d} generated reactions'.format(len(newSpecies), len(rxns)))
+
+            # Reactions generated from the same core species are consecutive
+            with self.timer.phase('reactions'):
+                for spc, group in itertools.groupby(zip(rxns, spcs), key=lambda item: item[1]):
+                    self.processNewReactions([rxn for rxn, spc0 in group], spc)
 
         ################################################################
         # Begin processing the new species and reactions
         
         # Generate kinetics of new reactions
         logging.info('Generating kinetics for new reactions...')
-        for reaction in self.newReactionList:
-            # If the reaction already has kinetics (e.g. from a library),
-            # assume the kinetics are satisfactory
-            if reaction.kinetics is None:
-                self.applyKineticsToReaction(reaction)
+        with self.timer.phase('kinetics'):
+            for reaction in self.newReactionList:
+                # If the reaction already has kinetics (e.g. from a library),
+                # assume the kinetics are satisfactory
+                if reaction.kinetics is None:
+                    self.timer.count('kineticsEstimates')
+                    self.applyKineticsToReaction(reaction)
                     
         # For new reactions, convert ArrheniusEP to Arrhenius, and fix barrier heights.
         # self.newReactionList only contains *actually* new reactions, all in the forward direction.
@@ -683,7 +779,8 @@ class CoreEdgeReactionModel:
         # Update unimolecular (pressure dependent) reaction networks
         if self.pressureDependence:
             # Recalculate k(T,P) values for modified networks
-            self.updateUnimolecularReactionNetworks()
+            with self.timer.phase('pdep'):
+                self.updateUnimolecularReactionNetworks()
             logging.info('')
             
         # Check new core and edge reactions for Chemkin duplicates
@@ -773,6 +870,7 @@ class CoreEdgeReactionModel:
         Makes a reaction and decides where to put it: core, edge, or PDepNetwork.
         """
         for rxn in newReactions:
+            spcs = []
             rxn, isNew = self.makeNewReaction(rxn)
             if rxn is None:
                 # Skip this reaction because there was something wrong with it
@@ -783,7 +881,6 @@ class CoreEdgeReactionModel:
                 allSpeciesInCore = True
                 # Add the reactant and product species to the edge if necessary
                 # At the same time, check if all reactants and products are in the core
-                spcs = []
                 for spec in rxn.reactants:
                     if spec not in self.core.species:
                         allSpeciesInCore = False
@@ -1030,6 +1127,7 @@ class CoreEdgeReactionModel:
             # If species was in edge, remove it
             logging.debug("Removing species {0} from edge.".format(spec))
             self.edge.species.remove(spec)
+            self.thermoFilterEdgeSpecies.discard(spec)
 
             # Search edge for reactions that now contain only core species;
             # these belong in the model core and will be moved there
@@ -1053,6 +1151,50 @@ class CoreEdgeReactionModel:
         """
         self.edge.species.append(spec)
     
+    def getFreeEnergyAtTmax(self, spc):
+        """
+        Return the Gibbs free energy of species `spc` at the maximum reactor
+        temperature Tmax used for thermodynamic filtering. The value is only
+        computed again if the thermo of the species has been replaced.
+        """
+        try:
+            thermo, G = self.thermoFilterFreeEnergies[spc]
+            if thermo is spc.thermo:
+                return G
+        except KeyError:
+            pass
+        G = spc.thermo.getFreeEnergy(self.Tmax)
+        self.thermoFilterFreeEnergies[spc] = (spc.thermo, G)
+        return G
+
+    def getFreeEnergiesAtTmax(self, spcs):
+        """
+        Return a list of the Gibbs free energies of the species `spcs` at the
+        maximum reactor temperature Tmax. The NASA polynomials of the species
+        whose values are not cached are evaluated together in a
+        :class:`NASATable`.
+        """
+        Gs = [None] * len(spcs)
+        uncached = []
+        for i, spc in enumerate(spcs):
+            try:
+                thermo, G = self.thermoFilterFreeEnergies[spc]
+                if thermo is spc.thermo:
+                    Gs[i] = G
+                    continue
+            except KeyError:
+                pass
+            if isinstance(spc.thermo, NASA):
+                uncached.append(i)
+            else:
+                Gs[i] = self.getFreeEnergyAtTmax(spc)
+        if uncached:
+            table = NASATable([spcs[i].thermo for i in uncached])
+            for i, G in zip(uncached, table.getFreeEnergies(numpy.array([self.Tmax], numpy.float64))[:,0]):
+                Gs[i] = float(G)
+                self.thermoFilterFreeEnergies[spcs[i]] = (spcs[i].thermo, Gs[i])
+        return Gs
+
     def setThermodynamicFilteringParameters(self,Tmax, toleranceThermoKeepSpeciesInEdge,minCoreSizeForPrune,maximumEdgeSpecies,reactionSystems):
         """
         sets parameters for thermodynamic filtering based on the current core
@@ -1061,11 +1203,26 @@ class CoreEdgeReactionModel:
         minCoreSizeForPrune is the core size at which thermodynamic filtering will start
         maximumEdgeSpecies is the maximum allowed number of edge species
         reactionSystems is a list of reactionSystem objects
+
+        The Gibbs energy range of the core is updated with the species added
+        to the core since the last call, unless Tmax has changed
         """
-        self.Tmax = Tmax
-        Gs = [spc.thermo.getFreeEnergy(Tmax) for spc in self.core.species]
-        self.Gmax = max(Gs)
-        self.Gmin = min(Gs)
+        if Tmax != self.Tmax or self.thermoFilterCoreCount > len(self.core.species):
+            # The Gibbs energies at the old Tmax cannot be reused
+            self.Tmax = Tmax
+            self.thermoFilterFreeEnergies = {}
+            self.thermoFilterCoreCount = 0
+            self.thermoFilterEdgeSpecies = set()
+            self.thermoFilterHeap = []
+        
+        Gs = self.getFreeEnergiesAtTmax(self.core.species[self.thermoFilterCoreCount:])
+        if self.thermoFilterCoreCount == 0:
+            self.Gmax = max(Gs)
+            self.Gmin = min(Gs)
+        elif Gs:
+            self.Gmax = max(self.Gmax, max(Gs))
+            self.Gmin = min(self.Gmin, min(Gs))
+        self.thermoFilterCoreCount = len(self.core.species)
         
         self.Gfmax = toleranceThermoKeepSpeciesInEdge*(self.Gmax-self.Gmin)+self.Gmax
         self.toleranceThermoKeepSpeciesInEdge = toleranceThermoKeepSpeciesInEdge
@@ -1078,9 +1235,7 @@ class CoreEdgeReactionModel:
         checks Gibbs energy of the species in species against the
         maximum allowed Gibbs energy
         """
-        Tmax = self.Tmax
-        for spc in spcs:
-            G = spc.thermo.getFreeEnergy(Tmax)
+        for spc, G in zip(spcs, self.getFreeEnergiesAtTmax(spcs)):
             if G > self.Gfmax:
                 Gn = (G-self.Gmax)/(self.Gmax-self.Gmin)
                 logging.info('Removing species {0} with Gibbs energy {1} from edge because it\'s Gibbs number {2} is greater than the toleranceThermoKeepSpeciesInEdge of {3} '.format(spc,G,Gn,self.toleranceThermoKeepSpeciesInEdge))
@@ -1089,7 +1244,27 @@ class CoreEdgeReactionModel:
         # Delete any networks that became empty as a result of pruning
         if self.pressureDependence:
             self.removeEmptyPdepNetworks()
-                        
+
+    def updateThermoFilterHeap(self):
+        """
+        Push the edge species that are not yet in the heap used by
+        thermoFilterDown, which orders them by decreasing Gibbs energy at Tmax.
+        Species that left the edge are only dropped from the heap when they
+        reach its top.
+        """
+        if (len(self.thermoFilterEdgeSpecies) > len(self.edge.species) or
+                len(self.thermoFilterHeap) > 2 * len(self.edge.species)):
+            # The edge was replaced, or most of the heap is species that left
+            # the edge, so start over
+            self.thermoFilterEdgeSpecies = set()
+            self.thermoFilterHeap = []
+        if len(self.thermoFilterEdgeSpecies) == len(self.edge.species):
+            return
+        newSpecies = [spc for spc in self.edge.species if spc not in self.thermoFilterEdgeSpecies]
+        for spc, G in zip(newSpecies, self.getFreeEnergiesAtTmax(newSpecies)):
+            self.thermoFilterEdgeSpecies.add(spc)
+            heapq.heappush(self.thermoFilterHeap, (-G, spc.index, spc))
+
     def thermoFilterDown(self,maximumEdgeSpecies,minSpeciesExistIterationsForPrune=0):
         """
         removes species from the edge based on their Gibbs energy until maximumEdgeSpecies
@@ -1099,7 +1274,6 @@ class CoreEdgeReactionModel:
         minSpeciesExistIterationsForPrune is the number of iterations a species must be in the edge
         before it is eligible for thermo filtering
         """
-        Tmax = self.Tmax
         numToRemove = len(self.edge.species) - maximumEdgeSpecies
         logging.debug('Planning to remove {0} species'.format(numToRemove))
         iteration = self.iterationNum
@@ -1107,29 +1281,35 @@ class CoreEdgeReactionModel:
         if numToRemove > 0: #implies flux pruning is off or did not trigger
             logging.info('Reached maximum number of edge species')
             logging.info('Attempting to remove excess edge species with Thermodynamic filtering')
-            spcs = self.edge.species
-            Gfs = numpy.array([spc.thermo.getFreeEnergy(Tmax) for spc in spcs])
-            Gns = (Gfs-self.Gmax)/(self.Gmax-self.Gmin) 
-            inds = numpy.argsort(Gns) #could actually do this with the Gfs, but want to print the Gn value later
-            inds = inds[::-1] #get in order of increasing Gf
+            self.updateThermoFilterHeap()
+            heap = self.thermoFilterHeap
 
-            ind = 0
             removeSpcs = []
-            
-            rInds = []
-            while ind < len(inds) and numToRemove > 0: #find the species we can remove and collect indices for removal     
-                i = inds[ind]
-                spc = spcs[i]
+            keep = []
+            while heap and numToRemove > 0: #find the species we can remove, highest Gibbs energy first
+                item = heapq.heappop(heap)
+                negG, index, spc = item
+                if spc not in self.thermoFilterEdgeSpecies:
+                    # The species has already left the edge
+                    continue
+                G = self.getFreeEnergyAtTmax(spc)
+                if G != -negG:
+                    # The thermo of the species has changed since it was pushed
+                    heapq.heappush(heap, (-G, index, spc))
+                    continue
                 if iteration - spc.creationIteration >= minSpeciesExistIterationsForPrune:
                     removeSpcs.append(spc)
-                    rInds.append(i)
                     numToRemove -= 1
-                ind += 1
+                else:
+                    keep.append(item)
+            for item in keep:
+                heapq.heappush(heap, item)
             
             logging.debug('found {0} eligible species for filtering'.format(len(removeSpcs)))
             
-            for i,spc in enumerate(removeSpcs):
-                logging.info('Removing species {0} from edge to meet maximum number of edge species, Gibbs number is {1}'.format(spc,Gns[rInds[i]]))
+            for spc in removeSpcs:
+                Gn = (self.getFreeEnergyAtTmax(spc)-self.Gmax)/(self.Gmax-self.Gmin)
+                logging.info('Removing species {0} from edge to meet maximum number of edge species, Gibbs number is {1}'.format(spc,Gn))
                 self.removeSpeciesFromEdge(self.reactionSystems,spc)
             
             # Delete any networks that became empty as a result of pruning
@@ -1251,6 +1431,8 @@ class CoreEdgeReactionModel:
         # remove the species
         self.edge.species.remove(spec)
         self.indexSpeciesDict.pop(spec.index)
+        self.thermoFilterEdgeSpecies.discard(spec)
+        self.thermoFilterFreeEnergies.pop(spec, None)
 
         # clean up species references in reactionSystems
         for reactionSystem in reactionSystems:
@@ -1300,21 +1482,7 @@ class CoreEdgeReactionModel:
                     network.updateConfigurations(self)
 
         # Remove from the global list of reactions
-        # also remove it from the global list of reactions
-        for family in self.reactionDict:
-            if spec in self.reactionDict[family]:
-                del self.reactionDict[family][spec]
-            for reactant1 in self.reactionDict[family]:
-                if spec in self.reactionDict[family][reactant1]:
-                    del self.reactionDict[family][reactant1][spec]
-            for reactant1 in self.reactionDict[family]:
-                for reactant2 in self.reactionDict[family][reactant1]:
-                    tempRxnDeleteList = []
-                    for templateReaction in self.reactionDict[family][reactant1][reactant2]:
-                        if spec in templateReaction.reactants or spec in templateReaction.products:
-                            tempRxnDeleteList.append(templateReaction)
-                    for tempRxnToBeDeleted in tempRxnDeleteList:
-                        self.reactionDict[family][reactant1][reactant2].remove(tempRxnToBeDeleted)
+        self.unregisterReactionsOfSpecies(spec)
 
         # remove from the global list of species, to free memory
         formula = spec.molecule[0].getFormula()
@@ -1724,40 +1892,58 @@ class CoreEdgeReactionModel:
         """
         Adds the reaction to the reaction database.
 
-        The reaction database is structured as a multi-level
-        dictionary, for efficient search and retrieval of
-        existing reactions.
+        The reaction database is a flat dictionary keyed by the reaction key
+        (see :func:`generateReactionKey`): the reaction family (or library)
+        and the sorted keys of the reactants and of the products. Each value
+        is the list of reactions with that key.
 
-        The database has two types of dictionary keys:
-        - reaction family
-        - reactant(s) keys
+        The reaction is also added to a second dictionary keyed by the
+        reaction ID (see :func:`generateReactionId`), which holds the
+        reactions of all families and libraries together and is used to
+        look for existing reactions across libraries. The last two elements
+        of a reaction key are its reaction ID.
 
-        First, the keys are generated for the parameter reaction.
-        
-        Next, it is checked whether the reaction database already 
-        contains similar keys. If not, a new container is created,
-        either a dictionary for the family key and first reactant key,
-        or a list for the second reactant key.
-
-        Finally, the reaction is inserted as the first element in the 
-        list.
+        Finally, the reaction key is added to the set of keys of each of its
+        reactants and products in `reactionKeysBySpecies`, so the reactions
+        of a species can be removed without searching the whole database.
         """
+        self.registerReactions([rxn])
 
-        key_family, key1, key2 = generateReactionKey(rxn)
-
-        # make dictionary entries if necessary
-        if key_family not in self.reactionDict:
-            self.reactionDict[key_family] = {}
-
-        if not self.reactionDict[key_family].has_key(key1):
-            self.reactionDict[key_family][key1] = {}
-
-        if not self.reactionDict[key_family][key1].has_key(key2):
-            self.reactionDict[key_family][key1][key2] = []
-
-        # store this reaction at the top of the relevant short-list
-        self.reactionDict[key_family][key1][key2].insert(0, rxn)
+    def registerReactions(self, rxns):
+        """
+        Adds each reaction in the list `rxns` to the reaction database.
+        """
+        reactionDict = self.reactionDict
+        reactionIdDict = self.reactionIdDict
+        reactionKeysBySpecies = self.reactionKeysBySpecies
+        for rxn in rxns:
+            rxnKey = generateReactionKey(rxn)
+            reactionDict.setdefault(rxnKey, []).append(rxn)
+            reactionIdDict.setdefault(rxnKey[1:], []).append(rxn)
+            for key in rxnKey[1] + rxnKey[2]:
+                reactionKeysBySpecies.setdefault(key, set()).add(rxnKey)
 
+    def unregisterReactionsOfSpecies(self, spec):
+        """
+        Removes all of the reactions with `spec` as a reactant or product
+        from the reaction database.
+        """
+        for rxnKey in self.reactionKeysBySpecies.pop(getKey(spec), ()):
+            for reactionIndex, key in [(self.reactionDict, rxnKey), (self.reactionIdDict, rxnKey[1:])]:
+                if key not in reactionIndex:
+                    # Already emptied through another family with this ID
+                    continue
+                rxnList = [rxn for rxn in reactionIndex[key]
+                           if spec not in rxn.reactants and spec not in rxn.products]
+                if rxnList:
+                    reactionIndex[key] = rxnList
+                else:
+                    del reactionIndex[key]
+            if rxnKey not in self.reactionDict:
+                for key in rxnKey[1] + rxnKey[2]:
+                    keys = self.reactionKeysBySpecies.get(key)
+                    if keys is not None:
+                        keys.discard(rxnKey)
 
     def searchRetrieveReactions(self, rxn):
         """
@@ -1765,28 +1951,20 @@ class CoreEdgeReactionModel:
         reactions with an identical reaction key as the key of the 
         parameter reaction.
 
-        Both the reaction key based on the reactants as well as on the products
-        is used to search for possible candidate reactions.
+        For reaction families the reaction key of the reverse reaction is
+        also used to search for possible candidate reactions.
         """
 
-        # Get the short-list of reactions with the same family, reactant1 and reactant2
-        family_label, r1_fwd, r2_fwd = generateReactionKey(rxn)
-        
-        my_reactionList = []
+        # Get the short-list of reactions with the same family, reactants and products
+        my_reactionList = self.retrieve(generateReactionKey(rxn))
 
-        rxns = self.retrieve(family_label, r1_fwd, r2_fwd)
-        my_reactionList.extend(rxns)
-            
-            
-        family = getFamilyLibraryObject(family_label)       
+        family = getFamilyLibraryObject(rxn.family)
         # if the family is its own reverse (H-Abstraction) then check the other direction
         if isinstance(family,KineticsFamily): 
 
-            # Get the short-list of reactions with the same family, product1 and product2
-            family_label, r1_rev, r2_rev = generateReactionKey(rxn, useProducts=True)
-
-            rxns = self.retrieve(family_label, r1_rev, r2_rev)
-            my_reactionList.extend(rxns)
+            # Get the short-list of reactions with the same family and the
+            # reactants and products swapped
+            my_reactionList.extend(self.retrieve(generateReactionKey(rxn, useProducts=True)))
 
         return my_reactionList
 
@@ -1803,19 +1981,29 @@ class CoreEdgeReactionModel:
             if spc.reactive:
                 self.indexSpeciesDict[spc.index] = spc
 
-    def retrieve(self, family_label, key1, key2):
+    def retrieve(self, key):
         """
         Returns a list of reactions from the reaction database with the 
-        same keys as the parameters.
+        reaction key `key`.
 
-        Returns an empty list when one of the keys could not be found.
+        Returns an empty list when the key could not be found.
         """
         try:
-            return self.reactionDict[family_label][key1][key2][:]
+            return self.reactionDict[key][:]
         except KeyError: # no such short-list: must be new, unless in seed.
             return []
 
+    def retrieveById(self, rxn_id):
+        """
+        Returns a list of reactions from the reaction database of any family
+        or library with the reaction ID `rxn_id`.
 
+        Returns an empty list when the ID could not be found.
+        """
+        try:
+            return self.reactionIdDict[rxn_id][:]
+        except KeyError:
+            return []
 
     def inflate(self, rxn):
         """
@@ -1877,36 +2065,32 @@ def generateReactionKey(rxn, useProducts=False):
     """
     Returns a tuple with 3 keys:
     - the reaction family (or library) the reaction belongs to
-    - the keys of the reactants.
+    - a tuple of the keys of the reactants
+    - a tuple of the keys of the products
 
-    None for the third element in the tuple if there is 
-    only 1 reactant.
+    If `useProducts` is ``True``, the keys of the products come first,
+    i.e. the key of the reverse reaction is returned.
 
-    The keys are sorted alphabetically.
+    The keys of the reactants and products are sorted alphabetically.
     """
 
-    key_family = rxn.family
-
-    spc_list = rxn.products if useProducts else rxn.reactants
-    key1 = getKey(spc_list[0])
-    key2 = None if len(spc_list) == 1 else getKey(spc_list[1])
-    key1, key2 = sorted([key1, key2], reverse=True)# ensure None is always at end
-
-    return (key_family, key1, key2)
+    reactants, products = generateReactionId(rxn)
+    if useProducts:
+        return (rxn.family, products, reactants)
+    return (rxn.family, reactants, products)
 
 def generateReactionId(rxn):
     """
     Returns a tuple of the reactions reactant and product
     keys.
 
-    Both lists are sorted.
+    Both tuples are sorted.
 
-    The first element in the tuple is the reactants list.
+    The first element in the tuple is the reactants tuple.
     """
 
-
-    reactants = sorted([getKey(reactant) for reactant in rxn.reactants])
-    products = sorted([getKey(product) for product in rxn.products])
+    reactants = tuple(sorted([getKey(reactant) for reactant in rxn.reactants]))
+    products = tuple(sorted([getKey(product) for product in rxn.products]))
 
     return (reactants, products)
 
@@ -238,13 +238,60 @@ class TestCoreEdgeReactionModel(unittest.TestCase):
 
         # count no. of entries in reactionDict:
         counter = 0
-        for fam, v1 in cerm.reactionDict.iteritems():
-            for key2, v2 in v1.iteritems():
-                for key3, rxnList in v2.iteritems():
-                    counter += len(rxnList)
+        for key, rxnList in cerm.reactionDict.iteritems():
+            counter += len(rxnList)
 
         self.assertEquals(counter, 3)
+
+        # the reactions are also indexed by reaction ID, regardless of family
+        counter = 0
+        for rxn_id, rxnList in cerm.reactionIdDict.iteritems():
+            counter += len(rxnList)
+
+        self.assertEquals(counter, 3)
+        for rxn in cerm.reactionIdDict.values()[0]:
+            self.assertIn(rxn, cerm.retrieve(generateReactionKey(rxn)))
+
+        # removing a species removes its reactions from every index
+        spcCH3 = [spc for rxnList in cerm.reactionDict.values() for rxn in rxnList
+                  for spc in rxn.reactants if spc.isIsomorphic(spcs[1])][0]
+        cerm.unregisterReactionsOfSpecies(spcCH3)
+        self.assertEquals(sum([len(rxnList) for rxnList in cerm.reactionDict.values()]), 1)
+        self.assertEquals(sum([len(rxnList) for rxnList in cerm.reactionIdDict.values()]), 1)
+        self.assertNotIn(getKey(spcCH3), cerm.reactionKeysBySpecies)
+        for keys in cerm.reactionKeysBySpecies.values():
+            for rxnKey in keys:
+                self.assertIn(rxnKey, cerm.reactionDict)
     
+    def testMakeNewSpeciesForReactions(self):
+        """
+        Test that CoreEdgeReactionModel.makeNewSpeciesForReactions makes each
+        distinct species of a batch of reactions once.
+        """
+
+        spcA = Species().fromSMILES('[OH]')
+        spcs = [Species().fromSMILES('CC'), Species().fromSMILES('[CH3]')]
+        spcTuples = [(spcA, spc) for spc in spcs]
+
+        rxns = list(react(*spcTuples))
+
+        cerm = CoreEdgeReactionModel()
+
+        newSpecies = cerm.makeNewSpeciesForReactions(rxns)
+
+        # [OH], CC and [CH3] react to give O, C[CH2], [CH2], [O] and C
+        self.assertEquals(len(newSpecies), 8)
+        self.assertEquals(len(cerm.indexSpeciesDict), 8)
+        for rxn in rxns:
+            for spc in rxn.reactants + rxn.products:
+                self.assertIn(spc, newSpecies)
+
+        for rxn in rxns:
+            cerm.makeNewReaction(rxn)
+
+        self.assertEquals(len(cerm.newReactionList), 3)
+        self.assertEquals(len(cerm.indexSpeciesDict), 8)
+
     def testThermoFilterSpecies(self):
         """
         test that thermoFilterSpecies leaves species alone if if toleranceThermoKeepInEdge
@@ -366,7 +413,57 @@ class TestCoreEdgeReactionModel(unittest.TestCase):
         difset = set([x.molecule[0].toSMILES() for x in cerm.edge.species])-set([x.molecule[0].toSMILES() for x in cerm.core.species])
         
         self.assertEquals(len(difset),1) #should be one because we thermo filtered down to one edge species
-        
+
+    def testThermoFilterBookkeeping(self):
+        """
+        test that the Gibbs energy range of the core is updated as species
+        are added to the core, and that the Gibbs energy of a species is
+        recomputed only when its thermo changes
+        """
+        cerm = CoreEdgeReactionModel()
+
+        spcs = [Species().fromSMILES('C'),
+                Species().fromSMILES('O'),
+                Species().fromSMILES('[OH]'),
+                Species().fromSMILES('[CH3]')]
+
+        for i, spc in enumerate(spcs):
+            cerm.makeNewSpecies(spc,label=spc.molecule[0].toSMILES())
+            spc.thermo = NASA(polynomials=[NASAPolynomial(coeffs=[3.5,0,0,0,0,-10000.0*(i+1),1.0], Tmin=(100,'K'), Tmax=(5000,'K'))], Tmin=(100,'K'), Tmax=(5000,'K'))
+
+        cerm.addSpeciesToCore(spcs[0])
+        cerm.addSpeciesToCore(spcs[1])
+        cerm.setThermodynamicFilteringParameters(Tmax=300.0,
+                                                 toleranceThermoKeepSpeciesInEdge=1000.0,
+                                                 minCoreSizeForPrune=0,
+                                                 maximumEdgeSpecies=1,
+                                                 reactionSystems=[])
+        cerm.addSpeciesToCore(spcs[2])
+        cerm.setThermodynamicFilteringParameters(Tmax=300.0,
+                                                 toleranceThermoKeepSpeciesInEdge=1000.0,
+                                                 minCoreSizeForPrune=0,
+                                                 maximumEdgeSpecies=1,
+                                                 reactionSystems=[])
+
+        Gs = [spc.thermo.getFreeEnergy(300.0) for spc in spcs[:3]]
+        self.assertAlmostEqual(cerm.Gmax, max(Gs))
+        self.assertAlmostEqual(cerm.Gmin, min(Gs))
+        self.assertEqual(cerm.thermoFilterCoreCount, 3)
+
+        G = cerm.getFreeEnergyAtTmax(spcs[3])
+        self.assertAlmostEqual(G, spcs[3].thermo.getFreeEnergy(300.0))
+        spcs[3].thermo = NASA(polynomials=[NASAPolynomial(coeffs=[3.5,0,0,0,0,10000.0,1.0], Tmin=(100,'K'), Tmax=(5000,'K'))], Tmin=(100,'K'), Tmax=(5000,'K'))
+        self.assertAlmostEqual(cerm.getFreeEnergyAtTmax(spcs[3]), spcs[3].thermo.getFreeEnergy(300.0))
+        self.assertNotAlmostEqual(cerm.getFreeEnergyAtTmax(spcs[3]), G)
+
+        # Species with NASA thermo are evaluated together, the others one by one
+        spcs[2].thermo = spcs[2].thermo.toThermoData()
+        spcs[1].thermo = NASA(polynomials=[NASAPolynomial(coeffs=[4.0,0,0,0,0,-5000.0,2.0], Tmin=(100,'K'), Tmax=(5000,'K'))], Tmin=(100,'K'), Tmax=(5000,'K'))
+        Gs = cerm.getFreeEnergiesAtTmax(spcs)
+        self.assertEqual(len(Gs), len(spcs))
+        for spc, G in zip(spcs, Gs):
+            self.assertAlmostEqual(G / spc.thermo.getFreeEnergy(300.0), 1.0, 10)
+
     def testInflate(self):
         """
         Test that CoreEdgeReactionModel.inflate method correctly works.
@@ -38,11 +38,12 @@ import logging
 import re
 import textwrap
 from rmgpy.util import makeOutputSubdirectory
+from rmgpy.molecule.imagestore import StructureImageStore
 from rmgpy.chemkin import getSpeciesIdentifier
 from rmgpy.exceptions import OutputError
 ################################################################################
 
-def saveOutputHTML(path, reactionModel, partCoreEdge='core'):
+def saveOutputHTML(path, reactionModel, partCoreEdge='core', imageStore=None):
     """
     Save the current set of  species and reactions of `reactionModel` to
     an HTML file `path` on disk. As part of this process, drawings of all 
@@ -50,11 +51,12 @@ def saveOutputHTML(path, reactionModel, partCoreEdge='core'):
     using the :mod:`rmgpy.molecule.draw` module. The :mod:`jinja`
     package is used to generate the HTML; if this package is not found, no
     HTML will be generated (but the program will carry on).
+
+    The drawings are kept in a :class:`StructureImageStore`, which may be
+    passed as `imageStore` to reuse it between calls.
     """
     
     from rmgpy.rmg.model import PDepReaction
-    
-    from rmgpy.molecule.draw import MoleculeDrawer
 
     try:
         import jinja2
@@ -73,8 +75,10 @@ def saveOutputHTML(path, reactionModel, partCoreEdge='core'):
     elif partCoreEdge == 'edge':
         species = reactionModel.edge.species[:] + reactionModel.outputSpeciesList
         
-    if not os.path.isdir(os.path.join(dirname,'species')):
-        os.makedirs(os.path.join(dirname,'species'))
+    closeImageStore = imageStore is None
+    if closeImageStore:
+        imageStore = StructureImageStore(os.path.join(dirname, 'species'))
+    structureImage = getStructureImageFunction(imageStore, os.path.relpath(imageStore.path, dirname))
 
     re_index_search = re.compile(r'\((\d+)\)$').search
     
@@ -86,13 +90,9 @@ def saveOutputHTML(path, reactionModel, partCoreEdge='core'):
         if match:
             spec.index = int(match.group(0)[1:-1])
             spec.label = spec.label[0:match.start()]
-        # Draw molecules if necessary
-        fstr = os.path.join(dirname, 'species', '{0}.png'.format(spec))
-        if not os.path.exists(fstr):
-            try:
-                MoleculeDrawer().draw(spec.molecule[0], 'png', fstr)
-            except IndexError:
-                raise OutputError("{0} species could not be drawn because it did not contain a molecular structure. Please recheck your files.".format(getSpeciesIdentifier(spec)))
+        # Request drawings of the molecules, also saved as species/<label>.png
+        # for the tools that look the images up by species
+        structureImage(spec, str(spec))
         #spec.thermo.comment=
         # Text wrap the thermo comments
     # We want to keep species sorted in the original order in which they were added to the RMG core.
@@ -422,7 +422,7 @@ $(document).ready(function() {
 
  </td>
     
-    <td class="structure" valign="top"><a href={{ spec.molecule[0].getURL() }}><img src="species/{{ spec|replace('#','%23') }}.png" alt="{{ getSpeciesIdentifier(spec) }}" title="{{ getSpeciesIdentifier(spec) }}"></a></td>
+    <td class="structure" valign="top"><a href={{ spec.molecule[0].getURL() }}><img loading="lazy" src="{{ structureImage(spec) }}" alt="{{ getSpeciesIdentifier(spec) }}" title="{{ getSpeciesIdentifier(spec) }}"></a></td>
     <td class="label" valign="top">{{ getSpeciesIdentifier(spec) }}</td>
     <td class="SMILES" valign="top">{{ spec.molecule[0].toSMILES() }}</td>
     
@@ -471,9 +471,9 @@ $(document).ready(function() {
 <tbody class="reaction">
 <tr class="{{ rxn.getSource()|csssafe }} rxnStart">
     <td class="index"><a href="{{ rxn.getURL() }}" title="Search on RMG website" class="searchlink">{{ rxn.index }}.</a></td>
-    <td class="reactants">{% for reactant in rxn.reactants %}<a href="{{ reactant.molecule[0].getURL() }}"><img src="species/{{ reactant|replace('#','%23') }}.png" alt="{{ getSpeciesIdentifier(reactant) }}" title="{{ getSpeciesIdentifier(reactant) }}, MW = {{ "%.2f g/mol"|format(reactant.molecule[0].getMolecularWeight() * 1000) }}"></a>{% if not loop.last %} + {% endif %}{% endfor %}</td>
+    <td class="reactants">{% for reactant in rxn.reactants %}<a href="{{ reactant.molecule[0].getURL() }}"><img loading="lazy" src="{{ structureImage(reactant) }}" alt="{{ getSpeciesIdentifier(reactant) }}" title="{{ getSpeciesIdentifier(reactant) }}, MW = {{ "%.2f g/mol"|format(reactant.molecule[0].getMolecularWeight() * 1000) }}"></a>{% if not loop.last %} + {% endif %}{% endfor %}</td>
     <td class="reactionArrow">{% if rxn.reversible %}&hArr;{% else %}&rarr;{% endif %}</td>
-    <td class="products">{% for product in rxn.products %}<a href="{{ product.molecule[0].getURL() }}"><img src="species/{{ product|replace('#','%23') }}.png" alt="{{ getSpeciesIdentifier(product) }}" title="{{ getSpeciesIdentifier(product) }}, MW = {{ "%.2f g/mol"|format(product.molecule[0].getMolecularWeight() * 1000) }}"></a>{% if not loop.last %} + {% endif %}{% endfor %}</td>
+    <td class="products">{% for product in rxn.products %}<a href="{{ product.molecule[0].getURL() }}"><img loading="lazy" src="{{ structureImage(product) }}" alt="{{ getSpeciesIdentifier(product) }}" title="{{ getSpeciesIdentifier(product) }}, MW = {{ "%.2f g/mol"|format(product.molecule[0].getMolecularWeight() * 1000) }}"></a>{% if not loop.last %} + {% endif %}{% endfor %}</td>
     <td class="family">{{ rxn.getSource() }}</td>
 </tr>
 <tr class="kinetics {{ rxn.getSource()|csssafe }} hide_kinetics">
@@ -503,9 +503,29 @@ $(document).ready(function() {
 
         
     f = open(path, 'w')
-    f.write(template.render(title=title, species=species, reactions=reactions, families=families, familyCount=familyCount, getSpeciesIdentifier=getSpeciesIdentifier,textwrap=textwrap))
+    f.write(template.render(title=title, species=species, reactions=reactions, families=families, familyCount=familyCount, getSpeciesIdentifier=getSpeciesIdentifier,textwrap=textwrap,
+                            structureImage=structureImage))
     f.close()
 
+    # Draw the structures referenced by the HTML that do not have images yet
+    imageStore.render()
+    if closeImageStore:
+        imageStore.close()
+
+def getStructureImageFunction(imageStore, relativePath):
+    """
+    Return a function that takes a species, requests the drawing of its
+    structure from `imageStore`, and returns the URL of the image relative to
+    the HTML file, for use in the jinja templates.
+    """
+    def structureImage(spec, name=None):
+        try:
+            molecule = spec.molecule[0]
+        except IndexError:
+            raise OutputError("{0} species could not be drawn because it did not contain a molecular structure. Please recheck your files.".format(getSpeciesIdentifier(spec)))
+        return '{0}/{1}'.format(relativePath.replace(os.sep, '/'), imageStore.getImage(molecule, name))
+    return structureImage
+
 
 def saveDiffHTML(path, commonSpeciesList, speciesList1, speciesList2, commonReactions, uniqueReactions1, uniqueReactions2):
     """
@@ -514,8 +534,6 @@ def saveDiffHTML(path, commonSpeciesList, speciesList1, speciesList2, commonReac
     """
     from rmgpy.rmg.model import PDepReaction
     from rmgpy.kinetics import Arrhenius, MultiArrhenius, MultiPDepArrhenius
-
-    from rmgpy.molecule.draw import MoleculeDrawer
     try:
         import jinja2
     except ImportError:
@@ -532,69 +550,11 @@ def saveDiffHTML(path, commonSpeciesList, speciesList1, speciesList2, commonReac
     re_index = re.compile(r'\((\d+)\)$')
 
         
-    if not os.path.isdir(os.path.join(dirname,'species1')):
-        os.makedirs(os.path.join(dirname,'species1'))    
-    
-    if not os.path.isdir(os.path.join(dirname,'species2')):
-        os.makedirs(os.path.join(dirname,'species2'))
-
-    for spec1, spec2 in commonSpeciesList:
-        # if the species dictionary came from an RMG-Java job, make them prettier
-        # We use the presence of a trailing index on the label to discern this
-        # (A single open parenthesis is not enough (e.g. when using SMILES strings as labels!)
-        match1 = re_index.search(spec1.label)
-        if match1:
-            spec1.index = int(match1.group(0)[1:-1])
-            spec1.label = spec1.label[0:match1.start()]
-
-        match2 = re_index.search(spec2.label)            
-        if match2:
-            spec2.index = int(match2.group(0)[1:-1])
-            spec2.label = spec2.label[0:match2.start()]            
-        
-        # Draw molecules if necessary
-        fstr = os.path.join(dirname, 'species1', '{0}.png'.format(spec1))
-        if not os.path.exists(fstr):
-            try:
-                MoleculeDrawer().draw(spec1.molecule[0], 'png', fstr)
-            except IndexError:
-                raise OutputError('{0} species could not be drawn because it did not contain a molecular structure. Please recheck your files.'.format(getSpeciesIdentifier(spec1)))
+    # Species of both models are drawn into the same store, since the images
+    # are named by structure rather than by label
+    imageStore = StructureImageStore(os.path.join(dirname, 'species'))
+    structureImage = getStructureImageFunction(imageStore, 'species')
 
-            
-        fstr = os.path.join(dirname, 'species2', '{0}.png'.format(spec2))
-        if not os.path.exists(fstr):
-            try:
-                MoleculeDrawer().draw(spec2.molecule[0], 'png', fstr)
-            except IndexError:
-                raise OutputError('{0} species could not be drawn because it did not contain a molecular structure. Please recheck your files.'.format(getSpeciesIdentifier(spec2)))
-    
-                
-    for spec in speciesList1:
-        match = re_index.search(spec.label)
-        if match:
-            spec.index = int(match.group(0)[1:-1])
-            spec.label = spec.label[0:match.start()]
-        # Draw molecules if necessary
-        fstr = os.path.join(dirname, 'species1', '{0}.png'.format(spec))
-        if not os.path.exists(fstr):
-            try:
-                MoleculeDrawer().draw(spec.molecule[0], 'png', fstr)
-            except IndexError:
-                raise OutputError('{0} species could not be drawn because it did not contain a molecular structure. Please recheck your files.'.format(getSpeciesIdentifier(spec)))
-    
-    for spec in speciesList2:
-        match = re_index.search(spec.label)
-        if match:
-            spec.index = int(match.group(0)[1:-1])
-            spec.label = spec.label[0:match.start()]
-        # Draw molecules if necessary
-        fstr = os.path.join(dirname, 'species2', '{0}.png'.format(spec))
-        if not os.path.exists(fstr):
-            try:
-                MoleculeDrawer().draw(spec.molecule[0], 'png', fstr)
-            except IndexError:
-                raise OutputError('{0} species could not be drawn because it did not contain a molecular structure. Please recheck your files.'.format(getSpeciesIdentifier(spec)))
-    
     #Add pictures for species that may not have different thermo but are in reactions with different kinetics
     allRxns = [rxnTuple[0] for rxnTuple in commonReactions] + uniqueReactions1 + uniqueReactions2
     allSpecies = []
@@ -605,18 +565,16 @@ def saveDiffHTML(path, commonSpeciesList, speciesList1, speciesList2, commonReac
             allSpecies.append(rxt)
     allSpecies = set(allSpecies)
 
-    for spec in allSpecies:
+    for spec in speciesList + list(allSpecies):
+        # if the species dictionary came from an RMG-Java job, make them prettier
+        # We use the presence of a trailing index on the label to discern this
+        # (A single open parenthesis is not enough (e.g. when using SMILES strings as labels!)
         match = re_index.search(spec.label)
         if match:
             spec.index = int(match.group(0)[1:-1])
             spec.label = spec.label[0:match.start()]
-        # Draw molecules if necessary
-        fstr = os.path.join(dirname, 'species2', '{0}.png'.format(spec))
-        if not os.path.exists(fstr):
-            try:
-                MoleculeDrawer().draw(spec.molecule[0], 'png', fstr)
-            except IndexError:
-                raise OutputError('{0} species could not be drawn because it did not contain a molecular structure. Please recheck your files.'.format(getSpeciesIdentifier(spec)))
+        # Request drawings of the molecules
+        structureImage(spec)
 
 
     familyCount1 = {}
@@ -870,7 +828,7 @@ $(document).ready(function() {
                 <tr><th>Structure</th><th>SMILES</th><th>MW (g/mol)</th></tr>
                 <tr>
                     <td>{{ spec1.molecule[0].toSMILES() }}</td>
-                    <td class="structure" align="center"><a href="{{spec1.molecule[0].getURL()}}"><img src="species1/{{ spec1|replace('#','%23') }}.png"></a></td>
+                    <td class="structure" align="center"><a href="{{spec1.molecule[0].getURL()}}"><img loading="lazy" src="{{ structureImage(spec1) }}"></a></td>
                     <td>{{ "%.2f"|format(spec1.molecule[0].getMolecularWeight() * 1000) }}</td>
                 </tr>
             </table>
@@ -982,7 +940,7 @@ $(document).ready(function() {
     <tr class="species">
         <td class="index">
         {{ spec.index }}.</td>
-        <td class="structure"><a href="{{ spec.molecule[0].getURL() }}"><img src="species1/{{ spec|replace('#','%23') }}.png" alt="{{ getSpeciesIdentifier(spec) }}" title="{{ getSpeciesIdentifier(spec) }}"></a></td>
+        <td class="structure"><a href="{{ spec.molecule[0].getURL() }}"><img loading="lazy" src="{{ structureImage(spec) }}" alt="{{ getSpeciesIdentifier(spec) }}" title="{{ getSpeciesIdentifier(spec) }}"></a></td>
         <td class="label">{{ getSpeciesIdentifier(spec) }}</td>
         <td>{{spec.molecule[0].toSMILES()}}</td>
         <td>{{ "%.2f"|format(spec.molecule[0].getMolecularWeight() * 1000) }}</td>
@@ -1031,7 +989,7 @@ $(document).ready(function() {
     <tr class="species">
         <td class="index">
         {{ spec.index }}.</td>
-        <td class="structure"><a href="{{ spec.molecule[0].getURL() }}"><img src="species2/{{ spec|replace('#','%23') }}.png" alt="{{ getSpeciesIdentifier(spec) }}" title="{{ getSpeciesIdentifier(spec) }}"></a></td>
+        <td class="structure"><a href="{{ spec.molecule[0].getURL() }}"><img loading="lazy" src="{{ structureImage(spec) }}" alt="{{ getSpeciesIdentifier(spec) }}" title="{{ getSpeciesIdentifier(spec) }}"></a></td>
         <td class="label">{{ getSpeciesIdentifier(spec) }}</td>
         <td>{{spec.molecule[0].toSMILES()}}</td>
         <td>{{ "%.2f"|format(spec.molecule[0].getMolecularWeight() * 1000) }}</td>
@@ -1128,9 +1086,9 @@ $(document).ready(function() {
 <td width=100% colspan="4">
 <table align="center">
 <tr>
-    <td class="reactants" align="right">{% for reactant in rxn1.reactants %}<a href="{{reactant.molecule[0].getURL() }}"><img src="species1/{{ reactant|replace('#','%23') }}.png" alt="{{ reactant }}" title="{{ reactant }}, MW = {{ "%.2f"|format(reactant.molecule[0].getMolecularWeight() * 1000) }}"></a>{% if not loop.last %} + {% endif %}{% endfor %}</td>
+    <td class="reactants" align="right">{% for reactant in rxn1.reactants %}<a href="{{reactant.molecule[0].getURL() }}"><img loading="lazy" src="{{ structureImage(reactant) }}" alt="{{ reactant }}" title="{{ reactant }}, MW = {{ "%.2f"|format(reactant.molecule[0].getMolecularWeight() * 1000) }}"></a>{% if not loop.last %} + {% endif %}{% endfor %}</td>
     <td class="reactionArrow" align="center">{% if rxn1.reversible %}&hArr;{% else %}&rarr;{% endif %}</td>
-    <td class="products" align="left">{% for product in rxn1.products %}<a href="{{product.molecule[0].getURL()}}"><img src="species1/{{ product|replace('#','%23') }}.png" alt="{{ product }}" title="{{ product }}, MW = {{ "%.2f"|format(product.molecule[0].getMolecularWeight() * 1000) }}"></a>{% if not loop.last %} + {% endif %}{% endfor %}</td>
+    <td class="products" align="left">{% for product in rxn1.products %}<a href="{{product.molecule[0].getURL()}}"><img loading="lazy" src="{{ structureImage(product) }}" alt="{{ product }}" title="{{ product }}, MW = {{ "%.2f"|format(product.molecule[0].getMolecularWeight() * 1000) }}"></a>{% if not loop.last %} + {% endif %}{% endfor %}</td>
 </tr>
 </table>
 </td>
@@ -1228,9 +1186,9 @@ $(document).ready(function() {
     {% for rxn in uniqueReactions1 %}
     <tr class="reaction {{ rxn.getSource()|csssafe }}">
         <td class="index"><a href="{{ rxn.getURL() }}" title="Search on RMG website" class="searchlink">{{ rxn.index }}.</a></td>
-        <td class="reactants">{% for reactant in rxn.reactants %}<a href="{{ reactant.molecule[0].getURL() }}"><img src="species1/{{ reactant|replace('#','%23') }}.png" alt="{{ reactant }}" title="{{ reactant }}, MW = {{ "%.2f"|format(reactant.molecule[0].getMolecularWeight() * 1000) }}"></a>{% if not loop.last %} + {% endif %}{% endfor %}</td>
+        <td class="reactants">{% for reactant in rxn.reactants %}<a href="{{ reactant.molecule[0].getURL() }}"><img loading="lazy" src="{{ structureImage(reactant) }}" alt="{{ reactant }}" title="{{ reactant }}, MW = {{ "%.2f"|format(reactant.molecule[0].getMolecularWeight() * 1000) }}"></a>{% if not loop.last %} + {% endif %}{% endfor %}</td>
         <td class="reactionArrow">{% if rxn.reversible %}&hArr;{% else %}&rarr;{% endif %}</td>
-        <td class="products">{% for product in rxn.products %}<a href="{{ product.molecule[0].getURL() }}"><img src="species1/{{ product|replace('#','%23') }}.png" alt="{{ product }}" title="{{ product }}, MW = {{ "%.2f"|format(product.molecule[0].getMolecularWeight() * 1000) }}"></a>{% if not loop.last %} + {% endif %}{% endfor %}</td>
+        <td class="products">{% for product in rxn.products %}<a href="{{ product.molecule[0].getURL() }}"><img loading="lazy" src="{{ structureImage(product) }}" alt="{{ product }}" title="{{ product }}, MW = {{ "%.2f"|format(product.molecule[0].getMolecularWeight() * 1000) }}"></a>{% if not loop.last %} + {% endif %}{% endfor %}</td>
         <td class="family">{{ rxn.getSource() }}</td>
     </tr>
     <tr class="kinetics {{ rxn.getSource()|csssafe }}">
@@ -1262,9 +1220,9 @@ $(document).ready(function() {
     {% for rxn in uniqueReactions2 %}
     <tr class="reaction {{ rxn.getSource()|csssafe }}">
         <td class="index"><a href="{{ rxn.getURL() }}" title="Search on RMG website" class="searchlink">{{ rxn.index }}.</a></td>
-        <td class="reactants">{% for reactant in rxn.reactants %}<a href="{{ reactant.molecule[0].getURL() }}"><img src="species2/{{ reactant|replace('#','%23') }}.png" alt="{{ reactant }}" title="{{ reactant }}, MW = {{ "%.2f"|format(reactant.molecule[0].getMolecularWeight() * 1000) }}"></a>{% if not loop.last %} + {% endif %}{% endfor %}</td>
+        <td class="reactants">{% for reactant in rxn.reactants %}<a href="{{ reactant.molecule[0].getURL() }}"><img loading="lazy" src="{{ structureImage(reactant) }}" alt="{{ reactant }}" title="{{ reactant }}, MW = {{ "%.2f"|format(reactant.molecule[0].getMolecularWeight() * 1000) }}"></a>{% if not loop.last %} + {% endif %}{% endfor %}</td>
         <td class="reactionArrow">{% if rxn.reversible %}&hArr;{% else %}&rarr;{% endif %}</td>
-        <td class="products">{% for product in rxn.products %}<a href="{{ product.molecule[0].getURL() }}"><img src="species2/{{ product|replace('#','%23') }}.png" alt="{{ product }}" title="{{ product }}, MW = {{ "%.2f"|format(product.molecule[0].getMolecularWeight() * 1000) }}"></a>{% if not loop.last %} + {% endif %}{% endfor %}</td>
+        <td class="products">{% for product in rxn.products %}<a href="{{ product.molecule[0].getURL() }}"><img loading="lazy" src="{{ structureImage(product) }}" alt="{{ product }}" title="{{ product }}, MW = {{ "%.2f"|format(product.molecule[0].getMolecularWeight() * 1000) }}"></a>{% if not loop.last %} + {% endif %}{% endfor %}</td>
         <td class="family">{{ rxn.getSource() }}</td>
     </tr>
     <tr class="kinetics {{ rxn.getSource()|csssafe }}">
@@ -1299,20 +1257,25 @@ $(document).ready(function() {
     f.write(template.render(title=title, commonSpecies=commonSpeciesList, speciesList1=speciesList1, speciesList2 = speciesList2, 
                             commonReactions=commonReactions, uniqueReactions1=uniqueReactions1, uniqueReactions2=uniqueReactions2, 
                             families1=families1, families2=families2, familyCount1=familyCount1,familyCount2=familyCount2, families_union=set(families1+families2),speciesList=speciesList,
-                            getSpeciesIdentifier=getSpeciesIdentifier,textwrap=textwrap))
+                            getSpeciesIdentifier=getSpeciesIdentifier,textwrap=textwrap,structureImage=structureImage))
     f.close()
 
+    # Draw the structures referenced by the HTML that do not have images yet
+    imageStore.render()
+    imageStore.close()
 
-def saveOutput(rmg):
+
+def saveOutput(rmg, imageStore=None):
     """
-    Save the current reaction model to a pretty HTML file.
+    Save the current reaction model to a pretty HTML file. The drawings of
+    the structures are kept in `imageStore` if given.
     """
     logging.info('Saving current model core to HTML file...')
-    saveOutputHTML(os.path.join(rmg.outputDirectory, 'output.html'), rmg.reactionModel, 'core')
+    saveOutputHTML(os.path.join(rmg.outputDirectory, 'output.html'), rmg.reactionModel, 'core', imageStore=imageStore)
     
     if rmg.saveEdgeSpecies == True:
         logging.info('Saving current model edge to HTML file...')
-        saveOutputHTML(os.path.join(rmg.outputDirectory, 'output_edge.html'), rmg.reactionModel, 'edge')
+        saveOutputHTML(os.path.join(rmg.outputDirectory, 'output_edge.html'), rmg.reactionModel, 'edge', imageStore=imageStore)
 
 class OutputHTMLWriter(object):
     """
@@ -1335,9 +1298,21 @@ class OutputHTMLWriter(object):
     rmg.detach(listener)
 
     """
+    # The HTML is written on the subject's thread: saveOutputHTML reads
+    # almost every attribute of the species and reactions and renames
+    # species with RMG-Java style labels, which are also the keys of the
+    # reaction model's dictionaries, so it must not run while the model grows
+
     def __init__(self, outputDirectory=''):
         super(OutputHTMLWriter, self).__init__()
         makeOutputSubdirectory(outputDirectory, 'species')
+        self.imageStore = StructureImageStore(os.path.join(outputDirectory, 'species'))
     
     def update(self, rmg):
-        saveOutput(rmg)
+        saveOutput(rmg, imageStore=self.imageStore)
+
+    def close(self):
+        """
+        Stop the worker processes drawing the structures.
+        """
+        self.imageStore.close()
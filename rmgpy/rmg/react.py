@@ -35,6 +35,7 @@ import itertools
 
 from rmgpy.data.rmg import getDB
 from rmgpy.scoop_framework.util import map_
+from rmgpy.species import Species
 
 
 def react(*spcTuples):
@@ -69,7 +70,7 @@ def reactSpecies(speciesTuple):
 
     The generated reactions are deflated.
     """
-    speciesTuple = tuple([spc.copy(deep=True) for spc in speciesTuple])
+    speciesTuple = prepareReactants(speciesTuple)
 
     reactions = getDB('kinetics').generate_reactions_from_families(speciesTuple)
 
@@ -80,6 +81,29 @@ def reactSpecies(speciesTuple):
     return reactions
 
 
+def prepareReactants(speciesTuple):
+    """
+    Return a tuple of species to react in place of the species in
+    `speciesTuple`, so that reaction generation does not change them.
+
+    Reaction generation only labels the atoms of the reactant molecules for
+    as long as it needs to, but it replaces the list of resonance structures
+    of each reactant and requires the atom IDs of the reactants to be
+    independent. If they are, each species is replaced by a new
+    :class:`Species` object that shares the molecules of the original in a
+    list of its own, and no molecules are copied. Otherwise, for instance
+    when a species reacts with itself, all of the species are deep-copied so
+    that new atom IDs can be assigned.
+    """
+    usedIDs = set()
+    for spc in speciesTuple:
+        ids = set([atom.id for atom in spc.molecule[0].atoms])
+        if len(ids) != len(spc.molecule[0].atoms) or not usedIDs.isdisjoint(ids):
+            return tuple([spc.copy(deep=True) for spc in speciesTuple])
+        usedIDs.update(ids)
+    return tuple([Species(index=spc.index, label=spc.label, molecule=spc.molecule[:], reactive=spc.reactive)
+                  for spc in speciesTuple])
+
 def deflate(rxns, species, reactantIndices):
     """
     The purpose of this function is to replace the reactants and
@@ -40,7 +40,7 @@ from rmgpy.reaction import Reaction
 from rmgpy.species import Species
 
 from rmgpy.rmg.main import RMG
-from rmgpy.rmg.react import react, reactAll, deflate, deflateReaction
+from rmgpy.rmg.react import react, reactAll, deflate, deflateReaction, prepareReactants
 
 ###################################################
 
@@ -141,6 +141,101 @@ class TestReact(unittest.TestCase):
                 rxn.reactants[i] = Molecule().fromSMILES(indices[reactant])
             self.assertTrue(rxn.isBalanced())
 
+    def testPrepareReactants(self):
+        """
+        Test that reactants share molecules with the original species when
+        their atom IDs are independent, and are copied otherwise.
+        """
+        spcA = Species().fromSMILES('[OH]')
+        spcB = Species().fromSMILES('C=C[CH2]')
+        spcA.generate_resonance_structures()
+        spcB.generate_resonance_structures()
+
+        reactants = prepareReactants((spcA, spcB))
+        for spc, reactant in zip([spcA, spcB], reactants):
+            self.assertIsNot(reactant, spc)
+            self.assertIsNot(reactant.molecule, spc.molecule)
+            self.assertEqual(len(reactant.molecule), len(spc.molecule))
+            for mol, mol0 in zip(reactant.molecule, spc.molecule):
+                self.assertIs(mol, mol0)
+
+        reactants = prepareReactants((spcB, spcB))
+        for reactant in reactants:
+            self.assertIsNot(reactant.molecule[0], spcB.molecule[0])
+
+    def testReactDoesNotModifySpecies(self):
+        """
+        Test that reaction generation leaves the atom IDs and resonance
+        structures of the reacting species unchanged.
+        """
+        spcA = Species().fromSMILES('[OH]')
+        spcB = Species().fromSMILES('C=C[CH2]')
+        spcA.generate_resonance_structures()
+        spcB.generate_resonance_structures()
+        molecules = [spc.molecule[:] for spc in [spcA, spcB]]
+        ids = [[atom.id for atom in mol.atoms] for spc in [spcA, spcB] for mol in spc.molecule]
+
+        reactionList = list(react((spcA, spcB)))
+        self.assertTrue(len(reactionList) > 0)
+
+        for spc, molecules0 in zip([spcA, spcB], molecules):
+            self.assertEqual(len(spc.molecule), len(molecules0))
+            for mol, mol0 in zip(spc.molecule, molecules0):
+                self.assertIs(mol, mol0)
+        self.assertEqual([[atom.id for atom in mol.atoms] for spc in [spcA, spcB] for mol in spc.molecule], ids)
+        for spc in [spcA, spcB]:
+            for mol in spc.molecule:
+                self.assertEqual(mol.getLabeledAtoms(), {})
+
+    def testReactClearsLabelsOfForbiddenProducts(self):
+        """
+        Test that the atoms of the reacting species are left unlabeled when
+        the products of every match are forbidden.
+        """
+        self.rmg.database.forbiddenStructures.loadEntry(label='water', group="""
+1 O u0 {2,S} {3,S}
+2 H u0 {1,S}
+3 H u0 {1,S}
+""")
+        spcA = Species().fromSMILES('[OH]')
+        spcB = Species().fromSMILES('CC')
+        spcA.generate_resonance_structures()
+        spcB.generate_resonance_structures()
+
+        reactionList = list(react((spcA, spcB)))
+        self.assertEqual(reactionList, [])
+
+        for spc in [spcA, spcB]:
+            for mol in spc.molecule:
+                self.assertEqual(mol.getLabeledAtoms(), {})
+                self.assertTrue(all([atom.label == '' for atom in mol.atoms]))
+
+    def testReactReverseDirection(self):
+        """
+        Test that reactions generated in the reverse direction of a family get
+        their reaction pairs and templates, and leave the species unlabeled.
+        """
+        path = os.path.join(settings['database.directory'])
+        self.rmg.database.loadKinetics(os.path.join(path, 'kinetics'),
+                                       kineticsFamilies=['Disproportionation'],
+                                       reactionLibraries=[]
+                                       )
+        spcA = Species().fromSMILES('C')
+        spcB = Species().fromSMILES('C=C')
+        spcA.generate_resonance_structures()
+        spcB.generate_resonance_structures()
+
+        reactionList = list(react((spcA, spcB)))
+        reverse = [rxn for rxn in reactionList if rxn.family == 'Disproportionation' and not rxn.isForward]
+        self.assertTrue(len(reverse) > 0)
+        for rxn in reverse:
+            self.assertEqual(len(rxn.pairs), 2)
+            self.assertTrue(rxn.template)
+
+        for spc in [spcA, spcB]:
+            for mol in spc.molecule:
+                self.assertEqual(mol.getLabeledAtoms(), {})
+
     def testReactAll(self):
         """
         Test that the reactAll function works.
@@ -121,6 +121,8 @@ cdef class ReactionSystem(DASx):
 
     cpdef logRates(self, double charRate, object species, double speciesRate, double maxDifLnAccumNum, object network, double networkRate)
      
+    cpdef getReachedTermination(self, dict speciesIndex, numpy.ndarray y0)
+    
     cpdef logConversions(self, speciesIndex, y0)
     
     cpdef getLayeringIndices(self)
@@ -58,6 +58,32 @@ from rmgpy.species import Species
 
 ################################################################################
 
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef updateAccumulationNumbers(numpy.ndarray[numpy.float64_t, ndim=1] totalDivAccumNums,
+                               numpy.ndarray[numpy.float64_t, ndim=1] reactionRates,
+                               numpy.ndarray[numpy.int_t, ndim=1] speciesIndices,
+                               numpy.ndarray[numpy.float64_t, ndim=1] speciesRates):
+    """
+    Multiply the accumulation number ratios `totalDivAccumNums` of a set of
+    reactions with rates `reactionRates` by the factor (r + R) / R of one of
+    their reactants or products, where `speciesIndices` gives the index of
+    that species for each reaction and R is its rate of consumption or
+    production in `speciesRates`. Missing (-1) and non-core species, and
+    species for which R is zero, are ignored.
+    """
+    cdef int i, spcIndex, numCoreSpecies
+    cdef double rate
+    numCoreSpecies = speciesRates.shape[0]
+    for i in xrange(totalDivAccumNums.shape[0]):
+        spcIndex = speciesIndices[i]
+        if spcIndex != -1 and spcIndex < numCoreSpecies:
+            rate = speciesRates[spcIndex]
+            if rate != 0:
+                totalDivAccumNums[i] *= (reactionRates[i] + rate) / rate
+
+################################################################################
+
 cdef class ReactionSystem(DASx):
     """
     A base class for all RMG reaction systems.
@@ -557,6 +583,8 @@ cdef class ReactionSystem(DASx):
         cdef numpy.ndarray[numpy.float64_t, ndim=1] forwardRateCoefficients, coreSpeciesConcentrations
         cdef double  prevTime, totalMoles, c, volume, RTP, unimolecularThresholdVal, bimolecularThresholdVal
         cdef bool useDynamicsTemp, firstTime, useDynamics, terminateAtMaxObjects, schanged
+        cdef int fluxCheckInterval, steps
+        cdef object reachedTermination
         cdef numpy.ndarray[numpy.float64_t, ndim=1] edgeReactionRates
         cdef double reactionRate, production, consumption
         cdef numpy.ndarray[numpy.int_t,ndim=1] surfaceSpeciesIndices, surfaceReactionIndices
@@ -595,6 +623,7 @@ cdef class ReactionSystem(DASx):
         sensitivityRelativeTolerance = simulatorSettings.sens_rtol
         filterReactions = modelSettings.filterReactions
         maxNumObjsPerIter = modelSettings.maxNumObjsPerIter
+        fluxCheckInterval = modelSettings.fluxCheckInterval
 
         #if not pruning always terminate at max objects, otherwise only do so if terminateAtMaxObjects=True
         terminateAtMaxObjects = True if not prune else modelSettings.terminateAtMaxObjects 
@@ -655,6 +684,7 @@ cdef class ReactionSystem(DASx):
         prevTime = self.t
 
         firstTime = True
+        steps = 0
         
         while not terminated:
             # Integrate forward in time by one time step
@@ -725,6 +755,17 @@ cdef class ReactionSystem(DASx):
             snapshot.extend(y_coreSpecies / numpy.sum(y_coreSpecies))
             self.snapshots.append(snapshot)            
 
+            # The fluxes are only checked every fluxCheckInterval steps, but
+            # always at the first step and when the simulation would terminate
+            reachedTermination = self.getReachedTermination(speciesIndex, y0)
+            if not firstTime and reachedTermination is None and steps % fluxCheckInterval != 0:
+                steps += 1
+                # Increment destination step time if necessary
+                if self.t >= 0.9999 * stepTime:
+                    stepTime *= 10.0
+                continue
+            steps += 1
+
             # Get the characteristic flux
             charRate = sqrt(numpy.sum(self.coreSpeciesRates * self.coreSpeciesRates))
             
@@ -743,12 +784,13 @@ cdef class ReactionSystem(DASx):
             coreSpeciesConcentrations = self.coreSpeciesConcentrations
             
             # Update the maximum species rate and maximum network leak rate arrays
-            for i,index in enumerate(prunableSpeciesIndices):
-                if maxEdgeSpeciesRateRatios[i] < edgeSpeciesRateRatios[index]:
-                    maxEdgeSpeciesRateRatios[i] = edgeSpeciesRateRatios[index]
-            for i,index in enumerate(prunableNetworkIndices):
-                if maxNetworkLeakRateRatios[i] < networkLeakRateRatios[index]:
-                    maxNetworkLeakRateRatios[i] = networkLeakRateRatios[index]
+            # (fmax keeps the current maximum when the new ratio is nan)
+            if len(prunableSpeciesIndices) > 0:
+                numpy.fmax(maxEdgeSpeciesRateRatios[:len(prunableSpeciesIndices)], edgeSpeciesRateRatios[prunableSpeciesIndices],
+                           maxEdgeSpeciesRateRatios[:len(prunableSpeciesIndices)])
+            if len(prunableNetworkIndices) > 0:
+                numpy.fmax(maxNetworkLeakRateRatios[:len(prunableNetworkIndices)], networkLeakRateRatios[prunableNetworkIndices],
+                           maxNetworkLeakRateRatios[:len(prunableNetworkIndices)])
             
             if charRate == 0 and len(edgeSpeciesRates)>0: #this deals with the case when there is no flux in the system
                 maxSpeciesIndex = numpy.argmax(edgeSpeciesRates)
@@ -764,19 +806,14 @@ cdef class ReactionSystem(DASx):
                 #######################################################
 
                 totalDivAccumNums = numpy.ones(numEdgeReactions)
-                for index in xrange(numEdgeReactions):
-                    reactionRate = edgeReactionRates[index]
-                    for spcIndex in self.reactantIndices[index+numCoreReactions,:]:
-                        if spcIndex != -1 and spcIndex<numCoreSpecies:
-                            consumption = coreSpeciesConsumptionRates[spcIndex]
-                            if consumption != 0: #if consumption = 0 ignore species
-                                totalDivAccumNums[index] *= (reactionRate+consumption)/consumption
-                            
-                    for spcIndex in self.productIndices[index+numCoreReactions,:]:
-                        if spcIndex != -1 and spcIndex<numCoreSpecies:
-                            production = coreSpeciesProductionRates[spcIndex]
-                            if production != 0: #if production = 0 ignore species
-                                totalDivAccumNums[index] *= (reactionRate+production)/production
+                # Multiply in the factor of each reactant and then each product
+                # in turn, ignoring species with zero consumption or production
+                for j in xrange(reactantIndices.shape[1]):
+                    updateAccumulationNumbers(totalDivAccumNums, edgeReactionRates,
+                                              reactantIndices[numCoreReactions:,j], coreSpeciesConsumptionRates)
+                for j in xrange(productIndices.shape[1]):
+                    updateAccumulationNumbers(totalDivAccumNums, edgeReactionRates,
+                                              productIndices[numCoreReactions:,j], coreSpeciesProductionRates)
                     
                 totalDivLnAccumNums = numpy.log(totalDivAccumNums)
                 
@@ -868,16 +905,13 @@ cdef class ReactionSystem(DASx):
                 unimolecularThresholdVal = toleranceMoveToCore * charRate / (2.08366122e10 * self.T.value_si)   
                 # Set the maximum bimolecular rate to be 1e7 m^3/mol*s, or 1e13 cm^3/mol*s
                 bimolecularThresholdVal = toleranceMoveToCore * charRate / 1e7 
-                for i in xrange(numCoreSpecies):
-                    if not unimolecularThreshold[i]:
-                        # Check if core species concentration has gone above threshold for unimolecular reaction
-                        if coreSpeciesConcentrations[i] > unimolecularThresholdVal:
-                            unimolecularThreshold[i] = True
-                for i in xrange(numCoreSpecies):
-                    for j in xrange(i, numCoreSpecies):
-                        if not bimolecularThreshold[i,j]:
-                            if coreSpeciesConcentrations[i]*coreSpeciesConcentrations[j] > bimolecularThresholdVal:
-                                bimolecularThreshold[i,j] = True
+                # Check if core species concentrations have gone above the
+                # thresholds for unimolecular and bimolecular reactions
+                numpy.logical_or(unimolecularThreshold, coreSpeciesConcentrations > unimolecularThresholdVal,
+                                 unimolecularThreshold)
+                numpy.logical_or(bimolecularThreshold,
+                                 numpy.triu(numpy.outer(coreSpeciesConcentrations, coreSpeciesConcentrations) > bimolecularThresholdVal),
+                                 bimolecularThreshold)
             
             
             ###############################################################################
@@ -898,7 +932,8 @@ cdef class ReactionSystem(DASx):
             #movement of species to core based on rate ratios
             
             if not ignoreOverallFluxCriterion:
-                for ind,obj in enumerate(edgeSpecies):
+                for ind in numpy.flatnonzero(edgeSpeciesRateRatios > min(toleranceMoveToCore, toleranceInterruptSimulation)).tolist():
+                    obj = edgeSpecies[ind]
                     RR = edgeSpeciesRateRatios[ind]
                     if RR > toleranceMoveToCore:
                         if not(obj in newObjects or obj in invalidObjects):
@@ -925,7 +960,9 @@ cdef class ReactionSystem(DASx):
                 validLayeringIndices = self.validLayeringIndices
                 tempSurfaceObjects = []
                 
-                for ind,obj in enumerate(edgeReactions):
+                for ind in numpy.flatnonzero(totalDivLnAccumNums > min(toleranceMoveEdgeReactionToCore, toleranceMoveEdgeReactionToSurface,
+                                                                       toleranceMoveEdgeReactionToCoreInterrupt)).tolist():
+                    obj = edgeReactions[ind]
                     dlnaccum = totalDivLnAccumNums[ind]
                     if dlnaccum > toleranceMoveEdgeReactionToCore:
                         if not(obj in newObjects or obj in invalidObjects):
@@ -1025,20 +1062,14 @@ cdef class ReactionSystem(DASx):
                 break
 
             # Finish simulation if any of the termination criteria are satisfied
-            for term in self.termination:
+            if reachedTermination is not None:
+                terminated = True
+                term = reachedTermination
                 if isinstance(term, TerminationTime):
-                    if self.t > term.time.value_si:
-                        terminated = True
-                        logging.info('At time {0:10.4e} s, reached target termination time.'.format(term.time.value_si))
-                        self.logConversions(speciesIndex, y0)
-                        break
-                elif isinstance(term, TerminationConversion):
-                    index = speciesIndex[term.species]
-                    if 1 - (y_coreSpecies[index] / y0[index]) > term.conversion:
-                        terminated = True
-                        logging.info('At time {0:10.4e} s, reached target termination conversion: {1:f} of {2}'.format(self.t,term.conversion,term.species))
-                        self.logConversions(speciesIndex, y0)
-                        break
+                    logging.info('At time {0:10.4e} s, reached target termination time.'.format(term.time.value_si))
+                else:
+                    logging.info('At time {0:10.4e} s, reached target termination conversion: {1:f} of {2}'.format(self.t,term.conversion,term.species))
+                self.logConversions(speciesIndex, y0)
 
             # Increment destination step time if necessary
             if self.t >= 0.9999 * stepTime:
@@ -1096,6 +1127,21 @@ cdef class ReactionSystem(DASx):
             if network is not None:
                 logging.info('    PDepNetwork #{0:d} leak rate: {1:10.4e} mol/m^3*s ({2:.4g})'.format(network.index, networkRate, networkRate / charRate))
                 
+    cpdef getReachedTermination(self, dict speciesIndex, numpy.ndarray y0):
+        """
+        Return the first of the termination criteria that is satisfied by the
+        current state of the reaction system, or ``None`` if none are.
+        """
+        for term in self.termination:
+            if isinstance(term, TerminationTime):
+                if self.t > term.time.value_si:
+                    return term
+            elif isinstance(term, TerminationConversion):
+                index = speciesIndex[term.species]
+                if 1 - (self.y[index] / y0[index]) > term.conversion:
+                    return term
+        return None
+
     cpdef logConversions(self, speciesIndex, y0):
         """
         Log information about the current conversion values.
@@ -42,6 +42,7 @@ import rmgpy.constants as constants
 cimport rmgpy.constants as constants
 from rmgpy.quantity import Quantity
 from rmgpy.quantity cimport ScalarQuantity, ArrayQuantity
+from rmgpy.exceptions import ReactionError
 
 cdef class SimpleReactor(ReactionSystem):
     """
@@ -81,6 +82,26 @@ cdef class SimpleReactor(ReactionSystem):
     """
     cdef public numpy.ndarray pdepColliderReactionIndices
 
+    """
+    pdepColliderSlots:
+    a dictionary mapping the index of each reaction in pdepColliderReactionIndices
+    to its position in that array, i.e. to its row in colliderEfficiencies.
+    """
+    cdef public dict pdepColliderSlots
+
+    """
+    colliderSpecies:
+    the list of core species the rows of colliderEfficiencyCache were computed for.
+    """
+    cdef public list colliderSpecies
+
+    """
+    colliderEfficiencyCache:
+    a dictionary with the kinetics objects of the pdep reactions as keys, and
+    as values their collider efficiency arrays for the species in colliderSpecies.
+    """
+    cdef public dict colliderEfficiencyCache
+
     """
     pdepSpecificColliderKinetics:
     an array that contains a reference to the kinetics object of the reaction
@@ -102,6 +123,22 @@ cdef class SimpleReactor(ReactionSystem):
     """
     cdef public numpy.ndarray pdepSpecificColliderReactionIndices
 
+    """
+    rateCoefficientCache:
+    a dictionary with reactions as keys, and as values tuples of the kinetics,
+    degeneracy and effective pressure the forward rate coefficient of the
+    reaction was last computed for, and that rate coefficient.
+    """
+    cdef public dict rateCoefficientCache
+
+    """
+    freeEnergyCache:
+    a dictionary with species as keys, and as values tuples of the thermo and
+    statmech objects the Gibbs free energy of the species was last computed
+    from, and that free energy at the temperature of the reactor.
+    """
+    cdef public dict freeEnergyCache
+
 
     def __init__(self, T, P, initialMoleFractions, termination, sensitiveSpecies=None, sensitivityThreshold=1e-3):
         ReactionSystem.__init__(self, termination, sensitiveSpecies, sensitivityThreshold)
@@ -115,9 +152,15 @@ cdef class SimpleReactor(ReactionSystem):
         self.pdepColliderReactionIndices = None
         self.pdepColliderKinetics = None
         self.colliderEfficiencies = None
+        self.pdepColliderSlots = None
+        self.colliderSpecies = []
+        self.colliderEfficiencyCache = {}
         self.pdepSpecificColliderReactionIndices = None
         self.pdepSpecificColliderKinetics = None
         self.specificColliderSpecies = None
+
+        self.rateCoefficientCache = {}
+        self.freeEnergyCache = {}
         
 
     def __reduce__(self):
@@ -190,41 +233,124 @@ cdef class SimpleReactor(ReactionSystem):
         y0_coreSpecies = self.y0[:self.numCoreSpecies]
         sum_core_species = numpy.sum(y0_coreSpecies)
         
-        j = self.reactionIndex[rxn]
-        for i in xrange(self.pdepColliderReactionIndices.shape[0]):
-            if j == self.pdepColliderReactionIndices[i]:
-                # Calculate effective pressure
-                if rxn.specificCollider is None:
-                    Peff = self.P.value_si * numpy.sum(self.colliderEfficiencies[i]*y0_coreSpecies / sum_core_species)
-                else:
-                    logging.debug("Calculating Peff using {0} as a specificCollider".format(rxn.specificCollider))
-                    Peff = self.P.value_si * self.y0[self.speciesIndex[rxn.specificCollider]] / sum_core_species
-                return Peff
-        return self.P.value_si
+        i = self.pdepColliderSlots.get(self.reactionIndex[rxn], -1)
+        if i < 0:
+            return self.P.value_si
+        # Calculate effective pressure
+        if rxn.specificCollider is None:
+            Peff = self.P.value_si * numpy.dot(self.colliderEfficiencies[i], y0_coreSpecies) / sum_core_species
+        else:
+            logging.debug("Calculating Peff using {0} as a specificCollider".format(rxn.specificCollider))
+            Peff = self.P.value_si * self.y0[self.speciesIndex[rxn.specificCollider]] / sum_core_species
+        return Peff
 
     def generate_rate_coefficients(self, coreReactions, edgeReactions):
         """
         Populates the forward rate coefficients (kf), reverse rate coefficients (kb)
         and equilibrium constants (Keq) arrays with the values computed at the temperature
         and (effective) pressure of the reaction system.
+
+        The temperature and pressure of the reactor are fixed, so the forward
+        rate coefficients are kept between calls, and only computed for
+        reactions that are new or whose kinetics, degeneracy or effective
+        pressure changed. The equilibrium constants of all reversible
+        reactions are computed together from the free energies of the species
+        returned by :meth:`get_free_energies`.
         """
+        cdef dict cache
+        cdef list reversibleIndices
+        cdef tuple key, entry
+        cdef double T, Peff
+        cdef int j
+        cdef numpy.ndarray rows, reactantIndices, productIndices, G, dGrxn, dn, Keq
 
+        T = self.T.value_si
+        cache = {}
+        reversibleIndices = []
         for rxn in itertools.chain(coreReactions, edgeReactions):
             j = self.reactionIndex[rxn]
             Peff = self.calculate_effective_pressure(rxn)
-            self.kf[j] = rxn.getRateCoefficient(self.T.value_si, Peff)
-
+            key = (rxn.kinetics, rxn.degeneracy, Peff)
+            entry = self.rateCoefficientCache.get(rxn)
+            if entry is None or entry[0] != key:
+                entry = (key, rxn.getRateCoefficient(T, Peff))
+            cache[rxn] = entry
+            self.kf[j] = entry[1]
             if rxn.reversible:
-                self.Keq[j] = rxn.getEquilibriumConstant(self.T.value_si)
-                self.kb[j] = self.kf[j] / self.Keq[j]
+                reversibleIndices.append(j)
+        # Only keep the reactions that are still in the model
+        self.rateCoefficientCache = cache
+
+        if reversibleIndices:
+            rows = numpy.array(reversibleIndices, numpy.int)
+            reactantIndices = self.reactantIndices[rows]
+            productIndices = self.productIndices[rows]
+            G = self.get_free_energies(numpy.union1d(reactantIndices.ravel(), productIndices.ravel()))
+            # The index -1 of missing reactants and products picks the zero
+            # at the end of G
+            dGrxn = G[productIndices].sum(axis=1) - G[reactantIndices].sum(axis=1)
+            dn = (productIndices >= 0).sum(axis=1) - (reactantIndices >= 0).sum(axis=1)
+            Keq = numpy.exp(-dGrxn / constants.R / T) * (1e5 / constants.R / T) ** dn
+            if numpy.any(Keq == 0):
+                raise ReactionError('Got equilibrium constant of 0')
+            self.Keq[rows] = Keq
+            self.kb[rows] = self.kf[rows] / Keq
+
+    def get_free_energies(self, indices):
+        """
+        Return an array of the Gibbs free energies in J/mol of the species at
+        the temperature of the reactor, with the values for the species at
+        `indices` filled in, and a zero as an extra last element. The free
+        energy of each species is kept between calls for as long as its thermo
+        and statmech objects are unchanged.
+        """
+        cdef dict cache, speciesByIndex
+        cdef numpy.ndarray G
+        cdef double T
+        cdef int i
+
+        T = self.T.value_si
+        speciesByIndex = {}
+        for spc, i in self.speciesIndex.iteritems():
+            speciesByIndex[i] = spc
+        cache = {}
+        G = numpy.zeros(self.numCoreSpecies + self.numEdgeSpecies + 1, numpy.float64)
+        for i in indices:
+            if i < 0:
+                continue
+            spc = speciesByIndex[i]
+            entry = self.freeEnergyCache.get(spc)
+            if entry is None or entry[0] is not spc.thermo or entry[1] is not spc.conformer:
+                Gspc = spc.getFreeEnergy(T)
+                entry = (spc.thermo, spc.conformer, Gspc)
+            cache[spc] = entry
+            G[i] = entry[2]
+        # Only keep the species that are still in the model
+        self.freeEnergyCache = cache
+        return G
 
 
     def set_colliders(self, coreReactions, edgeReactions, coreSpecies):
         """
         Store collider efficiencies and reaction indices for pdep reactions that have collider efficiencies,
         and store specific collider indices
+
+        The collider efficiencies of each kinetics object are kept between
+        calls. As long as the core species of the previous call are still the
+        first core species, only the efficiencies of the species added to the
+        core since then are computed.
         """
+        numColliderSpecies = len(self.colliderSpecies)
+        if (len(coreSpecies) < numColliderSpecies or
+                any([spc1 is not spc2 for spc1, spc2 in itertools.izip(coreSpecies, self.colliderSpecies)])):
+            # The core has changed other than by adding species, so start over
+            self.colliderEfficiencyCache = {}
+            numColliderSpecies = 0
+        newSpecies = coreSpecies[numColliderSpecies:]
+        cache = {}
+
         pdepColliderReactionIndices = []
+        self.pdepColliderSlots = {}
         self.pdepColliderKinetics = []
         colliderEfficiencies = []
         pdepSpecificColliderReactionIndices = []
@@ -235,9 +361,16 @@ cdef class SimpleReactor(ReactionSystem):
             if rxn.kinetics.isPressureDependent():
                 if rxn.kinetics.efficiencies:
                     j = self.reactionIndex[rxn]
+                    self.pdepColliderSlots[j] = len(pdepColliderReactionIndices)
                     pdepColliderReactionIndices.append(j)
                     self.pdepColliderKinetics.append(rxn.kinetics)
-                    colliderEfficiencies.append(rxn.kinetics.getEffectiveColliderEfficiencies(coreSpecies))
+                    efficiencies = self.colliderEfficiencyCache.get(rxn.kinetics)
+                    if efficiencies is None:
+                        efficiencies = rxn.kinetics.getEffectiveColliderEfficiencies(coreSpecies)
+                    elif newSpecies:
+                        efficiencies = numpy.concatenate((efficiencies, rxn.kinetics.getEffectiveColliderEfficiencies(newSpecies)))
+                    cache[rxn.kinetics] = efficiencies
+                    colliderEfficiencies.append(efficiencies)
                 if rxn.specificCollider:
                     pdepSpecificColliderReactionIndices.append(self.reactionIndex[rxn])
                     self.pdepSpecificColliderKinetics.append(rxn.kinetics)
@@ -245,6 +378,9 @@ cdef class SimpleReactor(ReactionSystem):
 
         self.pdepColliderReactionIndices = numpy.array(pdepColliderReactionIndices, numpy.int)
         self.colliderEfficiencies = numpy.array(colliderEfficiencies, numpy.float64)
+        # Only keep the kinetics of reactions that are still in the model
+        self.colliderEfficiencyCache = cache
+        self.colliderSpecies = list(coreSpecies)
         self.pdepSpecificColliderReactionIndices = numpy.array(pdepSpecificColliderReactionIndices, numpy.int)
 
 
@@ -288,7 +424,7 @@ cdef class SimpleReactor(ReactionSystem):
         cdef int i, j, z, first, second, third
         cdef double k, V, reactionRate, revReactionRate, T, P, Peff
         cdef numpy.ndarray[numpy.float64_t, ndim=1] coreSpeciesConcentrations, coreSpeciesRates, coreReactionRates, edgeSpeciesRates, edgeReactionRates, networkLeakRates, coreSpeciesConsumptionRates, coreSpeciesProductionRates
-        cdef numpy.ndarray[numpy.float64_t, ndim=1] C, y_coreSpecies
+        cdef numpy.ndarray[numpy.float64_t, ndim=1] C, y_coreSpecies, Peffs
         cdef numpy.ndarray[numpy.float64_t, ndim=2] jacobian, dgdk, colliderEfficiencies
         cdef numpy.ndarray[numpy.int_t, ndim=1] pdepColliderReactionIndices, pdepSpecificColliderReactionIndices
         cdef list pdepColliderKinetics, pdepSpecificColliderKinetics
@@ -314,11 +450,11 @@ cdef class SimpleReactor(ReactionSystem):
             pdepColliderReactionIndices = self.pdepColliderReactionIndices
             pdepColliderKinetics = self.pdepColliderKinetics
             colliderEfficiencies = self.colliderEfficiencies
+            # Calculate the effective pressures of all the reactions at once
+            Peffs = P * colliderEfficiencies.dot(y_coreSpecies) / numpy.sum(y_coreSpecies)
             for i in xrange(pdepColliderReactionIndices.shape[0]):
-                # Calculate effective pressure
-                Peff = P*numpy.sum(colliderEfficiencies[i]*y_coreSpecies / numpy.sum(y_coreSpecies))
                 j = pdepColliderReactionIndices[i]
-                kf[j] = pdepColliderKinetics[i].getRateCoefficient(T, Peff)
+                kf[j] = pdepColliderKinetics[i].getRateCoefficient(T, Peffs[i])
                 kr[j] = kf[j] / equilibriumConstants[j]
         if self.pdepSpecificColliderReactionIndices.shape[0] != 0:
             T = self.T.value_si
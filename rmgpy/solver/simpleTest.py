@@ -247,6 +247,91 @@ class SimpleReactorCheck(unittest.TestCase):
 #        pylab.show()
 
 
+    def testFluxCheckInterval(self):
+        """
+        Test that checking the edge fluxes only every few solver steps moves
+        the same edge species to the core as checking them at every step.
+        """
+        CH4 = Species(
+            molecule=[Molecule().fromSMILES("C")],
+            thermo=ThermoData(Tdata=([300,400,500,600,800,1000,1500],"K"), Cpdata=([ 8.615, 9.687,10.963,12.301,14.841,16.976,20.528],"cal/(mol*K)"), H298=(-17.714,"kcal/mol"), S298=(44.472,"cal/(mol*K)"))
+            )
+        CH3 = Species(
+            molecule=[Molecule().fromSMILES("[CH3]")],
+            thermo=ThermoData(Tdata=([300,400,500,600,800,1000,1500],"K"), Cpdata=([ 9.397,10.123,10.856,11.571,12.899,14.055,16.195],"cal/(mol*K)"), H298=(  9.357,"kcal/mol"), S298=(45.174,"cal/(mol*K)"))
+            )
+        C2H6 = Species(
+            molecule=[Molecule().fromSMILES("CC")],
+            thermo=ThermoData(Tdata=([300,400,500,600,800,1000,1500],"K"), Cpdata=([12.684,15.506,18.326,20.971,25.500,29.016,34.595],"cal/(mol*K)"), H298=(-19.521,"kcal/mol"), S298=(54.799,"cal/(mol*K)"))
+            )
+        C2H5 = Species(
+            molecule=[Molecule().fromSMILES("C[CH2]")],
+            thermo=ThermoData(Tdata=([300,400,500,600,800,1000,1500],"K"), Cpdata=([11.635,13.744,16.085,18.246,21.885,24.676,29.107],"cal/(mol*K)"), H298=( 29.496,"kcal/mol"), S298=(56.687,"cal/(mol*K)"))
+            )
+
+        coreSpecies = [CH4,CH3,C2H6]
+        edgeSpecies = [C2H5]
+        coreReactions = [Reaction(reactants=[C2H6], products=[CH3,CH3], kinetics=Arrhenius(A=(686.375e6,'1/s'), n=4.40721, Ea=(7.82799,'kcal/mol'), T0=(298.15,'K')))]
+        edgeReactions = [Reaction(reactants=[C2H6,CH3], products=[C2H5,CH4], kinetics=Arrhenius(A=(46.375*6,'m^3/(mol*s)'), n=3.40721, Ea=(6.82799,'kcal/mol'), T0=(298.15,'K')))]
+
+        results = []
+        for fluxCheckInterval in [1, 5]:
+            rxnSystem = SimpleReactor(1000, 1.0e5, initialMoleFractions={CH4:0.2,CH3:0.1,C2H6:0.7}, termination=[TerminationTime((1e-6,'s'))])
+            modelSettings = ModelSettings(toleranceKeepInEdge=0, toleranceMoveToCore=0.01, toleranceInterruptSimulation=1e8,
+                                          fluxCheckInterval=fluxCheckInterval)
+            simulatorSettings = SimulatorSettings()
+            terminated, resurrected, invalidObjects, surfaceSpecies, surfaceReactions = rxnSystem.simulate(
+                coreSpecies, coreReactions, edgeSpecies, edgeReactions, [], [],
+                modelSettings=modelSettings, simulatorSettings=simulatorSettings)
+            results.append((terminated, invalidObjects))
+
+        self.assertEqual(results[0], results[1])
+        self.assertEqual(results[0][1], [C2H5])
+
+    def testRateCoefficientCache(self):
+        """
+        Test that the rate coefficients are kept between simulations and
+        computed again only for reactions whose kinetics changed.
+        """
+        CH4 = Species(
+            molecule=[Molecule().fromSMILES("C")],
+            thermo=ThermoData(Tdata=([300,400,500,600,800,1000,1500],"K"), Cpdata=([ 8.615, 9.687,10.963,12.301,14.841,16.976,20.528],"cal/(mol*K)"), H298=(-17.714,"kcal/mol"), S298=(44.472,"cal/(mol*K)"))
+            )
+        CH3 = Species(
+            molecule=[Molecule().fromSMILES("[CH3]")],
+            thermo=ThermoData(Tdata=([300,400,500,600,800,1000,1500],"K"), Cpdata=([ 9.397,10.123,10.856,11.571,12.899,14.055,16.195],"cal/(mol*K)"), H298=(  9.357,"kcal/mol"), S298=(45.174,"cal/(mol*K)"))
+            )
+        C2H6 = Species(
+            molecule=[Molecule().fromSMILES("CC")],
+            thermo=ThermoData(Tdata=([300,400,500,600,800,1000,1500],"K"), Cpdata=([12.684,15.506,18.326,20.971,25.500,29.016,34.595],"cal/(mol*K)"), H298=(-19.521,"kcal/mol"), S298=(54.799,"cal/(mol*K)"))
+            )
+        C2H5 = Species(
+            molecule=[Molecule().fromSMILES("C[CH2]")],
+            thermo=ThermoData(Tdata=([300,400,500,600,800,1000,1500],"K"), Cpdata=([11.635,13.744,16.085,18.246,21.885,24.676,29.107],"cal/(mol*K)"), H298=( 29.496,"kcal/mol"), S298=(56.687,"cal/(mol*K)"))
+            )
+
+        coreSpecies = [CH4,CH3,C2H6]
+        edgeSpecies = [C2H5]
+        coreReactions = [Reaction(reactants=[C2H6], products=[CH3,CH3], kinetics=Arrhenius(A=(686.375e6,'1/s'), n=4.40721, Ea=(7.82799,'kcal/mol'), T0=(298.15,'K')))]
+        edgeReactions = [Reaction(reactants=[C2H6,CH3], products=[C2H5,CH4], kinetics=Arrhenius(A=(46.375*6,'m^3/(mol*s)'), n=3.40721, Ea=(6.82799,'kcal/mol'), T0=(298.15,'K')))]
+
+        T = 1000
+        rxnSystem = SimpleReactor(T, 1.0e5, initialMoleFractions={CH4:0.2,CH3:0.1,C2H6:0.7}, termination=[])
+        rxnSystem.initializeModel(coreSpecies, coreReactions, edgeSpecies, edgeReactions)
+        entries = [rxnSystem.rateCoefficientCache[rxn] for rxn in coreReactions + edgeReactions]
+        for j, rxn in enumerate(coreReactions + edgeReactions):
+            Keq = rxn.getEquilibriumConstant(T)
+            self.assertAlmostEqual(rxnSystem.kf[j] / rxn.getRateCoefficient(T), 1.0, 6)
+            self.assertAlmostEqual(rxnSystem.Keq[j] / Keq, 1.0, 6)
+            self.assertAlmostEqual(rxnSystem.kb[j] / (rxn.getRateCoefficient(T) / Keq), 1.0, 6)
+
+        # Change the kinetics of the edge reaction
+        edgeReactions[0].kinetics = Arrhenius(A=(46.375*12,'m^3/(mol*s)'), n=3.40721, Ea=(6.82799,'kcal/mol'), T0=(298.15,'K'))
+        rxnSystem.initializeModel(coreSpecies, coreReactions, edgeSpecies, edgeReactions)
+        self.assertIs(rxnSystem.rateCoefficientCache[coreReactions[0]], entries[0])
+        self.assertIsNot(rxnSystem.rateCoefficientCache[edgeReactions[0]], entries[1])
+        self.assertAlmostEqual(rxnSystem.kf[1] / entries[1][1], 2.0, 6)
+
     def testColliderModel(self):
         """
         Test the solver's ability to simulate a model with collision efficiencies.
@@ -315,6 +400,35 @@ class SimpleReactorCheck(unittest.TestCase):
         for i in range(len(simulatedMoleFracs)):
             self.assertAlmostEqual(simulatedMoleFracs[i],expectedMoleFracs[i])
 
+    def testColliderEfficiencyCache(self):
+        """
+        Test that the collider efficiencies are only computed for the species
+        added to the core since the last time the colliders were set.
+        """
+        chemFile = os.path.join(os.path.dirname(__file__),'files','collider_model','chem.inp')
+        dictionaryFile = os.path.join(os.path.dirname(__file__),'files','collider_model','species_dictionary.txt')
+        speciesList, reactionList = loadChemkinFile(chemFile, dictionaryFile)
+
+        initialMoleFractions = {speciesList[0]: 1.0}
+        rxnSystem = SimpleReactor(1000,10,initialMoleFractions=initialMoleFractions,termination=None)
+        rxnSystem.initializeModel(speciesList[:8], reactionList, speciesList[8:], [])
+        self.assertEqual(rxnSystem.colliderEfficiencies.shape[1], 8)
+        efficiencies = dict(rxnSystem.colliderEfficiencyCache)
+
+        # Add the rest of the species to the core
+        rxnSystem.initializeModel(speciesList, reactionList, [], [])
+        self.assertEqual(rxnSystem.colliderEfficiencies.shape[1], len(speciesList))
+        for j, i in rxnSystem.pdepColliderSlots.iteritems():
+            self.assertEqual(rxnSystem.pdepColliderReactionIndices[i], j)
+            kinetics = rxnSystem.pdepColliderKinetics[i]
+            expected = kinetics.getEffectiveColliderEfficiencies(speciesList)
+            self.assertTrue(numpy.array_equal(rxnSystem.colliderEfficiencies[i], expected))
+            self.assertTrue(numpy.array_equal(rxnSystem.colliderEfficiencies[i,:8], efficiencies[kinetics]))
+
+        # Reactions without collider efficiencies use the reactor pressure
+        for rxn in reactionList:
+            if rxnSystem.reactionIndex[rxn] not in rxnSystem.pdepColliderSlots:
+                self.assertEqual(rxnSystem.calculate_effective_pressure(rxn), rxnSystem.P.value_si)
 
     def testSpecificColliderModel(self):
         """
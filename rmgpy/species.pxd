@@ -77,6 +77,12 @@ cdef class Species:
 
     cpdef double getFreeEnergy(self, double T) except 100000000
 
+    cpdef numpy.ndarray getEnthalpies(self, numpy.ndarray Tlist)
+
+    cpdef numpy.ndarray getEntropies(self, numpy.ndarray Tlist)
+
+    cpdef numpy.ndarray getFreeEnergies(self, numpy.ndarray Tlist)
+
     cpdef numpy.ndarray getSumOfStates(self, numpy.ndarray Elist)
 
     cpdef numpy.ndarray getDensityOfStates(self, numpy.ndarray Elist)
@@ -375,6 +375,42 @@ class Species(object):
         else:
             raise Exception('Unable to calculate free energy for species {0!r}: no thermo or statmech data available.'.format(self.label))
         return G
+
+    def getEnthalpies(self, Tlist):
+        """
+        Return the enthalpies in J/mol for the species at the specified
+        temperatures `Tlist` in K.
+        """
+        if self.hasThermo():
+            return self.getThermoData().getEnthalpies(Tlist)
+        elif self.hasStatMech():
+            return numpy.array([self.conformer.getEnthalpy(T) for T in Tlist], numpy.float64) + self.conformer.E0.value_si
+        else:
+            raise Exception('Unable to calculate enthalpy for species {0!r}: no thermo or statmech data available.'.format(self.label))
+
+    def getEntropies(self, Tlist):
+        """
+        Return the entropies in J/mol*K for the species at the specified
+        temperatures `Tlist` in K.
+        """
+        if self.hasThermo():
+            return self.getThermoData().getEntropies(Tlist)
+        elif self.hasStatMech():
+            return numpy.array([self.conformer.getEntropy(T) for T in Tlist], numpy.float64)
+        else:
+            raise Exception('Unable to calculate entropy for species {0!r}: no thermo or statmech data available.'.format(self.label))
+
+    def getFreeEnergies(self, Tlist):
+        """
+        Return the Gibbs free energies in J/mol for the species at the
+        specified temperatures `Tlist` in K.
+        """
+        if self.hasThermo():
+            return self.getThermoData().getFreeEnergies(Tlist)
+        elif self.hasStatMech():
+            return numpy.array([self.conformer.getFreeEnergy(T) for T in Tlist], numpy.float64) + self.conformer.E0.value_si
+        else:
+            raise Exception('Unable to calculate free energy for species {0!r}: no thermo or statmech data available.'.format(self.label))
         
     def getSumOfStates(self, Elist):
         """
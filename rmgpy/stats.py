@@ -29,6 +29,10 @@
 
 import os.path
 import logging
+import copy
+import csv
+import json
+import time
 try:
     import xlwt
 except ImportError:
@@ -41,6 +45,16 @@ import matplotlib.pyplot as plt
 
 from rmgpy.util import makeOutputSubdirectory
 
+class ExecutionSnapshot(object):
+    """
+    The attributes of an RMG job needed by :class:`ExecutionStatsWriter` to
+    save its statistics, copied so they can be used in the background.
+    """
+    def __init__(self, rmg):
+        self.outputDirectory = rmg.outputDirectory
+        self.execTime = rmg.execTime[:]
+        self.generatePlots = rmg.generatePlots
+
 class ExecutionStatsWriter(object):
     """
     This class listens to a RMG subject
@@ -80,11 +94,47 @@ class ExecutionStatsWriter(object):
         self.restartSize = []
         self.memoryUse = []
     
+    # Only the latest statistics need to be saved and plotted
+    coalesce = True
+
     def update(self, rmg):
         self.update_execution(rmg)
 
+    def snapshot(self, rmg):
+        """
+        Record the statistics of the current iteration and return a copy of
+        everything collected so far, so the spreadsheet and plots can be
+        generated in the background by :meth:`write`.
+        """
+        self.updateStatistics(rmg)
+        stats = copy.copy(self)
+        stats.coreSpeciesCount = self.coreSpeciesCount[:]
+        stats.coreReactionCount = self.coreReactionCount[:]
+        stats.edgeSpeciesCount = self.edgeSpeciesCount[:]
+        stats.edgeReactionCount = self.edgeReactionCount[:]
+        stats.restartSize = self.restartSize[:]
+        stats.memoryUse = self.memoryUse[:]
+        return stats, ExecutionSnapshot(rmg)
+
+    def write(self, data):
+        stats, job = data
+        stats.saveExecutionStatistics(job)
+        if job.generatePlots:
+            stats.generateExecutionPlots(job)
+
     def update_execution(self, rmg):
+        self.updateStatistics(rmg)
+        self.saveExecutionStatistics(rmg)
+        if rmg.generatePlots:
+            self.generateExecutionPlots(rmg)
+
+        logging.info('')
 
+    def updateStatistics(self, rmg):
+        """
+        Append the model size, memory use and restart file size of the
+        current iteration to the collected statistics.
+        """
         # Update RMG execution statistics
         logging.info('Updating RMG execution statistics...')
         coreSpec, coreReac, edgeSpec, edgeReac = rmg.reactionModel.getModelSize()
@@ -113,11 +163,6 @@ class ExecutionStatsWriter(object):
             logging.info('    Restart file size: %.2f MB' % (self.restartSize[-1]))
         else:
             self.restartSize.append(0.0)
-        self.saveExecutionStatistics(rmg)
-        if rmg.generatePlots:
-            self.generateExecutionPlots(rmg)
-
-        logging.info('')
 
     def saveExecutionStatistics(self, rmg):
         """
@@ -225,3 +270,125 @@ class ExecutionStatsWriter(object):
         ax1.legend(['RAM', 'Restart file'], loc=2)
         plt.savefig(os.path.join(rmg.outputDirectory, 'plot/memoryUse.svg'))
         plt.clf()
+
+class PhaseTimingsWriter(object):
+    """
+    This class appends a record of the time spent in each phase of an RMG
+    job (simulation, reaction generation, thermo and kinetics estimation,
+    pressure dependence, pruning, output, ...) since the previous update to a
+    timeline in the output directory. The timeline
+    is written both as JSON, one record per line, to `timings.jsonl` and as a
+    table to `timings.csv`.
+
+    Each record also holds the iteration, the reaction system, the model size
+    and the number of species and reactions added since the previous record,
+    together with the counts of events such as isomorphism checks and cache
+    hits. The phase times and counts are collected from the
+    :class:`~rmgpy.util.PhaseTimer` of the RMG job, and the time each
+    background listener blocked the job is reported as an `output.<name>`
+    phase.
+
+    Unlike the other listeners, it is not attached to the RMG job, since the
+    output phase of an iteration only ends once all of the attached listeners
+    have been notified. Instead, :meth:`RMG.saveEverything` updates the
+    `phaseTimingsWriter` of the job after that phase:
+
+    rmg = ...
+    rmg.phaseTimingsWriter = PhaseTimingsWriter(outputDirectory)
+    rmg.saveEverything()
+    """
+    def __init__(self, outputDirectory):
+        super(PhaseTimingsWriter, self).__init__()
+        self.jsonFile = os.path.join(outputDirectory, 'timings.jsonl')
+        self.csvFile = os.path.join(outputDirectory, 'timings.csv')
+        for path in [self.jsonFile, self.csvFile]:
+            if os.path.exists(path):
+                os.remove(path)
+
+        self.records = []
+        self.modelSize = (0, 0, 0, 0)
+        self.counters = {}
+        self.listenerTimes = {}
+
+    def update(self, rmg):
+        self.write(self.snapshot(rmg))
+
+    def snapshot(self, rmg):
+        """
+        Return the record of the phase times and counts of `rmg` since the
+        previous update.
+        """
+        phases, counts = rmg.timer.collect()
+
+        # Time spent by the listeners that have already been updated
+        for observer in rmg._observers:
+            if hasattr(observer, 'updateTime'):
+                name = 'output.{0}'.format(observer.listener.__class__.__name__)
+                phases[name] = observer.updateTime - self.listenerTimes.get(name, 0.0)
+                self.listenerTimes[name] = observer.updateTime
+
+        # Counters that are accumulated over the job elsewhere
+        counters = getCounters(rmg)
+        for name, value in counters.iteritems():
+            # A counter smaller than before has been reset in the meantime
+            previous = self.counters.get(name, 0)
+            counts[name] = value - previous if value >= previous else value
+        self.counters = counters
+
+        modelSize = rmg.reactionModel.getModelSize()
+        for name, new, old in zip(['coreSpeciesAdded', 'coreReactionsAdded', 'edgeSpeciesAdded', 'edgeReactionsAdded'],
+                                  modelSize, self.modelSize):
+            counts[name] = new - old
+        self.modelSize = modelSize
+
+        reactionSystem = None
+        if rmg.reactionSystem is not None and rmg.reactionSystems:
+            reactionSystem = rmg.reactionSystems.index(rmg.reactionSystem) + 1
+
+        return {
+            'iteration': rmg.reactionModel.iterationNum,
+            'reactionSystem': reactionSystem,
+            'time': time.time() - rmg.initializationTime if rmg.initializationTime else 0.0,
+            'coreSpecies': modelSize[0],
+            'coreReactions': modelSize[1],
+            'edgeSpecies': modelSize[2],
+            'edgeReactions': modelSize[3],
+            'phases': phases,
+            'counts': counts,
+        }
+
+    def write(self, record):
+        """
+        Append `record` to the JSON timeline and write the table of all of the
+        records so far, with a column for each phase and count seen.
+        """
+        self.records.append(record)
+
+        with open(self.jsonFile, 'a') as f:
+            f.write(json.dumps(record, sort_keys=True) + '\n')
+
+        phases = sorted(set([name for r in self.records for name in r['phases']]))
+        counts = sorted(set([name for r in self.records for name in r['counts']]))
+        with open(self.csvFile, 'wb') as f:
+            worksheet = csv.writer(f)
+            worksheet.writerow(['Iteration', 'Reaction system', 'Execution time (s)',
+                                'Core species', 'Core reactions', 'Edge species', 'Edge reactions']
+                               + ['{0} (s)'.format(name) for name in phases] + counts)
+            for r in self.records:
+                worksheet.writerow([r['iteration'], r['reactionSystem'], r['time'],
+                                    r['coreSpecies'], r['coreReactions'], r['edgeSpecies'], r['edgeReactions']]
+                                   + [r['phases'].get(name, 0.0) for name in phases]
+                                   + [r['counts'].get(name, 0) for name in counts])
+
+def getCounters(rmg):
+    """
+    Return a dictionary of the event counters of `rmg` that are accumulated
+    over the whole job rather than by its :class:`~rmgpy.util.PhaseTimer`.
+    """
+    from rmgpy.data.base import Database
+    counters = {'treeDescents': Database.descendTreeCalls}
+    forbiddenStructures = getattr(rmg.database, 'forbiddenStructures', None)
+    if forbiddenStructures is not None:
+        counters['forbiddenCacheHits'] = forbiddenStructures.verdictCache.hits
+        counters['forbiddenCacheMisses'] = forbiddenStructures.verdictCache.misses
+    return counters
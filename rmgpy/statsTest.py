@@ -78,3 +78,63 @@ class TestExecutionStatsWriter(unittest.TestCase):
 
     def tearDown(self):
         shutil.rmtree(self.rmg.outputDirectory)
+
+class TestPhaseTimingsWriter(unittest.TestCase):
+    """
+    Contains unit tests of the PhaseTimingsWriter.
+    """
+
+    def setUp(self):
+        """
+        Set up an RMG object
+        """
+
+        folder = os.path.join(os.getcwd(),'rmgpy/output')
+        if not os.path.isdir(folder):
+            os.mkdir(folder)
+
+        self.rmg = RMG(outputDirectory=folder)
+        self.rmg.reactionModel = CoreEdgeReactionModel()
+        self.rmg.reactionModel.timer = self.rmg.timer
+
+    def test_save(self):
+        """
+        Tests that a record is appended to the timeline for each update.
+        """
+        import json
+
+        folder = self.rmg.outputDirectory
+
+        writer = PhaseTimingsWriter(folder)
+        with self.rmg.timer.phase('simulation'):
+            pass
+        self.rmg.timer.count('isomorphismChecks', 4)
+        writer.update(self.rmg)
+        writer.update(self.rmg)
+
+        with open(os.path.join(folder, 'timings.jsonl')) as f:
+            records = [json.loads(line) for line in f]
+        self.assertEqual(len(records), 2)
+        self.assertIn('simulation', records[0]['phases'])
+        self.assertEqual(records[0]['counts']['isomorphismChecks'], 4)
+        self.assertNotIn('simulation', records[1]['phases'])
+        self.assertTrue(os.path.isfile(os.path.join(folder, 'timings.csv')))
+
+    def test_saveEverything(self):
+        """
+        Tests that the output phase of an iteration is recorded with it.
+        """
+        import json
+
+        folder = self.rmg.outputDirectory
+
+        self.rmg.phaseTimingsWriter = PhaseTimingsWriter(folder)
+        self.rmg.saveEverything()
+
+        with open(os.path.join(folder, 'timings.jsonl')) as f:
+            records = [json.loads(line) for line in f]
+        self.assertEqual(len(records), 1)
+        self.assertIn('output', records[0]['phases'])
+
+    def tearDown(self):
+        shutil.rmtree(self.rmg.outputDirectory)
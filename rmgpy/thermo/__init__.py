@@ -29,5 +29,5 @@
 ################################################################################
 
 from .thermodata import ThermoData
-from .nasa import NASAPolynomial, NASA
+from .nasa import NASAPolynomial, NASA, NASATable
 from .wilhoit import Wilhoit
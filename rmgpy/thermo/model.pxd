@@ -25,6 +25,8 @@
 #
 ################################################################################
 
+cimport numpy
+
 from rmgpy.quantity cimport ScalarQuantity, ArrayQuantity
 
 cdef class HeatCapacityModel:
@@ -42,6 +44,14 @@ cdef class HeatCapacityModel:
 
     cpdef double getFreeEnergy(self, double T) except 1000000000
     
+    cpdef numpy.ndarray getHeatCapacities(self, numpy.ndarray Tlist)
+
+    cpdef numpy.ndarray getEnthalpies(self, numpy.ndarray Tlist)
+
+    cpdef numpy.ndarray getEntropies(self, numpy.ndarray Tlist)
+
+    cpdef numpy.ndarray getFreeEnergies(self, numpy.ndarray Tlist)
+    
     cpdef bint isSimilarTo(self, HeatCapacityModel other) except -2
 
     cpdef bint isIdenticalTo(self, HeatCapacityModel other) except -2
@@ -26,6 +26,9 @@
 #   DEALINGS IN THE SOFTWARE.
 #
 ################################################################################
+import numpy
+cimport numpy
+
 import rmgpy.quantity as quantity
 
 """
@@ -150,6 +153,56 @@ cdef class HeatCapacityModel:
         """
         raise NotImplementedError('Unexpected call to HeatCapacityModel.getFreeEnergy(); you should be using a class derived from HeatCapacityModel.')
 
+    cpdef numpy.ndarray getHeatCapacities(self, numpy.ndarray Tlist):
+        """
+        Return the constant-pressure heat capacities in J/mol*K at the
+        temperatures `Tlist` in K.
+        """
+        cdef numpy.ndarray[numpy.float64_t, ndim=1] T, Cp
+        cdef int i
+        T = numpy.asarray(Tlist, numpy.float64)
+        Cp = numpy.empty_like(T)
+        for i in range(T.shape[0]):
+            Cp[i] = self.getHeatCapacity(T[i])
+        return Cp
+
+    cpdef numpy.ndarray getEnthalpies(self, numpy.ndarray Tlist):
+        """
+        Return the enthalpies in J/mol at the temperatures `Tlist` in K.
+        """
+        cdef numpy.ndarray[numpy.float64_t, ndim=1] T, H
+        cdef int i
+        T = numpy.asarray(Tlist, numpy.float64)
+        H = numpy.empty_like(T)
+        for i in range(T.shape[0]):
+            H[i] = self.getEnthalpy(T[i])
+        return H
+
+    cpdef numpy.ndarray getEntropies(self, numpy.ndarray Tlist):
+        """
+        Return the entropies in J/mol*K at the temperatures `Tlist` in K.
+        """
+        cdef numpy.ndarray[numpy.float64_t, ndim=1] T, S
+        cdef int i
+        T = numpy.asarray(Tlist, numpy.float64)
+        S = numpy.empty_like(T)
+        for i in range(T.shape[0]):
+            S[i] = self.getEntropy(T[i])
+        return S
+
+    cpdef numpy.ndarray getFreeEnergies(self, numpy.ndarray Tlist):
+        """
+        Return the Gibbs free energies in J/mol at the temperatures `Tlist`
+        in K.
+        """
+        cdef numpy.ndarray[numpy.float64_t, ndim=1] T, G
+        cdef int i
+        T = numpy.asarray(Tlist, numpy.float64)
+        G = numpy.empty_like(T)
+        for i in range(T.shape[0]):
+            G[i] = self.getFreeEnergy(T[i])
+        return G
+
     cpdef bint isSimilarTo(self, HeatCapacityModel other) except -2:
         """
         Returns ``True`` if `self` and `other` report similar thermo values
@@ -67,6 +67,14 @@ cdef class NASA(HeatCapacityModel):
 
     cpdef double getFreeEnergy(self, double T) except 1000000000
 
+    cpdef numpy.ndarray getHeatCapacities(self, numpy.ndarray Tlist)
+
+    cpdef numpy.ndarray getEnthalpies(self, numpy.ndarray Tlist)
+
+    cpdef numpy.ndarray getEntropies(self, numpy.ndarray Tlist)
+
+    cpdef numpy.ndarray getFreeEnergies(self, numpy.ndarray Tlist)
+
     cpdef ThermoData toThermoData(self)
 
     cpdef Wilhoit toWilhoit(self)
@@ -74,3 +82,23 @@ cdef class NASA(HeatCapacityModel):
     cpdef NASA changeBaseEnthalpy(self, double deltaH)
 
     cpdef NASA changeBaseEntropy(self, double deltaS)
+
+cdef class NASATable:
+
+    cdef public numpy.ndarray coeffs, Tmin, Tmax
+
+    cpdef setThermo(self, list thermos)
+
+    cpdef numpy.ndarray selectCoefficients(self, numpy.ndarray Tlist)
+
+    cpdef numpy.ndarray getHeatCapacities(self, numpy.ndarray Tlist)
+
+    cpdef numpy.ndarray getEnthalpies(self, numpy.ndarray Tlist)
+
+    cpdef numpy.ndarray getEntropies(self, numpy.ndarray Tlist)
+
+    cpdef numpy.ndarray getFreeEnergies(self, numpy.ndarray Tlist)
+
+    cdef numpy.ndarray evaluateEnthalpies(self, numpy.ndarray c, numpy.ndarray T)
+
+    cdef numpy.ndarray evaluateEntropies(self, numpy.ndarray c, numpy.ndarray T)
@@ -297,6 +297,32 @@ cdef class NASA(HeatCapacityModel):
         """
         return self.selectPolynomial(T).getFreeEnergy(T)
 
+    cpdef numpy.ndarray getHeatCapacities(self, numpy.ndarray Tlist):
+        """
+        Return the constant-pressure heat capacities in J/mol*K at the
+        temperatures `Tlist` in K.
+        """
+        return NASATable([self]).getHeatCapacities(Tlist)[0]
+
+    cpdef numpy.ndarray getEnthalpies(self, numpy.ndarray Tlist):
+        """
+        Return the enthalpies in J/mol at the temperatures `Tlist` in K.
+        """
+        return NASATable([self]).getEnthalpies(Tlist)[0]
+
+    cpdef numpy.ndarray getEntropies(self, numpy.ndarray Tlist):
+        """
+        Return the entropies in J/mol*K at the temperatures `Tlist` in K.
+        """
+        return NASATable([self]).getEntropies(Tlist)[0]
+
+    cpdef numpy.ndarray getFreeEnergies(self, numpy.ndarray Tlist):
+        """
+        Return the Gibbs free energies in J/mol at the temperatures `Tlist`
+        in K.
+        """
+        return NASATable([self]).getFreeEnergies(Tlist)[0]
+
     cpdef ThermoData toThermoData(self):
         """
         Convert the Wilhoit model to a :class:`ThermoData` object.
@@ -388,3 +414,135 @@ cdef class NASA(HeatCapacityModel):
 
         # initialize cantera.NasaPoly2(T_low, T_high, P_ref, coeffs)
         return NasaPoly2(polys[0].Tmin.value_si, polys[1].Tmax.value_si, 10000.0, coeffs)
+
+################################################################################
+
+cdef class NASATable:
+    """
+    The NASA polynomials of many species packed into contiguous arrays, so
+    that their thermodynamic properties at many temperatures are evaluated
+    with a handful of array operations. The attributes are:
+
+    =============== ============================================================
+    Attribute       Description
+    =============== ============================================================
+    `coeffs`        The nine coefficients of up to three polynomials for each species, as an array of shape (N, 3, 9)
+    `Tmin`          The minimum temperature in K at which each polynomial is valid, as an array of shape (N, 3)
+    `Tmax`          The maximum temperature in K at which each polynomial is valid, as an array of shape (N, 3)
+    =============== ============================================================
+
+    Seven-coefficient polynomials are stored with zero `cm2` and `cm1`
+    coefficients, missing temperature limits are stored as infinite, and
+    missing polynomials are never valid. As in :meth:`NASA.selectPolynomial`,
+    the first valid polynomial of each species is used at each temperature.
+    The properties are returned as arrays of shape (N, M) for M temperatures.
+    """
+
+    def __init__(self, thermos=None):
+        self.coeffs = numpy.zeros((0,3,9), numpy.float64)
+        self.Tmin = numpy.zeros((0,3), numpy.float64)
+        self.Tmax = numpy.zeros((0,3), numpy.float64)
+        if thermos is not None:
+            self.setThermo(thermos)
+
+    def __len__(self):
+        return self.coeffs.shape[0]
+
+    def __reduce__(self):
+        """
+        A helper function used when pickling a NASATable object.
+        """
+        return (NASATable, (), {'coeffs': self.coeffs, 'Tmin': self.Tmin, 'Tmax': self.Tmax})
+
+    def __setstate__(self, state):
+        self.coeffs = state['coeffs']
+        self.Tmin = state['Tmin']
+        self.Tmax = state['Tmax']
+
+    cpdef setThermo(self, list thermos):
+        """
+        Fill the table with the polynomials of the list of :class:`NASA`
+        objects `thermos`, one row per object.
+        """
+        cdef NASA thermo
+        cdef NASAPolynomial poly
+        cdef int i, j
+        self.coeffs = numpy.zeros((len(thermos),3,9), numpy.float64)
+        self.Tmin = numpy.empty((len(thermos),3), numpy.float64)
+        self.Tmax = numpy.empty((len(thermos),3), numpy.float64)
+        self.Tmin.fill(numpy.inf)
+        self.Tmax.fill(-numpy.inf)
+        for i, thermo in enumerate(thermos):
+            for j, poly in enumerate(thermo.polynomials):
+                self.coeffs[i,j,:] = [poly.cm2, poly.cm1, poly.c0, poly.c1, poly.c2, poly.c3, poly.c4, poly.c5, poly.c6]
+                self.Tmin[i,j] = poly.Tmin.value_si if poly.Tmin is not None else -numpy.inf
+                self.Tmax[i,j] = poly.Tmax.value_si if poly.Tmax is not None else numpy.inf
+
+    cpdef numpy.ndarray selectCoefficients(self, numpy.ndarray Tlist):
+        """
+        Return the coefficients of the polynomial of each species that is
+        valid at each of the temperatures `Tlist` in K, as an array of shape
+        (N, M, 9). A :class:`ValueError` is raised if a species has no valid
+        polynomial at one of the temperatures.
+        """
+        cdef numpy.ndarray T, valid, found
+        T = numpy.asarray(Tlist, numpy.float64)
+        valid = (self.Tmin[:,:,numpy.newaxis] <= T) & (T <= self.Tmax[:,:,numpy.newaxis])
+        found = valid.any(axis=1)
+        if not found.all():
+            raise ValueError('No valid NASA polynomial at temperature {0:g} K.'.format(T[numpy.argwhere(~found)[0,1]]))
+        return self.coeffs[numpy.arange(self.coeffs.shape[0])[:,numpy.newaxis], valid.argmax(axis=1)]
+
+    cpdef numpy.ndarray getHeatCapacities(self, numpy.ndarray Tlist):
+        """
+        Return the constant-pressure heat capacities in J/mol*K of each
+        species at the temperatures `Tlist` in K.
+        """
+        cdef numpy.ndarray T, c
+        T = numpy.asarray(Tlist, numpy.float64)
+        c = self.selectCoefficients(T)
+        return ((c[:,:,0] / T + c[:,:,1]) / T + c[:,:,2] + T*(c[:,:,3] + T*(c[:,:,4] + T*(c[:,:,5] + c[:,:,6]*T)))) * constants.R
+
+    cpdef numpy.ndarray getEnthalpies(self, numpy.ndarray Tlist):
+        """
+        Return the enthalpies in J/mol of each species at the temperatures
+        `Tlist` in K.
+        """
+        cdef numpy.ndarray T = numpy.asarray(Tlist, numpy.float64)
+        return self.evaluateEnthalpies(self.selectCoefficients(T), T)
+
+    cpdef numpy.ndarray getEntropies(self, numpy.ndarray Tlist):
+        """
+        Return the entropies in J/mol*K of each species at the temperatures
+        `Tlist` in K.
+        """
+        cdef numpy.ndarray T = numpy.asarray(Tlist, numpy.float64)
+        return self.evaluateEntropies(self.selectCoefficients(T), T)
+
+    cpdef numpy.ndarray getFreeEnergies(self, numpy.ndarray Tlist):
+        """
+        Return the Gibbs free energies in J/mol of each species at the
+        temperatures `Tlist` in K.
+        """
+        cdef numpy.ndarray T, c
+        T = numpy.asarray(Tlist, numpy.float64)
+        c = self.selectCoefficients(T)
+        return self.evaluateEnthalpies(c, T) - T * self.evaluateEntropies(c, T)
+
+    cdef numpy.ndarray evaluateEnthalpies(self, numpy.ndarray c, numpy.ndarray T):
+        """
+        Return the enthalpies in J/mol for the selected coefficients `c` at
+        the temperatures `T` in K.
+        """
+        cdef numpy.ndarray T2 = T * T
+        cdef numpy.ndarray T4 = T2 * T2
+        return ((-c[:,:,0] / T + c[:,:,1] * numpy.log(T)) / T + c[:,:,2] + c[:,:,3]*T/2. + c[:,:,4]*T2/3. + c[:,:,5]*T2*T/4. + c[:,:,6]*T4/5. + c[:,:,7]/T) * constants.R * T
+
+    cdef numpy.ndarray evaluateEntropies(self, numpy.ndarray c, numpy.ndarray T):
+        """
+        Return the entropies in J/mol*K for the selected coefficients `c` at
+        the temperatures `T` in K.
+        """
+        cdef numpy.ndarray T2 = T * T
+        cdef numpy.ndarray T4 = T2 * T2
+        return ((-c[:,:,0] / T / 2. - c[:,:,1]) / T + c[:,:,2]*numpy.log(T) + c[:,:,3]*T + c[:,:,4]*T2/2. + c[:,:,5]*T2*T/3. + c[:,:,6]*T4/4. + c[:,:,8]) * constants.R
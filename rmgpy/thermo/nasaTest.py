@@ -36,7 +36,7 @@ import unittest
 import numpy
 import os.path
 
-from rmgpy.thermo.nasa import NASA, NASAPolynomial
+from rmgpy.thermo.nasa import NASA, NASAPolynomial, NASATable
 import rmgpy.constants as constants
 
 ################################################################################
@@ -168,6 +168,43 @@ class TestNASA(unittest.TestCase):
             Gact = self.nasa.getFreeEnergy(T)
             self.assertAlmostEqual(Gexp / Gact, 1.0, 4, '{0} != {1}'.format(Gexp, Gact))
     
+    def test_getThermoArrays(self):
+        """
+        Test that the array methods of NASA objects match the scalar methods.
+        """
+        Tlist = numpy.array([400,600,800,1000,1200,1400,1600,1800,2000], numpy.float64)
+        Cplist = self.nasa.getHeatCapacities(Tlist)
+        Hlist = self.nasa.getEnthalpies(Tlist)
+        Slist = self.nasa.getEntropies(Tlist)
+        Glist = self.nasa.getFreeEnergies(Tlist)
+        for i, T in enumerate(Tlist):
+            self.assertAlmostEqual(Cplist[i] / self.nasa.getHeatCapacity(T), 1.0, 10)
+            self.assertAlmostEqual(Hlist[i] / self.nasa.getEnthalpy(T), 1.0, 10)
+            self.assertAlmostEqual(Slist[i] / self.nasa.getEntropy(T), 1.0, 10)
+            self.assertAlmostEqual(Glist[i] / self.nasa.getFreeEnergy(T), 1.0, 10)
+        self.assertRaises(ValueError, self.nasa.getEnthalpies, numpy.array([200.], numpy.float64))
+
+    def test_NASATable(self):
+        """
+        Test that a NASATable evaluates the properties of many species at
+        many temperatures at once.
+        """
+        other = NASA(
+            polynomials = [NASAPolynomial(coeffs=self.coeffs_high, Tmin=(200,"K"), Tmax=(5000,"K"))],
+            Tmin = (200,"K"),
+            Tmax = (5000,"K"),
+        )
+        table = NASATable([self.nasa, other])
+        self.assertEqual(len(table), 2)
+        Tlist = numpy.array([400,800,1600], numpy.float64)
+        Glist = table.getFreeEnergies(Tlist)
+        Slist = table.getEntropies(Tlist)
+        self.assertEqual(Glist.shape, (2,3))
+        for i, thermo in enumerate([self.nasa, other]):
+            for j, T in enumerate(Tlist):
+                self.assertAlmostEqual(Glist[i,j] / thermo.getFreeEnergy(T), 1.0, 10)
+                self.assertAlmostEqual(Slist[i,j] / thermo.getEntropy(T), 1.0, 10)
+
     def test_pickle(self):
         """
         Test that a NASA object can be pickled and unpickled with no loss of
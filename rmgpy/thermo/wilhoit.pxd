@@ -46,6 +46,14 @@ cdef class Wilhoit(HeatCapacityModel):
     cpdef double getEntropy(self, double T) except -1000000000
 
     cpdef double getFreeEnergy(self, double T) except 1000000000
+
+    cpdef numpy.ndarray getHeatCapacities(self, numpy.ndarray Tlist)
+
+    cpdef numpy.ndarray getEnthalpies(self, numpy.ndarray Tlist)
+
+    cpdef numpy.ndarray getEntropies(self, numpy.ndarray Tlist)
+
+    cpdef numpy.ndarray getFreeEnergies(self, numpy.ndarray Tlist)
     
     cpdef Wilhoit copy(self)
     
@@ -172,6 +172,58 @@ cdef class Wilhoit(HeatCapacityModel):
         in K.
         """
         return self.getEnthalpy(T) - T * self.getEntropy(T)
+
+    cpdef numpy.ndarray getHeatCapacities(self, numpy.ndarray Tlist):
+        """
+        Return the constant-pressure heat capacities in J/mol*K at the
+        temperatures `Tlist` in K.
+        """
+        cdef double Cp0, CpInf, B, a0, a1, a2, a3
+        cdef numpy.ndarray T, y
+        Cp0, CpInf, B, a0, a1, a2, a3 = self._Cp0.value_si, self._CpInf.value_si, self._B.value_si, self.a0, self.a1, self.a2, self.a3
+        T = numpy.asarray(Tlist, numpy.float64)
+        y = T / (T + B)
+        return Cp0 + (CpInf - Cp0) * y * y * (
+            1 + (y - 1) * (a0 + y * (a1 + y * (a2 + y * a3)))
+        )
+
+    cpdef numpy.ndarray getEnthalpies(self, numpy.ndarray Tlist):
+        """
+        Return the enthalpies in J/mol at the temperatures `Tlist` in K.
+        """
+        cdef double Cp0, CpInf, B, a0, a1, a2, a3
+        cdef numpy.ndarray T, y
+        Cp0, CpInf, B, a0, a1, a2, a3 = self._Cp0.value_si, self._CpInf.value_si, self._B.value_si, self.a0, self.a1, self.a2, self.a3
+        T = numpy.asarray(Tlist, numpy.float64)
+        y = T / (T + B)
+        return self._H0.value_si + Cp0 * T - (CpInf - Cp0) * T * (
+            y * y * ((3 * a0 + a1 + a2 + a3) / 6. + 
+                     (4 * a1 + a2 + a3) * y / 12. + 
+                     (5 * a2 + a3) * y * y / 20. + 
+                     a3 * y * y * y / 5.) + 
+            (2 + a0 + a1 + a2 + a3) * (y / 2. - 1 + (1.0 / y - 1.) * numpy.log(B + T))
+        )
+
+    cpdef numpy.ndarray getEntropies(self, numpy.ndarray Tlist):
+        """
+        Return the entropies in J/mol*K at the temperatures `Tlist` in K.
+        """
+        cdef double Cp0, CpInf, B, a0, a1, a2, a3
+        cdef numpy.ndarray T, y
+        Cp0, CpInf, B, a0, a1, a2, a3 = self._Cp0.value_si, self._CpInf.value_si, self._B.value_si, self.a0, self.a1, self.a2, self.a3
+        T = numpy.asarray(Tlist, numpy.float64)
+        y = T / (T + B)
+        return self._S0.value_si + CpInf * numpy.log(T) - (CpInf - Cp0) * (
+            numpy.log(y) + y * (1 + y * (a0 / 2. + y * (a1 / 3. + y * (a2 / 4. + y * a3 / 5.))))
+        )
+
+    cpdef numpy.ndarray getFreeEnergies(self, numpy.ndarray Tlist):
+        """
+        Return the Gibbs free energies in J/mol at the temperatures `Tlist`
+        in K.
+        """
+        cdef numpy.ndarray T = numpy.asarray(Tlist, numpy.float64)
+        return self.getEnthalpies(T) - T * self.getEntropies(T)
     
     cpdef Wilhoit copy(self):
         """
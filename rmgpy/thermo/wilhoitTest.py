@@ -212,6 +212,21 @@ class TestWilhoit(unittest.TestCase):
             Gexp = self.wilhoit.getEnthalpy(T) - T * self.wilhoit.getEntropy(T)
             Gact = self.wilhoit.getFreeEnergy(T)
             self.assertAlmostEqual(Gexp / Gact, 1.0, 4, '{0} != {1}'.format(Gexp, Gact))
+
+    def test_getThermoArrays(self):
+        """
+        Test that the array methods of Wilhoit objects match the scalar methods.
+        """
+        Tlist = numpy.array([200,400,600,800,1000,1200,1400,1600,1800,2000], numpy.float64)
+        Cplist = self.wilhoit.getHeatCapacities(Tlist)
+        Hlist = self.wilhoit.getEnthalpies(Tlist)
+        Slist = self.wilhoit.getEntropies(Tlist)
+        Glist = self.wilhoit.getFreeEnergies(Tlist)
+        for i, T in enumerate(Tlist):
+            self.assertAlmostEqual(Cplist[i] / self.wilhoit.getHeatCapacity(T), 1.0, 10)
+            self.assertAlmostEqual(Hlist[i] / self.wilhoit.getEnthalpy(T), 1.0, 10)
+            self.assertAlmostEqual(Slist[i] / self.wilhoit.getEntropy(T), 1.0, 10)
+            self.assertAlmostEqual(Glist[i] / self.wilhoit.getFreeEnergy(T), 1.0, 10)
     
     def test_pickle(self):
         """
@@ -0,0 +1,624 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+################################################################################
+#
+#   RMG - Reaction Mechanism Generator
+#
+#   Copyright (c) 2002-2017 Prof. William H. Green (whgreen@mit.edu),
+#   Prof. Richard H. West (r.west@neu.edu) and the RMG Team (rmg_dev@mit.edu)
+#
+#   Permission is hereby granted, free of charge, to any person obtaining a
+#   copy of this software and associated documentation files (the 'Software'),
+#   to deal in the Software without restriction, including without limitation
+#   the rights to use, copy, modify, merge, publish, distribute, sublicense,
+#   and/or sell copies of the Software, and to permit persons to whom the
+#   Software is furnished to do so, subject to the following conditions:
+#
+#   The above copyright notice and this permission notice shall be included in
+#   all copies or substantial portions of the Software.
+#
+#   THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#   FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#   DEALINGS IN THE SOFTWARE.
+#
+################################################################################
+
+"""
+This module contains a suite of benchmarks of the most expensive parts of
+RMG: isomorphism, resonance, pickling, thermo group additivity, kinetics estimation,
+reaction generation, reactor simulation, pressure dependence and Chemkin
+input and output. Every benchmark runs a fixed workload built from the files
+in ``rmgpy/test_data`` and ``examples``, so that timings can be compared
+between versions of the code. The results can be saved as a JSON baseline and
+later runs compared against it, e.g. ::
+
+    python benchmark.py --save baseline.json
+    python benchmark.py --baseline baseline.json --tolerance 0.1
+"""
+
+import argparse
+import json
+import logging
+import os
+import os.path
+import platform
+import shutil
+import sys
+import tempfile
+import time
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+import rmgpy
+from rmgpy import settings
+
+################################################################################
+
+class Benchmark(object):
+    """
+    A benchmark of a fixed workload. The attributes are:
+
+    =============== ============================================================
+    Attribute       Description
+    =============== ============================================================
+    `name`          A unique name for the benchmark
+    `run`           A function of the setup state that runs the timed workload
+    `setup`         A function returning the state passed to `run`, or ``None``
+    `reset`         A function of the setup state that clears the values cached in it, or ``None``
+    `description`   A short description of the workload
+    =============== ============================================================
+
+    The `setup` function is called once and is not timed; `run` is timed on
+    every repetition and must leave the state unchanged so that repetitions
+    are comparable. Before each repetition the caches shared by the whole
+    process are cleared by :func:`clearCaches` and those of the state by
+    `reset`, neither of which is timed, so that every repetition is cold.
+    """
+
+    def __init__(self, name, run, setup=None, reset=None, description=''):
+        self.name = name
+        self.run = run
+        self.setup = setup
+        self.reset = reset
+        self.description = description
+
+    def __repr__(self):
+        return '<Benchmark "{0}">'.format(self.name)
+
+benchmarks = []
+
+def benchmark(name, setup=None, reset=None, description=''):
+    """
+    A decorator that registers the decorated function as the `run` function
+    of a new benchmark called `name`.
+    """
+    def register(run):
+        benchmarks.append(Benchmark(name, run, setup=setup, reset=reset, description=description))
+        return run
+    return register
+
+################################################################################
+
+def getPeakMemory():
+    """
+    Return the peak resident memory of the process in MB, or ``None`` if it
+    cannot be determined on this platform.
+    """
+    if resource is None:
+        return None
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    if sys.platform == 'darwin':
+        return maxrss / 1024.0 / 1024.0
+    return maxrss / 1024.0
+
+def clearCaches():
+    """
+    Clear the caches of structures and their properties that are shared by
+    the whole process, so that they do not carry over from one repetition of
+    a benchmark to the next.
+    """
+    from rmgpy.molecule.symmetry import symmetryNumberCache
+    from rmgpy.molecule.generator import identifier_cache
+    from rmgpy.molecule.resonance import resonance_cache
+    symmetryNumberCache.clear()
+    identifier_cache.clear()
+    resonance_cache.clear()
+    if _database is not None:
+        _database.forbiddenStructures.verdictCache.clear()
+
+def resetStructures(state):
+    """
+    Clear the ring perception and connectivity values cached in each molecule
+    or group of `state`, which may be a graph, a species, a reaction or a
+    list or tuple of any of these.
+    """
+    from rmgpy.molecule.graph import Graph
+    from rmgpy.species import Species
+    from rmgpy.reaction import Reaction
+    if isinstance(state, Graph):
+        state.resetConnectivityValues()
+    elif isinstance(state, Species):
+        resetStructures(state.molecule)
+    elif isinstance(state, Reaction):
+        resetStructures(state.reactants)
+        resetStructures(state.products)
+    elif isinstance(state, (list, tuple)):
+        for item in state:
+            resetStructures(item)
+
+def runBenchmark(bench, repeat=5):
+    """
+    Run the benchmark `bench` `repeat` times after its setup, clearing the
+    caches before each run. Return a dict with the fastest and median wall
+    time of the runs in s, the time of the setup in s, the peak memory of the
+    process in MB and the increase of the peak memory during the benchmark
+    in MB.
+    """
+    memory0 = getPeakMemory()
+    t0 = time.time()
+    state = bench.setup() if bench.setup is not None else None
+    setupTime = time.time() - t0
+
+    times = []
+    for i in range(repeat):
+        clearCaches()
+        if bench.reset is not None:
+            bench.reset(state)
+        t0 = time.time()
+        bench.run(state)
+        times.append(time.time() - t0)
+    times.sort()
+
+    memory = getPeakMemory()
+    return {
+        'time': times[0],
+        'median': times[len(times) // 2],
+        'repeat': repeat,
+        'setup': setupTime,
+        'memory': memory,
+        'memoryIncrease': memory - memory0 if memory is not None else None,
+    }
+
+def runBenchmarks(names=None, repeat=5):
+    """
+    Run the registered benchmarks whose names are in `names`, or all of them
+    if `names` is ``None``. Return a dict of the results of
+    :func:`runBenchmark` by benchmark name.
+    """
+    if names is not None:
+        unknown = set(names) - set([bench.name for bench in benchmarks])
+        if unknown:
+            raise ValueError('Unknown benchmarks {0!r}.'.format(sorted(unknown)))
+    results = {}
+    for bench in benchmarks:
+        if names is not None and bench.name not in names:
+            continue
+        logging.info('Running benchmark {0}...'.format(bench.name))
+        results[bench.name] = runBenchmark(bench, repeat)
+        logging.info('    {0:.4f} s (median {1:.4f} s)'.format(results[bench.name]['time'], results[bench.name]['median']))
+    return results
+
+################################################################################
+
+def saveResults(path, results):
+    """
+    Save the benchmark `results` to a JSON file at `path`, along with a
+    description of the machine and versions they were obtained with.
+    """
+    data = {
+        'rmgpy': rmgpy.__version__,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'date': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'benchmarks': results,
+    }
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+
+def loadResults(path):
+    """
+    Load benchmark results saved by :func:`saveResults` from the JSON file at
+    `path`. Return a dict of the results by benchmark name.
+    """
+    with open(path, 'r') as f:
+        data = json.load(f)
+    return data['benchmarks']
+
+def compareResults(results, baseline, tolerance=0.1):
+    """
+    Compare the fastest times of the benchmark `results` to those of the
+    `baseline`. A benchmark is a regression if its time exceeds the baseline
+    by more than the fraction `tolerance`, and an improvement if the baseline
+    exceeds its time by as much. Return a list of tuples of the name, time,
+    baseline time, ratio of the times and status of each benchmark, where the
+    status is one of ``'slower'``, ``'faster'``, ``'same'`` or ``'new'``.
+    """
+    comparison = []
+    for name in sorted(results):
+        time0 = results[name]['time']
+        if name not in baseline:
+            comparison.append((name, time0, None, None, 'new'))
+            continue
+        time1 = baseline[name]['time']
+        ratio = time0 / time1 if time1 > 0 else float('inf')
+        if ratio > 1 + tolerance:
+            status = 'slower'
+        elif ratio < 1 / (1 + tolerance):
+            status = 'faster'
+        else:
+            status = 'same'
+        comparison.append((name, time0, time1, ratio, status))
+    return comparison
+
+def printResults(results, comparison=None):
+    """
+    Log a table of the benchmark `results`, with the `comparison` to a
+    baseline from :func:`compareResults` if given.
+    """
+    statuses = {}
+    if comparison is not None:
+        for name, time0, time1, ratio, status in comparison:
+            statuses[name] = (time1, ratio, status)
+    logging.info('')
+    logging.info('{0:<28} {1:>10} {2:>10} {3:>10} {4:>10} {5:>8} {6}'.format(
+        'Benchmark', 'Time (s)', 'Median (s)', 'Mem (MB)', 'Base (s)', 'Ratio', 'Status'))
+    for name in sorted(results):
+        result = results[name]
+        memory = '{0:.1f}'.format(result['memory']) if result['memory'] is not None else '-'
+        time1, ratio, status = statuses.get(name, (None, None, ''))
+        logging.info('{0:<28} {1:>10.4f} {2:>10.4f} {3:>10} {4:>10} {5:>8} {6}'.format(
+            name, result['time'], result['median'], memory,
+            '{0:.4f}'.format(time1) if time1 is not None else '-',
+            '{0:.2f}'.format(ratio) if ratio is not None else '-',
+            status,
+        ))
+
+################################################################################
+
+# The workloads below share one database, which is loaded the first time it
+# is needed and not counted in the timings
+
+_database = None
+
+def getDatabase():
+    """
+    Return the RMG database loaded from the testing database in
+    ``rmgpy/test_data``, loading it on the first call.
+    """
+    global _database
+    if _database is None:
+        from rmgpy.data.rmg import RMGDatabase
+        from rmgpy.data.base import ForbiddenStructures
+        database = RMGDatabase()
+        database.load(
+            path=os.path.join(settings['test_data.directory'], 'testing_database'),
+            thermoLibraries=['primaryThermoLibrary'],
+            reactionLibraries=['GRI-Mech3.0'],
+            kineticsFamilies=['R_Recombination', 'Disproportionation', 'R_Addition_MultipleBond', 'H_Abstraction'],
+            testing=True,
+            depository=False,
+            solvation=False,
+        )
+        database.forbiddenStructures = ForbiddenStructures()
+        for family in database.kinetics.families.values():
+            family.addKineticsRulesFromTrainingSet(thermoDatabase=database.thermo)
+            family.fillKineticsRulesByAveragingUp(verbose=False)
+        _database = database
+    return _database
+
+# Structures used by the molecular benchmarks, chosen to include radicals,
+# rings, aromatics and resonance-stabilized species
+smilesList = [
+    'CCCCCCCC',
+    'CC(C)(C)CC(C)C',
+    'C=CC=CC=C',
+    'C=C[CH]C=C',
+    'c1ccccc1',
+    'c1ccc2ccccc2c1',
+    'Cc1ccccc1',
+    '[CH2]c1ccccc1',
+    'C1CCC2CCCCC2C1',
+    'OCC(O)CO',
+    'CC(=O)OC',
+    '[O]OC(C)CC',
+    'C=CC(=O)[O]',
+    'N#CC=CC#N',
+]
+
+def setupMolecules():
+    from rmgpy.molecule import Molecule
+    return [Molecule().fromSMILES(smiles) for smiles in smilesList]
+
+def setupSpecies():
+    from rmgpy.species import Species
+    getDatabase()
+    speciesList = []
+    for smiles in smilesList:
+        spc = Species().fromSMILES(smiles)
+        spc.generate_resonance_structures()
+        speciesList.append(spc)
+    return speciesList
+
+@benchmark('isIsomorphic', setup=setupMolecules, reset=resetStructures,
+           description='Isomorphism of every pair of a set of molecules and their copies')
+def runIsIsomorphic(molecules):
+    copies = [molecule.copy(deep=True) for molecule in molecules]
+    for molecule1 in molecules:
+        for molecule2 in copies:
+            molecule1.isIsomorphic(molecule2)
+
+def setupSubgraphs():
+    from rmgpy.molecule.group import Group
+    groups = [
+        Group().fromAdjacencyList("""
+1 *1 C u0 {2,S}
+2 *2 C u0 {1,S}
+"""),
+        Group().fromAdjacencyList("""
+1 *1 C u0 {2,D}
+2 *2 C u0 {1,D}
+"""),
+        Group().fromAdjacencyList("""
+1 *1 R!H u1
+"""),
+        Group().fromAdjacencyList("""
+1 *1 C  u0 {2,S} {3,S}
+2    O2s u0 {1,S}
+3    R   u0 {1,S}
+"""),
+    ]
+    return setupMolecules(), groups
+
+@benchmark('findSubgraphIsomorphisms', setup=setupSubgraphs, reset=resetStructures,
+           description='Subgraph isomorphisms of a set of groups in a set of molecules')
+def runFindSubgraphIsomorphisms(state):
+    molecules, groups = state
+    for molecule in molecules:
+        for group in groups:
+            molecule.findSubgraphIsomorphisms(group)
+
+@benchmark('resonance', setup=setupMolecules, reset=resetStructures,
+           description='Resonance structures of a set of molecules, without the cache')
+def runResonance(molecules):
+    from rmgpy.molecule.resonance import generate_resonance_structures_uncached
+    for molecule in molecules:
+        generate_resonance_structures_uncached(molecule.copy(deep=True))
+
+@benchmark('pickleSpecies', setup=setupSpecies,
+           description='Pickling and unpickling of a set of species with their resonance structures')
+def runPickleSpecies(speciesList):
+    import cPickle
+    cPickle.loads(cPickle.dumps(speciesList, cPickle.HIGHEST_PROTOCOL))
+
+@benchmark('thermoGroupAdditivity', setup=setupSpecies, reset=resetStructures,
+           description='Thermo of a set of species by group additivity')
+def runThermoGroupAdditivity(speciesList):
+    thermo = getDatabase().thermo
+    for spc in speciesList:
+        thermo.getThermoDataFromGroups(spc)
+
+def setupReactants():
+    from rmgpy.species import Species
+    getDatabase()
+    reactantsList = [
+        ['[OH]', 'CC'],
+        ['[H]', 'CCC'],
+        ['[CH3]', 'C=CC'],
+        ['[O]O', 'CC(C)C'],
+        ['[CH2]C=C', 'C=CC=C'],
+        ['[CH2]CC', '[CH3]'],
+        ['[CH2]C', '[CH2]C'],
+        ['[O]OC(C)CC', 'C=CC(=O)C'],
+    ]
+    for reactants in reactantsList:
+        for index, smiles in enumerate(reactants):
+            spc = Species().fromSMILES(smiles)
+            spc.generate_resonance_structures()
+            reactants[index] = spc
+    return reactantsList
+
+@benchmark('generateReactions', setup=setupReactants, reset=resetStructures,
+           description='Reactions of a set of reactant pairs from the kinetics families')
+def runGenerateReactions(reactantsList):
+    kinetics = getDatabase().kinetics
+    for reactants in reactantsList:
+        kinetics.generate_reactions_from_families(reactants)
+
+def setupKinetics():
+    kinetics = getDatabase().kinetics
+    reactions = []
+    for reactants in setupReactants():
+        reactions.extend(kinetics.generate_reactions_from_families(reactants))
+    return reactions
+
+@benchmark('kineticsEstimation', setup=setupKinetics, reset=resetStructures,
+           description='Kinetics of a set of reactions by rate rules, from the templates found when they were generated')
+def runKineticsEstimation(reactions):
+    families = getDatabase().kinetics.families
+    for rxn in reactions:
+        family = families[rxn.family]
+        family.getKinetics(rxn, templateLabels=rxn.template, degeneracy=rxn.degeneracy,
+                           estimator='rate rules', returnAllKinetics=False)
+
+def setupTemplateSearch():
+    from rmgpy.exceptions import ActionError
+    families = getDatabase().kinetics.families
+    reactions = []
+    for rxn in setupKinetics():
+        # The atom labels are removed once a reaction has been generated, so
+        # they are applied again to find the template
+        try:
+            families[rxn.family].addAtomLabelsForReaction(rxn, output_with_resonance=False)
+        except ActionError:
+            continue
+        reactions.append(rxn)
+    return reactions
+
+@benchmark('templateSearch', setup=setupTemplateSearch, reset=resetStructures,
+           description='Kinetics of a set of labeled reactions by rate rules, including the search of the family trees')
+def runTemplateSearch(reactions):
+    families = getDatabase().kinetics.families
+    for rxn in reactions:
+        family = families[rxn.family]
+        template = family.getReactionTemplate(rxn)
+        family.getKineticsForTemplate(template, degeneracy=rxn.degeneracy, method='rate rules')
+
+def setupSimulation():
+    from rmgpy.chemkin import loadChemkinFile
+    from rmgpy.solver.simple import SimpleReactor
+    from rmgpy.solver.base import TerminationTime
+    from rmgpy.rmg.settings import ModelSettings, SimulatorSettings
+    folder = os.path.join(settings['test_data.directory'], 'chemkin', 'chemkin_py', 'minimal')
+    speciesList, reactionList = loadChemkinFile(
+        os.path.join(folder, 'chem.inp'),
+        os.path.join(folder, 'species_dictionary.txt'),
+    )
+    species = dict([(spc.label, spc) for spc in speciesList])
+    reactor = SimpleReactor(
+        T=(1000, 'K'),
+        P=(1.0, 'bar'),
+        initialMoleFractions={species['ethane(1)']: 0.1, species['N2']: 0.9},
+        termination=[TerminationTime((1.0, 's'))],
+    )
+    modelSettings = ModelSettings(toleranceKeepInEdge=0, toleranceMoveToCore=1, toleranceInterruptSimulation=0)
+    simulatorSettings = SimulatorSettings()
+    return reactor, speciesList, reactionList, modelSettings, simulatorSettings
+
+def resetSimulation(state):
+    reactor = state[0]
+    reactor.rateCoefficientCache = {}
+    reactor.freeEnergyCache = {}
+    reactor.colliderEfficiencyCache = {}
+    reactor.colliderSpecies = []
+
+@benchmark('simulate', setup=setupSimulation, reset=resetSimulation,
+           description='Simulation of ethane pyrolysis in a simple batch reactor')
+def runSimulate(state):
+    reactor, speciesList, reactionList, modelSettings, simulatorSettings = state
+    reactor.simulate(
+        coreSpecies=speciesList,
+        coreReactions=reactionList,
+        edgeSpecies=[],
+        edgeReactions=[],
+        surfaceSpecies=[],
+        surfaceReactions=[],
+        modelSettings=modelSettings,
+        simulatorSettings=simulatorSettings,
+    )
+
+def setupPressureDependence():
+    from rmgpy.cantherm.input import loadInputFile
+    from rmgpy.cantherm.pdep import PressureDependenceJob
+    path = os.path.join(os.path.dirname(rmgpy.getPath()), 'examples', 'cantherm', 'networks', 'acetyl+O2', 'input.py')
+    jobList = loadInputFile(path)
+    for job in jobList:
+        if isinstance(job, PressureDependenceJob):
+            break
+    else:
+        raise ValueError('No pressure dependence job found in {0}.'.format(path))
+    job.initialize()
+    return job
+
+def runPressureDependence(job, method):
+    job.network.calculateRateCoefficients(job.Tlist.value_si, job.Plist.value_si, method)
+
+@benchmark('pdepMSC', setup=setupPressureDependence,
+           description='Phenomenological rate coefficients of acetyl + O2 by modified strong collision')
+def runPressureDependenceMSC(job):
+    runPressureDependence(job, 'modified strong collision')
+
+@benchmark('pdepRS', setup=setupPressureDependence,
+           description='Phenomenological rate coefficients of acetyl + O2 by reservoir state')
+def runPressureDependenceRS(job):
+    runPressureDependence(job, 'reservoir state')
+
+@benchmark('pdepCSE', setup=setupPressureDependence,
+           description='Phenomenological rate coefficients of acetyl + O2 by chemically-significant eigenvalues')
+def runPressureDependenceCSE(job):
+    runPressureDependence(job, 'chemically-significant eigenvalues')
+
+def getChemkinFolder():
+    return os.path.join(settings['test_data.directory'], 'chemkin', 'chemkin_py', 'pdd')
+
+@benchmark('loadChemkin',
+           description='Loading of a Chemkin file and species dictionary')
+def runLoadChemkin(state):
+    from rmgpy.chemkin import loadChemkinFile
+    folder = getChemkinFolder()
+    loadChemkinFile(os.path.join(folder, 'chem.inp'), os.path.join(folder, 'species_dictionary.txt'))
+
+def setupSaveChemkin():
+    from rmgpy.chemkin import loadChemkinFile
+    folder = getChemkinFolder()
+    return loadChemkinFile(os.path.join(folder, 'chem.inp'), os.path.join(folder, 'species_dictionary.txt'))
+
+@benchmark('saveChemkin', setup=setupSaveChemkin,
+           description='Saving of a Chemkin file and species dictionary')
+def runSaveChemkin(state):
+    from rmgpy.chemkin import saveChemkinFile, saveSpeciesDictionary
+    speciesList, reactionList = state
+    folder = tempfile.mkdtemp()
+    try:
+        saveChemkinFile(os.path.join(folder, 'chem.inp'), speciesList, reactionList)
+        saveSpeciesDictionary(os.path.join(folder, 'species_dictionary.txt'), speciesList)
+    finally:
+        shutil.rmtree(folder)
+
+################################################################################
+
+def parseArguments():
+
+    parser = argparse.ArgumentParser(description='Run benchmarks of the most expensive parts of RMG.')
+    parser.add_argument('--only', metavar='NAME', type=str, nargs='+',
+        help='run only the named benchmarks')
+    parser.add_argument('--repeat', metavar='N', type=int, default=5,
+        help='number of timed runs of each benchmark (default 5)')
+    parser.add_argument('--baseline', metavar='FILE', type=str,
+        help='JSON file of baseline results to compare against')
+    parser.add_argument('--tolerance', metavar='FRACTION', type=float, default=0.1,
+        help='fraction by which a benchmark may be slower than the baseline (default 0.1)')
+    parser.add_argument('--save', metavar='FILE', type=str,
+        help='JSON file to save the results to')
+    parser.add_argument('--list', action='store_true',
+        help='list the benchmarks and exit')
+
+    return parser.parse_args()
+
+def main():
+    args = parseArguments()
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
+    if args.list:
+        for bench in benchmarks:
+            logging.info('{0:<28} {1}'.format(bench.name, bench.description))
+        return 0
+
+    results = runBenchmarks(args.only, args.repeat)
+
+    comparison = None
+    if args.baseline:
+        comparison = compareResults(results, loadResults(args.baseline), args.tolerance)
+    printResults(results, comparison)
+
+    if args.save:
+        saveResults(args.save, results)
+        logging.info('Saved results to {0}'.format(os.path.abspath(args.save)))
+
+    if comparison is not None:
+        regressions = [name for name, time0, time1, ratio, status in comparison if status == 'slower']
+        if regressions:
+            logging.error('Slower than the baseline: {0}'.format(', '.join(regressions)))
+            return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+################################################################################
+#
+#   RMG - Reaction Mechanism Generator
+#
+#   Copyright (c) 2002-2017 Prof. William H. Green (whgreen@mit.edu), 
+#   Prof. Richard H. West (r.west@neu.edu) and the RMG Team (rmg_dev@mit.edu)
+#
+#   Permission is hereby granted, free of charge, to any person obtaining a
+#   copy of this software and associated documentation files (the 'Software'),
+#   to deal in the Software without restriction, including without limitation
+#   the rights to use, copy, modify, merge, publish, distribute, sublicense,
+#   and/or sell copies of the Software, and to permit persons to whom the
+#   Software is furnished to do so, subject to the following conditions:
+#
+#   The above copyright notice and this permission notice shall be included in
+#   all copies or substantial portions of the Software.
+#
+#   THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#   FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#   DEALINGS IN THE SOFTWARE.
+#
+################################################################################
+
+import os.path
+import shutil
+import tempfile
+import unittest
+
+from rmgpy.tools.benchmark import Benchmark, runBenchmark, clearCaches, saveResults, loadResults, compareResults, benchmarks
+
+################################################################################
+
+class BenchmarkTest(unittest.TestCase):
+    """
+    Contains unit tests of the benchmark runner and the comparison of the
+    results to a baseline.
+    """
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def testRunBenchmark(self):
+        """
+        Test that a benchmark is set up once and reset and run the requested number of times.
+        """
+        calls = {'setup': 0, 'reset': 0, 'run': 0}
+        def setup():
+            calls['setup'] += 1
+            return range(1000)
+        def reset(state):
+            calls['reset'] += 1
+        def run(state):
+            self.assertEqual(calls['reset'], calls['run'] + 1)
+            calls['run'] += 1
+            sum(state)
+        result = runBenchmark(Benchmark('sum', run, setup=setup, reset=reset), repeat=3)
+        self.assertEqual(calls['setup'], 1)
+        self.assertEqual(calls['reset'], 3)
+        self.assertEqual(calls['run'], 3)
+        self.assertEqual(result['repeat'], 3)
+        self.assertTrue(0 <= result['time'] <= result['median'])
+
+    def testClearCaches(self):
+        """
+        Test that the caches shared by the whole process are emptied.
+        """
+        from rmgpy.molecule import Molecule
+        from rmgpy.molecule.symmetry import symmetryNumberCache
+        from rmgpy.molecule.generator import identifier_cache
+        molecule = Molecule().fromSMILES('CCO')
+        molecule.getSymmetryNumber()
+        molecule.toInChI()
+        self.assertTrue(len(symmetryNumberCache) > 0)
+        self.assertTrue(len(identifier_cache) > 0)
+        clearCaches()
+        self.assertEqual(len(symmetryNumberCache), 0)
+        self.assertEqual(len(identifier_cache), 0)
+
+    def testBenchmarkNames(self):
+        """
+        Test that the registered benchmarks have unique names.
+        """
+        names = [bench.name for bench in benchmarks]
+        self.assertEqual(len(names), len(set(names)))
+        self.assertIn('isIsomorphic', names)
+        self.assertIn('pdepCSE', names)
+        self.assertIn('templateSearch', names)
+
+    def testSaveAndLoadResults(self):
+        """
+        Test that saved results are loaded back unchanged.
+        """
+        results = {'sum': {'time': 0.5, 'median': 0.6, 'repeat': 3, 'setup': 0.1, 'memory': 50.0, 'memoryIncrease': 1.0}}
+        path = os.path.join(self.folder, 'baseline.json')
+        saveResults(path, results)
+        self.assertEqual(loadResults(path), results)
+
+    def testCompareResults(self):
+        """
+        Test the status of benchmarks compared to a baseline.
+        """
+        baseline = {'a': {'time': 1.0}, 'b': {'time': 1.0}, 'c': {'time': 1.0}}
+        results = {'a': {'time': 1.05}, 'b': {'time': 1.5}, 'c': {'time': 0.5}, 'd': {'time': 1.0}}
+        comparison = compareResults(results, baseline, tolerance=0.1)
+        statuses = dict([(name, status) for name, time0, time1, ratio, status in comparison])
+        self.assertEqual(statuses, {'a': 'same', 'b': 'slower', 'c': 'faster', 'd': 'new'})
+        self.assertAlmostEqual(comparison[1][3], 1.5)
+
+################################################################################
+
+if __name__ == '__main__':
+    unittest.main(testRunner=unittest.TextTestRunner(verbosity=2))
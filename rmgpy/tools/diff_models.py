@@ -348,28 +348,13 @@ def execute(chemkin1, speciesDict1, thermo1, chemkin2, speciesDict2, thermo2, **
             logging.info('    {0!s}'.format(spec1))
             if spec1.thermo and spec2.thermo:
                 spec1.molecule[0].getSymmetryNumber()
-                logging.info('        {0:7.2f} {1:7.2f} {2:7.2f} {3:7.2f} {4:7.2f} {5:7.2f} {6:7.2f} {7:7.2f} {8:7.2f}'.format(
-                    spec1.thermo.getEnthalpy(300) / 4184.,
-                    spec1.thermo.getEntropy(300) / 4.184,
-                    spec1.thermo.getHeatCapacity(300) / 4.184,
-                    spec1.thermo.getHeatCapacity(400) / 4.184,
-                    spec1.thermo.getHeatCapacity(500) / 4.184,
-                    spec1.thermo.getHeatCapacity(600) / 4.184,
-                    spec1.thermo.getHeatCapacity(800) / 4.184,
-                    spec1.thermo.getHeatCapacity(1000) / 4.184,
-                    spec1.thermo.getHeatCapacity(1500) / 4.184,
-                ))
-                logging.info('        {0:7.2f} {1:7.2f} {2:7.2f} {3:7.2f} {4:7.2f} {5:7.2f} {6:7.2f} {7:7.2f} {8:7.2f}'.format(
-                    spec2.thermo.getEnthalpy(300) / 4184.,
-                    spec2.thermo.getEntropy(300) / 4.184,
-                    spec2.thermo.getHeatCapacity(300) / 4.184,
-                    spec2.thermo.getHeatCapacity(400) / 4.184,
-                    spec2.thermo.getHeatCapacity(500) / 4.184,
-                    spec2.thermo.getHeatCapacity(600) / 4.184,
-                    spec2.thermo.getHeatCapacity(800) / 4.184,
-                    spec2.thermo.getHeatCapacity(1000) / 4.184,
-                    spec2.thermo.getHeatCapacity(1500) / 4.184,
-                ))
+                Tlist = numpy.array([300,400,500,600,800,1000,1500], numpy.float64)
+                for thermo in [spec1.thermo, spec2.thermo]:
+                    logging.info('        {0:7.2f} {1:7.2f} {2:7.2f} {3:7.2f} {4:7.2f} {5:7.2f} {6:7.2f} {7:7.2f} {8:7.2f}'.format(
+                        thermo.getEnthalpy(300) / 4184.,
+                        thermo.getEntropy(300) / 4.184,
+                        *(thermo.getHeatCapacities(Tlist) / 4.184)
+                    ))
         logging.info('{0:d} species were only found in the first model:'.format(len(uniqueSpecies1)))
         for spec in uniqueSpecies1:
             logging.info('    {0!s}'.format(spec))
@@ -381,26 +366,11 @@ def execute(chemkin1, speciesDict1, thermo1, chemkin2, speciesDict2, thermo2, **
         for rxn1, rxn2 in commonReactions:
             logging.info('    {0!s}'.format(rxn1))
             if rxn1.kinetics and rxn2.kinetics:
-                logging.info('        {0:7.2f} {1:7.2f} {2:7.2f} {3:7.2f} {4:7.2f} {5:7.2f} {6:7.2f} {7:7.2f}'.format(
-                    math.log10(rxn1.kinetics.getRateCoefficient(300, 1e5)),
-                    math.log10(rxn1.kinetics.getRateCoefficient(400, 1e5)),
-                    math.log10(rxn1.kinetics.getRateCoefficient(500, 1e5)),
-                    math.log10(rxn1.kinetics.getRateCoefficient(600, 1e5)),
-                    math.log10(rxn1.kinetics.getRateCoefficient(800, 1e5)),
-                    math.log10(rxn1.kinetics.getRateCoefficient(1000, 1e5)),
-                    math.log10(rxn1.kinetics.getRateCoefficient(1500, 1e5)),
-                    math.log10(rxn1.kinetics.getRateCoefficient(2000, 1e5)),
-                ))
-                logging.info('        {0:7.2f} {1:7.2f} {2:7.2f} {3:7.2f} {4:7.2f} {5:7.2f} {6:7.2f} {7:7.2f}'.format(
-                    math.log10(rxn2.kinetics.getRateCoefficient(300, 1e5)),
-                    math.log10(rxn2.kinetics.getRateCoefficient(400, 1e5)),
-                    math.log10(rxn2.kinetics.getRateCoefficient(500, 1e5)),
-                    math.log10(rxn2.kinetics.getRateCoefficient(600, 1e5)),
-                    math.log10(rxn2.kinetics.getRateCoefficient(800, 1e5)),
-                    math.log10(rxn2.kinetics.getRateCoefficient(1000, 1e5)),
-                    math.log10(rxn2.kinetics.getRateCoefficient(1500, 1e5)),
-                    math.log10(rxn2.kinetics.getRateCoefficient(2000, 1e5)),
-                ))
+                Tlist = numpy.array([300,400,500,600,800,1000,1500,2000], numpy.float64)
+                for kinetics in [rxn1.kinetics, rxn2.kinetics]:
+                    logging.info('        {0:7.2f} {1:7.2f} {2:7.2f} {3:7.2f} {4:7.2f} {5:7.2f} {6:7.2f} {7:7.2f}'.format(
+                        *numpy.log10(kinetics.getRateCoefficients(Tlist, numpy.array([1e5], numpy.float64))[:,0])
+                    ))
         logging.info('{0:d} reactions were only found in the first model:'.format(len(uniqueReactions1)))
         for rxn in uniqueReactions1:
             logging.info('    {0!s}'.format(rxn))
@@ -49,6 +49,8 @@ class DiffModelsTest(unittest.TestCase):
 
         execute(chemkin1, speciesDict1, None, chemkin2, speciesDict2, None, **kwargs)
 
-        shutil.rmtree(os.path.join(folder,'species1'))
-        shutil.rmtree(os.path.join(folder,'species2'))
+        # Structures of both models are drawn into one content-addressed folder
+        self.assertFalse(os.path.exists(os.path.join(folder,'species1')))
+        self.assertTrue(os.path.isdir(os.path.join(folder,'species')))
+        shutil.rmtree(os.path.join(folder,'species'))
         os.remove(os.path.join(folder,'diff.html'))
@@ -37,8 +37,11 @@ This module contains functions for generating flux diagrams.
 import os.path
 import re
 import math
+import multiprocessing
+import shutil
 import numpy
 import pydot
+from scipy import sparse
 
 from rmgpy.solver.base import TerminationTime, TerminationConversion
 from rmgpy.solver.liquid import LiquidReactor
@@ -70,9 +73,140 @@ relativeTolerance = 1e-8        # The relative tolerance to use in the ODE simul
 framesPerSecond = 6             # The number of frames per second in the generated movie
 initialPadding = 5              # The number of seconds to display the initial fluxes at the start of the video
 finalPadding = 5                # The number of seconds to display the final fluxes at the end of the video
+renderProcesses = None          # The number of processes to render the frames with (default: the number of CPUs)
 
 ################################################################################
 
+class PairFluxes(object):
+    """
+    The net rates between pairs of species in a reaction model over a series
+    of time points. Only the pairs of species that are linked by at least one
+    reaction pair are stored, so the memory required grows with the number of
+    reactions rather than with the square of the number of species. The
+    attributes are:
+
+    =================== ========================================================
+    Attribute           Description
+    =================== ========================================================
+    `reactantIndices`   The index of the first species of each pair
+    `productIndices`    The index of the second species of each pair, which is always larger than the first
+    `rates`             The net rate from the first to the second species of each pair at each time point
+    `maxRates`          The largest absolute net rate of each pair over all time points
+    `pairIndex`         A dict mapping each ``(reactantIndex, productIndex)`` pair to its row in `rates`
+    =================== ========================================================
+
+    The rates are computed as the product of a sparse matrix of reaction pairs
+    with the given `reactionRates`, an array of the rate of each reaction in
+    `reactionList` (columns) at each time point (rows).
+    """
+
+    def __init__(self, speciesIndex, reactionList, reactionRates):
+        self.pairIndex = {}
+        rows = []; columns = []; signs = []
+        for index, reaction in enumerate(reactionList):
+            if not reaction.pairs: reaction.generatePairs()
+            for reactant, product in reaction.pairs:
+                reactantIndex = speciesIndex[reactant]
+                productIndex = speciesIndex[product]
+                if reactantIndex == productIndex:
+                    # The forward and reverse fluxes of such a pair cancel
+                    continue
+                elif reactantIndex < productIndex:
+                    key = (reactantIndex, productIndex); sign = 1.0
+                else:
+                    key = (productIndex, reactantIndex); sign = -1.0
+                rows.append(self.pairIndex.setdefault(key, len(self.pairIndex)))
+                columns.append(index)
+                signs.append(sign)
+
+        numPairs = len(self.pairIndex)
+        self.reactantIndices = numpy.zeros(numPairs, numpy.int64)
+        self.productIndices = numpy.zeros(numPairs, numpy.int64)
+        for (reactantIndex, productIndex), row in self.pairIndex.iteritems():
+            self.reactantIndices[row] = reactantIndex
+            self.productIndices[row] = productIndex
+
+        reactionRates = numpy.asarray(reactionRates, numpy.float64)
+        pairs = sparse.coo_matrix((signs, (rows, columns)), shape=(numPairs, len(reactionList))).tocsr()
+        self.rates = numpy.asarray(pairs.dot(reactionRates.T))
+        self.maxRates = numpy.max(numpy.abs(self.rates), axis=1) if self.rates.size else numpy.zeros(numPairs)
+
+    def getRates(self, reactantIndex, productIndex):
+        """
+        Return the net rate from the species at `reactantIndex` to the species
+        at `productIndex` at each time point.
+        """
+        if reactantIndex < productIndex:
+            row = self.pairIndex.get((reactantIndex, productIndex))
+            sign = 1.0
+        else:
+            row = self.pairIndex.get((productIndex, reactantIndex))
+            sign = -1.0
+        if row is None:
+            return numpy.zeros(self.rates.shape[1])
+        return sign * self.rates[row]
+
+    def getMaximumRate(self, reactantIndex, productIndex):
+        """
+        Return the largest absolute net rate between the species at
+        `reactantIndex` and `productIndex` over all time points.
+        """
+        row = self.pairIndex.get((min(reactantIndex, productIndex), max(reactantIndex, productIndex)))
+        return 0.0 if row is None else self.maxRates[row]
+
+    def getLargestPairs(self, count):
+        """
+        Return a list of up to `count` ``(reactantIndex, productIndex)`` pairs
+        with the largest nonzero maximum rates, in decreasing order of rate.
+        Only the selected pairs are sorted.
+        """
+        count = min(count, len(self.maxRates))
+        if count <= 0:
+            return []
+        elif count < len(self.maxRates):
+            candidates = numpy.argpartition(-self.maxRates, count - 1)[:count]
+        else:
+            candidates = numpy.arange(count)
+        candidates = candidates[numpy.argsort(-self.maxRates[candidates], kind='mergesort')]
+        return [(int(self.reactantIndices[row]), int(self.productIndices[row]))
+                for row in candidates if self.maxRates[row] > 0]
+
+################################################################################
+
+def getDotName(species):
+    """
+    Return the name of the node of `species` in a flux diagram as it must be
+    given to look the node up in a graph, quoted if it contains special
+    characters.
+    """
+    if re.search(r'^[a-zA-Z0-9_]*$', str(species)) is not None:
+        return str(species)
+    else:
+        return '"{0}"'.format(str(species))
+
+def _renderFrame(args):
+    """
+    Set the node and edge pen widths of the flux diagram given by `dotData`
+    for one time point and write it as a dot file and a png image to the
+    first of the `paths`. The remaining paths receive copies of the files.
+    This function runs in the worker processes of :func:`generateFluxDiagram`.
+    """
+    dotData, label, nodeStyles, edgeStyles, paths = args
+    graph = pydot.graph_from_dot_data(dotData)[0]
+    for name, penwidth in nodeStyles:
+        graph.get_node(name)[0].set_penwidth(penwidth)
+    for reactantName, productName, direction, penwidth in edgeStyles:
+        edge = graph.get_edge(reactantName, productName)[0]
+        edge.set_dir(direction)
+        edge.set_penwidth(penwidth)
+    graph.set_label(label)
+    dotPath, pngPath = paths[0]
+    graph.write_dot(dotPath)
+    graph.write_png(pngPath)
+    for copyDotPath, copyPngPath in paths[1:]:
+        shutil.copyfile(dotPath, copyDotPath)
+        shutil.copyfile(pngPath, copyPngPath)
+
 def generateFluxDiagram(reactionModel, times, concentrations, reactionRates, outputDirectory, centralSpecies=None, speciesDirectory=None, settings=None):
     """
     For a given `reactionModel` and simulation results stored as arrays of
@@ -81,7 +215,7 @@ def generateFluxDiagram(reactionModel, times, concentrations, reactionRates, out
     a movie. The individual frames and the final movie are saved on disk at
     `outputDirectory.`
     """
-    global maximumNodeCount, maximumEdgeCount, concentrationTolerance, speciesRateTolerance, maximumNodePenWidth, maximumEdgePenWidth
+    global maximumNodeCount, maximumEdgeCount, concentrationTolerance, speciesRateTolerance, maximumNodePenWidth, maximumEdgePenWidth, renderProcesses
     # Allow user defined settings for flux diagram generation if given
     if settings:
         maximumNodeCount = settings.get('maximumNodeCount', maximumNodeCount)
@@ -90,12 +224,12 @@ def generateFluxDiagram(reactionModel, times, concentrations, reactionRates, out
         speciesRateTolerance = settings.get('speciesRateTolerance', speciesRateTolerance)
         maximumNodePenWidth = settings.get('maximumNodePenWidth', maximumNodePenWidth)
         maximumEdgePenWidth= settings.get('maximumEdgePenWidth', maximumEdgePenWidth)
+        renderProcesses = settings.get('renderProcesses', renderProcesses)
     
     # Get the species and reactions corresponding to the provided concentrations and reaction rates
     speciesList = reactionModel.core.species[:]
-    numSpecies = len(speciesList)
+    speciesIndex = dict((species, index) for index, species in enumerate(speciesList))
     reactionList = reactionModel.core.reactions[:]
-    numReactions = len(reactionList)
     
     #search index of central species:
     if centralSpecies is not None:
@@ -104,51 +238,30 @@ def generateFluxDiagram(reactionModel, times, concentrations, reactionRates, out
                 centralSpeciesIndex = i
                 break 
     
-    # Compute the rates between each pair of species (big matrix warning!)
-    speciesRates = numpy.zeros((len(times),numSpecies,numSpecies), numpy.float64)
-    for index, reaction in enumerate(reactionList):
-        rate = reactionRates[:,index]
-        if not reaction.pairs: reaction.generatePairs()
-        for reactant, product in reaction.pairs:
-            reactantIndex = speciesList.index(reactant)
-            productIndex = speciesList.index(product)
-            speciesRates[:,reactantIndex,productIndex] += rate
-            speciesRates[:,productIndex,reactantIndex] -= rate
+    # Compute the net rates between each pair of species linked by a reaction
+    pairFluxes = PairFluxes(speciesIndex, reactionList, reactionRates)
     
     # Determine the maximum concentration for each species and the maximum overall concentration
     maxConcentrations = numpy.max(numpy.abs(concentrations), axis=0)
     maxConcentration = numpy.max(maxConcentrations)
     
-    # Determine the maximum rate for each species-species pair and the maximum overall species-species rate
-    maxSpeciesRates = numpy.max(numpy.abs(speciesRates), axis=0)
-    maxSpeciesRate = numpy.max(maxSpeciesRates)
-    speciesIndex = maxSpeciesRates.reshape((numSpecies*numSpecies)).argsort()
+    # Determine the maximum overall species-species rate
+    maxSpeciesRate = numpy.max(pairFluxes.maxRates) if len(pairFluxes.maxRates) > 0 else 0.0
     
     # Determine the nodes and edges to keep
     nodes = []; edges = []
     if centralSpecies is None:
-        for i in range(numSpecies*numSpecies):
-            productIndex, reactantIndex = divmod(speciesIndex[-i-1], numSpecies)
-            if reactantIndex > productIndex:
-                # Both reactant -> product and product -> reactant are in this list,
-                # so only keep one of them
-                continue
-            if maxSpeciesRates[reactantIndex, productIndex] == 0:
-                break
+        for reactantIndex, productIndex in pairFluxes.getLargestPairs(maximumEdgeCount):
             if reactantIndex not in nodes and len(nodes) < maximumNodeCount: nodes.append(reactantIndex)
             if productIndex not in nodes and len(nodes) < maximumNodeCount: nodes.append(productIndex)
-            if len(nodes) > maximumNodeCount: 
-                break
             edges.append([reactantIndex, productIndex])
-            if len(edges) >= maximumEdgeCount:
-                break
     else:
         nodes.append(centralSpeciesIndex)
         for index, reaction in enumerate(reactionList):
             for reactant, product in reaction.pairs:
-                reactantIndex = speciesList.index(reactant)
-                productIndex = speciesList.index(product)
-                if maxSpeciesRates[reactantIndex, productIndex] == 0:
+                reactantIndex = speciesIndex[reactant]
+                productIndex = speciesIndex[product]
+                if pairFluxes.getMaximumRate(reactantIndex, productIndex) == 0:
                     break
                 if len(nodes) > maximumNodeCount or len(edges) >= maximumEdgeCount: 
                     break
@@ -175,100 +288,98 @@ def generateFluxDiagram(reactionModel, times, concentrations, reactionRates, out
         node.set_penwidth(maximumNodePenWidth)
         graph.add_node(node)
         # Try to use an image instead of the label
-        speciesIndex = str(species) + '.png'
+        imageName = str(species) + '.png'
         imagePath = ''
         if not speciesDirectory or not os.path.exists(speciesDirectory): 
             continue
         for root, dirs, files in os.walk(speciesDirectory):
             for f in files:
-                if f.endswith(speciesIndex):
+                if f.endswith(imageName):
                     imagePath = os.path.join(root, f)
                     break
         if os.path.exists(imagePath):
             node.set_image(imagePath)
             node.set_label(" ")
     # Add an edge for each species-species rate
+    edges = [(reactantIndex, productIndex) for reactantIndex, productIndex in edges
+             if reactantIndex in nodes and productIndex in nodes]
     for reactantIndex, productIndex in edges:
-        if reactantIndex in nodes and productIndex in nodes:
-            reactant = speciesList[reactantIndex]
-            product = speciesList[productIndex]
-            edge = pydot.Edge(str(reactant), str(product))
-            edge.set_penwidth(maximumEdgePenWidth)
-            graph.add_edge(edge) 
+        reactant = speciesList[reactantIndex]
+        product = speciesList[productIndex]
+        edge = pydot.Edge(str(reactant), str(product))
+        edge.set_penwidth(maximumEdgePenWidth)
+        graph.add_edge(edge) 
     
     # Generate the coordinates for all of the nodes using the specified program
-    graph = pydot.graph_from_dot_data(graph.create_dot(prog=program))[0]
+    dotData = pydot.graph_from_dot_data(graph.create_dot(prog=program))[0].to_string()
     
-    # Now iterate over the time points, setting the pen widths appropriately
-    # This should preserve the coordinates of the nodes from frame to frame
+    # Now determine the pen widths at each time point; every frame is drawn
+    # from the same laid out graph, which preserves the coordinates of the
+    # nodes from frame to frame
+    nodeNames = [getDotName(speciesList[index]) for index in nodes]
+    nodeConcentrations = concentrations[:, nodes] / maxConcentration
+    edgeNames = [(getDotName(speciesList[reactantIndex]), getDotName(speciesList[productIndex])) for reactantIndex, productIndex in edges]
+    edgeRates = [pairFluxes.getRates(reactantIndex, productIndex) / maxSpeciesRate for reactantIndex, productIndex in edges]
+    nodeSlope = -maximumNodePenWidth / math.log10(concentrationTolerance)
+    edgeSlope = -maximumEdgePenWidth / math.log10(speciesRateTolerance)
+    
+    tasks = []
     frameNumber = 1
     for t in range(len(times)):
         # Update the nodes
-        slope = -maximumNodePenWidth / math.log10(concentrationTolerance)
-        for index in nodes:
-            species = speciesList[index]         
-            if re.search(r'^[a-zA-Z0-9_]*$',str(species)) is not None:
-                species_string = str(species)
-            else:
-                # species name contains special characters                
-                species_string = '"{0}"'.format(str(species))
-                
-            node = graph.get_node(species_string)[0]
-            concentration = concentrations[t,index] / maxConcentration
+        nodeStyles = []
+        for name, concentration in zip(nodeNames, nodeConcentrations[t, :]):
             if concentration < concentrationTolerance:
                 penwidth = 0.0
             else:
-                penwidth = round(slope * math.log10(concentration) + maximumNodePenWidth,3)
-            node.set_penwidth(penwidth)
+                penwidth = round(nodeSlope * math.log10(concentration) + maximumNodePenWidth,3)
+            nodeStyles.append((name, penwidth))
         # Update the edges
-        slope = -maximumEdgePenWidth / math.log10(speciesRateTolerance)
-        for index in range(len(edges)):
-            reactantIndex, productIndex = edges[index]
-            if reactantIndex in nodes and productIndex in nodes:
-                reactant = speciesList[reactantIndex]
-                product = speciesList[productIndex]
-                
-                if re.search(r'^[a-zA-Z0-9_]*$',str(reactant)) is not None:
-                    reactant_string = str(reactant)
-                else:
-                    reactant_string = '"{0}"'.format(str(reactant))
-                    
-                if re.search(r'^[a-zA-Z0-9_]*$',str(product)) is not None:
-                    product_string = str(product)
-                else:
-                    product_string = '"{0}"'.format(str(product))
-                    
-                edge = graph.get_edge(reactant_string, product_string)[0]
-                # Determine direction of arrow based on sign of rate
-                speciesRate = speciesRates[t,reactantIndex,productIndex] / maxSpeciesRate
-                if speciesRate < 0:
-                    edge.set_dir("back")
-                    speciesRate = -speciesRate
-                else:
-                    edge.set_dir("forward")
-                # Set the edge pen width
-                if speciesRate < speciesRateTolerance:
-                    penwidth = 0.0
-                    edge.set_dir("none")
-                else:
-                    penwidth = round(slope * math.log10(speciesRate) + maximumEdgePenWidth,3)
-                edge.set_penwidth(penwidth)
+        edgeStyles = []
+        for (reactantName, productName), rates in zip(edgeNames, edgeRates):
+            # Determine direction of arrow based on sign of rate
+            speciesRate = rates[t]
+            if speciesRate < 0:
+                direction = "back"
+                speciesRate = -speciesRate
+            else:
+                direction = "forward"
+            # Set the edge pen width
+            if speciesRate < speciesRateTolerance:
+                penwidth = 0.0
+                direction = "none"
+            else:
+                penwidth = round(edgeSlope * math.log10(speciesRate) + maximumEdgePenWidth,3)
+            edgeStyles.append((reactantName, productName, direction, penwidth))
         # Save the graph at this time to a dot file and a PNG image
         if times[t] == 0:
             label = 't = 0 s'
         else:
             label = 't = 10^{0:.1f} s'.format(math.log10(times[t]))
-        graph.set_label(label)
         if t == 0:
             repeat = framesPerSecond * initialPadding
         elif t == len(times) - 1:
             repeat = framesPerSecond * finalPadding
         else:
             repeat = 1
+        paths = []
         for r in range(repeat):
-            graph.write_dot(os.path.join(outputDirectory, 'flux_diagram_{0:04d}.dot'.format(frameNumber)))
-            graph.write_png(os.path.join(outputDirectory, 'flux_diagram_{0:04d}.png'.format(frameNumber)))
+            paths.append((os.path.join(outputDirectory, 'flux_diagram_{0:04d}.dot'.format(frameNumber)),
+                          os.path.join(outputDirectory, 'flux_diagram_{0:04d}.png'.format(frameNumber))))
             frameNumber += 1
+        tasks.append((dotData, label, nodeStyles, edgeStyles, paths))
+    
+    # Render the frames in parallel; each worker lays out its own copy of the graph
+    processes = min(renderProcesses or multiprocessing.cpu_count(), len(tasks))
+    if processes > 1:
+        pool = multiprocessing.Pool(processes)
+        try:
+            pool.map(_renderFrame, tasks, chunksize=max(1, len(tasks) // (4 * processes)))
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        map(_renderFrame, tasks)
     
     # Use ffmpeg to stitch the PNG images together into a movie
     import subprocess
@@ -285,6 +396,19 @@ def generateFluxDiagram(reactionModel, times, concentrations, reactionRates, out
     
 ################################################################################
 
+def _storeRow(array, count, row):
+    """
+    Store `row` as row number `count` of the two-dimensional `array`, doubling
+    the number of rows of the array if it is full. Returns the array, which is
+    created if `array` is ``None``.
+    """
+    if array is None:
+        array = numpy.zeros((64, len(row)), numpy.float64)
+    elif count == array.shape[0]:
+        array = numpy.concatenate((array, numpy.zeros_like(array)))
+    array[count, :] = row
+    return array
+
 def simulate(reactionModel, reactionSystem, settings=None):
     """
     Generate and return a set of core and edge species and reaction fluxes
@@ -318,10 +442,11 @@ def simulate(reactionModel, reactionSystem, settings=None):
     # Copy the initial conditions to use in evaluating conversions
     y0 = reactionSystem.y.copy()
 
+    # The results are stored in preallocated arrays that grow as needed
     time = []
-    coreSpeciesConcentrations = []
-    coreReactionRates = []
-    edgeReactionRates = []
+    coreSpeciesConcentrations = None
+    coreReactionRates = None
+    edgeReactionRates = None
 
     nextTime = initialTime
     terminated = False
@@ -329,10 +454,11 @@ def simulate(reactionModel, reactionSystem, settings=None):
         # Integrate forward in time to the next time point
         reactionSystem.advance(nextTime)
         
+        step = len(time)
         time.append(reactionSystem.t)
-        coreSpeciesConcentrations.append(reactionSystem.coreSpeciesConcentrations)
-        coreReactionRates.append(reactionSystem.coreReactionRates)
-        edgeReactionRates.append(reactionSystem.edgeReactionRates)
+        coreSpeciesConcentrations = _storeRow(coreSpeciesConcentrations, step, reactionSystem.coreSpeciesConcentrations)
+        coreReactionRates = _storeRow(coreReactionRates, step, reactionSystem.coreReactionRates)
+        edgeReactionRates = _storeRow(edgeReactionRates, step, reactionSystem.edgeReactionRates)
         
         # Finish simulation if any of the termination criteria are satisfied
         for term in reactionSystem.termination:
@@ -351,9 +477,9 @@ def simulate(reactionModel, reactionSystem, settings=None):
             nextTime *= timeStep
 
     time = numpy.array(time)
-    coreSpeciesConcentrations = numpy.array(coreSpeciesConcentrations)
-    coreReactionRates = numpy.array(coreReactionRates)
-    edgeReactionRates = numpy.array(edgeReactionRates)
+    coreSpeciesConcentrations = coreSpeciesConcentrations[:len(time), :]
+    coreReactionRates = coreReactionRates[:len(time), :]
+    edgeReactionRates = edgeReactionRates[:len(time), :]
     
     return time, coreSpeciesConcentrations, coreReactionRates, edgeReactionRates
 
@@ -31,7 +31,53 @@ import os.path
 import shutil
 from nose.plugins.attrib import attr
 import rmgpy
-from rmgpy.tools.fluxdiagram import createFluxDiagram
+import numpy
+from rmgpy.reaction import Reaction
+from rmgpy.species import Species
+from rmgpy.tools.fluxdiagram import createFluxDiagram, PairFluxes
+
+class PairFluxesTest(unittest.TestCase):
+
+    def setUp(self):
+        self.species = [Species(label=label) for label in ['A', 'B', 'C', 'D']]
+        A, B, C, D = self.species
+        self.reactions = [
+            Reaction(reactants=[A], products=[B], pairs=[(A, B)]),
+            Reaction(reactants=[C], products=[A], pairs=[(C, A)]),
+            Reaction(reactants=[A, C], products=[B, D], pairs=[(A, B), (C, D)]),
+            Reaction(reactants=[B], products=[B], pairs=[(B, B)]),
+        ]
+        self.reactionRates = numpy.array([[1.0, 2.0, 0.5, 7.0],
+                                          [-3.0, 0.0, 0.25, 7.0]])
+        self.speciesIndex = dict((species, index) for index, species in enumerate(self.species))
+
+    def testRatesMatchDenseMatrix(self):
+        """
+        Test that the sparse pair rates equal those of a dense species-species matrix.
+        """
+        numSpecies = len(self.species)
+        speciesRates = numpy.zeros((2, numSpecies, numSpecies))
+        for index, reaction in enumerate(self.reactions):
+            for reactant, product in reaction.pairs:
+                speciesRates[:, self.species.index(reactant), self.species.index(product)] += self.reactionRates[:, index]
+                speciesRates[:, self.species.index(product), self.species.index(reactant)] -= self.reactionRates[:, index]
+
+        pairFluxes = PairFluxes(self.speciesIndex, self.reactions, self.reactionRates)
+        self.assertEqual(len(pairFluxes.pairIndex), 3)
+        for i in range(numSpecies):
+            for j in range(numSpecies):
+                self.assertTrue(numpy.allclose(pairFluxes.getRates(i, j), speciesRates[:, i, j]))
+                self.assertAlmostEqual(pairFluxes.getMaximumRate(i, j), numpy.max(numpy.abs(speciesRates[:, i, j])))
+
+    def testLargestPairs(self):
+        """
+        Test that the pairs with the largest rates are returned in order.
+        """
+        pairFluxes = PairFluxes(self.speciesIndex, self.reactions, self.reactionRates)
+        self.assertEqual(pairFluxes.getLargestPairs(10), [(0, 1), (0, 2), (2, 3)])
+        self.assertEqual(pairFluxes.getLargestPairs(2), [(0, 1), (0, 2)])
+        self.assertEqual(pairFluxes.getLargestPairs(0), [])
+
 @attr('functional')
 class FluxDiagramTest(unittest.TestCase):
 
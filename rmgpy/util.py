@@ -30,6 +30,11 @@
 
 import os.path
 import shutil
+import sys
+import threading
+import Queue
+import cProfile
+from contextlib import contextmanager
 from functools import wraps
 import time
 import logging
@@ -109,6 +114,250 @@ class Subject(object):
             if modifier != observer:
                 observer.update(self)
 
+class BackgroundWorker(object):
+    """
+    Runs submitted tasks one at a time, in submission order, on a single
+    daemon thread. The thread is only started when the first task is
+    submitted.
+
+    An exception raised by a task does not stop the worker; it is stored and
+    re-raised in the calling thread by the next call to :meth:`submit` or
+    :meth:`flush`, so errors in background output are not silently lost.
+    """
+    def __init__(self, name=None):
+        self.name = name
+        self._queue = Queue.Queue()
+        self._thread = None
+        self._error = None
+
+    def _run(self):
+        while True:
+            func, args, kwargs = self._queue.get()
+            try:
+                func(*args, **kwargs)
+            except Exception:
+                logging.exception('Error in background task {0!r}.'.format(self.name))
+                if self._error is None:
+                    self._error = sys.exc_info()
+            finally:
+                self._queue.task_done()
+
+    def _raiseError(self):
+        if self._error is not None:
+            excType, excValue, excTraceback = self._error
+            self._error = None
+            raise excType, excValue, excTraceback
+
+    def submit(self, func, *args, **kwargs):
+        """
+        Queue the call ``func(*args, **kwargs)`` for execution on the worker
+        thread and return immediately.
+        """
+        self._raiseError()
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name=self.name)
+            self._thread.daemon = True
+            self._thread.start()
+        self._queue.put((func, args, kwargs))
+
+    def pending(self):
+        """
+        Return the number of submitted tasks that have not yet finished.
+        """
+        return self._queue.unfinished_tasks
+
+    def flush(self):
+        """
+        Block until every submitted task has finished.
+        """
+        self._queue.join()
+        self._raiseError()
+
+class BackgroundListener(object):
+    """
+    Wraps a listener so that writing its output does not block the subject.
+
+    A listener opts in by implementing ``snapshot(subject)``, which is called
+    on the subject's thread and must return everything needed to produce the
+    output without reading the subject again, and ``write(data)``, which is
+    called with that snapshot on a :class:`BackgroundWorker` thread. Other
+    listeners are updated synchronously as usual. If the listener has a true
+    ``coalesce`` attribute, a snapshot still waiting to be written when a new
+    one arrives is replaced by the new one, so a listener that falls behind
+    only writes the latest state.
+
+    Listeners whose output depends on each other (e.g. a plotter reading the
+    file written by another listener) should share the same `worker`.
+
+    The time spent by the wrapped listener is accumulated in `updateTime`
+    (time the subject was blocked) and `writeTime` (time spent writing in
+    the background).
+    """
+    def __init__(self, listener, worker=None):
+        self.listener = listener
+        self.worker = worker or BackgroundWorker(name=listener.__class__.__name__)
+        self.background = hasattr(listener, 'snapshot') and hasattr(listener, 'write')
+        self.coalesce = getattr(listener, 'coalesce', False)
+        self._lock = threading.Lock()
+        self._pending = None
+        self._hasPending = False
+        self.updates = 0
+        self.writes = 0
+        self.coalesced = 0
+        self.updateTime = 0.0
+        self.writeTime = 0.0
+
+    def update(self, subject):
+        t0 = time.time()
+        try:
+            if not self.background:
+                self.listener.update(subject)
+                self.writes += 1
+                self.writeTime += time.time() - t0
+            elif self.coalesce:
+                data = self.listener.snapshot(subject)
+                with self._lock:
+                    replaced = self._hasPending
+                    self._pending = data
+                    self._hasPending = True
+                if replaced:
+                    self.coalesced += 1
+                else:
+                    try:
+                        self.worker.submit(self._writePending)
+                    except:
+                        with self._lock:
+                            self._pending = None
+                            self._hasPending = False
+                        raise
+            else:
+                self.worker.submit(self._write, self.listener.snapshot(subject))
+        finally:
+            self.updates += 1
+            self.updateTime += time.time() - t0
+
+    def _writePending(self):
+        with self._lock:
+            data = self._pending
+            self._pending = None
+            self._hasPending = False
+        self._write(data)
+
+    def _write(self, data):
+        t0 = time.time()
+        try:
+            self.listener.write(data)
+        finally:
+            self.writes += 1
+            self.writeTime += time.time() - t0
+
+    def flush(self):
+        """
+        Block until all output of the wrapped listener has been written.
+        """
+        self.worker.flush()
+
+    def close(self):
+        """
+        Write all output of the wrapped listener, then close it if it has a
+        ``close`` method.
+        """
+        self.flush()
+        if hasattr(self.listener, 'close'):
+            self.listener.close()
+
+    def logTimings(self, level=logging.INFO):
+        """
+        Log the number of updates and the time spent by the wrapped listener.
+        """
+        logging.log(level, '    {0:<28} {1:4d} updates {2:4d} written {3:4d} coalesced {4:10.2f} s blocking {5:10.2f} s writing'.format(
+            self.listener.__class__.__name__, self.updates, self.writes, self.coalesced, self.updateTime, self.writeTime))
+
+class PhaseTimer(object):
+    """
+    Accumulates the wall time spent in named phases of a job and counts of
+    named events, until they are collected by :meth:`collect`. A phase is
+    timed with a context manager::
+
+        with timer.phase('thermo'):
+            <estimate thermo>
+
+    Phases can be nested, in which case the time of the inner phase is also
+    included in the outer one.
+
+    If `profile` is ``True``, or a list of phase names, those phases are also
+    profiled with :mod:`cProfile`. The profiles of each phase are accumulated
+    over the whole job in `profiles` and can be saved by :meth:`saveProfiles`.
+    Only one profiler can be active at a time, so a profiled phase nested in
+    another profiled phase is only included in the profile of the outer one.
+    """
+    def __init__(self, profile=None):
+        self.times = {}
+        self.counts = {}
+        self.profile = profile
+        self.profiles = {}
+        self._profiling = False
+
+    def __getstate__(self):
+        """
+        Return the state of the timer for pickling, without the profilers,
+        which cannot be pickled.
+        """
+        state = self.__dict__.copy()
+        state['profiles'] = {}
+        state['_profiling'] = False
+        return state
+
+    @contextmanager
+    def phase(self, name):
+        """
+        Time the enclosed block as part of the phase `name`.
+        """
+        profiler = None
+        if self.profile and not self._profiling and (self.profile is True or name in self.profile):
+            profiler = self.profiles.get(name)
+            if profiler is None:
+                profiler = self.profiles[name] = cProfile.Profile()
+            self._profiling = True
+            profiler.enable()
+        t0 = time.time()
+        try:
+            yield
+        finally:
+            dt = time.time() - t0
+            if profiler is not None:
+                profiler.disable()
+                self._profiling = False
+            self.times[name] = self.times.get(name, 0.0) + dt
+
+    def count(self, name, n=1):
+        """
+        Add `n` to the count of the event `name`.
+        """
+        self.counts[name] = self.counts.get(name, 0) + n
+
+    def collect(self):
+        """
+        Return the dictionaries of the phase times and event counts accumulated
+        since the previous call, and start accumulating new ones.
+        """
+        times, counts = self.times, self.counts
+        self.times = {}
+        self.counts = {}
+        return times, counts
+
+    def saveProfiles(self, directory):
+        """
+        Save the profile of each profiled phase to the file `<phase>.prof` in
+        `directory`, which is created if necessary.
+        """
+        if not self.profiles:
+            return
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+        for name, profiler in self.profiles.iteritems():
+            profiler.dump_stats(os.path.join(directory, '{0}.prof'.format(name)))
+
 def makeOutputSubdirectory(outputDirectory, folder):
     """
     Create a subdirectory `folder` in the output directory. If the folder
@@ -0,0 +1,195 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+################################################################################
+#
+#   RMG - Reaction Mechanism Generator
+#
+#   Copyright (c) 2002-2017 Prof. William H. Green (whgreen@mit.edu), 
+#   Prof. Richard H. West (r.west@neu.edu) and the RMG Team (rmg_dev@mit.edu)
+#
+#   Permission is hereby granted, free of charge, to any person obtaining a
+#   copy of this software and associated documentation files (the 'Software'),
+#   to deal in the Software without restriction, including without limitation
+#   the rights to use, copy, modify, merge, publish, distribute, sublicense,
+#   and/or sell copies of the Software, and to permit persons to whom the
+#   Software is furnished to do so, subject to the following conditions:
+#
+#   The above copyright notice and this permission notice shall be included in
+#   all copies or substantial portions of the Software.
+#
+#   THE SOFTWARE IS PROVIDED 'AS IS', WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+#   IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+#   FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+#   AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+#   LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+#   FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+#   DEALINGS IN THE SOFTWARE.
+#
+################################################################################
+
+"""
+This script contains unit tests of the :mod:`rmgpy.util` module.
+"""
+
+import threading
+import time
+import unittest
+
+from rmgpy.util import BackgroundWorker, BackgroundListener, PhaseTimer
+
+################################################################################
+
+class TestBackgroundWorker(unittest.TestCase):
+    """
+    Contains unit tests of the BackgroundWorker class.
+    """
+
+    def test_tasksRunInOrder(self):
+        """
+        Test that submitted tasks are all run, in submission order, by flush().
+        """
+        worker = BackgroundWorker()
+        result = []
+        for i in range(20):
+            worker.submit(result.append, i)
+        worker.flush()
+        self.assertEqual(result, range(20))
+        self.assertEqual(worker.pending(), 0)
+
+    def test_errorIsReraised(self):
+        """
+        Test that an exception raised by a task is re-raised by flush().
+        """
+        def fail():
+            raise ValueError('failed in background')
+        worker = BackgroundWorker()
+        worker.submit(fail)
+        self.assertRaises(ValueError, worker.flush)
+        # The worker keeps running after an error
+        result = []
+        worker.submit(result.append, 1)
+        worker.flush()
+        self.assertEqual(result, [1])
+
+################################################################################
+
+class SynchronousListener(object):
+
+    def __init__(self):
+        self.updates = []
+
+    def update(self, subject):
+        self.updates.append(subject)
+
+class SnapshotListener(object):
+
+    def __init__(self, coalesce=False):
+        self.coalesce = coalesce
+        self.written = []
+        self.blocked = threading.Event()
+        self.blocked.set()
+
+    def snapshot(self, subject):
+        return list(subject)
+
+    def write(self, data):
+        self.blocked.wait()
+        self.written.append(data)
+
+class TestBackgroundListener(unittest.TestCase):
+    """
+    Contains unit tests of the BackgroundListener class.
+    """
+
+    def test_synchronousListener(self):
+        """
+        Test that a listener without snapshot() and write() is updated immediately.
+        """
+        listener = SynchronousListener()
+        wrapper = BackgroundListener(listener)
+        wrapper.update('subject')
+        self.assertEqual(listener.updates, ['subject'])
+        self.assertEqual(wrapper.writes, 1)
+
+    def test_snapshotIsWritten(self):
+        """
+        Test that the snapshot taken at update time is what gets written.
+        """
+        listener = SnapshotListener()
+        wrapper = BackgroundListener(listener)
+        subject = [1, 2]
+        wrapper.update(subject)
+        subject.append(3)
+        wrapper.update(subject)
+        wrapper.flush()
+        self.assertEqual(listener.written, [[1, 2], [1, 2, 3]])
+        self.assertEqual(wrapper.updates, 2)
+        self.assertEqual(wrapper.writes, 2)
+
+    def test_coalesce(self):
+        """
+        Test that pending snapshots are replaced by newer ones for a coalescing listener.
+        """
+        listener = SnapshotListener(coalesce=True)
+        wrapper = BackgroundListener(listener)
+        listener.blocked.clear()
+        wrapper.update([1])
+        # Wait until the first write has started and is blocked
+        while wrapper._hasPending:
+            time.sleep(0.001)
+        wrapper.update([2])
+        wrapper.update([3])
+        listener.blocked.set()
+        wrapper.flush()
+        self.assertEqual(listener.written, [[1], [3]])
+        self.assertEqual(wrapper.coalesced, 1)
+
+class TestPhaseTimer(unittest.TestCase):
+    """
+    Contains unit tests of the PhaseTimer class.
+    """
+
+    def test_phasesAndCounts(self):
+        """
+        Test that phase times and counts accumulate until they are collected.
+        """
+        timer = PhaseTimer()
+        with timer.phase('outer'):
+            with timer.phase('inner'):
+                time.sleep(0.01)
+        with timer.phase('inner'):
+            pass
+        timer.count('events')
+        timer.count('events', 2)
+        times, counts = timer.collect()
+        self.assertEqual(sorted(times.keys()), ['inner', 'outer'])
+        self.assertTrue(times['outer'] >= times['inner'] - 1e-3 > 0)
+        self.assertEqual(counts, {'events': 3})
+        self.assertEqual(timer.collect(), ({}, {}))
+
+    def test_phaseWithException(self):
+        """
+        Test that a phase left by an exception is still timed.
+        """
+        timer = PhaseTimer()
+        with self.assertRaises(ValueError):
+            with timer.phase('failed'):
+                raise ValueError
+        self.assertIn('failed', timer.times)
+
+    def test_profile(self):
+        """
+        Test that only the requested phases are profiled, and that the timer
+        can be pickled with its profiles.
+        """
+        import cPickle
+        timer = PhaseTimer(profile=['profiled'])
+        with timer.phase('profiled'):
+            sum(range(100))
+        with timer.phase('other'):
+            pass
+        self.assertEqual(timer.profiles.keys(), ['profiled'])
+        timer = cPickle.loads(cPickle.dumps(timer))
+        self.assertEqual(timer.profiles, {})
+        self.assertEqual(timer.profile, ['profiled'])